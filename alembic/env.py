@@ -17,6 +17,9 @@ from app.infrastructure.database.connection import Base
 
 # すべてのモデルをインポート（autogenerate のため）
 from app.infrastructure.database.models.jquants_listed_info import JQuantsListedInfoModel
+from app.infrastructure.database.models.jquants_listed_info_history import JQuantsListedInfoHistoryModel
+from app.infrastructure.database.models.backfill_checkpoint import BackfillCheckpointModel
+from app.infrastructure.database.models.snapshot_digest import SnapshotDigestModel
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
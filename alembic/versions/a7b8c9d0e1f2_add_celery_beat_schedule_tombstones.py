@@ -0,0 +1,102 @@
+"""Add celery_beat_schedule_tombstones for incremental beat sync
+
+Revision ID: a7b8c9d0e1f2
+Revises: f5a6b7c8d9e0
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a7b8c9d0e1f2"
+down_revision: Union[str, None] = "f5a6b7c8d9e0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE = "celery_beat_schedules"
+TOMBSTONE_TABLE = "celery_beat_schedule_tombstones"
+
+# Celery Beat のエントリに影響する列（last_run_at だけの更新では updated_at を進めない）
+SCHEDULER_COLUMNS = ("name", "task_name", "cron_expression", "enabled", "args", "kwargs")
+
+
+def upgrade() -> None:
+    """Create tombstone table and triggers
+
+    DatabaseSchedulerAsyncPG の差分同期のため、削除されたスケジュールを墓標テーブルに記録し、
+    ORM を経由しない UPDATE でも updated_at が進むようにする。
+    """
+    op.create_table(
+        TOMBSTONE_TABLE,
+        sa.Column("schedule_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("name", sa.String(255), nullable=False),
+        sa.Column(
+            "deleted_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False
+        ),
+        sa.PrimaryKeyConstraint("schedule_id"),
+    )
+    op.create_index(
+        "idx_celery_beat_schedule_tombstones_deleted_at", TOMBSTONE_TABLE, ["deleted_at"]
+    )
+
+    op.execute(
+        f"""
+        CREATE FUNCTION {TOMBSTONE_TABLE}_record() RETURNS trigger AS $$
+        BEGIN
+            INSERT INTO {TOMBSTONE_TABLE} (schedule_id, name, deleted_at)
+            VALUES (OLD.id, OLD.name, now())
+            ON CONFLICT (schedule_id) DO UPDATE
+                SET name = EXCLUDED.name, deleted_at = EXCLUDED.deleted_at;
+            RETURN OLD;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        f"""
+        CREATE TRIGGER trg_{TABLE}_tombstone
+        AFTER DELETE ON {TABLE}
+        FOR EACH ROW EXECUTE FUNCTION {TOMBSTONE_TABLE}_record()
+        """
+    )
+
+    new_columns = ", ".join(f"NEW.{column}" for column in SCHEDULER_COLUMNS)
+    old_columns = ", ".join(f"OLD.{column}" for column in SCHEDULER_COLUMNS)
+    op.execute(
+        f"""
+        CREATE FUNCTION {TABLE}_touch_updated_at() RETURNS trigger AS $$
+        BEGIN
+            IF NEW.updated_at = OLD.updated_at
+               AND ROW({new_columns}) IS DISTINCT FROM ROW({old_columns}) THEN
+                NEW.updated_at := now();
+            END IF;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        f"""
+        CREATE TRIGGER trg_{TABLE}_touch_updated_at
+        BEFORE UPDATE ON {TABLE}
+        FOR EACH ROW EXECUTE FUNCTION {TABLE}_touch_updated_at()
+        """
+    )
+    op.create_index("idx_celery_beat_schedules_updated_at", TABLE, ["updated_at"])
+
+
+def downgrade() -> None:
+    """Drop tombstone table and triggers"""
+    op.drop_index("idx_celery_beat_schedules_updated_at", table_name=TABLE)
+    op.execute(f"DROP TRIGGER IF EXISTS trg_{TABLE}_touch_updated_at ON {TABLE}")
+    op.execute(f"DROP FUNCTION IF EXISTS {TABLE}_touch_updated_at()")
+    op.execute(f"DROP TRIGGER IF EXISTS trg_{TABLE}_tombstone ON {TABLE}")
+    op.execute(f"DROP FUNCTION IF EXISTS {TOMBSTONE_TABLE}_record()")
+    op.drop_index("idx_celery_beat_schedule_tombstones_deleted_at", table_name=TOMBSTONE_TABLE)
+    op.drop_table(TOMBSTONE_TABLE)
@@ -0,0 +1,38 @@
+"""Add snapshot progress columns to backfill_checkpoints
+
+Revision ID: b8c9d0e1f2a3
+Revises: a7b8c9d0e1f2
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b8c9d0e1f2a3"
+down_revision: Union[str, None] = "a7b8c9d0e1f2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add listed_codes and digest_state to backfill_checkpoints"""
+    op.add_column(
+        "backfill_checkpoints",
+        sa.Column("listed_codes", postgresql.JSONB(), nullable=True),
+    )
+    op.add_column(
+        "backfill_checkpoints",
+        sa.Column("digest_state", sa.LargeBinary(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Drop listed_codes and digest_state from backfill_checkpoints"""
+    op.drop_column("backfill_checkpoints", "digest_state")
+    op.drop_column("backfill_checkpoints", "listed_codes")
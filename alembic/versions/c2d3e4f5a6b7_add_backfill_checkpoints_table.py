@@ -0,0 +1,44 @@
+"""Add backfill_checkpoints table for resumable backfills
+
+Revision ID: c2d3e4f5a6b7
+Revises: b1c2d3e4f5g6
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c2d3e4f5a6b7"
+down_revision: Union[str, None] = "b1c2d3e4f5g6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create backfill_checkpoints table"""
+    op.create_table(
+        "backfill_checkpoints",
+        sa.Column("task_id", sa.String(255), nullable=False),
+        sa.Column("target_date", sa.Date(), nullable=False),
+        sa.Column("completed", sa.Boolean(), nullable=False, server_default=sa.false()),
+        sa.Column("pagination_key", sa.Text(), nullable=True),
+        sa.Column("fetched_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("saved_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("task_id", "target_date"),
+    )
+
+
+def downgrade() -> None:
+    """Drop backfill_checkpoints table"""
+    op.drop_table("backfill_checkpoints")
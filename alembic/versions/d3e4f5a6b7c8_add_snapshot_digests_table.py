@@ -0,0 +1,42 @@
+"""Add snapshot_digests table for skipping unchanged snapshots
+
+Revision ID: d3e4f5a6b7c8
+Revises: c2d3e4f5a6b7
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d3e4f5a6b7c8"
+down_revision: Union[str, None] = "c2d3e4f5a6b7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create snapshot_digests table"""
+    op.create_table(
+        "snapshot_digests",
+        sa.Column("dataset", sa.String(64), nullable=False),
+        sa.Column("target_date", sa.Date(), nullable=False),
+        sa.Column("digest", sa.String(64), nullable=False),
+        sa.Column("record_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("dataset", "target_date"),
+    )
+
+
+def downgrade() -> None:
+    """Drop snapshot_digests table"""
+    op.drop_table("snapshot_digests")
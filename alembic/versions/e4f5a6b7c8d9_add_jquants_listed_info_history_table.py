@@ -0,0 +1,60 @@
+"""Add jquants_listed_info_history table (SCD type 2)
+
+Revision ID: e4f5a6b7c8d9
+Revises: d3e4f5a6b7c8
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e4f5a6b7c8d9"
+down_revision: Union[str, None] = "d3e4f5a6b7c8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create jquants_listed_info_history table
+
+    既存の jquants_listed_info からの移行は scripts/migrate_listed_info_history.py で行う。
+    """
+    op.create_table(
+        "jquants_listed_info_history",
+        sa.Column("code", sa.String(10), nullable=False),
+        sa.Column("valid_from", sa.Date(), nullable=False),
+        sa.Column("valid_to", sa.Date(), nullable=False, server_default="9999-12-31"),
+        sa.Column("company_name", sa.String(255), nullable=False),
+        sa.Column("company_name_english", sa.String(255), nullable=True),
+        sa.Column("sector_17_code", sa.String(10), nullable=True),
+        sa.Column("sector_17_code_name", sa.String(255), nullable=True),
+        sa.Column("sector_33_code", sa.String(10), nullable=True),
+        sa.Column("sector_33_code_name", sa.String(255), nullable=True),
+        sa.Column("scale_category", sa.String(50), nullable=True),
+        sa.Column("market_code", sa.String(10), nullable=True),
+        sa.Column("market_code_name", sa.String(50), nullable=True),
+        sa.Column("margin_code", sa.String(10), nullable=True),
+        sa.Column("margin_code_name", sa.String(50), nullable=True),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.PrimaryKeyConstraint("code", "valid_from"),
+        sa.CheckConstraint("valid_from < valid_to", name="ck_jquants_listed_info_history_interval"),
+    )
+    op.create_index(
+        "idx_jquants_listed_info_history_valid_to",
+        "jquants_listed_info_history",
+        ["valid_to", "valid_from"],
+    )
+
+
+def downgrade() -> None:
+    """Drop jquants_listed_info_history table"""
+    op.drop_index(
+        "idx_jquants_listed_info_history_valid_to", table_name="jquants_listed_info_history"
+    )
+    op.drop_table("jquants_listed_info_history")
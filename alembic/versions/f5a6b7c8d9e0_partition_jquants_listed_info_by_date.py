@@ -0,0 +1,116 @@
+"""Partition jquants_listed_info by date range
+
+Revision ID: f5a6b7c8d9e0
+Revises: e4f5a6b7c8d9
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f5a6b7c8d9e0"
+down_revision: Union[str, None] = "e4f5a6b7c8d9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE = "jquants_listed_info"
+OLD_TABLE = "jquants_listed_info_unpartitioned"
+
+# このマイグレーションで作成するパーティションは月単位で、現在の月の 3 か月先までとする。
+# 実行時の環境やアプリケーションのコードに依存しないよう値を固定している。
+# 以降のパーティションはメンテナンスタスクが設定（DATABASE_LISTED_INFO_PARTITION_INTERVAL /
+# DATABASE_PARTITION_PREMAKE）に従って作成する。
+PREMAKE_MONTHS = 3
+
+COLUMNS = (
+    "date, code, company_name, company_name_english, sector_17_code, sector_17_code_name, "
+    "sector_33_code, sector_33_code_name, scale_category, market_code, market_code_name, "
+    "margin_code, margin_code_name, created_at, updated_at"
+)
+
+
+def _columns() -> list:
+    return [
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("code", sa.String(10), nullable=False),
+        sa.Column("company_name", sa.String(255), nullable=False),
+        sa.Column("company_name_english", sa.String(255), nullable=True),
+        sa.Column("sector_17_code", sa.String(10), nullable=True),
+        sa.Column("sector_17_code_name", sa.String(255), nullable=True),
+        sa.Column("sector_33_code", sa.String(10), nullable=True),
+        sa.Column("sector_33_code_name", sa.String(255), nullable=True),
+        sa.Column("scale_category", sa.String(50), nullable=True),
+        sa.Column("market_code", sa.String(10), nullable=True),
+        sa.Column("market_code_name", sa.String(50), nullable=True),
+        sa.Column("margin_code", sa.String(10), nullable=True),
+        sa.Column("margin_code_name", sa.String(50), nullable=True),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+    ]
+
+
+def _rename_indexes(table: str, suffix_from: str, suffix_to: str) -> None:
+    op.execute(f"ALTER INDEX idx_jquants_listed_info_code{suffix_from} RENAME TO idx_jquants_listed_info_code{suffix_to}")
+    op.execute(f"ALTER INDEX idx_jquants_listed_info_date{suffix_from} RENAME TO idx_jquants_listed_info_date{suffix_to}")
+    op.execute(f"ALTER TABLE {table} RENAME CONSTRAINT {TABLE}_pkey{suffix_from} TO {TABLE}_pkey{suffix_to}")
+
+
+def _add_months(month_start: date, months: int) -> date:
+    index = month_start.year * 12 + month_start.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def upgrade() -> None:
+    """Recreate jquants_listed_info as a range-partitioned table (monthly)"""
+    op.rename_table(TABLE, OLD_TABLE)
+    _rename_indexes(OLD_TABLE, "", "_old")
+
+    op.create_table(
+        TABLE,
+        *_columns(),
+        sa.PrimaryKeyConstraint("date", "code", name=f"{TABLE}_pkey"),
+        postgresql_partition_by="RANGE (date)",
+    )
+    op.create_index("idx_jquants_listed_info_code", TABLE, ["code"])
+    op.create_index("idx_jquants_listed_info_date", TABLE, ["date"])
+
+    # 既存データの最初の月から、現在の月の PREMAKE_MONTHS か月先までを作成
+    first_date = op.get_bind().execute(sa.text(f"SELECT min(date) FROM {OLD_TABLE}")).scalar()
+    today = date.today()
+    start = (first_date or today).replace(day=1)
+    last = _add_months(today.replace(day=1), PREMAKE_MONTHS)
+    while start <= last:
+        end = _add_months(start, 1)
+        op.execute(
+            f"CREATE TABLE {TABLE}_p{start.year}_{start.month:02d} PARTITION OF {TABLE} "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+        start = end
+    op.execute(f"CREATE TABLE {TABLE}_default PARTITION OF {TABLE} DEFAULT")
+
+    op.execute(f"INSERT INTO {TABLE} ({COLUMNS}) SELECT {COLUMNS} FROM {OLD_TABLE}")
+    op.drop_table(OLD_TABLE)
+
+
+def downgrade() -> None:
+    """Recreate jquants_listed_info as a plain table"""
+    op.rename_table(TABLE, OLD_TABLE)
+    _rename_indexes(OLD_TABLE, "", "_old")
+
+    op.create_table(
+        TABLE,
+        *_columns(),
+        sa.PrimaryKeyConstraint("date", "code", name=f"{TABLE}_pkey"),
+    )
+    op.create_index("idx_jquants_listed_info_code", TABLE, ["code"])
+    op.create_index("idx_jquants_listed_info_date", TABLE, ["date"])
+
+    op.execute(f"INSERT INTO {TABLE} ({COLUMNS}) SELECT {COLUMNS} FROM {OLD_TABLE}")
+    # 切り離し済みのパーティションは通常のテーブルとして残る
+    op.drop_table(OLD_TABLE)
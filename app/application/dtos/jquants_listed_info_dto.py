@@ -1,5 +1,5 @@
 """Listed info Data Transfer Objects."""
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date, datetime
 from typing import Any, Dict, List, Optional
 
@@ -113,6 +113,20 @@ class FetchJQuantsListedInfoResult:
     error_message: Optional[str] = None
     target_date: Optional[date] = None
     code: Optional[str] = None
+    # ステージごとの所要時間（秒）。取得と保存は並行に実行されるため、
+    # elapsed_seconds はおおよそ max(fetch, transform + save) になる
+    fetch_seconds: float = 0.0
+    transform_seconds: float = 0.0
+    save_seconds: float = 0.0
+    elapsed_seconds: float = 0.0
+    # 保存件数の内訳（既存行と内容が同じ場合は unchanged として書き込まない）
+    inserted_count: int = 0
+    updated_count: int = 0
+    unchanged_count: int = 0
+    # 前回保存したスナップショットと同一のため書き込みを省略した
+    snapshot_unchanged: bool = False
+    # コミット後に発行するドメインイベント（FetchJQuantsListedInfoUseCase.publish_events）
+    events: List[Any] = field(default_factory=list)
 
 
 @dataclass(frozen=True)
@@ -123,4 +137,5 @@ class JQuantsListedInfoSearchCriteria:
     code: Optional[str] = None
     market_code: Optional[str] = None
     sector_17_code: Optional[str] = None
-    sector_33_code: Optional[str] = None
\ No newline at end of file
+    sector_33_code: Optional[str] = None
+    scale_category: Optional[str] = None
\ No newline at end of file
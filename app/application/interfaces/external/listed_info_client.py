@@ -1,6 +1,23 @@
 """Listed info client interface."""
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
+from typing import AsyncIterator, Dict, Any, Iterable, List, Optional
+
+
+class ListedInfoPage(List[Dict[str, Any]]):
+    """One page of listed info records.
+
+    Behaves as a plain list and additionally carries the pagination key of
+    the following page (None on the last page), so callers can checkpoint
+    how far a paginated fetch has progressed.
+    """
+
+    def __init__(
+        self,
+        records: Iterable[Dict[str, Any]] = (),
+        next_pagination_key: Optional[str] = None,
+    ) -> None:
+        super().__init__(records)
+        self.next_pagination_key = next_pagination_key
 
 
 class ListedInfoClientInterface(ABC):
@@ -43,4 +60,27 @@ class ListedInfoClientInterface(ABC):
             JQuantsListedInfoAPIError: If API request fails.
             ValidationError: If response data is invalid.
         """
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def iter_listed_info_pages(
+        self, date: Optional[str] = None, pagination_key: Optional[str] = None
+    ) -> AsyncIterator[ListedInfoPage]:
+        """
+        Stream all listed company information page by page.
+
+        Each page is yielded as soon as it is received, so callers can
+        process and persist data without holding the full dataset in memory.
+
+        Args:
+            date: Target date in YYYYMMDD format. If None, get latest data.
+            pagination_key: Resume from the page identified by this key.
+
+        Yields:
+            ListedInfoPage for one page (a list carrying next_pagination_key).
+
+        Raises:
+            JQuantsListedInfoAPIError: If API request fails.
+            ValidationError: If response data is invalid.
+        """
+        pass
@@ -0,0 +1,26 @@
+"""Trading calendar client interface."""
+from abc import ABC, abstractmethod
+from datetime import date
+
+from app.domain.value_objects.trading_calendar import TradingCalendar
+
+
+class TradingCalendarClientInterface(ABC):
+    """Interface for fetching the exchange trading calendar."""
+
+    @abstractmethod
+    async def get_trading_calendar(self, from_date: date, to_date: date) -> TradingCalendar:
+        """
+        Get the trading calendar for a date range.
+
+        Args:
+            from_date: Start date (inclusive)
+            to_date: End date (inclusive)
+
+        Returns:
+            TradingCalendar containing the days returned by the API.
+
+        Raises:
+            JQuantsAPIException: If API request fails.
+        """
+        pass
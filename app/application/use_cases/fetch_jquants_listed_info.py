@@ -1,28 +1,120 @@
 """Fetch listed info use case."""
 import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
 from datetime import date
 from logging import Logger
-from typing import List, Optional
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from celery.exceptions import SoftTimeLimitExceeded
 
 from app.application.dtos.jquants_listed_info_dto import FetchJQuantsListedInfoResult, JQuantsListedInfoDTO
-from app.domain.entities.jquants_listed_info import JQuantsListedInfo
+from app.domain.entities.snapshot_digest import LISTED_INFO_DATASET, SnapshotDigest
+from app.domain.events.base import DomainEvent, EventPublisher
+from app.domain.events.jquants_listed_info_events import ListedInfoStored
 from app.domain.exceptions.jquants_listed_info_exceptions import (
     JQuantsListedInfoAPIError,
     JQuantsListedInfoDataError,
     JQuantsListedInfoStorageError,
 )
-from app.application.interfaces.external.listed_info_client import ListedInfoClientInterface
-from app.domain.repositories.jquants_listed_info_repository_interface import JQuantsListedInfoRepositoryInterface
+from app.application.interfaces.external.listed_info_client import (
+    ListedInfoClientInterface,
+    ListedInfoPage,
+)
+from app.domain.repositories.jquants_listed_info_repository_interface import (
+    JQuantsListedInfoRepositoryInterface,
+    ListedInfoSaveResult,
+)
+from app.domain.repositories.snapshot_digest_repository_interface import (
+    SnapshotDigestRepositoryInterface,
+)
+from app.domain.factories.jquants_listed_info_factory import ListedInfoFactory
+from app.domain.services.listed_info_diff_engine import ListedInfoDiffEngine
+from app.domain.services.snapshot_digest_builder import SnapshotDigestBuilder
+
+# フェッチステージの終了を表す番兵
+_END_OF_PAGES = object()
+
+
+@dataclass
+class SnapshotProgress:
+    """全銘柄のスナップショットの、保存済みページまでの途中経過
+
+    途中のページから再開した実行でも、スナップショットに含まれる銘柄の確定と
+    ダイジェストの保存ができるように、チェックポイントと一緒に記録する。
+    """
+
+    listed_codes: Set[str]
+    digest_state: Optional[bytes] = None  # SnapshotDigestBuilder.export_state の値
+
+
+# 保存済みページの次ページのキー、そのページまでのレコード件数と、
+# スナップショットの途中経過（全銘柄の日付指定取得の場合）を受け取るコールバック
+CheckpointCallback = Callable[[str, int, Optional[SnapshotProgress]], Awaitable[None]]
+
+# パイプライン内部で保存済みページの次ページのキーと件数を受け取るコールバック
+_PageCallback = Callable[[str, int], Awaitable[None]]
+
+# ダイジェストの計算に使用する API レスポンスの項目（この順序で正規化する）
+_DIGEST_FIELDS = (
+    "Date",
+    "Code",
+    "CompanyName",
+    "CompanyNameEnglish",
+    "Sector17Code",
+    "Sector17CodeName",
+    "Sector33Code",
+    "Sector33CodeName",
+    "ScaleCategory",
+    "MarketCode",
+    "MarketCodeName",
+    "MarginCode",
+    "MarginCodeName",
+)
+
+
+def _add_to_digest(builder: SnapshotDigestBuilder, records: List[Dict[str, Any]]) -> None:
+    """API レスポンスのレコードを正規化してダイジェストに追加する"""
+    for data in records:
+        builder.add([data.get(key) for key in _DIGEST_FIELDS])
+
+
+@dataclass
+class _PipelineStats:
+    """パイプライン実行中の件数と各ステージの所要時間"""
+
+    fetched_count: int = 0
+    saved_count: int = 0
+    save_result: ListedInfoSaveResult = ListedInfoSaveResult()
+    fetch_seconds: float = 0.0
+    transform_seconds: float = 0.0
+    save_seconds: float = 0.0
 
 
 class FetchJQuantsListedInfoUseCase:
-    """上場銘柄情報を取得して保存するユースケース"""
+    """上場銘柄情報を取得して保存するユースケース
+
+    取得（API）と変換・保存（DB）は有界キューで接続されたパイプラインとして実行され、
+    ページ N の保存中にページ N+1 のダウンロードが進む。
+
+    execute はドメインイベントを結果に保持するだけで発行しない。呼び出し側は
+    トランザクションをコミットした後に publish_events で発行する。
+    """
+
+    BATCH_SIZE = 1000
+    DEFAULT_PIPELINE_DEPTH = 2
 
     def __init__(
         self,
         jquants_client: ListedInfoClientInterface,
         listed_info_repository: JQuantsListedInfoRepositoryInterface,
         logger: Logger,
+        pipeline_depth: int = DEFAULT_PIPELINE_DEPTH,
+        event_publisher: Optional[EventPublisher] = None,
+        snapshot_repository: Optional[SnapshotDigestRepositoryInterface] = None,
+        row_fast_path: bool = False,
+        detect_changes: bool = True,
     ):
         """Initialize use case.
 
@@ -30,27 +122,55 @@ class FetchJQuantsListedInfoUseCase:
             jquants_client: Listed info client interface
             listed_info_repository: Listed info repository
             logger: Logger instance
+            pipeline_depth: Max number of fetched pages waiting to be saved
+            event_publisher: Publisher for ListedInfoStored events and, after a
+                full snapshot, listing change events against the previous snapshot (optional).
+                Events are only published by ``publish_events``.
+            snapshot_repository: Snapshot digest repository. If given, a full
+                snapshot of a date identical to the stored one is not written again.
+            row_fast_path: Convert API records straight into rows and save them with
+                ``save_rows`` instead of building DTOs and entities
+            detect_changes: Compare a full snapshot with the previous stored one.
+                Disable it when the previous trading day may not be stored yet
+                (backfills and runs over several dates), as the diff would then
+                be taken against an older date.
         """
+        if pipeline_depth <= 0:
+            raise ValueError("pipeline_depth must be positive")
+
         self._jquants_client = jquants_client
         self._listed_info_repository = listed_info_repository
         self._logger = logger
+        self._pipeline_depth = pipeline_depth
+        self._event_publisher = event_publisher
+        self._snapshot_repository = snapshot_repository
+        self._row_fast_path = row_fast_path
+        self._detect_changes = detect_changes
 
     async def execute(
         self,
         code: Optional[str] = None,
         target_date: Optional[date] = None,
+        resume_pagination_key: Optional[str] = None,
+        on_checkpoint: Optional[CheckpointCallback] = None,
+        resume_progress: Optional[SnapshotProgress] = None,
     ) -> FetchJQuantsListedInfoResult:
         """上場銘柄情報を取得して保存
 
         Args:
             code: 銘柄コード（特定銘柄のみ取得する場合）
             target_date: 基準日（指定しない場合は最新）
+            resume_pagination_key: 全銘柄取得を途中のページから再開する場合のキー
+            on_checkpoint: あるページまでの全レコードを保存し終えるたびに
+                (次ページのキー, そのページまでの件数, スナップショットの途中経過) で呼ばれるコールバック
+            resume_progress: 再開するページまでのスナップショットの途中経過。指定した場合は
+                再開した実行でもスナップショットを確定し、ダイジェストを保存する
 
         Returns:
             FetchJQuantsListedInfoResult: 処理結果
         """
-        fetched_count = 0
-        saved_count = 0
+        stats = _PipelineStats()
+        started_at = time.perf_counter()
 
         try:
             # 日付のフォーマット
@@ -62,116 +182,482 @@ class FetchJQuantsListedInfoUseCase:
                 f"Fetching listed info - code: {code}, date: {date_param}"
             )
 
-            # API から情報取得
+            # API から情報取得（全銘柄はページ単位でストリーミング）
             if code:
                 # 特定銘柄の情報取得
-                api_data = await self._jquants_client.get_listed_info(
-                    code=code, date=date_param
+                pages = self._fetch_single_page(code, date_param)
+            elif resume_pagination_key:
+                # チェックポイントのページから再開
+                pages = self._jquants_client.iter_listed_info_pages(
+                    date=date_param, pagination_key=resume_pagination_key
                 )
             else:
                 # 全銘柄の情報取得（ページネーション対応）
-                api_data = await self._jquants_client.get_all_listed_info(
-                    date=date_param
-                )
+                pages = self._jquants_client.iter_listed_info_pages(date=date_param)
 
-            fetched_count = len(api_data)
-            self._logger.info(f"Fetched {fetched_count} records from API")
-            
-            # デバッグ用に API レスポンスの一部をログ出力
-            if api_data:
-                self._logger.debug(f"First API response: {api_data[0]}")
-
-            if fetched_count == 0:
-                return FetchJQuantsListedInfoResult(
-                    success=True,
-                    fetched_count=0,
-                    saved_count=0,
-                    target_date=target_date,
-                    code=code,
-                )
+            full_snapshot = code is None and target_date is not None
+            if resume_pagination_key and resume_progress is None:
+                # 途中経過がない場合、再開した実行ではスナップショットを確定できない
+                full_snapshot = False
 
-            # DTO に変換
-            dtos = [JQuantsListedInfoDTO.from_api_response(data) for data in api_data]
+            # 日付指定の全銘柄取得はダイジェストを計算し、前回と同じ内容なら書き込まない
+            digest_builder: Optional[SnapshotDigestBuilder] = None
+            # ストリーミング中に受信したレコードをダイジェストに追加する場合に設定
+            streaming_digest: Optional[SnapshotDigestBuilder] = None
+            if full_snapshot and self._snapshot_repository is not None and resume_pagination_key:
+                if resume_progress.digest_state is not None:
+                    # 保存済みページまでのダイジェストに残りのページを追加する
+                    digest_builder = streaming_digest = SnapshotDigestBuilder.from_state(
+                        resume_progress.digest_state
+                    )
+            elif full_snapshot and self._snapshot_repository is not None:
+                digest_builder = streaming_digest = SnapshotDigestBuilder()
+                stored = await self._snapshot_repository.get(LISTED_INFO_DATASET, target_date)
+                if stored is not None:
+                    # 比較のため全ページを受信するまで保存を待つ（1 日分の API レスポンスを保持する）
+                    buffered, rest = await self._buffer_pages(pages, stats, stored.record_count)
+                    if rest is None:
+                        streaming_digest = None
+                        for page in buffered:
+                            _add_to_digest(digest_builder, page)
+                        if digest_builder.hexdigest() == stored.digest:
+                            self._logger.info(
+                                f"Snapshot for {target_date} is unchanged "
+                                f"({stats.fetched_count} records), skipping save"
+                            )
+                            stats.save_result = ListedInfoSaveResult(
+                                unchanged_count=stats.fetched_count
+                            )
+                            return self._build_result(
+                                stats, started_at, target_date, code, snapshot_unchanged=True
+                            )
+                    # 取得件数とダイジェスト（未計算の場合）はパイプラインで数え直す
+                    stats.fetched_count = 0
+                    pages = self._replay_pages(buffered, rest)
 
-            # エンティティに変換
-            entities = [dto.to_entity() for dto in dtos]
+            # 全銘柄分のスナップショットでは含まれていた銘柄を記録し、保存後に通知する
+            listed_codes: Optional[Set[str]] = None
+            if full_snapshot:
+                listed_codes = set(resume_progress.listed_codes) if resume_progress else set()
 
-            # バッチ処理でデータベースに保存
-            batch_size = 1000
-            for i in range(0, len(entities), batch_size):
-                batch = entities[i : i + batch_size]
-                await self._listed_info_repository.save_all(batch)
-                saved_count += len(batch)
-                self._logger.info(
-                    f"Saved batch {i // batch_size + 1} - {len(batch)} records"
-                )
+            notify_checkpoint: Optional[_PageCallback] = None
+            if on_checkpoint is not None:
+                # ダイジェストは受信済みで未保存のレコードを含むため、保存済みのページまでを記録する
+                # （全ページを保持してから保存する場合は、この実行で保存した件数まで）
+                digest_offset = streaming_digest.record_count if streaming_digest else 0
 
-            self._logger.info(
-                f"Successfully saved {saved_count} listed info records"
+                async def _checkpoint(next_key: str, count: int) -> None:
+                    progress = None
+                    if listed_codes is not None:
+                        progress = SnapshotProgress(listed_codes=set(listed_codes))
+                        if digest_builder is not None:
+                            progress.digest_state = digest_builder.export_state(
+                                digest_offset + count
+                            )
+                    await on_checkpoint(next_key, count, progress)
+
+                notify_checkpoint = _checkpoint
+
+            await self._run_pipeline(
+                pages, stats, notify_checkpoint, streaming_digest, listed_codes
             )
 
-            return FetchJQuantsListedInfoResult(
-                success=True,
-                fetched_count=fetched_count,
-                saved_count=saved_count,
-                target_date=target_date,
-                code=code,
+            self._logger.info(f"Fetched {stats.fetched_count} records from API")
+
+            if stats.fetched_count == 0 and not listed_codes:
+                return self._build_result(stats, started_at, target_date, code)
+
+            self._logger.info(
+                f"Successfully saved {stats.saved_count} listed info records"
+            )
+            self._logger.info(
+                f"Save breakdown - inserted: {stats.save_result.inserted_count}, "
+                f"updated: {stats.save_result.updated_count}, "
+                f"unchanged: {stats.save_result.unchanged_count}"
+            )
+            self._logger.info(
+                f"Stage timings - fetch: {stats.fetch_seconds:.2f}s, "
+                f"transform: {stats.transform_seconds:.2f}s, "
+                f"save: {stats.save_seconds:.2f}s"
             )
 
+            if listed_codes:
+                await self._listed_info_repository.finalize_snapshot(target_date, listed_codes)
+
+            if digest_builder is not None:
+                await self._snapshot_repository.save(
+                    SnapshotDigest(
+                        dataset=LISTED_INFO_DATASET,
+                        target_date=target_date,
+                        digest=digest_builder.hexdigest(),
+                        record_count=digest_builder.record_count,
+                    )
+                )
+
+            events = self._stored_events(stats, target_date)
+            if listed_codes and self._detect_changes:
+                events.extend(await self._detect_listing_changes(target_date))
+
+            return self._build_result(stats, started_at, target_date, code, events=events)
+
+        except (SoftTimeLimitExceeded, asyncio.CancelledError):
+            # タスクの時間制限やキャンセルは日付単位のエラーにせず呼び出し元へ伝える
+            raise
+
         except JQuantsListedInfoAPIError as e:
             self._logger.error(f"API error occurred: {str(e)}")
-            return FetchJQuantsListedInfoResult(
-                success=False,
-                fetched_count=fetched_count,
-                saved_count=saved_count,
-                error_message=f"API error: {str(e)}",
-                target_date=target_date,
-                code=code,
+            return self._build_result(
+                stats, started_at, target_date, code, f"API error: {str(e)}"
             )
 
         except JQuantsListedInfoDataError as e:
             self._logger.error(f"Data error occurred: {str(e)}")
-            return FetchJQuantsListedInfoResult(
-                success=False,
-                fetched_count=fetched_count,
-                saved_count=saved_count,
-                error_message=f"Data error: {str(e)}",
-                target_date=target_date,
-                code=code,
+            return self._build_result(
+                stats, started_at, target_date, code, f"Data error: {str(e)}"
             )
 
         except JQuantsListedInfoStorageError as e:
             self._logger.error(f"Storage error occurred: {str(e)}")
-            return FetchJQuantsListedInfoResult(
-                success=False,
-                fetched_count=fetched_count,
-                saved_count=saved_count,
-                error_message=f"Storage error: {str(e)}",
-                target_date=target_date,
-                code=code,
+            return self._build_result(
+                stats, started_at, target_date, code, f"Storage error: {str(e)}"
             )
 
         except Exception as e:
             self._logger.error(f"Unexpected error occurred: {str(e)}")
-            return FetchJQuantsListedInfoResult(
-                success=False,
-                fetched_count=fetched_count,
-                saved_count=saved_count,
-                error_message=f"Unexpected error: {str(e)}",
-                target_date=target_date,
-                code=code,
+            return self._build_result(
+                stats, started_at, target_date, code, f"Unexpected error: {str(e)}"
             )
 
-    async def fetch_and_update_all(self, target_date: Optional[date] = None) -> FetchJQuantsListedInfoResult:
+    async def _run_pipeline(
+        self,
+        pages: AsyncIterator[ListedInfoPage],
+        stats: _PipelineStats,
+        on_checkpoint: Optional[_PageCallback] = None,
+        digest_builder: Optional[SnapshotDigestBuilder] = None,
+        listed_codes: Optional[Set[str]] = None,
+    ) -> None:
+        """取得ステージと変換・保存ステージを並行に実行
+
+        取得済みで未保存のページは最大 ``pipeline_depth`` 件までキューに保持され、
+        保存が追いつかない場合は取得側が待機する（バックプレッシャー）。
+
+        Args:
+            pages: ページ単位の API レスポンス
+            stats: 件数と所要時間の集計先
+            on_checkpoint: ページ単位の保存完了を通知するコールバック
+            digest_builder: 受信したレコードを追加するダイジェスト（任意）
+            listed_codes: 受信したレコードの銘柄コードの追加先（任意）
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self._pipeline_depth)
+        producer = asyncio.create_task(self._produce_pages(pages, queue, stats))
+
+        try:
+            await self._consume_pages(queue, stats, on_checkpoint, digest_builder, listed_codes)
+        finally:
+            if not producer.done():
+                producer.cancel()
+            try:
+                await producer
+            except asyncio.CancelledError:
+                pass
+
+    async def _produce_pages(
+        self,
+        pages: AsyncIterator[ListedInfoPage],
+        queue: asyncio.Queue,
+        stats: _PipelineStats,
+    ) -> None:
+        """取得ステージ: ページを受信してキューに投入する"""
+        iterator = pages.__aiter__()
+        try:
+            while True:
+                fetch_started = time.perf_counter()
+                try:
+                    page = await iterator.__anext__()
+                except StopAsyncIteration:
+                    break
+                finally:
+                    stats.fetch_seconds += time.perf_counter() - fetch_started
+
+                stats.fetched_count += len(page)
+                await queue.put(page)
+        except asyncio.CancelledError:
+            raise
+        except BaseException as e:
+            # 例外は保存ステージへ渡して execute のエラーハンドリングに委ねる
+            await queue.put(e)
+            if isinstance(e, SoftTimeLimitExceeded):
+                # 時間制限は取得ステージのタスクからも送出し、_run_pipeline で握りつぶさない
+                raise
+            return
+
+        await queue.put(_END_OF_PAGES)
+
+    async def _consume_pages(
+        self,
+        queue: asyncio.Queue,
+        stats: _PipelineStats,
+        on_checkpoint: Optional[_PageCallback] = None,
+        digest_builder: Optional[SnapshotDigestBuilder] = None,
+        listed_codes: Optional[Set[str]] = None,
+    ) -> None:
+        """変換・保存ステージ: キューからページを取り出しバッチ単位で保存する
+
+        バッチとページの境界は一致しないため、各ページの末尾が何件目かを記録し、
+        そこまで保存し終えた時点でそのページの次ページのキーを通知する。
+        """
+        # エンティティ、または row_fast_path の場合は保存用の行
+        pending: List[Any] = []
+        batch_number = 0
+        first_page = True
+        # (ページ末尾の累積件数, 次ページのキー)
+        page_marks: Deque[Tuple[int, Optional[str]]] = deque()
+        received_count = 0
+
+        while True:
+            item = await queue.get()
+            if item is _END_OF_PAGES:
+                break
+            if isinstance(item, BaseException):
+                raise item
+
+            if item and first_page:
+                # デバッグ用に API レスポンスの一部をログ出力
+                self._logger.debug(f"First API response: {item[0]}")
+                first_page = False
+
+            transform_started = time.perf_counter()
+            if digest_builder is not None:
+                _add_to_digest(digest_builder, item)
+            if listed_codes is not None:
+                listed_codes.update(data["Code"] for data in item)
+            if self._row_fast_path:
+                # 検証して保存用の行に直接変換
+                pending.extend(ListedInfoFactory.rows_from_jquants_response(item))
+            else:
+                # DTO を経由してエンティティに変換
+                pending.extend(
+                    JQuantsListedInfoDTO.from_api_response(data).to_entity()
+                    for data in item
+                )
+            stats.transform_seconds += time.perf_counter() - transform_started
+
+            received_count += len(item)
+            if on_checkpoint is not None:
+                page_marks.append((received_count, item.next_pagination_key))
+
+            while len(pending) >= self.BATCH_SIZE:
+                batch = pending[: self.BATCH_SIZE]
+                del pending[: self.BATCH_SIZE]
+                batch_number += 1
+                await self._save_batch(batch, batch_number, stats)
+                await self._notify_checkpoint(page_marks, stats, on_checkpoint)
+
+        if pending:
+            batch_number += 1
+            await self._save_batch(pending, batch_number, stats)
+        await self._notify_checkpoint(page_marks, stats, on_checkpoint)
+
+    @staticmethod
+    async def _notify_checkpoint(
+        page_marks: Deque[Tuple[int, Optional[str]]],
+        stats: _PipelineStats,
+        on_checkpoint: Optional[_PageCallback],
+    ) -> None:
+        """保存し終えたページのうち最後のものの次ページのキーを通知する"""
+        if on_checkpoint is None:
+            return
+
+        durable: Optional[Tuple[int, Optional[str]]] = None
+        while page_marks and page_marks[0][0] <= stats.saved_count:
+            mark = page_marks.popleft()
+            # 最終ページ（キーなし）の完了は呼び出し側が結果で判断する
+            if mark[1]:
+                durable = mark
+
+        if durable is not None:
+            await on_checkpoint(durable[1], durable[0])
+
+    async def _save_batch(
+        self,
+        batch: List[Any],
+        batch_number: int,
+        stats: _PipelineStats,
+    ) -> None:
+        """1 バッチ分のエンティティ（row_fast_path の場合は行）を保存
+
+        Args:
+            batch: 保存するエンティティまたは行のリスト
+            batch_number: バッチ番号（ログ出力用）
+            stats: 件数と所要時間の集計先
+        """
+        save_started = time.perf_counter()
+        try:
+            if self._row_fast_path:
+                result = await self._listed_info_repository.save_rows(batch)
+            else:
+                result = await self._listed_info_repository.save_all(batch)
+        finally:
+            stats.save_seconds += time.perf_counter() - save_started
+        stats.saved_count += len(batch)
+        if isinstance(result, ListedInfoSaveResult):
+            stats.save_result += result
+        self._logger.info(f"Saved batch {batch_number} - {len(batch)} records")
+
+    async def publish_events(self, result: FetchJQuantsListedInfoResult) -> None:
+        """execute の結果に保持したイベントを発行する（失敗しても処理は継続）
+
+        保存したデータを読む購読者に未コミットの状態を見せないよう、
+        execute のトランザクションをコミットした後に呼び出す。
+        """
+        if self._event_publisher is None or not result.events:
+            return
+
+        try:
+            await self._event_publisher.publish_batch(list(result.events))
+        except Exception as e:
+            self._logger.warning(f"Failed to publish listed info events: {str(e)}")
+
+    def _stored_events(self, stats: _PipelineStats, target_date: Optional[date]) -> List[DomainEvent]:
+        """保存件数の ListedInfoStored イベント"""
+        if self._event_publisher is None or stats.saved_count == 0:
+            return []
+
+        return [
+            ListedInfoStored(
+                store_date=target_date or date.today(),
+                count=stats.saved_count,
+                new_count=stats.save_result.inserted_count,
+                updated_count=stats.save_result.updated_count,
+            )
+        ]
+
+    async def _detect_listing_changes(self, target_date: date) -> List[DomainEvent]:
+        """直前のスナップショットとの差分の変更イベント（失敗しても処理は継続）"""
+        if self._event_publisher is None:
+            return []
+
+        try:
+            previous_date = await self._listed_info_repository.find_previous_snapshot_date(
+                target_date
+            )
+            if previous_date is None:
+                return []
+
+            frame = await self._listed_info_repository.find_frame_by_dates(
+                [previous_date, target_date]
+            )
+            events = ListedInfoDiffEngine.detect(
+                frame.on(previous_date), frame.on(target_date), target_date
+            )
+            self._logger.info(
+                f"Detected {max(len(events) - 1, 0)} listing changes "
+                f"between {previous_date} and {target_date}"
+            )
+            return list(events)
+        except Exception as e:
+            self._logger.warning(f"Failed to detect listing changes: {str(e)}")
+            return []
+
+    @staticmethod
+    async def _buffer_pages(
+        pages: AsyncIterator[ListedInfoPage], stats: _PipelineStats, stored_count: int
+    ) -> Tuple[Deque[ListedInfoPage], Optional[AsyncIterator[ListedInfoPage]]]:
+        """保存済みのスナップショットと比較するためにページを受信して保持する
+
+        受信件数が保存済みの件数を超えた時点で内容が変わったと判断できるため、
+        残りのページは受信せずに返す。
+
+        Returns:
+            保持したページと、残りのページ（全ページを受信した場合は None）
+        """
+        buffered: Deque[ListedInfoPage] = deque()
+        iterator = pages.__aiter__()
+        fetch_started = time.perf_counter()
+        try:
+            async for page in iterator:
+                buffered.append(page)
+                stats.fetched_count += len(page)
+                if stats.fetched_count > stored_count:
+                    return buffered, iterator
+        finally:
+            stats.fetch_seconds += time.perf_counter() - fetch_started
+        return buffered, None
+
+    @staticmethod
+    async def _replay_pages(
+        buffered: Deque[ListedInfoPage], rest: Optional[AsyncIterator[ListedInfoPage]] = None
+    ) -> AsyncIterator[ListedInfoPage]:
+        """保持したページ、続けて残りのページをパイプラインに流す
+
+        保持したページはパイプラインに渡した時点で手放し、保存が進むにつれてメモリを解放する。
+        """
+        while buffered:
+            yield buffered.popleft()
+        if rest is not None:
+            async for page in rest:
+                yield page
+
+    async def _fetch_single_page(
+        self, code: str, date_param: Optional[str]
+    ) -> AsyncIterator[ListedInfoPage]:
+        """特定銘柄のレスポンスを 1 ページとして扱う"""
+        yield ListedInfoPage(await self._jquants_client.get_listed_info(code=code, date=date_param))
+
+    @staticmethod
+    def _build_result(
+        stats: _PipelineStats,
+        started_at: float,
+        target_date: Optional[date],
+        code: Optional[str],
+        error_message: Optional[str] = None,
+        snapshot_unchanged: bool = False,
+        events: Optional[List[DomainEvent]] = None,
+    ) -> FetchJQuantsListedInfoResult:
+        """集計結果から処理結果 DTO を作成"""
+        return FetchJQuantsListedInfoResult(
+            success=error_message is None,
+            fetched_count=stats.fetched_count,
+            saved_count=stats.saved_count,
+            error_message=error_message,
+            target_date=target_date,
+            code=code,
+            fetch_seconds=stats.fetch_seconds,
+            transform_seconds=stats.transform_seconds,
+            save_seconds=stats.save_seconds,
+            elapsed_seconds=time.perf_counter() - started_at,
+            inserted_count=stats.save_result.inserted_count,
+            updated_count=stats.save_result.updated_count,
+            unchanged_count=stats.save_result.unchanged_count,
+            snapshot_unchanged=snapshot_unchanged,
+            events=events or [],
+        )
+
+    async def fetch_and_update_all(
+        self,
+        target_date: Optional[date] = None,
+        resume_pagination_key: Optional[str] = None,
+        on_checkpoint: Optional[CheckpointCallback] = None,
+        resume_progress: Optional[SnapshotProgress] = None,
+    ) -> FetchJQuantsListedInfoResult:
         """全銘柄の上場情報を取得して更新
 
         Args:
             target_date: 基準日（指定しない場合は最新）
+            resume_pagination_key: 途中のページから再開する場合のキー
+            on_checkpoint: ページ単位の保存完了を通知するコールバック
+            resume_progress: 再開するページまでのスナップショットの途中経過
 
         Returns:
             FetchJQuantsListedInfoResult: 処理結果
         """
-        return await self.execute(code=None, target_date=target_date)
+        return await self.execute(
+            code=None,
+            target_date=target_date,
+            resume_pagination_key=resume_pagination_key,
+            on_checkpoint=on_checkpoint,
+            resume_progress=resume_progress,
+        )
 
     async def fetch_by_code(self, code: str, target_date: Optional[date] = None) -> FetchJQuantsListedInfoResult:
         """特定銘柄の上場情報を取得
@@ -183,4 +669,4 @@ class FetchJQuantsListedInfoUseCase:
         Returns:
             FetchJQuantsListedInfoResult: 処理結果
         """
-        return await self.execute(code=code, target_date=target_date)
\ No newline at end of file
+        return await self.execute(code=code, target_date=target_date)
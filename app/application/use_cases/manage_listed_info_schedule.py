@@ -294,10 +294,11 @@ class ManageListedInfoScheduleUseCase:
         if enabled_only:
             schedules = [s for s in schedules if s.enabled]
         
-        # 次回実行時刻を計算して追加
+        # 次回実行時刻を計算して追加（基準時刻はすべてのスケジュールで共通）
+        now = datetime.now()
         for schedule in schedules:
             try:
-                schedule.next_run_at = get_next_run_time(schedule.cron_expression)
+                schedule.next_run_at = get_next_run_time(schedule.cron_expression, now)
             except Exception:
                 schedule.next_run_at = None
         
@@ -0,0 +1,83 @@
+"""上場銘柄情報参照ユースケース"""
+from datetime import date
+from typing import List, Optional, Tuple
+
+from app.application.dtos.jquants_listed_info_dto import (
+    JQuantsListedInfoDTO,
+    JQuantsListedInfoSearchCriteria,
+)
+from app.domain.entities.jquants_listed_info import JQuantsListedInfo
+from app.domain.repositories.jquants_listed_info_repository_interface import (
+    JQuantsListedInfoRepositoryInterface,
+)
+from app.domain.services.listed_info_universe import ListedInfoUniverse
+from app.domain.value_objects.stock_code import StockCode
+
+
+class QueryListedInfoUseCase:
+    """保存済みの上場銘柄情報を参照するユースケース"""
+
+    def __init__(self, listed_info_repository: JQuantsListedInfoRepositoryInterface) -> None:
+        """
+        Args:
+            listed_info_repository: 上場銘柄情報リポジトリ
+        """
+        self._listed_info_repository = listed_info_repository
+
+    async def search(
+        self,
+        criteria: JQuantsListedInfoSearchCriteria,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> Tuple[List[JQuantsListedInfoDTO], int]:
+        """指定日の上場銘柄情報を条件で絞り込んで取得する
+
+        日付ごとのスナップショットを取得し、市場・業種・規模で絞り込む。
+
+        Args:
+            criteria: 検索条件（date は必須）
+            offset: 取得開始位置
+            limit: 最大件数（None の場合はすべて）
+
+        Returns:
+            (銘柄コード順の DTO のリスト, 絞り込み後の総件数)
+
+        Raises:
+            ValueError: 日付が指定されていない場合
+        """
+        if criteria.date is None:
+            raise ValueError("date is required to search listed info")
+
+        listed_infos = await self._listed_info_repository.find_all_by_date(criteria.date)
+        listed_infos = self._filter(listed_infos, criteria)
+        listed_infos.sort(key=lambda info: info.code.value)
+
+        end = None if limit is None else offset + limit
+        return [JQuantsListedInfoDTO.from_entity(info) for info in listed_infos[offset:end]], len(
+            listed_infos
+        )
+
+    @staticmethod
+    def _filter(
+        listed_infos: List[JQuantsListedInfo], criteria: JQuantsListedInfoSearchCriteria
+    ) -> List[JQuantsListedInfo]:
+        """検索条件で絞り込む（内部メソッド）"""
+        return ListedInfoUniverse(listed_infos).filter(
+            codes=[StockCode(criteria.code)] if criteria.code is not None else None,
+            market_code=criteria.market_code,
+            sector_17_code=criteria.sector_17_code,
+            sector_33_code=criteria.sector_33_code,
+            scale_category=criteria.scale_category,
+        )
+
+    async def get_by_code(self, code: str, target_date: date) -> Optional[JQuantsListedInfoDTO]:
+        """銘柄コードと日付で取得する"""
+        listed_info = await self._listed_info_repository.find_by_code_and_date(
+            StockCode(code), target_date
+        )
+        return JQuantsListedInfoDTO.from_entity(listed_info) if listed_info else None
+
+    async def get_latest_by_code(self, code: str) -> Optional[JQuantsListedInfoDTO]:
+        """銘柄コードで最新の情報を取得する"""
+        listed_info = await self._listed_info_repository.find_latest_by_code(StockCode(code))
+        return JQuantsListedInfoDTO.from_entity(listed_info) if listed_info else None
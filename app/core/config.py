@@ -80,6 +80,12 @@ class Settings(BaseSettings):
     celery_beat_min_sync_interval: int = Field(
         default=5, description="Minimum sync interval in seconds"
     )
+    celery_beat_full_sync_interval: int = Field(
+        default=3600, description="Interval in seconds for full schedule reloads (also prunes old tombstones)"
+    )
+    celery_beat_last_run_flush_interval: float = Field(
+        default=5.0, description="Interval in seconds for writing buffered last_run_at updates"
+    )
     celery_beat_redis_channel: str = Field(
         default="celery_beat_schedule_updates", description="Redis channel for schedule updates"
     )
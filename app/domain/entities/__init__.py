@@ -1,12 +1,16 @@
 """ドメインエンティティ"""
 from .auth import RefreshToken
+from .backfill_checkpoint import BackfillCheckpoint
 from .jquants_listed_info import JQuantsListedInfo
 from .schedule import Schedule
+from .snapshot_digest import SnapshotDigest
 from .task_log import TaskExecutionLog
 
 __all__ = [
     "RefreshToken",
+    "BackfillCheckpoint",
     "JQuantsListedInfo",
     "Schedule",
+    "SnapshotDigest",
     "TaskExecutionLog",
 ]
\ No newline at end of file
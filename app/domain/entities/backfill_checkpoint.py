@@ -0,0 +1,24 @@
+"""Backfill checkpoint entity."""
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import List, Optional
+
+
+@dataclass
+class BackfillCheckpoint:
+    """Progress of one target date within a backfill task.
+
+    Celery の自動リトライでは同じ task_id で再実行されるため、
+    task_id と対象日の組で進捗を記録し、再実行時に再開位置として使用する。
+    """
+
+    task_id: str
+    target_date: date
+    completed: bool = False
+    pagination_key: Optional[str] = None  # 保存済みページの次ページのキー
+    fetched_count: int = 0
+    saved_count: int = 0
+    # 全銘柄のスナップショットを再開後に確定するための、保存済みページまでの途中経過
+    listed_codes: Optional[List[str]] = None
+    digest_state: Optional[bytes] = None
+    updated_at: Optional[datetime] = None
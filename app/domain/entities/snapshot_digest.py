@@ -0,0 +1,22 @@
+"""Snapshot digest entity."""
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Optional
+
+# 上場銘柄情報（jquants_listed_info）のスナップショットのデータセット名
+LISTED_INFO_DATASET = "jquants_listed_info"
+
+
+@dataclass
+class SnapshotDigest:
+    """Content digest of one dataset snapshot (dataset, date).
+
+    前回保存したスナップショットと同じ内容を再取得した場合に、
+    書き込みを省略するために使用する。
+    """
+
+    dataset: str
+    target_date: date
+    digest: str  # 正規化したレコード群の SHA-256（16 進）
+    record_count: int = 0
+    updated_at: Optional[datetime] = None
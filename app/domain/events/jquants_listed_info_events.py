@@ -187,6 +187,36 @@ class SectorChangeDetected(DomainEvent):
         return base_dict
 
 
+@dataclass(frozen=True)
+class MarginChangeDetected(DomainEvent):
+    """信用区分変更検出イベント"""
+    
+    code: StockCode
+    company_name: str
+    old_margin_code: Optional[str]
+    new_margin_code: Optional[str]
+    old_margin_name: Optional[str]
+    new_margin_name: Optional[str]
+    change_date: date
+    
+    @property
+    def event_type(self) -> str:
+        return "listed_info.margin_change_detected"
+    
+    def to_dict(self) -> Dict[str, Any]:
+        base_dict = super().to_dict()
+        base_dict.update({
+            "code": self.code.value,
+            "company_name": self.company_name,
+            "old_margin_code": self.old_margin_code,
+            "new_margin_code": self.new_margin_code,
+            "old_margin_name": self.old_margin_name,
+            "new_margin_name": self.new_margin_name,
+            "change_date": self.change_date.isoformat(),
+        })
+        return base_dict
+
+
 @dataclass(frozen=True)
 class ListedInfoBulkChangesDetected(DomainEvent):
     """上場銘柄情報一括変更検出イベント"""
@@ -197,6 +227,7 @@ class ListedInfoBulkChangesDetected(DomainEvent):
     market_changes: List[str] = field(default_factory=list)
     name_changes: List[str] = field(default_factory=list)
     sector_changes: List[str] = field(default_factory=list)
+    margin_changes: List[str] = field(default_factory=list)
     
     @property
     def event_type(self) -> str:
@@ -211,12 +242,14 @@ class ListedInfoBulkChangesDetected(DomainEvent):
             "market_changes": self.market_changes,
             "name_changes": self.name_changes,
             "sector_changes": self.sector_changes,
+            "margin_changes": self.margin_changes,
             "total_changes": (
                 len(self.new_listings) + 
                 len(self.delistings) + 
                 len(self.market_changes) + 
                 len(self.name_changes) +
-                len(self.sector_changes)
+                len(self.sector_changes) +
+                len(self.margin_changes)
             ),
         })
         return base_dict
\ No newline at end of file
@@ -1,4 +1,5 @@
 """J-Quants API 関連の例外定義"""
+from typing import Optional
 
 from app.domain.exceptions.base import DomainException
 
@@ -30,7 +31,14 @@ class NetworkError(JQuantsException):
 class RateLimitError(JQuantsException):
     """レート制限エラー"""
 
-    pass
+    def __init__(self, message: str = "Rate limit exceeded", retry_after: Optional[float] = None):
+        """
+        Args:
+            message: エラーメッセージ
+            retry_after: サーバーが指定した再試行までの秒数（Retry-After ヘッダー）
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
 
 
 class StorageError(JQuantsException):
@@ -1,10 +1,46 @@
 """Listed info factory for creating entities from external data."""
-from datetime import datetime
-from typing import List
+from datetime import date, datetime
+from typing import Any, Dict, List
 
 from app.domain.entities.jquants_listed_info import JQuantsListedInfo
+from app.domain.services.listed_info_frame import ListedInfoRow
 from app.domain.value_objects.stock_code import StockCode
 
+# 会社名以降の任意項目の API のキー（ATTRIBUTE_COLUMNS の順）
+_OPTIONAL_KEYS = (
+    "CompanyNameEnglish",
+    "Sector17Code",
+    "Sector17CodeName",
+    "Sector33Code",
+    "Sector33CodeName",
+    "ScaleCategory",
+    "MarketCode",
+    "MarketCodeName",
+    "MarginCode",
+    "MarginCodeName",
+)
+
+
+def _parse_date(date_str: str) -> date:
+    """YYYYMMDD または YYYY-MM-DD 形式の日付を解析する
+
+    ASCII 数字のみで構成された形式は fromisoformat で解析し、
+    それ以外は from_jquants_response と同じ strptime で解析する（同じ例外になる）。
+    """
+    if len(date_str) == 8:  # YYYYMMDD 形式
+        if date_str.isascii() and date_str.isdigit():
+            return date.fromisoformat(date_str)
+        return datetime.strptime(date_str, "%Y%m%d").date()
+    if (
+        len(date_str) == 10
+        and date_str[4] == "-"
+        and date_str[7] == "-"
+        and date_str.isascii()
+        and (date_str[:4] + date_str[5:7] + date_str[8:]).isdigit()
+    ):
+        return date.fromisoformat(date_str)
+    return datetime.strptime(date_str, "%Y-%m-%d").date()
+
 
 class ListedInfoFactory:
     """J-Quants API レスポンスから JQuantsListedInfo エンティティを生成"""
@@ -48,4 +84,34 @@ class ListedInfoFactory:
         return [
             ListedInfoFactory.from_jquants_response(data)
             for data in data_list
-        ]
\ No newline at end of file
+        ]
+
+    @staticmethod
+    def row_from_jquants_response(data: Dict[str, Any]) -> ListedInfoRow:
+        """J-Quants API のレスポンスを保存用の行に変換
+
+        from_jquants_response と同じ検証（日付の形式、銘柄コードの形式、会社名の必須）を行い、
+        エンティティを作成せずに (date, code, *ATTRIBUTE_COLUMNS) の順のタプルを返す。
+
+        Args:
+            data: J-Quants API のレスポンスデータ
+
+        Returns:
+            保存用の行
+
+        Raises:
+            KeyError: 必須項目（Date・Code・CompanyName）がない場合
+            ValueError: 値が不正な場合
+        """
+        listing_date = _parse_date(data["Date"])
+        code = data["Code"]
+        StockCode.validate(code)
+        company_name = data["CompanyName"]
+        if not company_name:
+            raise ValueError("会社名は必須です")
+        return (listing_date, code, company_name, *map(data.get, _OPTIONAL_KEYS))
+
+    @staticmethod
+    def rows_from_jquants_response(data_list: List[Dict[str, Any]]) -> List[ListedInfoRow]:
+        """複数の J-Quants API レスポンスを保存用の行に変換"""
+        return [ListedInfoFactory.row_from_jquants_response(data) for data in data_list]
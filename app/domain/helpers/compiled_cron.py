@@ -0,0 +1,156 @@
+"""コンパイル済み cron 式モジュール"""
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import List
+
+import numpy as np
+from croniter import croniter
+
+# キャッシュするコンパイル済み cron 式の数
+CRON_CACHE_SIZE = 1024
+
+_MINUTES_PER_DAY = 24 * 60
+# 次回実行時刻を探す最長の期間（日数、閏年の周期を含む 28 年）
+_MAX_SEARCH_DAYS = 28 * 366
+# 一度に評価する日数の上限
+_MAX_CHUNK_DAYS = 4096
+# 1970-01-01 の曜日（日曜日 = 0）
+_EPOCH_WEEKDAY = 4
+
+
+def _mask(values: list, size: int, offset: int = 0) -> np.ndarray:
+    """展開済みフィールドの値のブール配列（'*' はすべて True）"""
+    mask = np.zeros(size, dtype=bool)
+    if values == ["*"]:
+        mask[offset:] = True
+    else:
+        mask[values] = True
+    return mask
+
+
+@dataclass(frozen=True, eq=False)
+class CompiledCron:
+    """解析済みの 5 フィールドの cron 式
+
+    各フィールドを展開した結果を保持し、次回以降の実行時刻を
+    日付と時刻の格子から numpy でまとめて求める。
+    L（月末）や #（第 n 曜日）、タイムゾーン付き（UTC 以外）の基準時刻は
+    croniter で計算する。
+    """
+
+    expression: str
+    # 1 日の中の実行時刻（0 時からの分、昇順）
+    times_of_day: np.ndarray
+    month_mask: np.ndarray
+    day_mask: np.ndarray
+    weekday_mask: np.ndarray
+    # 日と曜日の両方が指定されている場合はどちらかに一致すれば実行する（cron の仕様）
+    day_or_weekday: bool
+    vectorizable: bool
+
+    def next_time(self, base: datetime) -> datetime:
+        """base より後の最初の実行時刻"""
+        return self.next_times(base, 1)[0]
+
+    def next_times(self, base: datetime, count: int) -> List[datetime]:
+        """base より後の実行時刻を count 件
+
+        Raises:
+            ValueError: 実行時刻が存在しない場合（例: "0 0 30 2 *"）
+        """
+        if count <= 0:
+            return []
+        if not self.vectorizable or base.tzinfo not in (None, timezone.utc):
+            cron = croniter(self.expression, base)
+            return [cron.get_next(datetime) for _ in range(count)]
+
+        start = base.replace(hour=0, minute=0, second=0, microsecond=0)
+        start_minute = base.hour * 60 + base.minute
+        first_day = np.datetime64(base.date(), "D")
+
+        found: List[np.ndarray] = []
+        remaining = count
+        offset = 0
+        last_found = 0
+        chunk = max(32, -(-count // len(self.times_of_day)) + 1)
+        while remaining > 0:
+            if offset - last_found > _MAX_SEARCH_DAYS:
+                raise ValueError(
+                    f"failed to find next date for cron expression: {self.expression}"
+                )
+            day_offsets = offset + np.arange(chunk)
+            day_offsets = day_offsets[self._matching_days(first_day + day_offsets)]
+            minutes = (day_offsets[:, None] * _MINUTES_PER_DAY + self.times_of_day[None, :]).ravel()
+            if offset == 0:
+                # 基準時刻の分ちょうどの実行は base より後ではない
+                minutes = minutes[minutes > start_minute]
+            if len(minutes):
+                found.append(minutes[:remaining])
+                remaining -= len(found[-1])
+                last_found = offset + chunk
+            offset += chunk
+            chunk = min(chunk * 2, max(chunk, _MAX_CHUNK_DAYS))
+
+        return [start + timedelta(minutes=minute) for minute in np.concatenate(found).tolist()]
+
+    def _matching_days(self, days: np.ndarray) -> np.ndarray:
+        """日付の配列のうち実行日であるもののブール配列"""
+        month_start = days.astype("datetime64[M]")
+        months = month_start.astype(np.int64) % 12 + 1
+        days_of_month = (days - month_start).astype(np.int64) + 1
+        weekdays = (days.astype(np.int64) + _EPOCH_WEEKDAY) % 7
+
+        day_match = self.day_mask[days_of_month]
+        weekday_match = self.weekday_mask[weekdays]
+        if self.day_or_weekday:
+            matched = day_match | weekday_match
+        else:
+            matched = day_match & weekday_match
+        return self.month_mask[months] & matched
+
+
+@lru_cache(maxsize=CRON_CACHE_SIZE)
+def compile_cron(expression: str) -> CompiledCron:
+    """cron 式を解析する（式の文字列ごとにキャッシュする）
+
+    Args:
+        expression: cron 形式の文字列（例: "0 9 * * *"）
+
+    Raises:
+        ValueError: 無効な cron 式の場合
+        TypeError: 文字列以外が指定された場合
+    """
+    if not isinstance(expression, str):
+        raise TypeError(f"cron expression must be a string, not {type(expression).__name__}")
+    fields, nth_weekdays = croniter.expand(expression)
+    # 検証は croniter と同じ規則で行う（expand は一部の不正な式を受け付ける）
+    croniter(expression)
+
+    vectorizable = len(fields) == 5 and not nth_weekdays and "l" not in fields[2]
+    if not vectorizable:
+        return CompiledCron(
+            expression=expression,
+            times_of_day=np.array([], dtype=np.int64),
+            month_mask=np.array([], dtype=bool),
+            day_mask=np.array([], dtype=bool),
+            weekday_mask=np.array([], dtype=bool),
+            day_or_weekday=False,
+            vectorizable=False,
+        )
+
+    minutes, hours, days, months, weekdays = fields
+    minute_values = range(60) if minutes == ["*"] else minutes
+    hour_values = range(24) if hours == ["*"] else hours
+    return CompiledCron(
+        expression=expression,
+        times_of_day=np.array(
+            sorted(hour * 60 + minute for hour in hour_values for minute in minute_values),
+            dtype=np.int64,
+        ),
+        month_mask=_mask(months, 13, offset=1),
+        day_mask=_mask(days, 32, offset=1),
+        weekday_mask=_mask(weekdays, 7),
+        day_or_weekday=days != ["*"] and weekdays != ["*"],
+        vectorizable=True,
+    )
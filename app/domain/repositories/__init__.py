@@ -1,11 +1,19 @@
 from .auth_repository_interface import AuthRepositoryInterface
-from .jquants_listed_info_repository_interface import JQuantsListedInfoRepositoryInterface
+from .backfill_checkpoint_repository_interface import BackfillCheckpointRepositoryInterface
+from .jquants_listed_info_repository_interface import (
+    JQuantsListedInfoRepositoryInterface,
+    ListedInfoSaveResult,
+)
 from .schedule_repository_interface import ScheduleRepositoryInterface
+from .snapshot_digest_repository_interface import SnapshotDigestRepositoryInterface
 from .task_log_repository_interface import TaskLogRepositoryInterface
 
 __all__ = [
     "AuthRepositoryInterface",
+    "BackfillCheckpointRepositoryInterface",
     "JQuantsListedInfoRepositoryInterface",
+    "ListedInfoSaveResult",
     "ScheduleRepositoryInterface",
+    "SnapshotDigestRepositoryInterface",
     "TaskLogRepositoryInterface",
 ]
\ No newline at end of file
@@ -0,0 +1,49 @@
+"""Backfill checkpoint repository interface."""
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Collection, Dict, Optional
+
+from app.domain.entities.backfill_checkpoint import BackfillCheckpoint
+
+
+class BackfillCheckpointRepositoryInterface(ABC):
+    """バックフィルのチェックポイントリポジトリのインターフェース
+
+    保存はトランザクションをコミットしない。取得したデータと同じトランザクションで
+    コミットすることで、データとチェックポイントの整合性を保つ。
+    """
+
+    @abstractmethod
+    async def get_by_task_id(self, task_id: str) -> Dict[date, BackfillCheckpoint]:
+        """タスクのチェックポイントを対象日ごとに取得"""
+        pass
+
+    @abstractmethod
+    async def save_progress(
+        self,
+        task_id: str,
+        target_date: date,
+        pagination_key: Optional[str],
+        fetched_count: int,
+        saved_count: int,
+        listed_codes: Optional[Collection[str]] = None,
+        digest_state: Optional[bytes] = None,
+    ) -> None:
+        """対象日の途中経過（次に取得するページのキーとスナップショットの途中経過）を保存"""
+        pass
+
+    @abstractmethod
+    async def mark_completed(
+        self,
+        task_id: str,
+        target_date: date,
+        fetched_count: int,
+        saved_count: int,
+    ) -> None:
+        """対象日の処理完了を記録"""
+        pass
+
+    @abstractmethod
+    async def delete_by_task_id(self, task_id: str) -> int:
+        """タスクのチェックポイントを削除し、削除件数を返す"""
+        pass
@@ -1,27 +1,90 @@
 """Listed info repository interface."""
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from datetime import date
-from typing import List, Optional
+from typing import Collection, List, Optional
 
 from app.domain.entities.jquants_listed_info import JQuantsListedInfo
+from app.domain.services.listed_info_frame import (
+    ATTRIBUTE_COLUMNS,
+    ListedInfoFrame,
+    ListedInfoFrameBuilder,
+    ListedInfoRow,
+)
 from app.domain.value_objects.stock_code import StockCode
 
 
+@dataclass(frozen=True)
+class ListedInfoSaveResult:
+    """上場銘柄情報の保存結果（件数）"""
+
+    inserted_count: int = 0
+    updated_count: int = 0
+    unchanged_count: int = 0
+
+    @property
+    def total_count(self) -> int:
+        """保存対象の総件数"""
+        return self.inserted_count + self.updated_count + self.unchanged_count
+
+    def __add__(self, other: "ListedInfoSaveResult") -> "ListedInfoSaveResult":
+        return ListedInfoSaveResult(
+            inserted_count=self.inserted_count + other.inserted_count,
+            updated_count=self.updated_count + other.updated_count,
+            unchanged_count=self.unchanged_count + other.unchanged_count,
+        )
+
+
 class JQuantsListedInfoRepositoryInterface(ABC):
     """上場銘柄情報リポジトリのインターフェース"""
 
     @abstractmethod
-    async def save_all(self, listed_infos: List[JQuantsListedInfo]) -> None:
+    async def save_all(
+        self, listed_infos: List[JQuantsListedInfo], only_changed: Optional[bool] = None
+    ) -> ListedInfoSaveResult:
         """複数の上場銘柄情報を保存
 
         Args:
             listed_infos: 保存する上場銘柄情報のリスト
+            only_changed: True の場合、既存行は業務項目に差分がある場合のみ更新する
+                （None の場合は実装の既定値）
+
+        Returns:
+            ListedInfoSaveResult: 新規・更新・変更なしの件数
 
         Raises:
             StorageError: 保存に失敗した場合
         """
         pass
 
+    async def save_rows(
+        self, rows: List[ListedInfoRow], only_changed: Optional[bool] = None
+    ) -> ListedInfoSaveResult:
+        """検証済みの行（ListedInfoFactory.row_from_jquants_response の結果）を保存
+
+        既定ではエンティティに変換して save_all を呼び出す。
+        行をそのまま書き込める実装では上書きする。
+
+        Args:
+            rows: (date, code, *ATTRIBUTE_COLUMNS) の順の行のリスト
+            only_changed: save_all と同じ
+
+        Returns:
+            ListedInfoSaveResult: 新規・更新・変更なしの件数
+
+        Raises:
+            StorageError: 保存に失敗した場合
+        """
+        return await self.save_all(
+            [
+                JQuantsListedInfo(
+                    date=row[0], code=StockCode(row[1]), **dict(zip(ATTRIBUTE_COLUMNS, row[2:]))
+                )
+                for row in rows
+            ],
+            only_changed=only_changed,
+        )
+
     @abstractmethod
     async def find_by_code_and_date(
         self, code: StockCode, target_date: date
@@ -85,4 +148,57 @@ class JQuantsListedInfoRepositoryInterface(ABC):
         Raises:
             StorageError: 削除に失敗した場合
         """
-        pass
\ No newline at end of file
+        pass
+
+    async def finalize_snapshot(self, target_date: date, listed_codes: Collection[str]) -> int:
+        """全銘柄分のスナップショットの保存完了を通知する
+
+        save_all はバッチ単位で呼ばれるため、スナップショットに含まれない銘柄
+        （上場廃止など）は全バッチの保存後にしか判定できない。
+        日付ごとに全件を保持する実装では何もしない。
+
+        Args:
+            target_date: スナップショットの基準日
+            listed_codes: スナップショットに含まれていた銘柄コード
+
+        Returns:
+            int: 基準日で有効期間を終了した銘柄数
+        """
+        return 0
+
+    async def find_frame_by_dates(self, target_dates: Collection[date]) -> ListedInfoFrame:
+        """複数日付の全銘柄を列指向の ListedInfoFrame として検索
+
+        既定では日付ごとに find_all_by_date を呼び出す。
+        エンティティを経由せずに読み込める実装では上書きする。
+
+        Args:
+            target_dates: 基準日
+
+        Returns:
+            ListedInfoFrame: 日付・銘柄コード順の上場銘柄情報
+
+        Raises:
+            StorageError: 検索に失敗した場合
+        """
+        builder = ListedInfoFrameBuilder()
+        for target_date in sorted(set(target_dates)):
+            builder.extend_entities(await self.find_all_by_date(target_date))
+        return builder.build()
+
+    async def find_previous_snapshot_date(self, target_date: date) -> Optional[date]:
+        """target_date より前で最も新しいスナップショットの日付を検索
+
+        前回のスナップショットとの比較に使用する。既定では比較しない（None）。
+
+        Args:
+            target_date: 基準日
+
+        Returns:
+            date: 直前のスナップショットの日付
+            None: 直前のスナップショットがない場合
+
+        Raises:
+            StorageError: 検索に失敗した場合
+        """
+        return None
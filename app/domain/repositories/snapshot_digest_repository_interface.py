@@ -0,0 +1,33 @@
+"""Snapshot digest repository interface."""
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Optional
+
+from app.domain.entities.snapshot_digest import SnapshotDigest
+
+
+class SnapshotDigestRepositoryInterface(ABC):
+    """スナップショットのダイジェストリポジトリのインターフェース
+
+    保存はトランザクションをコミットしない。スナップショットのデータと同じ
+    トランザクションでコミットすることで、データとダイジェストの整合性を保つ。
+    """
+
+    @abstractmethod
+    async def get(self, dataset: str, target_date: date) -> Optional[SnapshotDigest]:
+        """データセットと日付のダイジェストを取得"""
+        pass
+
+    @abstractmethod
+    async def save(self, snapshot_digest: SnapshotDigest) -> None:
+        """ダイジェストを保存（既存の場合は更新）"""
+        pass
+
+    @abstractmethod
+    async def delete_range(self, dataset: str, start: date, end: date) -> int:
+        """start 以上 end 未満の日付のダイジェストを削除し、削除件数を返す
+
+        スナップショットのデータを削除した場合に呼び出し、再取得した同じ内容の
+        スナップショットが「変更なし」として書き込みを省略されないようにする。
+        """
+        pass
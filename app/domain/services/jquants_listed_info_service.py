@@ -1,20 +1,35 @@
 """Listed info domain service."""
 from datetime import date
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Sequence, Set
 
 from app.domain.entities.jquants_listed_info import JQuantsListedInfo
+from app.domain.services.listed_info_universe import ListedInfoUniverse
 from app.domain.value_objects.stock_code import StockCode
 
 
+# JQuantsListedInfo の判定メソッドと同じ値
+PRIME_MARKET_CODE = "0111"
+STANDARD_MARKET_CODE = "0112"
+GROWTH_MARKET_CODE = "0113"
+MARGINABLE_CODE = "1"
+LARGE_CAP_CATEGORY = "TOPIX Large70"
+MID_CAP_CATEGORY = "TOPIX Mid400"
+SMALL_CAP_CATEGORY = "TOPIX Small"
+
+
 class ListedInfoService:
     """Listed info domain service.
     
     上場銘柄情報に関するドメインロジックを集約
+
+    絞り込み・検索・グループ化は ListedInfoUniverse に委譲する。
+    同じスナップショットを繰り返し絞り込む場合は ListedInfoUniverse を作成して渡すと、
+    索引が再利用され該当件数に比例するコストで済む。
     """
     
     @staticmethod
     def filter_by_market(
-        listed_infos: List[JQuantsListedInfo],
+        listed_infos: Sequence[JQuantsListedInfo],
         market_code: str
     ) -> List[JQuantsListedInfo]:
         """市場コードで上場銘柄をフィルタリング
@@ -26,10 +41,10 @@ class ListedInfoService:
         Returns:
             該当市場の上場銘柄リスト
         """
-        return [info for info in listed_infos if info.market_code == market_code]
+        return ListedInfoUniverse.of(listed_infos).filter(market_code=market_code)
     
     @staticmethod
-    def filter_prime_market(listed_infos: List[JQuantsListedInfo]) -> List[JQuantsListedInfo]:
+    def filter_prime_market(listed_infos: Sequence[JQuantsListedInfo]) -> List[JQuantsListedInfo]:
         """プライム市場の銘柄をフィルタリング
         
         Args:
@@ -38,10 +53,10 @@ class ListedInfoService:
         Returns:
             プライム市場の上場銘柄リスト
         """
-        return [info for info in listed_infos if info.is_prime_market()]
+        return ListedInfoUniverse.of(listed_infos).filter(market_code=PRIME_MARKET_CODE)
     
     @staticmethod
-    def filter_standard_market(listed_infos: List[JQuantsListedInfo]) -> List[JQuantsListedInfo]:
+    def filter_standard_market(listed_infos: Sequence[JQuantsListedInfo]) -> List[JQuantsListedInfo]:
         """スタンダード市場の銘柄をフィルタリング
         
         Args:
@@ -50,10 +65,10 @@ class ListedInfoService:
         Returns:
             スタンダード市場の上場銘柄リスト
         """
-        return [info for info in listed_infos if info.is_standard_market()]
+        return ListedInfoUniverse.of(listed_infos).filter(market_code=STANDARD_MARKET_CODE)
     
     @staticmethod
-    def filter_growth_market(listed_infos: List[JQuantsListedInfo]) -> List[JQuantsListedInfo]:
+    def filter_growth_market(listed_infos: Sequence[JQuantsListedInfo]) -> List[JQuantsListedInfo]:
         """グロース市場の銘柄をフィルタリング
         
         Args:
@@ -62,11 +77,11 @@ class ListedInfoService:
         Returns:
             グロース市場の上場銘柄リスト
         """
-        return [info for info in listed_infos if info.is_growth_market()]
+        return ListedInfoUniverse.of(listed_infos).filter(market_code=GROWTH_MARKET_CODE)
     
     @staticmethod
     def filter_by_sector_17(
-        listed_infos: List[JQuantsListedInfo],
+        listed_infos: Sequence[JQuantsListedInfo],
         sector_code: str
     ) -> List[JQuantsListedInfo]:
         """17 業種コードで銘柄をフィルタリング
@@ -78,11 +93,11 @@ class ListedInfoService:
         Returns:
             該当業種の上場銘柄リスト
         """
-        return [info for info in listed_infos if info.belongs_to_sector_17(sector_code)]
+        return ListedInfoUniverse.of(listed_infos).filter(sector_17_code=sector_code)
     
     @staticmethod
     def filter_by_sector_33(
-        listed_infos: List[JQuantsListedInfo],
+        listed_infos: Sequence[JQuantsListedInfo],
         sector_code: str
     ) -> List[JQuantsListedInfo]:
         """33 業種コードで銘柄をフィルタリング
@@ -94,10 +109,10 @@ class ListedInfoService:
         Returns:
             該当業種の上場銘柄リスト
         """
-        return [info for info in listed_infos if info.belongs_to_sector_33(sector_code)]
+        return ListedInfoUniverse.of(listed_infos).filter(sector_33_code=sector_code)
     
     @staticmethod
-    def filter_marginable(listed_infos: List[JQuantsListedInfo]) -> List[JQuantsListedInfo]:
+    def filter_marginable(listed_infos: Sequence[JQuantsListedInfo]) -> List[JQuantsListedInfo]:
         """信用取引可能な銘柄をフィルタリング
         
         Args:
@@ -106,11 +121,11 @@ class ListedInfoService:
         Returns:
             信用取引可能な上場銘柄リスト
         """
-        return [info for info in listed_infos if info.is_marginable()]
+        return ListedInfoUniverse.of(listed_infos).filter(margin_code=MARGINABLE_CODE)
     
     @staticmethod
     def filter_by_scale(
-        listed_infos: List[JQuantsListedInfo],
+        listed_infos: Sequence[JQuantsListedInfo],
         scale_category: str
     ) -> List[JQuantsListedInfo]:
         """規模カテゴリで銘柄をフィルタリング
@@ -122,10 +137,10 @@ class ListedInfoService:
         Returns:
             該当規模の上場銘柄リスト
         """
-        return [info for info in listed_infos if info.scale_category == scale_category]
+        return ListedInfoUniverse.of(listed_infos).filter(scale_category=scale_category)
     
     @staticmethod
-    def filter_large_cap(listed_infos: List[JQuantsListedInfo]) -> List[JQuantsListedInfo]:
+    def filter_large_cap(listed_infos: Sequence[JQuantsListedInfo]) -> List[JQuantsListedInfo]:
         """大型株をフィルタリング
         
         Args:
@@ -134,10 +149,10 @@ class ListedInfoService:
         Returns:
             大型株の上場銘柄リスト
         """
-        return [info for info in listed_infos if info.is_large_cap()]
+        return ListedInfoUniverse.of(listed_infos).filter(scale_category=LARGE_CAP_CATEGORY)
     
     @staticmethod
-    def filter_mid_cap(listed_infos: List[JQuantsListedInfo]) -> List[JQuantsListedInfo]:
+    def filter_mid_cap(listed_infos: Sequence[JQuantsListedInfo]) -> List[JQuantsListedInfo]:
         """中型株をフィルタリング
         
         Args:
@@ -146,10 +161,10 @@ class ListedInfoService:
         Returns:
             中型株の上場銘柄リスト
         """
-        return [info for info in listed_infos if info.is_mid_cap()]
+        return ListedInfoUniverse.of(listed_infos).filter(scale_category=MID_CAP_CATEGORY)
     
     @staticmethod
-    def filter_small_cap(listed_infos: List[JQuantsListedInfo]) -> List[JQuantsListedInfo]:
+    def filter_small_cap(listed_infos: Sequence[JQuantsListedInfo]) -> List[JQuantsListedInfo]:
         """小型株をフィルタリング
         
         Args:
@@ -158,11 +173,11 @@ class ListedInfoService:
         Returns:
             小型株の上場銘柄リスト
         """
-        return [info for info in listed_infos if info.is_small_cap()]
+        return ListedInfoUniverse.of(listed_infos).filter(scale_category=SMALL_CAP_CATEGORY)
     
     @staticmethod
     def find_by_code(
-        listed_infos: List[JQuantsListedInfo],
+        listed_infos: Sequence[JQuantsListedInfo],
         code: StockCode
     ) -> Optional[JQuantsListedInfo]:
         """銘柄コードで銘柄を検索
@@ -174,14 +189,14 @@ class ListedInfoService:
         Returns:
             該当する上場銘柄、見つからない場合は None
         """
-        for info in listed_infos:
-            if info.code == code:
-                return info
-        return None
+        if isinstance(listed_infos, ListedInfoUniverse):
+            return listed_infos.find_by_code(code)
+        # 一度だけの検索では索引を作成せずに走査する
+        return next((info for info in listed_infos if info.code == code), None)
     
     @staticmethod
     def find_by_codes(
-        listed_infos: List[JQuantsListedInfo],
+        listed_infos: Sequence[JQuantsListedInfo],
         codes: List[StockCode]
     ) -> List[JQuantsListedInfo]:
         """複数の銘柄コードで銘柄を検索
@@ -193,11 +208,10 @@ class ListedInfoService:
         Returns:
             該当する上場銘柄リスト
         """
-        code_set = set(codes)
-        return [info for info in listed_infos if info.code in code_set]
+        return ListedInfoUniverse.of(listed_infos).find_by_codes(codes)
     
     @staticmethod
-    def group_by_market(listed_infos: List[JQuantsListedInfo]) -> Dict[Optional[str], List[JQuantsListedInfo]]:
+    def group_by_market(listed_infos: Sequence[JQuantsListedInfo]) -> Dict[Optional[str], List[JQuantsListedInfo]]:
         """市場別に銘柄をグループ化
         
         Args:
@@ -206,16 +220,10 @@ class ListedInfoService:
         Returns:
             市場コードをキーとした上場銘柄の辞書
         """
-        grouped: Dict[Optional[str], List[JQuantsListedInfo]] = {}
-        for info in listed_infos:
-            market = info.market_code
-            if market not in grouped:
-                grouped[market] = []
-            grouped[market].append(info)
-        return grouped
+        return ListedInfoUniverse.of(listed_infos).group_by("market_code")
     
     @staticmethod
-    def group_by_sector_17(listed_infos: List[JQuantsListedInfo]) -> Dict[Optional[str], List[JQuantsListedInfo]]:
+    def group_by_sector_17(listed_infos: Sequence[JQuantsListedInfo]) -> Dict[Optional[str], List[JQuantsListedInfo]]:
         """17 業種別に銘柄をグループ化
         
         Args:
@@ -224,16 +232,10 @@ class ListedInfoService:
         Returns:
             17 業種コードをキーとした上場銘柄の辞書
         """
-        grouped: Dict[Optional[str], List[JQuantsListedInfo]] = {}
-        for info in listed_infos:
-            sector = info.sector_17_code
-            if sector not in grouped:
-                grouped[sector] = []
-            grouped[sector].append(info)
-        return grouped
+        return ListedInfoUniverse.of(listed_infos).group_by("sector_17_code")
     
     @staticmethod
-    def group_by_sector_33(listed_infos: List[JQuantsListedInfo]) -> Dict[Optional[str], List[JQuantsListedInfo]]:
+    def group_by_sector_33(listed_infos: Sequence[JQuantsListedInfo]) -> Dict[Optional[str], List[JQuantsListedInfo]]:
         """33 業種別に銘柄をグループ化
         
         Args:
@@ -242,16 +244,10 @@ class ListedInfoService:
         Returns:
             33 業種コードをキーとした上場銘柄の辞書
         """
-        grouped: Dict[Optional[str], List[JQuantsListedInfo]] = {}
-        for info in listed_infos:
-            sector = info.sector_33_code
-            if sector not in grouped:
-                grouped[sector] = []
-            grouped[sector].append(info)
-        return grouped
+        return ListedInfoUniverse.of(listed_infos).group_by("sector_33_code")
     
     @staticmethod
-    def extract_codes(listed_infos: List[JQuantsListedInfo]) -> List[StockCode]:
+    def extract_codes(listed_infos: Sequence[JQuantsListedInfo]) -> List[StockCode]:
         """銘柄コードのリストを抽出
         
         Args:
@@ -263,7 +259,7 @@ class ListedInfoService:
         return [info.code for info in listed_infos]
     
     @staticmethod
-    def extract_unique_codes(listed_infos: List[JQuantsListedInfo]) -> Set[StockCode]:
+    def extract_unique_codes(listed_infos: Sequence[JQuantsListedInfo]) -> Set[StockCode]:
         """重複のない銘柄コードのセットを抽出
         
         Args:
@@ -315,7 +311,7 @@ class ListedInfoService:
     
     @staticmethod
     def filter_by_date(
-        listed_infos: List[JQuantsListedInfo],
+        listed_infos: Sequence[JQuantsListedInfo],
         target_date: date
     ) -> List[JQuantsListedInfo]:
         """特定の日付の上場銘柄をフィルタリング
@@ -330,7 +326,7 @@ class ListedInfoService:
         return [info for info in listed_infos if info.date == target_date]
     
     @staticmethod
-    def get_latest_by_code(listed_infos: List[JQuantsListedInfo]) -> Dict[StockCode, JQuantsListedInfo]:
+    def get_latest_by_code(listed_infos: Sequence[JQuantsListedInfo]) -> Dict[StockCode, JQuantsListedInfo]:
         """各銘柄コードの最新の情報を取得
         
         Args:
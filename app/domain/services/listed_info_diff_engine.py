@@ -0,0 +1,226 @@
+"""Listed info snapshot diff engine."""
+from datetime import date
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from app.domain.events.base import DomainEvent
+from app.domain.events.jquants_listed_info_events import (
+    CompanyNameChangeDetected,
+    DelistingDetected,
+    ListedInfoBulkChangesDetected,
+    MarginChangeDetected,
+    MarketChangeDetected,
+    NewListingDetected,
+    SectorChangeDetected,
+)
+from app.domain.services.listed_info_frame import ListedInfoFrame, ListedInfoFrameDiff
+from app.domain.value_objects.stock_code import StockCode
+
+_SECTOR_COLUMNS = ("sector_17_code", "sector_33_code")
+
+
+def _values(frame: ListedInfoFrame, name: str, rows: np.ndarray) -> List[Optional[str]]:
+    """指定行の列の値（内部関数）"""
+    return frame.column(name).take(rows).decode().tolist()
+
+
+class ListedInfoDiffEngine:
+    """2 日分のスナップショットの差分から上場銘柄の変更イベントを生成する
+
+    比較は ListedInfoFrame の列単位で行い、イベントの生成だけを変更のあった銘柄について行う。
+    """
+
+    @staticmethod
+    def detect(
+        old: ListedInfoFrame,
+        new: ListedInfoFrame,
+        change_date: date,
+        include_bulk: bool = True,
+    ) -> List[DomainEvent]:
+        """スナップショットの変更をイベントとして検出
+
+        Args:
+            old: 比較元（前回）のスナップショット
+            new: 比較先（今回）のスナップショット
+            change_date: 変更日（通常は new の基準日）
+            include_bulk: 変更があった場合に ListedInfoBulkChangesDetected を末尾に追加する
+
+        Returns:
+            新規上場・上場廃止・市場・業種・会社名・信用区分の変更イベント
+
+        Raises:
+            ValueError: いずれかのスナップショットに同じ銘柄コードが複数含まれる場合
+        """
+        diff = old.diff(new)
+        events: List[DomainEvent] = []
+        events.extend(ListedInfoDiffEngine._new_listings(new, diff, change_date))
+        events.extend(ListedInfoDiffEngine._delistings(old, diff, change_date))
+        events.extend(ListedInfoDiffEngine._market_changes(old, new, diff, change_date))
+        events.extend(ListedInfoDiffEngine._sector_changes(old, new, diff, change_date))
+        events.extend(ListedInfoDiffEngine._name_changes(diff, change_date))
+        events.extend(ListedInfoDiffEngine._margin_changes(old, new, diff, change_date))
+
+        if include_bulk and events:
+            events.append(ListedInfoDiffEngine._bulk_event(events, change_date))
+        return events
+
+    @staticmethod
+    def _new_listings(
+        new: ListedInfoFrame, diff: ListedInfoFrameDiff, change_date: date
+    ) -> List[NewListingDetected]:
+        rows = diff.added_rows
+        return [
+            NewListingDetected(
+                code=StockCode(code),
+                company_name=company_name,
+                listing_date=change_date,
+                market_code=market_code,
+                market_name=market_name,
+            )
+            for code, company_name, market_code, market_name in zip(
+                diff.added.tolist(),
+                _values(new, "company_name", rows),
+                _values(new, "market_code", rows),
+                _values(new, "market_code_name", rows),
+            )
+        ]
+
+    @staticmethod
+    def _delistings(
+        old: ListedInfoFrame, diff: ListedInfoFrameDiff, change_date: date
+    ) -> List[DelistingDetected]:
+        return [
+            DelistingDetected(
+                code=StockCode(code),
+                company_name=company_name,
+                delisting_date=change_date,
+            )
+            for code, company_name in zip(
+                diff.removed.tolist(), _values(old, "company_name", diff.removed_rows)
+            )
+        ]
+
+    @staticmethod
+    def _market_changes(
+        old: ListedInfoFrame, new: ListedInfoFrame, diff: ListedInfoFrameDiff, change_date: date
+    ) -> List[MarketChangeDetected]:
+        change = diff.changed.get("market_code")
+        if change is None:
+            return []
+        return [
+            MarketChangeDetected(
+                code=StockCode(code),
+                company_name=company_name,
+                old_market_code=old_code,
+                new_market_code=new_code,
+                old_market_name=old_name,
+                new_market_name=new_name,
+                change_date=change_date,
+            )
+            for code, company_name, old_code, new_code, old_name, new_name in zip(
+                change.codes.tolist(),
+                _values(new, "company_name", change.new_rows),
+                change.old_values.tolist(),
+                change.new_values.tolist(),
+                _values(old, "market_code_name", change.old_rows),
+                _values(new, "market_code_name", change.new_rows),
+            )
+        ]
+
+    @staticmethod
+    def _sector_changes(
+        old: ListedInfoFrame, new: ListedInfoFrame, diff: ListedInfoFrameDiff, change_date: date
+    ) -> List[SectorChangeDetected]:
+        changes = [diff.changed[name] for name in _SECTOR_COLUMNS if name in diff.changed]
+        if not changes:
+            return []
+
+        # 17 業種・33 業種のどちらかが変わった銘柄を 1 件のイベントにまとめる
+        codes, index = np.unique(
+            np.concatenate([change.codes for change in changes]), return_index=True
+        )
+        old_rows = np.concatenate([change.old_rows for change in changes])[index]
+        new_rows = np.concatenate([change.new_rows for change in changes])[index]
+        return [
+            SectorChangeDetected(
+                code=StockCode(code),
+                company_name=company_name,
+                old_sector_17_code=old_17,
+                new_sector_17_code=new_17,
+                old_sector_33_code=old_33,
+                new_sector_33_code=new_33,
+                change_date=change_date,
+            )
+            for code, company_name, old_17, new_17, old_33, new_33 in zip(
+                codes.tolist(),
+                _values(new, "company_name", new_rows),
+                _values(old, "sector_17_code", old_rows),
+                _values(new, "sector_17_code", new_rows),
+                _values(old, "sector_33_code", old_rows),
+                _values(new, "sector_33_code", new_rows),
+            )
+        ]
+
+    @staticmethod
+    def _name_changes(
+        diff: ListedInfoFrameDiff, change_date: date
+    ) -> List[CompanyNameChangeDetected]:
+        change = diff.changed.get("company_name")
+        if change is None:
+            return []
+        return [
+            CompanyNameChangeDetected(
+                code=StockCode(code),
+                old_name=old_name,
+                new_name=new_name,
+                change_date=change_date,
+            )
+            for code, old_name, new_name in zip(
+                change.codes.tolist(), change.old_values.tolist(), change.new_values.tolist()
+            )
+        ]
+
+    @staticmethod
+    def _margin_changes(
+        old: ListedInfoFrame, new: ListedInfoFrame, diff: ListedInfoFrameDiff, change_date: date
+    ) -> List[MarginChangeDetected]:
+        change = diff.changed.get("margin_code")
+        if change is None:
+            return []
+        return [
+            MarginChangeDetected(
+                code=StockCode(code),
+                company_name=company_name,
+                old_margin_code=old_code,
+                new_margin_code=new_code,
+                old_margin_name=old_name,
+                new_margin_name=new_name,
+                change_date=change_date,
+            )
+            for code, company_name, old_code, new_code, old_name, new_name in zip(
+                change.codes.tolist(),
+                _values(new, "company_name", change.new_rows),
+                change.old_values.tolist(),
+                change.new_values.tolist(),
+                _values(old, "margin_code_name", change.old_rows),
+                _values(new, "margin_code_name", change.new_rows),
+            )
+        ]
+
+    @staticmethod
+    def _bulk_event(
+        events: Sequence[DomainEvent], change_date: date
+    ) -> ListedInfoBulkChangesDetected:
+        def codes_of(event_class: type) -> List[str]:
+            return [event.code.value for event in events if isinstance(event, event_class)]
+
+        return ListedInfoBulkChangesDetected(
+            change_date=change_date,
+            new_listings=codes_of(NewListingDetected),
+            delistings=codes_of(DelistingDetected),
+            market_changes=codes_of(MarketChangeDetected),
+            name_changes=codes_of(CompanyNameChangeDetected),
+            sector_changes=codes_of(SectorChangeDetected),
+            margin_changes=codes_of(MarginChangeDetected),
+        )
@@ -0,0 +1,349 @@
+"""Columnar listed info frame."""
+from array import array
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.domain.entities.jquants_listed_info import JQuantsListedInfo
+from app.domain.value_objects.stock_code import StockCode
+
+# 日付・銘柄コード以外の列（JQuantsListedInfo のフィールド順）
+ATTRIBUTE_COLUMNS = (
+    "company_name",
+    "company_name_english",
+    "sector_17_code",
+    "sector_17_code_name",
+    "sector_33_code",
+    "sector_33_code_name",
+    "scale_category",
+    "market_code",
+    "market_code_name",
+    "margin_code",
+    "margin_code_name",
+)
+
+# (date, code, *ATTRIBUTE_COLUMNS) の順の 1 行分の値
+ListedInfoRow = Tuple[Any, ...]
+
+# None を表すカテゴリ番号
+_NULL = -1
+# 比較先のカテゴリに存在しない値を表すカテゴリ番号
+_MISSING = -2
+
+_CODE_DTYPE = "<U10"
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+class _Encoder:
+    """値をカテゴリ番号に変換する（内部クラス）"""
+
+    def __init__(self) -> None:
+        self.index: Dict[str, int] = {}
+        self.codes = array("i")
+
+    def append(self, value: Optional[str]) -> None:
+        if value is None:
+            self.codes.append(_NULL)
+            return
+        category = self.index.get(value)
+        if category is None:
+            category = self.index[value] = len(self.index)
+        self.codes.append(category)
+
+    def build(self) -> "CategoricalColumn":
+        return CategoricalColumn(
+            codes=np.frombuffer(self.codes, dtype=np.int32).copy(),
+            categories=tuple(self.index),
+        )
+
+
+@dataclass(frozen=True)
+class CategoricalColumn:
+    """カテゴリ番号の配列と値の一覧で表した列
+
+    codes はカテゴリ番号（None は -1）、categories は番号に対応する値。
+    """
+
+    codes: np.ndarray
+    categories: Tuple[str, ...]
+
+    def code_of(self, value: Optional[str]) -> int:
+        """値のカテゴリ番号（None は -1、存在しない値は -2）"""
+        if value is None:
+            return _NULL
+        try:
+            return self.categories.index(value)
+        except ValueError:
+            return _MISSING
+
+    def decode(self) -> np.ndarray:
+        """値の配列（object 型）に戻す"""
+        lookup = np.array(self.categories + (None,), dtype=object)
+        return lookup[self.codes]
+
+    def recode(self, categories: Sequence[str]) -> np.ndarray:
+        """別の値の一覧に対するカテゴリ番号に変換する（存在しない値は -2）"""
+        if tuple(categories) == self.categories:
+            return self.codes
+        index = {value: category for category, value in enumerate(categories)}
+        lookup = np.array(
+            [index.get(value, _MISSING) for value in self.categories] + [_NULL], dtype=np.int32
+        )
+        return lookup[self.codes]
+
+    def take(self, indexer: np.ndarray) -> "CategoricalColumn":
+        return CategoricalColumn(codes=self.codes[indexer], categories=self.categories)
+
+
+class ListedInfoFrameBuilder:
+    """行を逐次追加して ListedInfoFrame を作成する
+
+    行ごとに値をカテゴリ番号へ変換するため、追加済みの行の文字列は保持しない。
+    """
+
+    def __init__(self) -> None:
+        self._dates = array("i")
+        self._codes = _Encoder()
+        self._columns = {column: _Encoder() for column in ATTRIBUTE_COLUMNS}
+
+    def append(self, row: ListedInfoRow) -> None:
+        """(date, code, *ATTRIBUTE_COLUMNS) の順の行を追加する"""
+        self._dates.append(row[0].toordinal() - _EPOCH_ORDINAL)
+        self._codes.append(row[1])
+        for column, value in zip(ATTRIBUTE_COLUMNS, row[2:]):
+            self._columns[column].append(value)
+
+    def extend(self, rows: Iterable[ListedInfoRow]) -> None:
+        for row in rows:
+            self.append(row)
+
+    def extend_entities(self, listed_infos: Iterable[JQuantsListedInfo]) -> None:
+        for info in listed_infos:
+            self.append(
+                (info.date, info.code.value, *(getattr(info, column) for column in ATTRIBUTE_COLUMNS))
+            )
+
+    def build(self) -> "ListedInfoFrame":
+        codes = self._codes.build()
+        return ListedInfoFrame(
+            dates=np.frombuffer(self._dates, dtype=np.int32).astype("datetime64[D]"),
+            codes=np.array(codes.categories, dtype=_CODE_DTYPE)[codes.codes],
+            columns={column: encoder.build() for column, encoder in self._columns.items()},
+        )
+
+
+@dataclass(frozen=True)
+class ColumnChange:
+    """1 列分の変更（銘柄コード順）
+
+    old_rows・new_rows は比較元・比較先のフレームでの行位置。
+    """
+
+    codes: np.ndarray
+    old_values: np.ndarray
+    new_values: np.ndarray
+    old_rows: np.ndarray
+    new_rows: np.ndarray
+
+
+@dataclass(frozen=True)
+class ListedInfoFrameDiff:
+    """2 つのスナップショットの差分
+
+    added・removed は銘柄コードの配列（昇順）、changed は変更があった列ごとの変更。
+    added_rows は比較先、removed_rows は比較元のフレームでの行位置。
+    """
+
+    added: np.ndarray
+    removed: np.ndarray
+    changed: Dict[str, ColumnChange]
+    added_rows: np.ndarray
+    removed_rows: np.ndarray
+
+    @property
+    def changed_codes(self) -> np.ndarray:
+        """いずれかの列が変更された銘柄コード（昇順）"""
+        if not self.changed:
+            return np.array([], dtype=_CODE_DTYPE)
+        return np.unique(np.concatenate([change.codes for change in self.changed.values()]))
+
+    def is_empty(self) -> bool:
+        return not (len(self.added) or len(self.removed) or self.changed)
+
+
+class ListedInfoFrame:
+    """列指向の上場銘柄情報
+
+    日付は datetime64、銘柄コードは固定長文字列、その他の列はカテゴリ番号の配列で保持する。
+    エンティティのリストと比べてメモリ使用量が小さく、
+    複数日付分のスナップショットをまとめて絞り込み・集計・比較できる。
+    """
+
+    def __init__(
+        self,
+        dates: np.ndarray,
+        codes: np.ndarray,
+        columns: Dict[str, CategoricalColumn],
+    ) -> None:
+        """
+        Args:
+            dates: 日付の配列（datetime64[D]）
+            codes: 銘柄コードの配列
+            columns: ATTRIBUTE_COLUMNS の各列
+        """
+        self.dates = dates
+        self.codes = codes
+        self._columns = columns
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[ListedInfoRow]) -> "ListedInfoFrame":
+        """(date, code, *ATTRIBUTE_COLUMNS) の順の行から作成する"""
+        builder = ListedInfoFrameBuilder()
+        builder.extend(rows)
+        return builder.build()
+
+    @classmethod
+    def from_entities(cls, listed_infos: Iterable[JQuantsListedInfo]) -> "ListedInfoFrame":
+        """エンティティのリストから作成する"""
+        builder = ListedInfoFrameBuilder()
+        builder.extend_entities(listed_infos)
+        return builder.build()
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def column(self, name: str) -> CategoricalColumn:
+        """列を取得する
+
+        Raises:
+            KeyError: 存在しない列の場合
+        """
+        return self._columns[name]
+
+    def values(self, name: str) -> np.ndarray:
+        """列の値の配列（object 型）"""
+        return self._columns[name].decode()
+
+    def unique_dates(self) -> List[date]:
+        """含まれる日付（昇順）"""
+        return np.unique(self.dates).astype(object).tolist()
+
+    def take(self, indexer: np.ndarray) -> "ListedInfoFrame":
+        """ブール配列または位置の配列で行を選択する"""
+        return ListedInfoFrame(
+            dates=self.dates[indexer],
+            codes=self.codes[indexer],
+            columns={name: column.take(indexer) for name, column in self._columns.items()},
+        )
+
+    def mask(self, **criteria: Optional[str]) -> np.ndarray:
+        """条件をすべて満たす行のブール配列（値が None の条件は無視する）
+
+        Raises:
+            KeyError: 存在しない列が指定された場合
+        """
+        mask = np.ones(len(self), dtype=bool)
+        for name, value in criteria.items():
+            if value is None:
+                continue
+            column = self._columns[name]
+            mask &= column.codes == column.code_of(value)
+        return mask
+
+    def filter(self, **criteria: Optional[str]) -> "ListedInfoFrame":
+        """条件をすべて満たす行を選択する"""
+        return self.take(self.mask(**criteria))
+
+    def on(self, target_date: date) -> "ListedInfoFrame":
+        """指定日の行を選択する"""
+        return self.take(self.dates == np.datetime64(target_date, "D"))
+
+    def count_by(self, name: str) -> Dict[Optional[str], int]:
+        """列の値ごとの件数（件数が 0 の値は含まない）"""
+        column = self._columns[name]
+        counts = np.bincount(column.codes + 1, minlength=len(column.categories) + 1)
+        keys = (None,) + column.categories
+        return {keys[i]: int(counts[i]) for i in np.flatnonzero(counts)}
+
+    def count_by_date(self, name: str) -> Dict[date, Dict[Optional[str], int]]:
+        """日付ごとの列の値ごとの件数"""
+        column = self._columns[name]
+        unique_dates, date_index = np.unique(self.dates, return_inverse=True)
+        width = len(column.categories) + 1
+        counts = np.bincount(
+            date_index * width + column.codes + 1, minlength=len(unique_dates) * width
+        ).reshape(len(unique_dates), width)
+        keys = (None,) + column.categories
+        return {
+            day: {keys[i]: int(row[i]) for i in np.flatnonzero(row)}
+            for day, row in zip(unique_dates.astype(object).tolist(), counts)
+        }
+
+    def to_entities(self) -> List[JQuantsListedInfo]:
+        """エンティティのリストに変換する"""
+        columns = [self.values(name) for name in ATTRIBUTE_COLUMNS]
+        return [
+            JQuantsListedInfo(
+                date=day,
+                code=StockCode(str(code)),
+                **dict(zip(ATTRIBUTE_COLUMNS, row)),
+            )
+            for day, code, *row in zip(self.dates.astype(object).tolist(), self.codes, *columns)
+        ]
+
+    def diff(self, new: "ListedInfoFrame") -> ListedInfoFrameDiff:
+        """このスナップショットから new への差分を計算する
+
+        銘柄コードで整列した配列同士を比較し、列ごとに値が変わった銘柄を求める。
+        new のカテゴリ番号はこのフレームの値の一覧に変換してから比較する。
+
+        Raises:
+            ValueError: いずれかのフレームに同じ銘柄コードが複数含まれる場合
+        """
+        old_order = _code_order(self)
+        new_order = _code_order(new)
+        old_codes = self.codes[old_order]
+        new_codes = new.codes[new_order]
+
+        common, old_index, new_index = np.intersect1d(
+            old_codes, new_codes, assume_unique=True, return_indices=True
+        )
+        old_rows = old_order[old_index]
+        new_rows = new_order[new_index]
+
+        changed: Dict[str, ColumnChange] = {}
+        for name, column in self._columns.items():
+            old_values = column.codes[old_rows]
+            new_values = new._columns[name].recode(column.categories)[new_rows]
+            differs = old_values != new_values
+            if differs.any():
+                changed[name] = ColumnChange(
+                    codes=common[differs],
+                    old_values=column.take(old_rows[differs]).decode(),
+                    new_values=new._columns[name].take(new_rows[differs]).decode(),
+                    old_rows=old_rows[differs],
+                    new_rows=new_rows[differs],
+                )
+
+        added = np.ones(len(new_codes), dtype=bool)
+        added[new_index] = False
+        removed = np.ones(len(old_codes), dtype=bool)
+        removed[old_index] = False
+        return ListedInfoFrameDiff(
+            added=new_codes[added],
+            removed=old_codes[removed],
+            changed=changed,
+            added_rows=new_order[added],
+            removed_rows=old_order[removed],
+        )
+
+
+def _code_order(frame: ListedInfoFrame) -> np.ndarray:
+    """銘柄コード順の行位置（重複がある場合は ValueError）"""
+    order = np.argsort(frame.codes, kind="stable")
+    sorted_codes = frame.codes[order]
+    if len(sorted_codes) > 1 and (sorted_codes[1:] == sorted_codes[:-1]).any():
+        raise ValueError("Frame must contain at most one row per code to be diffed")
+    return order
@@ -0,0 +1,177 @@
+"""Indexed listed info universe."""
+from typing import (
+    AbstractSet,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    overload,
+)
+
+from app.domain.entities.jquants_listed_info import JQuantsListedInfo
+from app.domain.value_objects.stock_code import StockCode
+
+# 索引を作成できる属性
+INDEXED_ATTRIBUTES = (
+    "market_code",
+    "sector_17_code",
+    "sector_33_code",
+    "scale_category",
+    "margin_code",
+)
+
+_Positions = List[int]
+# 属性の索引の位置リストのキー（属性名と値の組、銘柄コードの位置リストは None）
+_PostingKey = Optional[Tuple[str, Optional[str]]]
+
+
+class ListedInfoUniverse(Sequence[JQuantsListedInfo]):
+    """索引付きの上場銘柄情報の集合
+
+    スナップショットごとに一度作成し、銘柄コードと各属性のハッシュ索引で検索する。
+    属性の索引は最初に使用したときに作成するため、単一の条件で一度だけ
+    絞り込む場合でもリストの走査と同程度のコストで済む。
+    共通部分を取る際の位置の集合も属性と値の組ごとに保持するため、
+    2 回目以降の複数条件の検索は最も件数の少ない条件の件数に比例するコストで済む。
+
+    検索結果は常に元のリストの順序を保つ。
+    """
+
+    def __init__(self, listed_infos: Iterable[JQuantsListedInfo]) -> None:
+        """
+        Args:
+            listed_infos: 上場銘柄リスト（複数日付を含んでもよい）
+        """
+        self._infos: List[JQuantsListedInfo] = list(listed_infos)
+        self._by_code: Optional[Dict[StockCode, _Positions]] = None
+        self._indexes: Dict[str, Dict[Optional[str], _Positions]] = {}
+        self._posting_sets: Dict[Tuple[str, Optional[str]], FrozenSet[int]] = {}
+
+    @classmethod
+    def of(
+        cls, listed_infos: Union["ListedInfoUniverse", Iterable[JQuantsListedInfo]]
+    ) -> "ListedInfoUniverse":
+        """上場銘柄リストから作成する（作成済みの場合はそのまま返す）"""
+        if isinstance(listed_infos, cls):
+            return listed_infos
+        return cls(listed_infos)
+
+    def __len__(self) -> int:
+        return len(self._infos)
+
+    def __iter__(self) -> Iterator[JQuantsListedInfo]:
+        return iter(self._infos)
+
+    @overload
+    def __getitem__(self, index: int) -> JQuantsListedInfo: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[JQuantsListedInfo]: ...
+
+    def __getitem__(self, index):
+        return self._infos[index]
+
+    def _code_index(self) -> Dict[StockCode, _Positions]:
+        """銘柄コードの索引（内部メソッド）"""
+        if self._by_code is None:
+            by_code: Dict[StockCode, _Positions] = {}
+            for position, info in enumerate(self._infos):
+                by_code.setdefault(info.code, []).append(position)
+            self._by_code = by_code
+        return self._by_code
+
+    def _index(self, attribute: str) -> Dict[Optional[str], _Positions]:
+        """属性の索引（内部メソッド）"""
+        index = self._indexes.get(attribute)
+        if index is None:
+            if attribute not in INDEXED_ATTRIBUTES:
+                raise ValueError(f"Unsupported attribute: {attribute}")
+            index = {}
+            for position, info in enumerate(self._infos):
+                index.setdefault(getattr(info, attribute), []).append(position)
+            self._indexes[attribute] = index
+        return index
+
+    def _posting_set(self, key: _PostingKey, positions: _Positions) -> AbstractSet[int]:
+        """位置リストの集合（属性の索引の分は保持して再利用する、内部メソッド）"""
+        if key is None:
+            return set(positions)
+        posting_set = self._posting_sets.get(key)
+        if posting_set is None:
+            posting_set = self._posting_sets[key] = frozenset(positions)
+        return posting_set
+
+    def _select(
+        self, postings: List[Tuple[_Positions, _PostingKey]]
+    ) -> List[JQuantsListedInfo]:
+        """位置リストの共通部分を元の順序で返す（内部メソッド）"""
+        if not postings:
+            return list(self._infos)
+        postings.sort(key=lambda posting: len(posting[0]))
+        smallest = postings[0][0]
+        rest = [self._posting_set(key, positions) for positions, key in postings[1:]]
+        return [
+            self._infos[position]
+            for position in smallest
+            if all(position in positions for positions in rest)
+        ]
+
+    def filter(
+        self,
+        codes: Optional[Iterable[StockCode]] = None,
+        **criteria: Optional[str],
+    ) -> List[JQuantsListedInfo]:
+        """条件をすべて満たす上場銘柄を取得する
+
+        各条件の該当位置を索引から取得し、件数の少ない条件から順に共通部分を取る。
+        値が None の条件は無視する。
+
+        Args:
+            codes: 銘柄コード
+            **criteria: 属性名（INDEXED_ATTRIBUTES）と値の組
+
+        Returns:
+            該当する上場銘柄リスト
+
+        Raises:
+            ValueError: 索引を作成できない属性が指定された場合
+        """
+        postings: List[Tuple[_Positions, _PostingKey]] = []
+        if codes is not None:
+            postings.append((self._code_positions(codes), None))
+        for attribute, value in criteria.items():
+            if value is not None:
+                postings.append((self._index(attribute).get(value, []), (attribute, value)))
+        if any(not positions for positions, _ in postings):
+            return []
+        return self._select(postings)
+
+    def _code_positions(self, codes: Iterable[StockCode]) -> _Positions:
+        """銘柄コードに該当する位置を昇順で返す（内部メソッド）"""
+        by_code = self._code_index()
+        positions: _Positions = []
+        for code in set(codes):
+            positions.extend(by_code.get(code, ()))
+        positions.sort()
+        return positions
+
+    def find_by_code(self, code: StockCode) -> Optional[JQuantsListedInfo]:
+        """銘柄コードで検索する（複数ある場合は最初のもの）"""
+        positions = self._code_index().get(code)
+        return self._infos[positions[0]] if positions else None
+
+    def find_by_codes(self, codes: Iterable[StockCode]) -> List[JQuantsListedInfo]:
+        """複数の銘柄コードで検索する"""
+        return self.filter(codes=codes)
+
+    def group_by(self, attribute: str) -> Dict[Optional[str], List[JQuantsListedInfo]]:
+        """属性の値ごとにグループ化する（キーは最初に現れた順）"""
+        return {
+            value: [self._infos[position] for position in positions]
+            for value, positions in self._index(attribute).items()
+        }
@@ -0,0 +1,56 @@
+"""Snapshot digest builder."""
+import hashlib
+import json
+from typing import Any, List, Optional, Sequence
+
+# 正規化の方法を変更した場合は値を上げ、既存のダイジェストと一致しないようにする
+DIGEST_VERSION = 1
+
+# レコードごとのハッシュ（SHA-256）のバイト数
+_RECORD_DIGEST_SIZE = 32
+
+
+class SnapshotDigestBuilder:
+    """スナップショットの内容から安定したダイジェストを計算する
+
+    レコードごとのハッシュをソートしてから結合するため、
+    API がレコードを返す順序やページの分かれ方に依存しない。
+    ページ単位で逐次追加できる。
+    """
+
+    def __init__(self) -> None:
+        self._record_digests: List[bytes] = []
+
+    @classmethod
+    def from_state(cls, state: bytes) -> "SnapshotDigestBuilder":
+        """export_state で書き出した途中経過から再開する"""
+        if len(state) % _RECORD_DIGEST_SIZE:
+            raise ValueError("Invalid snapshot digest state")
+        builder = cls()
+        builder._record_digests = [
+            state[i:i + _RECORD_DIGEST_SIZE] for i in range(0, len(state), _RECORD_DIGEST_SIZE)
+        ]
+        return builder
+
+    def export_state(self, record_count: Optional[int] = None) -> bytes:
+        """先頭から record_count 件（省略時は全件）までの途中経過を書き出す"""
+        return b"".join(self._record_digests[:record_count])
+
+    def add(self, record: Sequence[Any]) -> None:
+        """正規化済みのレコード（値の並び）を追加する"""
+        encoded = json.dumps(
+            list(record), ensure_ascii=False, separators=(",", ":"), default=str
+        ).encode("utf-8")
+        self._record_digests.append(hashlib.sha256(encoded).digest())
+
+    @property
+    def record_count(self) -> int:
+        """追加したレコード数"""
+        return len(self._record_digests)
+
+    def hexdigest(self) -> str:
+        """追加したレコード全体のダイジェスト（SHA-256 の 16 進表記）"""
+        digest = hashlib.sha256(f"v{DIGEST_VERSION}:{self.record_count}:".encode("ascii"))
+        for record_digest in sorted(self._record_digests):
+            digest.update(record_digest)
+        return digest.hexdigest()
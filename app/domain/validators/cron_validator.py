@@ -1,10 +1,11 @@
 """cron 式バリデーターモジュール"""
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from croniter import croniter
 
 from app.domain.exceptions.schedule_exceptions import InvalidCronExpressionException
+from app.domain.helpers.compiled_cron import compile_cron
 
 
 def validate_cron_expression(expression: str) -> bool:
@@ -21,7 +22,7 @@ def validate_cron_expression(expression: str) -> bool:
         InvalidCronExpressionException: 無効な cron 式の場合
     """
     try:
-        croniter(expression)
+        compile_cron(expression)
         return True
     except (ValueError, TypeError) as e:
         raise InvalidCronExpressionException(
@@ -45,8 +46,33 @@ def get_next_run_time(cron_expression: str, base_time: Optional[datetime] = None
     """
     try:
         base = base_time or datetime.now()
-        cron = croniter(cron_expression, base)
-        return cron.get_next(datetime)
+        return compile_cron(cron_expression).next_time(base)
+    except (ValueError, TypeError) as e:
+        raise InvalidCronExpressionException(
+            f"無効な cron 式です: {cron_expression}. エラー: {str(e)}"
+        )
+
+
+def get_next_run_times(
+    cron_expression: str, count: int, base_time: Optional[datetime] = None
+) -> List[datetime]:
+    """
+    次回以降の実行時刻を複数件計算する
+    
+    Args:
+        cron_expression: cron 形式の文字列
+        count: 件数
+        base_time: 基準時刻（省略時は現在時刻）
+        
+    Returns:
+        実行予定時刻のリスト（昇順）
+        
+    Raises:
+        InvalidCronExpressionException: 無効な cron 式の場合
+    """
+    try:
+        base = base_time or datetime.now()
+        return compile_cron(cron_expression).next_times(base, count)
     except (ValueError, TypeError) as e:
         raise InvalidCronExpressionException(
             f"無効な cron 式です: {cron_expression}. エラー: {str(e)}"
@@ -11,13 +11,18 @@ class StockCode:
     value: str
 
     def __post_init__(self) -> None:
-        if not self.value:
+        self.validate(self.value)
+
+    @staticmethod
+    def validate(value: str) -> None:
+        """銘柄コードの形式を検証する（不正な場合は ValueError）"""
+        if not value:
             raise ValueError("銘柄コードは空にできません")
         
         # 銘柄コードの長さチェック（1-10 文字）- J-Quants API は様々な形式を返す可能性がある
-        if len(self.value) > 10:
+        if len(value) > 10:
             raise ValueError("銘柄コードは 10 文字以下である必要があります")
         
         # 銘柄コードの形式チェック（英数字とハイフン、アンダースコアのみ）
-        if not self.value.replace('-', '').replace('_', '').isalnum():
+        if not value.replace('-', '').replace('_', '').isalnum():
             raise ValueError("銘柄コードは英数字、ハイフン、アンダースコアのみ使用可能です")
\ No newline at end of file
@@ -1,7 +1,9 @@
 """Time period value object module."""
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
-from typing import Iterator, Tuple
+from typing import Iterator, Optional, Tuple
+
+from app.domain.value_objects.trading_calendar import TradingCalendar, is_default_trading_day
 
 
 @dataclass(frozen=True)
@@ -101,6 +103,64 @@ class TimePeriod:
             # Move to first day of next month
             current = period_end + timedelta(days=1)
 
+    def iter_days(self) -> Iterator[date]:
+        """Iterate over every calendar day in the period.
+
+        Yields:
+            Each date from start_date to end_date
+        """
+        current = self.start_date
+        while current <= self.end_date:
+            yield current
+            current += timedelta(days=1)
+
+    def iter_trading_days(self, calendar: Optional[TradingCalendar] = None) -> Iterator[date]:
+        """Iterate over trading days in the period.
+
+        Args:
+            calendar: Trading calendar (weekday-based rule if None)
+
+        Yields:
+            Each trading day from start_date to end_date
+        """
+        is_trading_day = calendar.is_trading_day if calendar else is_default_trading_day
+        for day in self.iter_days():
+            if is_trading_day(day):
+                yield day
+
+    def split_by_days(self, days: int = 1) -> Iterator["TimePeriod"]:
+        """Split period into consecutive periods of at most N days.
+
+        Args:
+            days: Number of days in each period
+
+        Yields:
+            TimePeriod for each chunk
+        """
+        if days < 1:
+            raise ValueError("Days must be positive")
+
+        current = self.start_date
+        while current <= self.end_date:
+            period_end = min(current + timedelta(days=days - 1), self.end_date)
+            yield TimePeriod(current, period_end)
+            current = period_end + timedelta(days=1)
+
+    def split_by_weeks(self) -> Iterator["TimePeriod"]:
+        """Split period into calendar weeks (Monday to Sunday).
+
+        Yields:
+            TimePeriod for each week
+        """
+        current = self.start_date
+        while current <= self.end_date:
+            week_end = current + timedelta(days=6 - current.weekday())
+            period_end = min(week_end, self.end_date)
+
+            yield TimePeriod(current, period_end)
+
+            current = period_end + timedelta(days=1)
+
     def to_datetime_range(self) -> Tuple[datetime, datetime]:
         """Convert to datetime range (start of start_date to end of end_date).
 
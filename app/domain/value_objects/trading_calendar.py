@@ -0,0 +1,85 @@
+"""Trading calendar value object module."""
+from dataclasses import dataclass, field
+from datetime import date
+from typing import FrozenSet, Iterable
+
+# 東証の年末年始休業日（月, 日）。営業日カレンダーがない場合の判定に使用する
+_YEAR_END_HOLIDAYS = frozenset({(12, 31), (1, 1), (1, 2), (1, 3)})
+
+
+def is_default_trading_day(day: date) -> bool:
+    """Fallback trading day rule used when no calendar data is available.
+
+    Weekends and the TSE year-end holidays are treated as non-trading days.
+    National holidays cannot be detected without calendar data.
+
+    Args:
+        day: Date to check
+
+    Returns:
+        True if the date is presumed to be a trading day
+    """
+    return day.weekday() < 5 and (day.month, day.day) not in _YEAR_END_HOLIDAYS
+
+
+@dataclass(frozen=True)
+class TradingCalendar:
+    """Value object representing known trading and non-trading days.
+
+    Dates not contained in either set fall back to ``is_default_trading_day``,
+    so a calendar with partial (or no) data still gives a usable answer.
+    """
+
+    trading_days: FrozenSet[date] = field(default_factory=frozenset)
+    non_trading_days: FrozenSet[date] = field(default_factory=frozenset)
+
+    def __post_init__(self) -> None:
+        """Validate calendar after initialization."""
+        overlap = self.trading_days & self.non_trading_days
+        if overlap:
+            raise ValueError(
+                f"Dates cannot be both trading and non-trading days: {sorted(overlap)[:3]}"
+            )
+
+    def is_known(self, day: date) -> bool:
+        """Check if the calendar has data for a date."""
+        return day in self.trading_days or day in self.non_trading_days
+
+    def is_trading_day(self, day: date) -> bool:
+        """Check if a date is a trading day.
+
+        Args:
+            day: Date to check
+
+        Returns:
+            True if the date is a trading day
+        """
+        if day in self.trading_days:
+            return True
+        if day in self.non_trading_days:
+            return False
+        return is_default_trading_day(day)
+
+    def merge(self, other: "TradingCalendar") -> "TradingCalendar":
+        """Merge with another calendar covering different dates.
+
+        Args:
+            other: Another trading calendar
+
+        Returns:
+            New calendar containing the data of both calendars
+        """
+        return TradingCalendar(
+            trading_days=self.trading_days | other.trading_days,
+            non_trading_days=self.non_trading_days | other.non_trading_days,
+        )
+
+    @classmethod
+    def from_days(
+        cls, trading_days: Iterable[date], non_trading_days: Iterable[date] = ()
+    ) -> "TradingCalendar":
+        """Create calendar from iterables of dates."""
+        return cls(
+            trading_days=frozenset(trading_days),
+            non_trading_days=frozenset(non_trading_days),
+        )
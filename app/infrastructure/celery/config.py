@@ -47,6 +47,10 @@ result_compression = "gzip"
 # Routing
 task_routes = {
     "fetch_listed_info_task": {"queue": "default"},
+    "backfill_listed_info_task": {"queue": "default"},
+    "fetch_listed_info_chunk_task": {"queue": "default"},
+    "aggregate_listed_info_backfill_task": {"queue": "default"},
+    "maintain_listed_info_partitions_task": {"queue": "default"},
 }
 
 # Queue configuration
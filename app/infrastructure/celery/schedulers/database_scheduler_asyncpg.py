@@ -1,37 +1,74 @@
 """Database scheduler for Celery Beat with asyncpg support."""
 import asyncio
+import concurrent.futures
+import heapq
+import itertools
 import json
 import threading
-from datetime import datetime
-from typing import Any, Dict, Optional
+import time
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from uuid import UUID
 
 import redis
 from celery import schedules
 from celery.beat import ScheduleEntry, Scheduler
 from celery.utils.log import get_logger
-from croniter import croniter
-from sqlalchemy import select, update
+from sqlalchemy import DateTime, column, delete, func, select, update, values
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 
 from app.core.config import get_settings
-from app.infrastructure.database.connection import get_async_session_context
-from app.infrastructure.database.models.schedule import CeleryBeatSchedule
+from app.domain.helpers.compiled_cron import CRON_CACHE_SIZE, compile_cron
+from app.infrastructure.database.connection import dispose_engine, get_async_session_context
+from app.infrastructure.database.models.schedule import (
+    CeleryBeatSchedule,
+    CeleryBeatScheduleTombstone,
+)
 
 logger = get_logger(__name__)
 settings = get_settings()
 
-# Thread-local storage for event loop
-_thread_local = threading.local()
+# Delta syncs re-read this window before the watermark so that rows committed
+# by transactions that started before the previous sync are not missed
+SYNC_OVERLAP = timedelta(seconds=60)
 
+# Tombstones older than this are deleted on full syncs. A scheduler whose
+# watermark is older than this misses those deletions until its own next
+# full sync, which removes the entries anyway.
+TOMBSTONE_RETENTION = timedelta(days=1)
 
-def get_or_create_event_loop():
-    """Get or create event loop for the current thread."""
-    try:
-        return asyncio.get_running_loop()
-    except RuntimeError:
-        if not hasattr(_thread_local, 'loop') or _thread_local.loop.is_closed():
-            _thread_local.loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(_thread_local.loop)
-        return _thread_local.loop
+# Upper bound for a single database call made from beat's thread
+DB_CALL_TIMEOUT = 60.0
+
+# Delay before re-evaluating an entry that is still due after being applied
+RETRY_DELAY = 1.0
+
+
+@lru_cache(maxsize=CRON_CACHE_SIZE)
+def cron_to_crontab(cron_expression: str) -> schedules.crontab:
+    """Convert cron expression to celery crontab schedule.
+
+    Parsed schedules are cached by expression, so rebuilding entries on sync
+    does not re-parse unchanged cron strings. crontab objects are not mutated
+    after creation and are shared between entries of the same app.
+    """
+    # Parse cron expression (minute hour day month day_of_week)
+    parts = cron_expression.split()
+    if len(parts) != 5:
+        raise ValueError(f"Invalid cron expression: {cron_expression}")
+    # Validate with the same rules as the schedule API
+    compile_cron(cron_expression)
+
+    minute, hour, day, month, day_of_week = parts
+
+    return schedules.crontab(
+        minute=minute,
+        hour=hour,
+        day_of_month=day,
+        month_of_year=month,
+        day_of_week=day_of_week,
+    )
 
 
 class DatabaseScheduleEntry(ScheduleEntry):
@@ -78,20 +115,7 @@ class DatabaseScheduleEntry(ScheduleEntry):
 
     def _cron_to_schedule(self, cron_expression: str) -> schedules.crontab:
         """Convert cron expression to celery crontab schedule."""
-        # Parse cron expression (minute hour day month day_of_week)
-        parts = cron_expression.split()
-        if len(parts) != 5:
-            raise ValueError(f"Invalid cron expression: {cron_expression}")
-        
-        minute, hour, day, month, day_of_week = parts
-        
-        return schedules.crontab(
-            minute=minute,
-            hour=hour,
-            day_of_month=day,
-            month_of_year=month,
-            day_of_week=day_of_week,
-        )
+        return cron_to_crontab(cron_expression)
 
     def is_due(self):
         """Check if the task is due."""
@@ -99,10 +123,11 @@ class DatabaseScheduleEntry(ScheduleEntry):
             return False, 60.0  # Check again in 60 seconds
         
         result = super().is_due()
-        is_due, next_run_seconds = result
-        logger.debug(f"Task {self.name} is_due check: is_due={is_due}, "
-                    f"next_run_seconds={next_run_seconds}, schedule={self.schedule}, "
-                    f"last_run_at={self.last_run_at}")
+        # Lazy formatting: is_due is called for every entry the heap yields
+        logger.debug(
+            "Task %s is_due check: is_due=%s, next_run_seconds=%s, schedule=%s, last_run_at=%s",
+            self.name, result[0], result[1], self.schedule, self.last_run_at,
+        )
         return result
     
     def __next__(self):
@@ -130,7 +155,23 @@ class DatabaseSchedulerAsyncPG(Scheduler):
         self._last_updated = None
         self._last_sync_time = None
         self._schedule_cache = {}
+        # Incremental sync state (schedule id -> entry name / updated_at)
+        self._watermark: Optional[datetime] = None
+        self._last_full_sync_time: Optional[float] = None
+        self._entry_names: Dict[UUID, str] = {}
+        self._entry_ids: Dict[str, UUID] = {}
+        self._entry_versions: Dict[UUID, datetime] = {}
+        self._sync_lock = threading.RLock()
+        # Write-behind buffer of last_run_at (schedule id -> last run)
+        self._pending_last_run: Dict[UUID, datetime] = {}
+        self._pending_last_run_lock = threading.Lock()
+        self._last_flush_time = time.monotonic()
+        # Min-heap of (next fire time, sequence, entry name, entry). Items of
+        # replaced or removed entries are skipped when they reach the top.
+        self._due_heap: List[Tuple[float, int, str, DatabaseScheduleEntry]] = []
+        self._heap_sequence = itertools.count()
         self._event_loop = None
+        self._event_loop_thread = None
         self._redis_subscriber_thread = None
         self._redis_client = None
         self._shutdown_event = threading.Event()
@@ -145,12 +186,13 @@ class DatabaseSchedulerAsyncPG(Scheduler):
         logger.info(f"Redis URL: {settings.redis_url}")
         logger.info("=" * 60)
         
+        # The database loop must be running before the parent constructor
+        # calls setup_schedule()
+        self._setup_event_loop()
+
         # Call parent constructor
         super().__init__(*args, **kwargs)
         
-        # Setup event loop after parent init
-        self._setup_event_loop()
-        
         # Start Redis subscriber if enabled
         if settings.celery_beat_redis_sync_enabled:
             logger.info("Redis Sync is ENABLED - Starting Redis subscriber thread")
@@ -159,9 +201,36 @@ class DatabaseSchedulerAsyncPG(Scheduler):
             logger.warning("Redis Sync is DISABLED - Scheduler will sync every 60 seconds")
         
     def _setup_event_loop(self):
-        """Setup event loop for scheduler."""
-        self._event_loop = get_or_create_event_loop()
-        logger.info("Event loop setup for database scheduler")
+        """Start the event loop thread that runs all database work.
+
+        Every coroutine is submitted to this one loop, so the engine (keyed by
+        loop in get_engine) and its connection pool live as long as the
+        scheduler instead of being created for every sync and update.
+        """
+        if self._event_loop_thread is not None and self._event_loop_thread.is_alive():
+            return
+        self._event_loop = asyncio.new_event_loop()
+        self._event_loop_thread = threading.Thread(
+            target=self._run_event_loop,
+            daemon=True,
+            name="CeleryBeatDatabaseLoop",
+        )
+        self._event_loop_thread.start()
+        logger.info("Event loop thread started for database scheduler")
+
+    def _run_event_loop(self):
+        """Event loop thread worker."""
+        asyncio.set_event_loop(self._event_loop)
+        self._event_loop.run_forever()
+
+    def _run_db(self, coro, timeout: float = DB_CALL_TIMEOUT):
+        """Run a coroutine on the database loop and wait for its result."""
+        future = asyncio.run_coroutine_threadsafe(coro, self._event_loop)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
     
     def _start_redis_subscriber(self):
         """Start Redis event listener in a separate thread."""
@@ -251,96 +320,274 @@ class DatabaseSchedulerAsyncPG(Scheduler):
     def setup_schedule(self):
         """Initial schedule setup."""
         # Ensure event loop is set up
-        if not hasattr(self, '_event_loop') or self._event_loop is None:
-            self._setup_event_loop()
+        self._setup_event_loop()
         self.sync_schedules()
         
-    def sync_schedules(self):
-        """Sync schedules from database."""
-        logger.info("Syncing schedules from database")
-        
-        try:
-            # Use a separate event loop for database operations to avoid conflicts
-            # with the Redis subscriber thread's event loop
-            db_loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(db_loop)
-            
+    def sync_schedules(self, full: bool = False):
+        """Sync schedules from database.
+
+        The first sync (or ``full=True``) loads every enabled schedule, and so
+        does every sync after ``celery_beat_full_sync_interval`` seconds; full
+        syncs also prune old tombstones. Other syncs only load rows whose
+        ``updated_at`` is past the watermark and the tombstones of deleted
+        schedules, rebuild those entries and keep the in-memory state of all
+        other entries.
+        """
+        with self._sync_lock:
+            full = full or self._watermark is None or self._should_full_sync()
+            logger.info(f"Syncing schedules from database ({'full' if full else 'delta'})")
+
             try:
-                logger.info("Using dedicated event loop for database operations")
-                schedules = db_loop.run_until_complete(
-                    self._load_schedules_from_db()
+                if full:
+                    schedules = self._run_db(self._load_schedules_from_db())
+                    tombstones = []
+                    self._last_full_sync_time = time.monotonic()
+                    self._prune_tombstones()
+                else:
+                    schedules, tombstones = self._run_db(
+                        self._load_changes_from_db(self._watermark - SYNC_OVERLAP)
+                    )
+                logger.info(
+                    f"Successfully loaded {len(schedules)} schedules "
+                    f"and {len(tombstones)} tombstones"
                 )
-                logger.info(f"Successfully loaded {len(schedules)} schedules")
-            finally:
-                db_loop.close()
-                # Reset the event loop to None to avoid interference
-                asyncio.set_event_loop(None)
-            
-            # Update schedule
-            self.schedule.clear()
-            
-            for schedule in schedules:
-                entry = self.Entry(schedule, app=self.app)
-                self.schedule[schedule.name] = entry
-                
-            logger.info(f"Updated scheduler with {len(schedules)} schedules")
-            self._last_updated = datetime.utcnow()
-            self._last_sync_time = datetime.utcnow()
-            
+
+                if full:
+                    loaded_ids = {schedule.id for schedule in schedules}
+                    deleted_ids = [
+                        schedule_id for schedule_id in self._entry_names
+                        if schedule_id not in loaded_ids
+                    ]
+                else:
+                    deleted_ids = [schedule_id for schedule_id, _ in tombstones]
+
+                rebuilt, removed = self._apply_schedule_changes(schedules, deleted_ids)
+                self._compact_due_heap()
+                self._advance_watermark(
+                    [schedule.updated_at for schedule in schedules]
+                    + [deleted_at for _, deleted_at in tombstones]
+                )
+
+                logger.info(
+                    f"Updated scheduler: {rebuilt} rebuilt, {removed} removed, "
+                    f"{len(self.schedule)} schedules in total"
+                )
+                self._last_updated = datetime.utcnow()
+                self._last_sync_time = datetime.utcnow()
+
+            except Exception as e:
+                logger.error(f"Failed to sync schedules: {str(e)}", exc_info=True)
+
+    def _apply_schedule_changes(
+        self,
+        schedules: Sequence[CeleryBeatSchedule],
+        deleted_ids: Iterable[UUID],
+    ) -> Tuple[int, int]:
+        """Apply loaded schedule rows and deletions to the in-memory schedule.
+
+        Rows whose ``updated_at`` matches the version already held are skipped,
+        so re-reading the overlap window does not rebuild entries.
+
+        Returns:
+            Number of rebuilt entries and number of removed entries
+        """
+        rebuilt = 0
+        removed = 0
+
+        for schedule_id in deleted_ids:
+            if self._remove_entry(schedule_id):
+                removed += 1
+
+        for model in schedules:
+            if self._entry_versions.get(model.id) == model.updated_at:
+                continue
+
+            previous = self.schedule.get(self._entry_names.get(model.id))
+            had_entry = self._remove_entry(model.id)
+            if not model.enabled:
+                if had_entry:
+                    removed += 1
+                continue
+
+            # Schedule names are not unique; the last loaded row wins as before
+            displaced_id = self._entry_ids.get(model.name)
+            if displaced_id is not None:
+                self._remove_entry(displaced_id)
+
+            entry = self.Entry(model, app=self.app)
+            # The database may not have the latest run yet (write-behind), so
+            # never move last_run_at backwards when rebuilding an entry
+            if previous is not None and (
+                model.last_run_at is None or previous.last_run_at > model.last_run_at
+            ):
+                entry.last_run_at = previous.last_run_at
+                entry.total_run_count = previous.total_run_count
+            self.schedule[model.name] = entry
+            self._push_entry(entry)
+            self._entry_names[model.id] = model.name
+            self._entry_ids[model.name] = model.id
+            self._entry_versions[model.id] = model.updated_at
+            rebuilt += 1
+
+        return rebuilt, removed
+
+    def _remove_entry(self, schedule_id: UUID) -> bool:
+        """Remove the entry of a schedule. Returns True if it was present."""
+        name = self._entry_names.pop(schedule_id, None)
+        self._entry_versions.pop(schedule_id, None)
+        if name is None:
+            return False
+        if self._entry_ids.get(name) == schedule_id:
+            del self._entry_ids[name]
+            self.schedule.pop(name, None)
+        return True
+
+    def _advance_watermark(self, timestamps: Iterable[Optional[datetime]]):
+        """Move the watermark to the newest timestamp seen."""
+        timestamps = [timestamp for timestamp in timestamps if timestamp is not None]
+        if self._watermark is not None:
+            timestamps.append(self._watermark)
+        if timestamps:
+            self._watermark = max(timestamps)
+
+    def _should_full_sync(self) -> bool:
+        """Check if the next sync should reload every schedule."""
+        if self._last_full_sync_time is None:
+            return True
+        elapsed = time.monotonic() - self._last_full_sync_time
+        return elapsed >= settings.celery_beat_full_sync_interval
+
+    def _prune_tombstones(self):
+        """Delete tombstones older than TOMBSTONE_RETENTION.
+
+        Failures are logged only; the tombstones are pruned on a later full sync.
+        """
+        try:
+            pruned = self._run_db(self._prune_tombstones_async(TOMBSTONE_RETENTION))
         except Exception as e:
-            logger.error(f"Failed to sync schedules: {str(e)}", exc_info=True)
-    
+            logger.error(f"Failed to prune schedule tombstones: {e}", exc_info=True)
+            return
+        if pruned:
+            logger.info(f"Pruned {pruned} schedule tombstones")
+
     async def _load_schedules_from_db(self):
-        """Load schedules from database."""
-        logger.info("Starting to load schedules from database")
-        start_time = asyncio.get_event_loop().time()
-        
-        try:
-            logger.info("Getting async session...")
-            async with get_async_session_context() as session:
-                session_time = asyncio.get_event_loop().time()
-                logger.info(f"Got session in {session_time - start_time:.2f}s")
-                
-                logger.info("Executing query...")
-                result = await session.execute(
-                    select(CeleryBeatSchedule).where(CeleryBeatSchedule.enabled == True)
+        """Load enabled schedules from database."""
+        async with get_async_session_context() as session:
+            result = await session.execute(
+                select(CeleryBeatSchedule).where(CeleryBeatSchedule.enabled == True)
+            )
+            schedules = result.scalars().all()
+            logger.debug(f"Loaded {len(schedules)} schedules")
+            return schedules
+
+    async def _prune_tombstones_async(self, retention: timedelta) -> int:
+        """Delete tombstones recorded more than ``retention`` ago."""
+        async with get_async_session_context() as session:
+            result = await session.execute(
+                delete(CeleryBeatScheduleTombstone).where(
+                    CeleryBeatScheduleTombstone.deleted_at < func.now() - retention
                 )
-                query_time = asyncio.get_event_loop().time()
-                logger.info(f"Query executed in {query_time - session_time:.2f}s")
-                
-                schedules = result.scalars().all()
-                logger.info(f"Loaded {len(schedules)} schedules in total {asyncio.get_event_loop().time() - start_time:.2f}s")
-                return schedules
-        except Exception as e:
-            logger.error(f"Error loading schedules from database: {e}", exc_info=True)
-            raise
-    
+            )
+            return result.rowcount
+
+    async def _load_changes_from_db(self, since: datetime):
+        """Load schedules updated and tombstones recorded after ``since``.
+
+        Disabled schedules are included so that disabling removes the entry.
+        """
+        async with get_async_session_context() as session:
+            result = await session.execute(
+                select(CeleryBeatSchedule).where(CeleryBeatSchedule.updated_at > since)
+            )
+            schedules = result.scalars().all()
+
+            result = await session.execute(
+                select(
+                    CeleryBeatScheduleTombstone.schedule_id,
+                    CeleryBeatScheduleTombstone.deleted_at,
+                ).where(CeleryBeatScheduleTombstone.deleted_at > since)
+            )
+            tombstones = [tuple(row) for row in result.all()]
+
+            logger.debug(
+                f"Loaded {len(schedules)} changed schedules and "
+                f"{len(tombstones)} tombstones since {since}"
+            )
+            return schedules, tombstones
+
+    def _push_entry(
+        self,
+        entry: DatabaseScheduleEntry,
+        now: Optional[float] = None,
+        due_delay: float = 0.0,
+    ):
+        """Push an entry onto the heap keyed by its next fire time.
+
+        Args:
+            entry: Entry to schedule
+            now: Current time (time.time())
+            due_delay: Delay used when the entry is already due. tick passes
+                a positive delay so that an entry whose run could not be
+                recorded is retried later instead of in the same tick.
+        """
+        if now is None:
+            now = time.time()
+        is_due, next_run_seconds = entry.is_due()
+        # When already due, next_run_seconds is the wait after this run
+        due_at = now + (due_delay if is_due else next_run_seconds)
+        heapq.heappush(
+            self._due_heap, (due_at, next(self._heap_sequence), entry.name, entry)
+        )
+
+    def _compact_due_heap(self):
+        """Drop stale heap items once they outnumber the live entries."""
+        if len(self._due_heap) <= 2 * len(self.schedule) + 64:
+            return
+        self._due_heap = [
+            item for item in self._due_heap if self.schedule.get(item[2]) is item[3]
+        ]
+        heapq.heapify(self._due_heap)
+
     def tick(self):
-        """Run one iteration of the scheduler."""
+        """Run one iteration of the scheduler.
+
+        Only entries at the top of the heap whose fire time has passed are
+        evaluated; the others are not touched until they are due or changed.
+        """
         # Reload schedules every 60 seconds
         if self._should_reload_schedules():
             self.sync_schedules()
-        
-        # Calculate minimum interval until next run
-        min_interval = self.max_interval
-        
-        # Log current schedules
-        logger.debug(f"Processing {len(self.schedule)} schedules in tick")
-        
-        # Process each schedule entry
-        for entry in self.schedule.values():
-            is_due, next_run_seconds = entry.is_due()
-            
-            if is_due:
-                logger.info(f"Task {entry.name} is due, applying entry")
-                try:
-                    self.apply_entry(entry)
-                except Exception as e:
-                    logger.error(f"Failed to apply entry {entry.name}: {e}", exc_info=True)
-            
-            # Update minimum interval
-            min_interval = min(min_interval, next_run_seconds)
-        
+
+        # Hold the sync lock so that a Redis-triggered sync does not change
+        # the schedule or the heap while entries are applied
+        with self._sync_lock:
+            now = time.time()
+            while self._due_heap and self._due_heap[0][0] <= now:
+                _, _, name, entry = heapq.heappop(self._due_heap)
+                if self.schedule.get(name) is not entry:
+                    continue
+
+                is_due, _ = entry.is_due()
+                if is_due:
+                    logger.info(f"Task {entry.name} is due, applying entry")
+                    try:
+                        self.apply_entry(entry)
+                    except Exception as e:
+                        logger.error(f"Failed to apply entry {entry.name}: {e}", exc_info=True)
+                self._push_entry(entry, now, due_delay=RETRY_DELAY)
+
+            # Sleep until the heap head is due
+            min_interval = self.max_interval
+            if self._due_heap:
+                min_interval = min(min_interval, max(self._due_heap[0][0] - time.time(), 0.0))
+
+        # Write buffered last_run_at updates in the background
+        if self._pending_last_run:
+            flush_interval = settings.celery_beat_last_run_flush_interval
+            if time.monotonic() - self._last_flush_time >= flush_interval:
+                self._flush_last_run_at()
+            min_interval = min(min_interval, flush_interval)
+
         return min_interval
     
     def apply_entry(self, entry, producer=None):
@@ -352,48 +599,97 @@ class DatabaseSchedulerAsyncPG(Scheduler):
             # Call parent class apply_entry to send the task
             result = super().apply_entry(entry, producer)
             logger.info(f"Task {entry.name} sent successfully")
-            
-            # Update last_run_at in database
-            self._update_last_run_at(entry)
+
+            # Advance the entry in place and buffer the database update,
+            # which is written by _flush_last_run_at
+            entry.last_run_at = entry.default_now()
+            entry.total_run_count += 1
+            self._buffer_last_run_at(entry)
             
             return result
         except Exception as e:
             logger.error(f"Failed to send task {entry.name}: {e}", exc_info=True)
             raise
     
-    def _update_last_run_at(self, entry):
-        """Update last_run_at in database."""
+    def _buffer_last_run_at(self, entry):
+        """Buffer last_run_at of an entry for the next flush."""
+        with self._pending_last_run_lock:
+            self._pending_last_run[entry.model.id] = entry.last_run_at
+
+    def _flush_last_run_at(self, wait: bool = False):
+        """Write buffered last_run_at updates in one statement.
+
+        Args:
+            wait: Wait for the write to finish (used by sync and close).
+                Otherwise the write runs on the database loop in the
+                background and beat's tick is not blocked.
+        """
+        with self._pending_last_run_lock:
+            if not self._pending_last_run:
+                return
+            pending, self._pending_last_run = self._pending_last_run, {}
+        self._last_flush_time = time.monotonic()
+
+        if self._event_loop is None or self._event_loop.is_closed():
+            logger.error(f"Database loop is closed; dropping {len(pending)} last_run_at updates")
+            return
+
+        future = asyncio.run_coroutine_threadsafe(
+            self._write_last_run_at_async(pending), self._event_loop
+        )
+        if not wait:
+            future.add_done_callback(lambda done: self._on_last_run_flushed(done, pending))
+            return
         try:
-            # Create a new event loop for this operation
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            try:
-                loop.run_until_complete(self._update_last_run_at_async(entry))
-            finally:
-                loop.close()
-                asyncio.set_event_loop(None)
-                
+            future.result(DB_CALL_TIMEOUT)
         except Exception as e:
-            logger.error(f"Failed to update last_run_at for {entry.name}: {e}", exc_info=True)
-    
-    async def _update_last_run_at_async(self, entry):
-        """Update last_run_at in database asynchronously."""
+            future.cancel()
+            logger.error(f"Failed to write last_run_at updates: {e}", exc_info=True)
+            self._requeue_last_run_at(pending)
+
+    def _on_last_run_flushed(self, future, pending: Dict[UUID, datetime]):
+        """Re-buffer the updates of a failed background flush."""
+        if future.cancelled() or future.exception() is not None:
+            logger.error(f"Failed to write last_run_at updates: {future.exception()}")
+            self._requeue_last_run_at(pending)
+
+    def _requeue_last_run_at(self, pending: Dict[UUID, datetime]):
+        """Put updates back into the buffer unless a newer run is buffered."""
+        with self._pending_last_run_lock:
+            for schedule_id, last_run_at in pending.items():
+                buffered = self._pending_last_run.get(schedule_id)
+                if buffered is None or buffered < last_run_at:
+                    self._pending_last_run[schedule_id] = last_run_at
+
+    async def _write_last_run_at_async(self, pending: Dict[UUID, datetime]):
+        """Write last_run_at of several schedules with UPDATE ... FROM (VALUES ...)."""
+        runs = values(
+            column("id", PG_UUID(as_uuid=True)),
+            column("last_run_at", DateTime(timezone=True)),
+            name="runs",
+        ).data(list(pending.items()))
+        stmt = (
+            update(CeleryBeatSchedule)
+            .where(CeleryBeatSchedule.id == runs.c.id)
+            # Runs may be written out of order; never move last_run_at backwards
+            .where(
+                (CeleryBeatSchedule.last_run_at.is_(None))
+                | (CeleryBeatSchedule.last_run_at < runs.c.last_run_at)
+            )
+            # Keep updated_at so that recording a run does not look like
+            # a schedule change to the incremental sync
+            .values(
+                last_run_at=runs.c.last_run_at,
+                updated_at=CeleryBeatSchedule.updated_at,
+            )
+        )
         async with get_async_session_context() as session:
-            try:
-                # Update the last_run_at field
-                stmt = (
-                    update(CeleryBeatSchedule)
-                    .where(CeleryBeatSchedule.name == entry.name)
-                    .values(last_run_at=entry.last_run_at)
-                )
-                await session.execute(stmt)
-                await session.commit()
-                logger.debug(f"Updated last_run_at for {entry.name} to {entry.last_run_at}")
-            except Exception as e:
-                await session.rollback()
-                logger.error(f"Database error updating last_run_at: {e}", exc_info=True)
-                raise
+            await session.execute(stmt)
+        logger.debug(f"Updated last_run_at for {len(pending)} schedules")
+
+    def sync(self):
+        """Write buffered state to the database (called by Celery Beat)."""
+        self._flush_last_run_at(wait=True)
 
     def _should_reload_schedules(self) -> bool:
         """Check if schedules should be reloaded."""
@@ -417,16 +713,23 @@ class DatabaseSchedulerAsyncPG(Scheduler):
         # Wait for Redis subscriber to finish
         if self._redis_subscriber_thread and self._redis_subscriber_thread.is_alive():
             self._redis_subscriber_thread.join(timeout=5)
+
+        # Write buffered last_run_at updates before the database loop stops
+        self._flush_last_run_at(wait=True)
             
         if self._event_loop and not self._event_loop.is_closed():
-            # Schedule cleanup in the event loop
-            asyncio.run_coroutine_threadsafe(
-                self._cleanup_async(), self._event_loop
-            ).result()
-            self._event_loop.close()
+            if self._event_loop_thread and self._event_loop_thread.is_alive():
+                try:
+                    self._run_db(self._cleanup_async())
+                except Exception as e:
+                    logger.error(f"Failed to clean up database connections: {e}", exc_info=True)
+                self._event_loop.call_soon_threadsafe(self._event_loop.stop)
+                self._event_loop_thread.join(timeout=5)
+            if not self._event_loop.is_running():
+                self._event_loop.close()
         super().close()
-        
+
     async def _cleanup_async(self):
         """Async cleanup tasks."""
-        # Add any async cleanup here if needed
-        pass
\ No newline at end of file
+        # Dispose the pool owned by the database loop
+        await dispose_engine()
\ No newline at end of file
@@ -1,4 +1,16 @@
 """Celery tasks."""
 from .jquants_listed_info_task import fetch_listed_info_task
+from .listed_info_backfill_task import (
+    aggregate_listed_info_backfill_task,
+    backfill_listed_info_task,
+    fetch_listed_info_chunk_task,
+)
+from .partition_maintenance_task import maintain_listed_info_partitions_task
 
-__all__ = ["fetch_listed_info_task"]
\ No newline at end of file
+__all__ = [
+    "fetch_listed_info_task",
+    "backfill_listed_info_task",
+    "fetch_listed_info_chunk_task",
+    "aggregate_listed_info_backfill_task",
+    "maintain_listed_info_partitions_task",
+]
@@ -1,22 +1,41 @@
 """Listed info Celery task with proper async handling."""
 import asyncio
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID, uuid4
 
 from celery import Task
+from celery.exceptions import SoftTimeLimitExceeded
 from celery.utils.log import get_task_logger
 
 from app.infrastructure.celery.app import celery_app
 from app.infrastructure.celery.worker_hooks import get_or_create_event_loop
+from app.domain.entities.backfill_checkpoint import BackfillCheckpoint
+from app.domain.value_objects.time_period import TimePeriod
 from app.infrastructure.database.connection import get_async_session_context
+from app.infrastructure.repositories.database.backfill_checkpoint_repository import (
+    BackfillCheckpointRepository,
+)
 from app.infrastructure.repositories.database.task_log_repository import TaskLogRepository
 
 logger = get_task_logger(__name__)
 
 
+class ListedInfoDatesFailedError(Exception):
+    """一部の日付の取得・保存に失敗した
+
+    自動リトライで同じ task_id のチェックポイントから再開し、失敗した日付だけを処理し直す。
+    """
+
+
 class FetchListedInfoTask(Task):
-    """Base task class for listed info fetching."""
+    """Base task class for listed info fetching.
+
+    リトライでの再開に使うチェックポイントは、リトライを使い切って失敗した時点で削除する。
+    """
 
     autoretry_for = (Exception,)
     max_retries = 3
@@ -29,6 +48,8 @@ class FetchListedInfoTask(Task):
     def on_failure(self, exc, task_id, args, kwargs, einfo):
         """Called when task fails."""
         logger.error(f"Task {task_id} failed: {exc}")
+        # これ以上再開されないため、チェックポイントを残さない
+        get_or_create_event_loop().run_until_complete(_clear_checkpoints(task_id))
 
 
 @celery_app.task(bind=True, base=FetchListedInfoTask, name="fetch_listed_info_task")
@@ -40,6 +61,7 @@ def fetch_listed_info_task(
     codes: Optional[List[str]] = None,
     market: Optional[str] = None,
     period_type: Optional[str] = "yesterday",  # "yesterday", "7days", "30days", "custom"
+    max_concurrency: Optional[int] = None,
 ):
     """
     Fetch listed info data from J-Quants API with proper async handling.
@@ -51,6 +73,7 @@ def fetch_listed_info_task(
         codes: List of stock codes to fetch
         market: Market code to filter
         period_type: Period type for date range calculation
+        max_concurrency: Max dates processed concurrently (defaults to settings)
     """
     task_id = self.request.id
     log_id = uuid4()
@@ -74,6 +97,7 @@ def fetch_listed_info_task(
             codes=codes,
             market=market,
             period_type=period_type,
+            max_concurrency=max_concurrency,
         )
     )
 
@@ -87,14 +111,22 @@ async def _fetch_listed_info_async(
     codes: Optional[List[str]] = None,
     market: Optional[str] = None,
     period_type: Optional[str] = "yesterday",
+    max_concurrency: Optional[int] = None,
 ):
-    """Async implementation of fetch_listed_info task."""
-    from app.application.use_cases.fetch_jquants_listed_info import FetchJQuantsListedInfoUseCase
+    """Async implementation of fetch_listed_info task.
+
+    対象日ごとの取得・保存は最大 ``max_concurrency`` 件まで並行に実行する。
+    各日付は専用の DB セッション（トランザクション）で処理し、
+    J-Quants クライアントとレートリミッターは全日付で共有する。
+    進捗は task_id 単位でチェックポイントに記録され、同じ task_id での
+    再実行（Celery の自動リトライ）は完了済みの日付・ページを読み飛ばす。
+    """
     from app.infrastructure.external_services.jquants.client_factory import create_authenticated_client
-    from app.infrastructure.repositories.database.jquants_listed_info_repository_impl import (
-        JQuantsListedInfoRepositoryImpl,
-    )
-    from app.core.logger import get_logger
+    from app.infrastructure.config.settings import get_infrastructure_settings
+
+    if max_concurrency is None:
+        max_concurrency = get_infrastructure_settings().jquants.backfill_concurrency
+    max_concurrency = max(1, max_concurrency)
 
     async with get_async_session_context() as session:
         # Initialize task log
@@ -121,49 +153,30 @@ async def _fetch_listed_info_async(
                 period_type, from_date, to_date
             )
             
-            logger.info(f"Processing dates: {target_dates}")
+            logger.info(
+                f"Processing dates: {target_dates} (concurrency: {max_concurrency})"
+            )
             
             # Initialize dependencies
-            # 認証済みクライアントを取得
+            # 認証済みクライアントを取得（全日付でレートリミッターを共有）
             base_client, jquants_client = await create_authenticated_client()
-            listed_info_repo = JQuantsListedInfoRepositoryImpl(session)
-            app_logger = get_logger(__name__)
             
-            use_case = FetchJQuantsListedInfoUseCase(
-                jquants_client=jquants_client,
-                listed_info_repository=listed_info_repo,
-                logger=app_logger,
-            )
+            # 土日・祝日などの非営業日は API を呼ばずに除外
+            calendar_dates = target_dates
+            target_dates = await _filter_trading_days(base_client, calendar_dates)
+            skipped_dates = sorted(set(calendar_dates) - set(target_dates))
             
-            # Process each date
-            total_fetched = 0
-            total_saved = 0
-            errors = []
+            # Process dates concurrently
+            # 変更イベントは直前の営業日が保存済みである日次の実行でだけ検出する
+            date_results = await _process_dates(
+                jquants_client, target_dates, codes, max_concurrency,
+                checkpoint_task_id=task_id,
+                detect_changes=period_type == "yesterday",
+            )
             
-            for target_date in target_dates:
-                logger.info(f"Processing date: {target_date}")
-                
-                if codes:
-                    # Process specific codes
-                    for code in codes:
-                        result = await use_case.fetch_by_code(
-                            code=code, target_date=target_date
-                        )
-                        if result.success:
-                            total_fetched += result.fetched_count
-                            total_saved += result.saved_count
-                        else:
-                            errors.append(f"Code {code}: {result.error_message}")
-                else:
-                    # Process all codes
-                    result = await use_case.fetch_and_update_all(
-                        target_date=target_date
-                    )
-                    if result.success:
-                        total_fetched += result.fetched_count
-                        total_saved += result.saved_count
-                    else:
-                        errors.append(f"Date {target_date}: {result.error_message}")
+            total_fetched = sum(r.fetched_count for r in date_results)
+            total_saved = sum(r.saved_count for r in date_results)
+            errors = [error for r in date_results for error in r.errors]
             
             # Update task log with results
             status = "success" if not errors else "failed"
@@ -171,9 +184,15 @@ async def _fetch_listed_info_async(
                 "total_fetched": total_fetched,
                 "total_saved": total_saved,
                 "dates_processed": [d.isoformat() for d in target_dates],
+                "dates_skipped": [d.isoformat() for d in skipped_dates],
+                "dates_unchanged": [
+                    r.target_date.isoformat() for r in date_results if r.snapshot_unchanged
+                ],
                 "codes": codes,
                 "market": market,
                 "errors": errors,
+                "concurrency": max_concurrency,
+                "date_results": [r.to_dict() for r in date_results],
             }
             
             await task_log_repo.update_status(
@@ -193,8 +212,21 @@ async def _fetch_listed_info_async(
             # base_client をクローズ
             await base_client.close()
             
+            if errors:
+                # 失敗した日付は自動リトライでチェックポイントから再開する
+                raise ListedInfoDatesFailedError(
+                    f"{len(errors)} errors in {len(target_dates)} dates: {errors[0]}"
+                )
+
+            # 正常終了した場合は再開の必要がないためチェックポイントを削除
+            await _clear_checkpoints(task_id)
+            
             return result_data
             
+        except ListedInfoDatesFailedError:
+            # タスクログは結果を記録済み
+            raise
+
         except Exception as e:
             logger.error(f"Task failed with error: {str(e)}")
             
@@ -214,6 +246,342 @@ async def _fetch_listed_info_async(
             raise
 
 
+@dataclass
+class _DateFetchResult:
+    """1 日付分の処理結果"""
+
+    target_date: date
+    fetched_count: int = 0
+    saved_count: int = 0
+    inserted_count: int = 0
+    updated_count: int = 0
+    unchanged_count: int = 0
+    errors: List[str] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+    skipped: bool = False  # 前回の実行で完了済み
+    resumed: bool = False  # 前回の実行のページから再開
+    snapshot_unchanged: bool = False  # 前回保存した内容と同一のため書き込みを省略
+
+    def add_save_counts(self, result: Any) -> None:
+        """ユースケースの結果から新規・更新・変更なしの件数を加算する"""
+        self.inserted_count += result.inserted_count
+        self.updated_count += result.updated_count
+        self.unchanged_count += result.unchanged_count
+
+    def to_dict(self) -> Dict[str, Any]:
+        """タスクログ保存用の辞書に変換"""
+        return {
+            "date": self.target_date.isoformat(),
+            "fetched": self.fetched_count,
+            "saved": self.saved_count,
+            "inserted": self.inserted_count,
+            "updated": self.updated_count,
+            "unchanged": self.unchanged_count,
+            "errors": self.errors,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "skipped": self.skipped,
+            "resumed": self.resumed,
+            "snapshot_unchanged": self.snapshot_unchanged,
+        }
+
+
+async def _process_dates(
+    jquants_client: Any,
+    target_dates: List[date],
+    codes: Optional[List[str]],
+    max_concurrency: int,
+    checkpoint_task_id: Optional[str] = None,
+    detect_changes: bool = False,
+) -> List[_DateFetchResult]:
+    """複数の日付を同時実行数の上限付きで処理する
+
+    履歴（history）方式で保存する場合は、版を日付の昇順に積み上げるため
+    max_concurrency によらず日付の昇順に 1 件ずつ処理する。
+
+    Args:
+        checkpoint_task_id: 進捗を記録・再開するチェックポイントのキー（None の場合は記録しない）
+        detect_changes: 直前のスナップショットとの変更イベントを検出する
+
+    Returns:
+        target_dates と同じ順序の処理結果
+    """
+    from app.infrastructure.config.settings import get_infrastructure_settings
+
+    processing_order = target_dates
+    if get_infrastructure_settings().database.listed_info_storage == "history":
+        max_concurrency = 1
+        processing_order = sorted(target_dates)
+
+    checkpoints: Dict[date, BackfillCheckpoint] = {}
+    if checkpoint_task_id:
+        async with get_async_session_context() as session:
+            checkpoints = await BackfillCheckpointRepository(session).get_by_task_id(
+                checkpoint_task_id
+            )
+        if checkpoints:
+            completed = sum(1 for c in checkpoints.values() if c.completed)
+            logger.info(
+                f"Resuming from checkpoint - {completed} of {len(target_dates)} dates completed"
+            )
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(target_date: date) -> _DateFetchResult:
+        async with semaphore:
+            return await _process_date(
+                jquants_client,
+                target_date,
+                codes,
+                checkpoint_task_id=checkpoint_task_id,
+                checkpoint=checkpoints.get(target_date),
+                detect_changes=detect_changes,
+            )
+
+    # タスクは作成順にセマフォを取得するため、processing_order の順に処理される
+    tasks = {d: asyncio.create_task(run(d)) for d in processing_order}
+    try:
+        await asyncio.gather(*tasks.values())
+        return [tasks[d].result() for d in target_dates]
+    except BaseException:
+        # 時間制限などで中断する場合は残りの日付も止め、次回はチェックポイントから再開する
+        for task in tasks.values():
+            task.cancel()
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+        raise
+
+
+async def _process_date(
+    jquants_client: Any,
+    target_date: date,
+    codes: Optional[List[str]],
+    checkpoint_task_id: Optional[str] = None,
+    checkpoint: Optional[BackfillCheckpoint] = None,
+    detect_changes: bool = False,
+) -> _DateFetchResult:
+    """1 日付分の上場銘柄情報を専用のセッションで取得・保存する
+
+    checkpoint_task_id が指定された場合、全銘柄取得ではページの保存ごとに
+    次ページのキーを同じトランザクションでコミットし、完了時に完了を記録する。
+    履歴方式ではコミットで書き込みのロックが解放されないよう、日付の処理全体でロックを保持する。
+    ドメインイベントはセッションのコミット後に発行する。
+    """
+    from app.application.use_cases.fetch_jquants_listed_info import (
+        FetchJQuantsListedInfoUseCase,
+        SnapshotProgress,
+    )
+    from app.infrastructure.repositories.database.listed_info_repository_factory import (
+        create_listed_info_repository,
+    )
+    from app.core.logger import get_logger
+    from app.infrastructure.config.settings import get_infrastructure_settings
+    from app.infrastructure.repositories.database.snapshot_digest_repository import (
+        SnapshotDigestRepository,
+    )
+
+    date_result = _DateFetchResult(target_date=target_date)
+
+    if checkpoint is not None and checkpoint.completed:
+        logger.info(f"Skipping date: {target_date} (completed in a previous attempt)")
+        date_result.fetched_count = checkpoint.fetched_count
+        date_result.saved_count = checkpoint.saved_count
+        date_result.skipped = True
+        return date_result
+
+    # 途中まで保存済みの場合はその件数を引き継いで再開する
+    resume_key = None
+    resume_progress = None
+    base_count = 0
+    if checkpoint is not None and checkpoint.pagination_key and not codes:
+        resume_key = checkpoint.pagination_key
+        base_count = checkpoint.saved_count
+        date_result.resumed = True
+        if checkpoint.listed_codes is not None:
+            resume_progress = SnapshotProgress(
+                listed_codes=set(checkpoint.listed_codes),
+                digest_state=checkpoint.digest_state,
+            )
+
+    logger.info(
+        f"Processing date: {target_date}" + (" (resuming from checkpoint)" if resume_key else "")
+    )
+    started_at = time.perf_counter()
+
+    # ページごとにコミットする場合は、日付の途中で他の書き込みが割り込まないようにする
+    hold_history_lock = (
+        checkpoint_task_id is not None
+        and not codes
+        and get_infrastructure_settings().database.listed_info_storage == "history"
+    )
+
+    results = []
+    try:
+        async with _date_session_context(hold_history_lock) as session:
+            use_case = FetchJQuantsListedInfoUseCase(
+                jquants_client=jquants_client,
+                listed_info_repository=create_listed_info_repository(session),
+                logger=get_logger(__name__),
+                snapshot_repository=(
+                    SnapshotDigestRepository(session)
+                    if get_infrastructure_settings().jquants.skip_unchanged_snapshots
+                    else None
+                ),
+                row_fast_path=get_infrastructure_settings().jquants.listed_info_row_fast_path,
+                detect_changes=detect_changes,
+            )
+            checkpoint_repo = (
+                BackfillCheckpointRepository(session) if checkpoint_task_id else None
+            )
+
+            async def save_checkpoint(
+                next_key: str, count: int, progress: Optional[SnapshotProgress]
+            ) -> None:
+                # 保存済みのデータと次ページのキー、スナップショットの途中経過を同時にコミット
+                await checkpoint_repo.save_progress(
+                    checkpoint_task_id, target_date, next_key,
+                    base_count + count, base_count + count,
+                    listed_codes=progress.listed_codes if progress else None,
+                    digest_state=progress.digest_state if progress else None,
+                )
+                await session.commit()
+
+            if codes:
+                # Process specific codes
+                for code in codes:
+                    result = await use_case.fetch_by_code(
+                        code=code, target_date=target_date
+                    )
+                    results.append(result)
+                    if result.success:
+                        date_result.fetched_count += result.fetched_count
+                        date_result.saved_count += result.saved_count
+                        date_result.add_save_counts(result)
+                    else:
+                        date_result.errors.append(f"Code {code}: {result.error_message}")
+            else:
+                # Process all codes
+                result = await use_case.fetch_and_update_all(
+                    target_date=target_date,
+                    resume_pagination_key=resume_key,
+                    on_checkpoint=save_checkpoint if checkpoint_repo else None,
+                    resume_progress=resume_progress,
+                )
+                results.append(result)
+                if result.success:
+                    date_result.fetched_count += base_count + result.fetched_count
+                    date_result.saved_count += base_count + result.saved_count
+                    date_result.add_save_counts(result)
+                    date_result.snapshot_unchanged = result.snapshot_unchanged
+                else:
+                    date_result.errors.append(f"Date {target_date}: {result.error_message}")
+
+            if checkpoint_repo is not None and not date_result.errors:
+                await checkpoint_repo.mark_completed(
+                    checkpoint_task_id,
+                    target_date,
+                    date_result.fetched_count,
+                    date_result.saved_count,
+                )
+
+        # コミット済みのデータについてのイベントだけを発行する
+        for result in results:
+            await use_case.publish_events(result)
+    except SoftTimeLimitExceeded:
+        # 時間制限はタスク全体を中断させ、リトライ時にチェックポイントから再開する
+        raise
+    except Exception as e:
+        # 1 日付の失敗で他の日付の処理を中断しない
+        logger.error(f"Failed to process date {target_date}: {str(e)}")
+        date_result.errors.append(f"Date {target_date}: {str(e)}")
+    finally:
+        date_result.elapsed_seconds = time.perf_counter() - started_at
+
+    logger.info(
+        f"Finished date: {target_date} - fetched: {date_result.fetched_count}, "
+        f"saved: {date_result.saved_count}, elapsed: {date_result.elapsed_seconds:.2f}s"
+    )
+    return date_result
+
+
+@asynccontextmanager
+async def _date_session_context(hold_history_lock: bool = False):
+    """1 日付分の処理に使うセッション
+
+    hold_history_lock が True の場合は接続を固定し、セッションを閉じるまで
+    履歴への書き込みのロック（セッション単位）を保持する。
+    """
+    if not hold_history_lock:
+        async with get_async_session_context() as session:
+            yield session
+        return
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from app.infrastructure.database.connection import get_engine
+    from app.infrastructure.repositories.database.jquants_listed_info_history_repository import (
+        lock_history_writes,
+        unlock_history_writes,
+    )
+
+    async with get_engine().connect() as connection:
+        await lock_history_writes(connection)
+        try:
+            async with AsyncSession(
+                bind=connection, expire_on_commit=False, autoflush=False
+            ) as session:
+                try:
+                    yield session
+                    await session.commit()
+                except Exception:
+                    await session.rollback()
+                    raise
+        finally:
+            try:
+                await unlock_history_writes(connection)
+            except Exception as e:
+                # ロックを保持したまま接続をプールに戻さない（接続の切断でロックは解放される）
+                logger.warning(f"Failed to release history write lock: {str(e)}")
+                await connection.invalidate()
+
+
+async def _clear_checkpoints(task_id: Optional[str]) -> None:
+    """タスクのチェックポイントを削除する（失敗してもタスクは失敗させない）"""
+    if not task_id:
+        return
+    try:
+        async with get_async_session_context() as session:
+            await BackfillCheckpointRepository(session).delete_by_task_id(task_id)
+    except Exception as e:
+        logger.warning(f"Failed to clear checkpoints for task {task_id}: {str(e)}")
+
+
+async def _filter_trading_days(base_client, target_dates: List[date]) -> List[date]:
+    """対象日から非営業日を除外する（順序は維持）
+
+    取引カレンダーはキャッシュ経由で取得し、取得できない場合は平日ベースで判定する。
+    ``jquants.skip_non_trading_days`` が無効な場合はそのまま返す。
+    """
+    from app.infrastructure.config.settings import get_infrastructure_settings
+    from app.infrastructure.external_services.jquants.trading_calendar_cache import (
+        get_trading_calendar_cache,
+    )
+    from app.infrastructure.external_services.jquants.trading_calendar_client import (
+        JQuantsTradingCalendarClient,
+    )
+
+    if not target_dates or not get_infrastructure_settings().jquants.skip_non_trading_days:
+        return target_dates
+
+    period = TimePeriod(start_date=min(target_dates), end_date=max(target_dates))
+    calendar = await get_trading_calendar_cache().get_calendar(
+        period.start_date, period.end_date, JQuantsTradingCalendarClient(base_client)
+    )
+    trading_days = set(period.iter_trading_days(calendar))
+    skipped = [d for d in target_dates if d not in trading_days]
+    if skipped:
+        logger.info(f"Skipping non-trading days: {[d.isoformat() for d in skipped]}")
+    return [d for d in target_dates if d in trading_days]
+
+
 def _calculate_date_range(
     period_type: str,
     from_date: Optional[str] = None,
@@ -0,0 +1,413 @@
+"""Listed info backfill Celery tasks (fan-out with group/chord).
+
+長期間のバックフィルを日付（または週・月）単位のサブタスクに分割し、
+Celery の group として全ワーカーに分散して実行する。
+各サブタスクの結果は chord のコールバックで集計され、
+コーディネーターが作成した 1 つの TaskExecutionLog に記録される。
+サブタスクがリトライを使い切って例外で終わった場合は、chord のエラーコールバックが
+タスクログを失敗として記録する。
+
+履歴（history）方式で保存する場合は版を日付の昇順に積み上げる必要があるため、
+サブタスクを並行に実行せず、日付の昇順の chain として 1 つずつ実行する。
+"""
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from uuid import UUID, uuid4
+
+from celery import chain, chord, group
+from celery.utils.log import get_task_logger
+
+from app.domain.value_objects.time_period import TimePeriod
+from app.infrastructure.celery.app import celery_app
+from app.infrastructure.celery.tasks.jquants_listed_info_task import (
+    FetchListedInfoTask,
+    ListedInfoDatesFailedError,
+    _clear_checkpoints,
+    _filter_trading_days,
+    _process_dates,
+)
+from app.infrastructure.celery.worker_hooks import get_or_create_event_loop
+from app.infrastructure.database.connection import get_async_session_context
+from app.infrastructure.repositories.database.task_log_repository import TaskLogRepository
+
+logger = get_task_logger(__name__)
+
+BACKFILL_TASK_NAME = "backfill_listed_info_task"
+
+# サブタスクの分割単位
+CHUNK_UNITS = ("day", "week", "month")
+
+
+def _split_period(period: TimePeriod, chunk: str) -> List[TimePeriod]:
+    """期間をサブタスク単位に分割する"""
+    if chunk == "day":
+        return list(period.split_by_days())
+    if chunk == "week":
+        return list(period.split_by_weeks())
+    if chunk == "month":
+        return list(period.split_by_months())
+    raise ValueError(f"Invalid chunk: {chunk} (expected one of {', '.join(CHUNK_UNITS)})")
+
+
+@celery_app.task(bind=True, name=BACKFILL_TASK_NAME)
+def backfill_listed_info_task(
+    self,
+    from_date: str,
+    to_date: str,
+    codes: Optional[List[str]] = None,
+    market: Optional[str] = None,
+    schedule_id: Optional[str] = None,
+    chunk: str = "day",
+):
+    """
+    Split a date range into subtasks and dispatch them as a Celery chord.
+
+    With history storage the subtasks are chained in date order instead.
+
+    Args:
+        from_date: Start date (YYYY-MM-DD)
+        to_date: End date (YYYY-MM-DD)
+        codes: List of stock codes to fetch
+        market: Market code to filter
+        schedule_id: Schedule ID if triggered by schedule
+        chunk: Subtask unit ("day", "week" or "month")
+    """
+    period = TimePeriod.from_strings(from_date, to_date)
+    chunks = _split_period(period, chunk)
+    log_id = uuid4()
+
+    logger.info(
+        f"Starting backfill - task_id: {self.request.id}, period: {period}, "
+        f"chunk: {chunk}, subtasks: {len(chunks)}"
+    )
+
+    loop = get_or_create_event_loop()
+    loop.run_until_complete(
+        _create_backfill_log(
+            log_id=log_id,
+            task_id=self.request.id,
+            schedule_id=schedule_id,
+            period=period,
+            chunk=chunk,
+            chunk_count=len(chunks),
+        )
+    )
+
+    callback = aggregate_listed_info_backfill_task.s(
+        log_id=str(log_id), codes=codes, market=market
+    ).on_error(fail_listed_info_backfill_task.s(log_id=str(log_id)))
+
+    result = {
+        "log_id": str(log_id),
+        "subtasks": len(chunks),
+        "chunk": chunk,
+        "from_date": from_date,
+        "to_date": to_date,
+    }
+
+    if _is_history_storage():
+        # 版の期間が崩れないよう、チャンクを日付の昇順に 1 つずつ実行する
+        links = []
+        for i, c in enumerate(chunks):
+            # 先頭のチャンクには空の結果を渡す（以降は前のチャンクの結果が渡される）
+            previous_results = ([],) if i == 0 else ()
+            links.append(
+                fetch_listed_info_chunk_in_order_task.s(
+                    *previous_results,
+                    from_date=c.start_date.isoformat(),
+                    to_date=c.end_date.isoformat(),
+                    codes=codes,
+                ).on_error(fail_listed_info_backfill_task.s(log_id=str(log_id)))
+            )
+        chain_result = chain(*links, callback).apply_async()
+        result["chain_id"] = chain_result.id
+        return result
+
+    header = group(
+        fetch_listed_info_chunk_task.s(
+            from_date=c.start_date.isoformat(),
+            to_date=c.end_date.isoformat(),
+            codes=codes,
+        )
+        for c in chunks
+    )
+    chord_result = chord(header)(callback)
+    result["chord_id"] = chord_result.id
+    return result
+
+
+@celery_app.task(bind=True, base=FetchListedInfoTask, name="fetch_listed_info_chunk_task")
+def fetch_listed_info_chunk_task(
+    self,
+    from_date: str,
+    to_date: str,
+    codes: Optional[List[str]] = None,
+    max_concurrency: Optional[int] = None,
+):
+    """
+    Fetch listed info for one chunk of a backfill.
+
+    失敗した日付がある場合はリトライし、チェックポイントから失敗した日付だけを再処理する。
+    リトライを使い切った場合はエラーを例外ではなく結果として返し、
+    chord のコールバックで集計できるようにする。
+    時間制限で中断された場合もリトライ時にチェックポイントから再開する。
+
+    Args:
+        from_date: Start date (YYYY-MM-DD)
+        to_date: End date (YYYY-MM-DD)
+        codes: List of stock codes to fetch
+        max_concurrency: Max dates processed concurrently within the chunk
+    """
+    return _run_chunk(self, from_date, to_date, codes, max_concurrency)
+
+
+@celery_app.task(bind=True, base=FetchListedInfoTask, name="fetch_listed_info_chunk_in_order_task")
+def fetch_listed_info_chunk_in_order_task(
+    self,
+    previous_results: List[Dict[str, Any]],
+    from_date: str,
+    to_date: str,
+    codes: Optional[List[str]] = None,
+    max_concurrency: Optional[int] = None,
+):
+    """
+    Fetch listed info for one chunk of a backfill chained in date order.
+
+    履歴方式のバックフィルで使用する。前のチャンクまでの結果を受け取り、このチャンクの結果を
+    追加して次のチャンク（最後は集計コールバック）に渡す。
+    前のチャンクに失敗した日付がある場合は、版を日付の昇順に積み上げられないため
+    このチャンクを処理せずにエラーとして記録する。
+
+    Args:
+        previous_results: Results of the preceding chunks in the chain
+        from_date: Start date (YYYY-MM-DD)
+        to_date: End date (YYYY-MM-DD)
+        codes: List of stock codes to fetch
+        max_concurrency: Max dates processed concurrently within the chunk
+    """
+    if any(r.get("errors") for r in previous_results):
+        logger.warning(
+            f"Skipping backfill chunk {from_date} to {to_date} - an earlier chunk failed"
+        )
+        return [*previous_results, _skipped_chunk_result(from_date, to_date)]
+    return [*previous_results, _run_chunk(self, from_date, to_date, codes, max_concurrency)]
+
+
+def _run_chunk(
+    task,
+    from_date: str,
+    to_date: str,
+    codes: Optional[List[str]],
+    max_concurrency: Optional[int],
+) -> Dict[str, Any]:
+    """チャンクを取得・保存し、失敗した日付があればリトライする"""
+    logger.info(
+        f"Starting backfill chunk - task_id: {task.request.id}, {from_date} to {to_date}"
+    )
+
+    loop = get_or_create_event_loop()
+    chunk_result = loop.run_until_complete(
+        _fetch_chunk_async(
+            period=TimePeriod.from_strings(from_date, to_date),
+            codes=codes,
+            max_concurrency=max_concurrency,
+            task_id=task.request.id,
+        )
+    )
+
+    errors = chunk_result["errors"]
+    if errors:
+        if task.request.retries < task.max_retries:
+            raise task.retry(
+                exc=ListedInfoDatesFailedError(
+                    f"{len(errors)} errors in chunk {from_date} to {to_date}: {errors[0]}"
+                )
+            )
+        # 最後の試行ではエラーを集計に回し、再開しないチェックポイントを削除する
+        loop.run_until_complete(_clear_checkpoints(task.request.id))
+    return chunk_result
+
+
+def _skipped_chunk_result(from_date: str, to_date: str) -> Dict[str, Any]:
+    """前のチャンクの失敗で処理しなかったチャンクの結果"""
+    return {
+        "from_date": from_date,
+        "to_date": to_date,
+        "fetched": 0,
+        "saved": 0,
+        "errors": [f"Chunk {from_date} to {to_date}: skipped because an earlier chunk failed"],
+        "date_results": [],
+    }
+
+
+def _is_history_storage() -> bool:
+    """上場銘柄情報を履歴方式で保存するか"""
+    from app.infrastructure.config.settings import get_infrastructure_settings
+
+    return get_infrastructure_settings().database.listed_info_storage == "history"
+
+
+@celery_app.task(bind=True, name="aggregate_listed_info_backfill_task")
+def aggregate_listed_info_backfill_task(
+    self,
+    chunk_results: List[Dict[str, Any]],
+    log_id: str,
+    codes: Optional[List[str]] = None,
+    market: Optional[str] = None,
+):
+    """
+    Chord callback aggregating chunk results into the backfill task log.
+
+    Args:
+        chunk_results: Results returned by fetch_listed_info_chunk_task
+        log_id: Task execution log ID created by the coordinator
+        codes: List of stock codes fetched
+        market: Market code filtered
+    """
+    result_data = _aggregate_chunk_results(chunk_results)
+    result_data["codes"] = codes
+    result_data["market"] = market
+
+    loop = get_or_create_event_loop()
+    loop.run_until_complete(_finish_backfill_log(UUID(log_id), result_data))
+
+    logger.info(
+        f"Backfill completed - log_id: {log_id}, status: {result_data['status']}, "
+        f"fetched: {result_data['total_fetched']}, saved: {result_data['total_saved']}"
+    )
+    return result_data
+
+
+@celery_app.task(name="fail_listed_info_backfill_task")
+def fail_listed_info_backfill_task(request, exc, traceback, log_id: str):
+    """
+    Chord error callback marking the backfill task log as failed.
+
+    サブタスクまたは集計コールバックが例外で終わると集計コールバックは実行されないため、
+    タスクログが running のまま残らないようにここで失敗として記録する。
+
+    Args:
+        request: Request of the failed task
+        exc: Exception raised by the failed task
+        traceback: Traceback of the exception
+        log_id: Task execution log ID created by the coordinator
+    """
+    error = f"Backfill failed: {exc!r}"
+    logger.error(f"Backfill failed - log_id: {log_id}, error: {exc!r}")
+
+    loop = get_or_create_event_loop()
+    loop.run_until_complete(
+        _finish_backfill_log(UUID(log_id), {"status": "failed", "errors": [error]})
+    )
+
+
+async def _create_backfill_log(
+    log_id: UUID,
+    task_id: Optional[str],
+    schedule_id: Optional[str],
+    period: TimePeriod,
+    chunk: str,
+    chunk_count: int,
+) -> None:
+    """コーディネーターのタスクログを作成する"""
+    from app.domain.entities.task_log import TaskExecutionLog
+
+    async with get_async_session_context() as session:
+        task_log_repo = TaskLogRepository(session)
+        await task_log_repo.create(
+            TaskExecutionLog(
+                id=log_id,
+                schedule_id=UUID(schedule_id) if schedule_id else None,
+                task_name=BACKFILL_TASK_NAME,
+                task_id=task_id,
+                started_at=datetime.utcnow(),
+                status="running",
+                result={
+                    "from_date": period.start_date.isoformat(),
+                    "to_date": period.end_date.isoformat(),
+                    "chunk": chunk,
+                    "subtasks": chunk_count,
+                },
+            )
+        )
+
+
+async def _fetch_chunk_async(
+    period: TimePeriod,
+    codes: Optional[List[str]],
+    max_concurrency: Optional[int],
+    task_id: Optional[str] = None,
+) -> Dict[str, Any]:
+    """1 チャンク分の日付を取得・保存する"""
+    from app.infrastructure.config.settings import get_infrastructure_settings
+    from app.infrastructure.external_services.jquants.client_factory import create_authenticated_client
+
+    if max_concurrency is None:
+        max_concurrency = get_infrastructure_settings().jquants.backfill_concurrency
+
+    target_dates = [c.start_date for c in period.split_by_days()]
+    chunk_result: Dict[str, Any] = {
+        "from_date": period.start_date.isoformat(),
+        "to_date": period.end_date.isoformat(),
+        "fetched": 0,
+        "saved": 0,
+        "errors": [],
+        "date_results": [],
+    }
+
+    try:
+        base_client, jquants_client = await create_authenticated_client()
+    except Exception as e:
+        logger.error(f"Backfill chunk {period} failed: {str(e)}")
+        chunk_result["errors"].append(f"Chunk {period}: {str(e)}")
+        return chunk_result
+
+    try:
+        target_dates = await _filter_trading_days(base_client, target_dates)
+        date_results = await _process_dates(
+            jquants_client, target_dates, codes, max(1, max_concurrency),
+            checkpoint_task_id=task_id,
+        )
+    finally:
+        await base_client.close()
+
+    chunk_result["fetched"] = sum(r.fetched_count for r in date_results)
+    chunk_result["saved"] = sum(r.saved_count for r in date_results)
+    chunk_result["errors"] = [error for r in date_results for error in r.errors]
+    chunk_result["date_results"] = [r.to_dict() for r in date_results]
+
+    # 失敗した日付はリトライ時にチェックポイントから再開する
+    if not chunk_result["errors"]:
+        await _clear_checkpoints(task_id)
+    return chunk_result
+
+
+def _aggregate_chunk_results(chunk_results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """チャンクごとの結果を 1 つのタスクログ結果に集計する"""
+    ordered = sorted(chunk_results, key=lambda r: r["from_date"])
+    errors = [error for r in ordered for error in r.get("errors", [])]
+    date_results = [d for r in ordered for d in r.get("date_results", [])]
+
+    return {
+        "status": "success" if not errors else "failed",
+        "total_fetched": sum(r.get("fetched", 0) for r in ordered),
+        "total_saved": sum(r.get("saved", 0) for r in ordered),
+        "dates_processed": [d["date"] for d in date_results],
+        "dates_unchanged": [d["date"] for d in date_results if d.get("snapshot_unchanged")],
+        "subtasks": len(ordered),
+        "errors": errors,
+        "date_results": date_results,
+    }
+
+
+async def _finish_backfill_log(log_id: UUID, result_data: Dict[str, Any]) -> None:
+    """集計結果でコーディネーターのタスクログを更新する"""
+    async with get_async_session_context() as session:
+        task_log_repo = TaskLogRepository(session)
+        await task_log_repo.update_status(
+            log_id=log_id,
+            status=result_data["status"],
+            finished_at=datetime.utcnow(),
+            result=result_data,
+            error_message="\n".join(result_data["errors"]) if result_data["errors"] else None,
+        )
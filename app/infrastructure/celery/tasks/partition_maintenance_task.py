@@ -0,0 +1,100 @@
+"""Partition maintenance Celery task.
+
+jquants_listed_info の将来分のパーティションを事前に作成し、
+保持期間を過ぎたパーティションを切り離す。
+celery_beat_schedules に task_name="maintain_listed_info_partitions_task" の
+スケジュール（例: 毎日 1 回）を登録して実行する。
+"""
+from datetime import date
+from typing import Any, Dict, Optional
+
+from celery.utils.log import get_task_logger
+
+from app.infrastructure.celery.app import celery_app
+from app.infrastructure.celery.worker_hooks import get_or_create_event_loop
+from app.infrastructure.database.connection import get_async_session_context
+from app.infrastructure.database.partitioning import (
+    LISTED_INFO_TABLE,
+    Partition,
+    RangePartitionManager,
+    partition_start,
+)
+
+logger = get_task_logger(__name__)
+
+PARTITION_MAINTENANCE_TASK_NAME = "maintain_listed_info_partitions_task"
+
+
+@celery_app.task(bind=True, name=PARTITION_MAINTENANCE_TASK_NAME)
+def maintain_listed_info_partitions_task(
+    self,
+    premake: Optional[int] = None,
+    retention_months: Optional[int] = None,
+    from_date: Optional[str] = None,
+):
+    """
+    Create upcoming partitions of jquants_listed_info and detach expired ones.
+
+    Args:
+        premake: Number of future partitions to keep created (defaults to settings)
+        retention_months: Detach partitions older than this many months, 0 keeps all
+            (defaults to settings)
+        from_date: Also create partitions from this date (YYYY-MM-DD), e.g. before a backfill
+    """
+    logger.info(f"Starting partition maintenance - task_id: {self.request.id}")
+
+    loop = get_or_create_event_loop()
+    return loop.run_until_complete(
+        _maintain_partitions_async(
+            premake=premake,
+            retention_months=retention_months,
+            from_date=date.fromisoformat(from_date) if from_date else None,
+        )
+    )
+
+
+def _months_before(target_date: date, months: int) -> date:
+    """target_date の月初から months か月前の月初"""
+    index = target_date.year * 12 + target_date.month - 1 - months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+async def _maintain_partitions_async(
+    premake: Optional[int] = None,
+    retention_months: Optional[int] = None,
+    from_date: Optional[date] = None,
+    today: Optional[date] = None,
+) -> Dict[str, Any]:
+    """パーティションの作成と切り離しを 1 トランザクションで行う"""
+    from app.infrastructure.config.settings import get_infrastructure_settings
+
+    db_settings = get_infrastructure_settings().database
+    interval = db_settings.listed_info_partition_interval
+    if premake is None:
+        premake = db_settings.partition_premake
+    if retention_months is None:
+        retention_months = db_settings.partition_retention_months
+    today = today or date.today()
+
+    # 現在のパーティションから premake 個先のパーティションまで
+    last = Partition.containing(LISTED_INFO_TABLE, today, interval)
+    for _ in range(max(0, premake)):
+        last = Partition.containing(LISTED_INFO_TABLE, last.end, interval)
+
+    async with get_async_session_context() as session:
+        manager = RangePartitionManager(session, LISTED_INFO_TABLE, interval=interval)
+        created = await manager.ensure_partitions(min(from_date or today, today), last.start)
+
+        detached = []
+        if retention_months > 0:
+            cutoff = partition_start(_months_before(today, retention_months), interval)
+            detached = await manager.detach_partitions_before(cutoff)
+
+    result = {
+        "created": [p.name for p in created],
+        "detached": [p.name for p in detached],
+    }
+    logger.info(
+        f"Partition maintenance completed - created: {len(created)}, detached: {len(detached)}"
+    )
+    return result
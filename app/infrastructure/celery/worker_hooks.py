@@ -37,4 +37,13 @@ def cleanup_worker_loop(**kwargs):
     """Clean up event loop when worker process shuts down."""
     logger.info("Cleaning up event loop for worker process")
     if hasattr(_thread_local, 'loop') and not _thread_local.loop.is_closed():
+        from app.infrastructure.external_services.jquants.session_registry import (
+            close_jquants_sessions,
+        )
+
+        # 共有 HTTP セッションはループを閉じる前にクローズする
+        try:
+            _thread_local.loop.run_until_complete(close_jquants_sessions())
+        except Exception as e:
+            logger.warning(f"Failed to close J-Quants sessions: {e}")
         _thread_local.loop.close()
\ No newline at end of file
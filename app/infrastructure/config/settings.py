@@ -1,7 +1,7 @@
 """Infrastructure-specific settings."""
-from typing import Optional
+from typing import Literal, Optional
 
-from pydantic import Field
+from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -21,6 +21,34 @@ class DatabaseSettings(BaseSettings):
     max_overflow: int = Field(default=20, description="Max overflow connections")
     pool_timeout: int = Field(default=30, description="Pool timeout in seconds")
     echo: bool = Field(default=False, description="Echo SQL statements")
+    copy_threshold: int = Field(
+        default=5000,
+        description="Row count from which bulk saves stream rows with COPY (0 disables)"
+    )
+    listed_info_storage: Literal["snapshot", "history"] = Field(
+        default="snapshot",
+        description="Listed info storage model: full daily snapshots or SCD type-2 history"
+    )
+    listed_info_partition_interval: Literal["month", "year"] = Field(
+        default="month",
+        description=(
+            "Range partition size of jquants_listed_info used by the maintenance task (the "
+            "partitioning migration always creates monthly partitions); changing it only affects "
+            "newly created partitions"
+        )
+    )
+    partition_premake: int = Field(
+        default=3,
+        description="Number of future partitions created ahead by the maintenance task"
+    )
+    partition_retention_months: int = Field(
+        default=0,
+        description="Detach partitions older than this many months (0 keeps all)"
+    )
+    upsert_only_changed: bool = Field(
+        default=True,
+        description="Only rewrite existing rows on upsert when a business column differs"
+    )
 
 
 class RedisSettings(BaseSettings):
@@ -38,6 +66,10 @@ class RedisSettings(BaseSettings):
     ttl: int = Field(default=3600, description="Default TTL in seconds")
     max_connections: int = Field(default=10, description="Max connections")
     decode_responses: bool = Field(default=True, description="Decode responses")
+    listed_info_cache_ttl: int = Field(
+        default=3600,
+        description="TTL of cached per-date listed info snapshots in seconds (0 disables)"
+    )
 
 
 class CelerySettings(BaseSettings):
@@ -92,6 +124,51 @@ class JQuantsSettings(BaseSettings):
     )
     timeout: int = Field(default=30, description="API timeout in seconds")
     max_retries: int = Field(default=3, description="Max retry attempts")
+    connection_limit: int = Field(
+        default=100,
+        description="Max total connections in the shared J-Quants connection pool"
+    )
+    connection_limit_per_host: int = Field(
+        default=10,
+        description="Max connections per host in the shared J-Quants connection pool"
+    )
+    keepalive_timeout: float = Field(
+        default=30.0,
+        description="Seconds to keep idle J-Quants connections alive"
+    )
+    session_idle_timeout: float = Field(
+        default=300.0,
+        description="Seconds of inactivity before the shared J-Quants session is recreated"
+    )
+    backfill_concurrency: int = Field(
+        default=4,
+        description="Max dates fetched and saved concurrently by multi-date listed info tasks"
+    )
+    skip_unchanged_snapshots: bool = Field(
+        default=True,
+        description=(
+            "Skip writing a date whose fetched snapshot matches the stored content digest. "
+            "When a digest is stored for the date, the raw API pages of the whole day are held "
+            "in memory until they can be compared (about 6 MB for 4,400 listings), so saving "
+            "does not overlap with fetching for that date"
+        )
+    )
+    listed_info_row_fast_path: bool = Field(
+        default=True,
+        description="Convert fetched listed info records straight into database rows instead of entities"
+    )
+    skip_non_trading_days: bool = Field(
+        default=True,
+        description="Skip weekends and exchange holidays when expanding listed info date ranges"
+    )
+    trading_calendar_cache_ttl: int = Field(
+        default=86400,
+        description="Seconds to cache the trading calendar of the current and future years"
+    )
+    trading_calendar_past_year_cache_ttl: int = Field(
+        default=30 * 86400,
+        description="Seconds to cache the trading calendar of past years"
+    )
 
 
 class RateLimitSettings(BaseSettings):
@@ -105,27 +182,52 @@ class RateLimitSettings(BaseSettings):
     # J-Quants rate limiting
     jquants_max_requests: int = Field(
         default=100,
-        description="Maximum requests per window for J-Quants API",
-        env="JQUANTS_RATE_LIMIT_REQUESTS"
+        description="Maximum requests per window for J-Quants API"
     )
     jquants_window_seconds: int = Field(
         default=60,
-        description="Time window in seconds for J-Quants rate limiting",
-        env="JQUANTS_RATE_LIMIT_WINDOW"
+        description="Time window in seconds for J-Quants rate limiting"
+    )
+    jquants_backend: str = Field(
+        default="memory",
+        description="Rate limiter backend for J-Quants API: 'memory' (per process) or 'redis' (shared by all workers)"
+    )
+    jquants_adaptive: bool = Field(
+        default=False,
+        description="Adapt the J-Quants request rate to 429 responses (AIMD) and retry instead of failing"
+    )
+    jquants_adaptive_max_requests: Optional[int] = Field(
+        default=None,
+        description="Upper bound of requests per window the adaptive limiter may grow to (defaults to jquants_max_requests)"
+    )
+    jquants_max_rate_limit_retries: int = Field(
+        default=5,
+        description="Maximum retries of a single J-Quants request after 429 responses in adaptive mode"
+    )
+    redis_key_prefix: str = Field(
+        default="stockura:rate_limit:",
+        description="Key prefix for Redis-backed rate limiter buckets"
     )
     
     # yfinance rate limiting
     yfinance_max_requests: int = Field(
         default=2000,
-        description="Maximum requests per window for yfinance API",
-        env="YFINANCE_RATE_LIMIT_REQUESTS"
+        description="Maximum requests per window for yfinance API"
     )
     yfinance_window_seconds: int = Field(
         default=3600,
-        description="Time window in seconds for yfinance rate limiting",
-        env="YFINANCE_RATE_LIMIT_WINDOW"
+        description="Time window in seconds for yfinance rate limiting"
     )
 
+    @model_validator(mode="after")
+    def validate_jquants_adaptive_backend(self) -> "RateLimitSettings":
+        """Reject adaptive rate limiting with the Redis backend at startup."""
+        if self.jquants_adaptive and self.jquants_backend == "redis":
+            raise ValueError(
+                "jquants_adaptive is only supported by the 'memory' jquants_backend"
+            )
+        return self
+
 
 class InfrastructureSettings(BaseSettings):
     """Combined infrastructure settings."""
@@ -180,10 +282,19 @@ class InfrastructureSettings(BaseSettings):
             self.rate_limit.jquants_max_requests = int(jquants_max_requests)
         if jquants_window := os.getenv("JQUANTS_RATE_LIMIT_WINDOW"):
             self.rate_limit.jquants_window_seconds = int(jquants_window)
+        if jquants_backend := os.getenv("JQUANTS_RATE_LIMIT_BACKEND"):
+            self.rate_limit.jquants_backend = jquants_backend.lower()
+        if jquants_adaptive := os.getenv("JQUANTS_RATE_LIMIT_ADAPTIVE"):
+            self.rate_limit.jquants_adaptive = jquants_adaptive.lower() == "true"
+        if jquants_adaptive_max := os.getenv("JQUANTS_RATE_LIMIT_ADAPTIVE_MAX_REQUESTS"):
+            self.rate_limit.jquants_adaptive_max_requests = int(jquants_adaptive_max)
         if yfinance_max_requests := os.getenv("YFINANCE_RATE_LIMIT_REQUESTS"):
             self.rate_limit.yfinance_max_requests = int(yfinance_max_requests)
         if yfinance_window := os.getenv("YFINANCE_RATE_LIMIT_WINDOW"):
             self.rate_limit.yfinance_window_seconds = int(yfinance_window)
+        # The overrides above bypass validation; re-validate so that model validators
+        # (e.g. the adaptive/backend check) see the final values
+        self.rate_limit = RateLimitSettings.model_validate(self.rate_limit.model_dump())
 
 
 _infrastructure_settings: Optional[InfrastructureSettings] = None
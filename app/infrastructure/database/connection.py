@@ -122,6 +122,20 @@ async def close_database() -> None:
     _sessionmakers.clear()
 
 
+async def dispose_engine() -> None:
+    """Close database connections of the current event loop.
+
+    Long-lived loops (e.g. the Celery Beat scheduler's database thread) call
+    this before the loop is closed so that its pool is not leaked.
+    """
+    loop = asyncio.get_running_loop()
+    _sessionmakers.pop(loop, None)
+    engine = _engines.pop(loop, None)
+    if engine is not None:
+        await engine.dispose()
+        logger.info(f"Database connections closed for event loop {id(loop)}")
+
+
 @asynccontextmanager
 async def get_async_session_context():
     """Get async database session context manager for CLI usage.
@@ -1,10 +1,17 @@
 """Database models."""
+from .backfill_checkpoint import BackfillCheckpointModel
 from .jquants_listed_info import JQuantsListedInfoModel
-from .schedule import CeleryBeatSchedule
+from .jquants_listed_info_history import JQuantsListedInfoHistoryModel
+from .schedule import CeleryBeatSchedule, CeleryBeatScheduleTombstone
+from .snapshot_digest import SnapshotDigestModel
 from .task_log import TaskExecutionLog
 
 __all__ = [
+    "BackfillCheckpointModel",
     "JQuantsListedInfoModel",
+    "JQuantsListedInfoHistoryModel",
     "CeleryBeatSchedule",
+    "CeleryBeatScheduleTombstone",
+    "SnapshotDigestModel",
     "TaskExecutionLog",
 ]
\ No newline at end of file
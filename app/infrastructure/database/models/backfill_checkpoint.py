@@ -0,0 +1,42 @@
+"""Backfill checkpoint database model."""
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Date,
+    DateTime,
+    Integer,
+    LargeBinary,
+    PrimaryKeyConstraint,
+    String,
+    Text,
+    func,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+
+from app.infrastructure.database.connection import Base
+
+
+class BackfillCheckpointModel(Base):
+    """Progress of each target date within a backfill task (keyed by Celery task ID)."""
+
+    __tablename__ = "backfill_checkpoints"
+    __table_args__ = (PrimaryKeyConstraint("task_id", "target_date"),)
+
+    task_id = Column(String(255), nullable=False)  # Celery task ID（リトライ間で共通）
+    target_date = Column(Date, nullable=False)
+    completed = Column(Boolean, nullable=False, default=False)
+    pagination_key = Column(Text, nullable=True)  # 次に取得するページのキー
+    fetched_count = Column(Integer, nullable=False, default=0)
+    saved_count = Column(Integer, nullable=False, default=0)
+    listed_codes = Column(JSONB, nullable=True)  # 保存済みページまでに含まれていた銘柄コード
+    digest_state = Column(LargeBinary, nullable=True)  # 保存済みページまでのダイジェストの途中経過
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return (
+            f"<BackfillCheckpointModel(task_id='{self.task_id}', "
+            f"target_date='{self.target_date}', completed={self.completed})>"
+        )
@@ -1,10 +1,25 @@
 """Listed info database model."""
 from datetime import datetime
 
-from sqlalchemy import Column, Date, DateTime, Index, PrimaryKeyConstraint, String, func
+from sqlalchemy import DDL, Column, Date, DateTime, Index, PrimaryKeyConstraint, String, event, func
 
 from app.infrastructure.database.connection import Base
 
+# 銘柄コード・日付以外の業務項目（差分判定の対象）
+LISTED_INFO_ATTRIBUTE_COLUMNS = (
+    "company_name",
+    "company_name_english",
+    "sector_17_code",
+    "sector_17_code_name",
+    "sector_33_code",
+    "sector_33_code_name",
+    "scale_category",
+    "market_code",
+    "market_code_name",
+    "margin_code",
+    "margin_code_name",
+)
+
 
 class JQuantsListedInfoModel(Base):
     """J-Quants listed info SQLAlchemy model for J-Quants listed company information."""
@@ -14,6 +29,8 @@ class JQuantsListedInfoModel(Base):
         PrimaryKeyConstraint("date", "code"),
         Index("idx_jquants_listed_info_code", "code"),
         Index("idx_jquants_listed_info_date", "date"),
+        # date で月（または年）ごとにレンジパーティション化（partitioning モジュールで管理）
+        {"postgresql_partition_by": "RANGE (date)"},
     )
 
     date = Column(Date, nullable=False)
@@ -34,4 +51,16 @@ class JQuantsListedInfoModel(Base):
 
     def __repr__(self) -> str:
         """String representation."""
-        return f"<JQuantsListedInfoModel(date='{self.date}', code='{self.code}', company_name='{self.company_name}')>"
\ No newline at end of file
+        return f"<JQuantsListedInfoModel(date='{self.date}', code='{self.code}', company_name='{self.company_name}')>"
+
+
+# パーティションのない範囲の行を受け入れる DEFAULT パーティション
+# （マイグレーションを使わずに create_all で作成する場合向け）
+event.listen(
+    JQuantsListedInfoModel.__table__,
+    "after_create",
+    DDL(
+        "CREATE TABLE IF NOT EXISTS jquants_listed_info_default "
+        "PARTITION OF jquants_listed_info DEFAULT"
+    ).execute_if(dialect="postgresql"),
+)
@@ -0,0 +1,48 @@
+"""Listed info history (SCD type 2) database model."""
+from datetime import date
+
+from sqlalchemy import CheckConstraint, Column, Date, DateTime, Index, PrimaryKeyConstraint, String, func
+
+from app.infrastructure.database.connection import Base
+
+# 終了日が未確定（現在も有効）な版の valid_to
+OPEN_VALID_TO = date(9999, 12, 31)
+
+
+class JQuantsListedInfoHistoryModel(Base):
+    """J-Quants listed info history with validity intervals per code.
+
+    各版は [valid_from, valid_to) の期間に有効で、属性が変化した日にだけ新しい版を作成する。
+    """
+
+    __tablename__ = "jquants_listed_info_history"
+    __table_args__ = (
+        PrimaryKeyConstraint("code", "valid_from"),
+        CheckConstraint("valid_from < valid_to", name="ck_jquants_listed_info_history_interval"),
+        # 時点指定での全銘柄検索用
+        Index("idx_jquants_listed_info_history_valid_to", "valid_to", "valid_from"),
+    )
+
+    code = Column(String(10), nullable=False)  # 銘柄コード（最大 10 文字）
+    valid_from = Column(Date, nullable=False)
+    valid_to = Column(Date, nullable=False, default=OPEN_VALID_TO)
+    company_name = Column(String(255), nullable=False)
+    company_name_english = Column(String(255), nullable=True)
+    sector_17_code = Column(String(10), nullable=True)
+    sector_17_code_name = Column(String(255), nullable=True)
+    sector_33_code = Column(String(10), nullable=True)
+    sector_33_code_name = Column(String(255), nullable=True)
+    scale_category = Column(String(50), nullable=True)
+    market_code = Column(String(10), nullable=True)
+    market_code_name = Column(String(50), nullable=True)
+    margin_code = Column(String(10), nullable=True)
+    margin_code_name = Column(String(50), nullable=True)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return (
+            f"<JQuantsListedInfoHistoryModel(code='{self.code}', "
+            f"valid_from='{self.valid_from}', valid_to='{self.valid_to}')>"
+        )
@@ -3,7 +3,7 @@ from datetime import datetime
 from typing import Optional
 from uuid import uuid4
 
-from sqlalchemy import Boolean, Column, DateTime, String, Text, CheckConstraint
+from sqlalchemy import Boolean, Column, DateTime, Index, String, Text, CheckConstraint
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.sql import func
 
@@ -19,6 +19,7 @@ class CeleryBeatSchedule(Base):
             "execution_policy IN ('allow', 'skip', 'queue')",
             name="ck_celery_beat_schedules_execution_policy"
         ),
+        Index("idx_celery_beat_schedules_updated_at", "updated_at"),
     )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
@@ -46,4 +47,27 @@ class CeleryBeatSchedule(Base):
 
     def __repr__(self) -> str:
         """String representation."""
-        return f"<CeleryBeatSchedule(name={self.name}, task={self.task_name}, enabled={self.enabled})>"
\ No newline at end of file
+        return f"<CeleryBeatSchedule(name={self.name}, task={self.task_name}, enabled={self.enabled})>"
+
+
+class CeleryBeatScheduleTombstone(Base):
+    """Deleted Celery Beat schedule.
+
+    Rows are written by a database trigger when a schedule is deleted so that
+    the beat scheduler can drop the entry without reloading every schedule.
+    """
+
+    __tablename__ = "celery_beat_schedule_tombstones"
+    __table_args__ = (
+        Index("idx_celery_beat_schedule_tombstones_deleted_at", "deleted_at"),
+    )
+
+    schedule_id = Column(UUID(as_uuid=True), primary_key=True)
+    name = Column(String(255), nullable=False)
+    deleted_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"<CeleryBeatScheduleTombstone(name={self.name}, deleted_at={self.deleted_at})>"
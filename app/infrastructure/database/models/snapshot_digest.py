@@ -0,0 +1,26 @@
+"""Snapshot digest database model."""
+from sqlalchemy import Column, Date, DateTime, Integer, PrimaryKeyConstraint, String, func
+
+from app.infrastructure.database.connection import Base
+
+
+class SnapshotDigestModel(Base):
+    """Content digest of each stored dataset snapshot (dataset, date)."""
+
+    __tablename__ = "snapshot_digests"
+    __table_args__ = (PrimaryKeyConstraint("dataset", "target_date"),)
+
+    dataset = Column(String(64), nullable=False)  # 例: jquants_listed_info
+    target_date = Column(Date, nullable=False)
+    digest = Column(String(64), nullable=False)  # SHA-256（16 進）
+    record_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return (
+            f"<SnapshotDigestModel(dataset='{self.dataset}', "
+            f"target_date='{self.target_date}', digest='{self.digest[:12]}')>"
+        )
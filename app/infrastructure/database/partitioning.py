@@ -0,0 +1,230 @@
+"""Range partition maintenance for date-partitioned tables.
+
+jquants_listed_info は date 列で月（または年）ごとにレンジパーティション化されている。
+このモジュールは将来分のパーティションの事前作成と、古いパーティションの切り離しを行う。
+範囲外の日付は DEFAULT パーティションに入るため、作成が遅れても書き込みは失敗しない。
+"""
+import re
+from dataclasses import dataclass
+from datetime import date
+from typing import List, Literal, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.logger import get_logger
+from app.infrastructure.repositories.database.snapshot_digest_repository import (
+    SnapshotDigestRepository,
+)
+
+logger = get_logger(__name__)
+
+PartitionInterval = Literal["month", "year"]
+
+LISTED_INFO_TABLE = "jquants_listed_info"
+
+
+def default_partition_name(table: str) -> str:
+    """DEFAULT パーティションのテーブル名"""
+    return f"{table}_default"
+
+
+def partition_start(target_date: date, interval: PartitionInterval) -> date:
+    """target_date を含むパーティションの開始日"""
+    if interval == "year":
+        return date(target_date.year, 1, 1)
+    return date(target_date.year, target_date.month, 1)
+
+
+def next_partition_start(start: date, interval: PartitionInterval) -> date:
+    """start から始まるパーティションの次のパーティションの開始日（終了日・排他）"""
+    if interval == "year":
+        return date(start.year + 1, 1, 1)
+    if start.month == 12:
+        return date(start.year + 1, 1, 1)
+    return date(start.year, start.month + 1, 1)
+
+
+@dataclass(frozen=True)
+class Partition:
+    """1 つのレンジパーティション [start, end)"""
+
+    table: str
+    start: date
+    end: date
+
+    @property
+    def name(self) -> str:
+        """パーティションのテーブル名（例: jquants_listed_info_p2024_01）"""
+        if self.end == date(self.start.year + 1, 1, 1) and self.start.month == 1:
+            return f"{self.table}_p{self.start.year}"
+        return f"{self.table}_p{self.start.year}_{self.start.month:02d}"
+
+    def overlaps(self, other: "Partition") -> bool:
+        """範囲が重なるかどうか"""
+        return self.start < other.end and other.start < self.end
+
+    @classmethod
+    def containing(cls, table: str, target_date: date, interval: PartitionInterval) -> "Partition":
+        """target_date を含むパーティション"""
+        start = partition_start(target_date, interval)
+        return cls(table=table, start=start, end=next_partition_start(start, interval))
+
+    @classmethod
+    def covering(
+        cls, table: str, from_date: date, to_date: date, interval: PartitionInterval
+    ) -> List["Partition"]:
+        """from_date から to_date までを含むパーティションの一覧"""
+        partitions = []
+        start = partition_start(from_date, interval)
+        while start <= to_date:
+            end = next_partition_start(start, interval)
+            partitions.append(cls(table=table, start=start, end=end))
+            start = end
+        return partitions
+
+    @classmethod
+    def from_name(cls, table: str, name: str) -> Optional["Partition"]:
+        """パーティション名から範囲を復元する（命名規則に合わない場合は None）"""
+        match = re.fullmatch(rf"{re.escape(table)}_p(\d{{4}})(?:_(\d{{2}}))?", name)
+        if match is None:
+            return None
+        year = int(match.group(1))
+        if match.group(2) is None:
+            return cls(table=table, start=date(year, 1, 1), end=date(year + 1, 1, 1))
+        start = date(year, int(match.group(2)), 1)
+        return cls(table=table, start=start, end=next_partition_start(start, "month"))
+
+
+class RangePartitionManager:
+    """date 列でレンジパーティション化されたテーブルのパーティションを管理する
+
+    DDL はセッションのトランザクション内で実行されるため、コミットは呼び出し側で行う。
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        table: str = LISTED_INFO_TABLE,
+        column: str = "date",
+        interval: PartitionInterval = "month",
+    ) -> None:
+        """
+        Args:
+            session: AsyncSession instance
+            table: 親テーブル名
+            column: パーティションキーの列名
+            interval: パーティションの単位（month / year）
+        """
+        self._session = session
+        self.table = table
+        self.column = column
+        self.interval = interval
+
+    async def list_partitions(self) -> List[Partition]:
+        """アタッチされているレンジパーティションを開始日の昇順で取得"""
+        result = await self._session.execute(
+            text(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+                "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "WHERE parent.relname = :table"
+            ),
+            {"table": self.table},
+        )
+        partitions = [Partition.from_name(self.table, name) for name in result.scalars().all()]
+        return sorted((p for p in partitions if p is not None), key=lambda p: p.start)
+
+    async def ensure_partitions(self, from_date: date, to_date: date) -> List[Partition]:
+        """from_date から to_date までのパーティションを作成する
+
+        Returns:
+            新しく作成したパーティション
+        """
+        existing = await self.list_partitions()
+        created = []
+        for partition in Partition.covering(self.table, from_date, to_date, self.interval):
+            # 単位を変更した場合も既存の範囲と重なるパーティションは作らない
+            if any(partition.overlaps(other) for other in existing):
+                continue
+            await self._create_partition(partition)
+            created.append(partition)
+
+        if created:
+            logger.info(
+                f"Created {len(created)} partitions of {self.table}: "
+                f"{', '.join(p.name for p in created)}"
+            )
+        return created
+
+    async def _create_partition(self, partition: Partition) -> None:
+        """パーティションを作成する（内部メソッド）
+
+        DEFAULT パーティションに範囲内の行がある場合は、そのままでは作成できないため
+        通常のテーブルとして作成して行を移し、アタッチする。
+        """
+        default = default_partition_name(self.table)
+        bounds = {"start": partition.start, "end": partition.end}
+        in_range = f"{self.column} >= :start AND {self.column} < :end"
+        for_values = (
+            f"FOR VALUES FROM ('{partition.start.isoformat()}') TO ('{partition.end.isoformat()}')"
+        )
+
+        has_default_rows = (
+            await self._session.execute(
+                text(f"SELECT EXISTS (SELECT 1 FROM {default} WHERE {in_range})"), bounds
+            )
+        ).scalar()
+        if not has_default_rows:
+            await self._session.execute(
+                text(f"CREATE TABLE {partition.name} PARTITION OF {self.table} {for_values}")
+            )
+            return
+
+        await self._session.execute(
+            text(
+                f"CREATE TABLE {partition.name} "
+                f"(LIKE {self.table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+            )
+        )
+        moved = await self._session.execute(
+            text(
+                f"WITH moved AS (DELETE FROM {default} WHERE {in_range} RETURNING *) "
+                f"INSERT INTO {partition.name} SELECT * FROM moved"
+            ),
+            bounds,
+        )
+        await self._session.execute(
+            text(f"ALTER TABLE {self.table} ATTACH PARTITION {partition.name} {for_values}")
+        )
+        logger.info(f"Moved {moved.rowcount} rows from {default} to {partition.name}")
+
+    async def detach_partitions_before(self, cutoff: date) -> List[Partition]:
+        """cutoff より前で終わるパーティションを切り離す
+
+        切り離したパーティションは通常のテーブルとして残るため、
+        アーカイブ後に削除するかどうかは運用側で判断する。
+        切り離した範囲のスナップショットのダイジェスト（データセット名はテーブル名）も
+        同じトランザクションで削除し、再取得したデータが「変更なし」として省略されないようにする。
+
+        Returns:
+            切り離したパーティション
+        """
+        detached = []
+        for partition in await self.list_partitions():
+            if partition.end > cutoff:
+                break
+            await self._session.execute(
+                text(f"ALTER TABLE {self.table} DETACH PARTITION {partition.name}")
+            )
+            await SnapshotDigestRepository(self._session).delete_range(
+                self.table, partition.start, partition.end
+            )
+            detached.append(partition)
+
+        if detached:
+            logger.info(
+                f"Detached {len(detached)} partitions of {self.table}: "
+                f"{', '.join(p.name for p in detached)}"
+            )
+        return detached
@@ -1,11 +1,12 @@
 import asyncio
-import gzip
 import json
-from typing import Any, Dict, Optional, TypeVar, Union
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Dict, Optional, TypeVar
 
-import aiohttp
 from aiohttp import ClientError, ClientResponse, ClientSession
 
+from app.core.logger import get_logger
 from app.domain.entities.auth import JQuantsCredentials
 from app.domain.exceptions.jquants_exceptions import (
     NetworkError,
@@ -13,10 +14,15 @@ from app.domain.exceptions.jquants_exceptions import (
     ValidationError,
 )
 from app.infrastructure.config.settings import get_infrastructure_settings
-from app.infrastructure.rate_limiter import RateLimiter, with_rate_limit
+from app.infrastructure.external_services.jquants.session_registry import (
+    get_jquants_session,
+)
+from app.infrastructure.rate_limiter import create_rate_limiter, with_rate_limit
 
 T = TypeVar("T")
 
+logger = get_logger(__name__)
+
 
 class JQuantsBaseClient:
     """J-Quants API 用の基底 HTTP クライアント"""
@@ -36,11 +42,18 @@ class JQuantsBaseClient:
         
         # レートリミッターの初期化
         settings = get_infrastructure_settings()
-        self._rate_limiter = RateLimiter(
+        # redis バックエンドの場合は全ワーカーで 1 つの予算を共有する
+        # adaptive の場合は 429 に応じてレートを自動調整する
+        self._rate_limiter = create_rate_limiter(
             max_requests=settings.rate_limit.jquants_max_requests,
             window_seconds=settings.rate_limit.jquants_window_seconds,
-            name="J-Quants API"
+            name="J-Quants API",
+            backend=settings.rate_limit.jquants_backend,
+            key=f"{settings.rate_limit.redis_key_prefix}jquants",
+            adaptive=settings.rate_limit.jquants_adaptive,
+            ceiling_requests=settings.rate_limit.jquants_adaptive_max_requests,
         )
+        self._max_rate_limit_retries = settings.rate_limit.jquants_max_rate_limit_retries
 
     async def __aenter__(self) -> "JQuantsBaseClient":
         """非同期コンテキストマネージャーの開始"""
@@ -52,34 +65,21 @@ class JQuantsBaseClient:
         await self.close()
 
     async def _ensure_session(self) -> None:
-        """セッションの初期化を確実に行う"""
-        if self._session is None or self._session.closed:
-            # TCP コネクターの設定
-            connector = aiohttp.TCPConnector(
-                force_close=True,  # 接続を強制的にクローズ
-                limit=100,         # 接続数の制限
-                ttl_dns_cache=300  # DNS キャッシュの TTL
-            )
-            
-            # タイムアウトの設定
-            timeout = aiohttp.ClientTimeout(
-                total=30,      # 全体のタイムアウト
-                connect=10,    # 接続タイムアウト
-                sock_read=10   # 読み取りタイムアウト
-            )
-            
-            # aiohttp が Content-Encoding に基づいて自動的に Gzip 解凍を処理
-            self._session = ClientSession(
-                connector=connector,
-                timeout=timeout
-            )
+        """セッションの初期化を確実に行う
+
+        セッションはプロセス内の J-Quants クライアントで共有され、
+        keep-alive 接続がページ・クライアントをまたいで再利用される。
+        レジストリ側でアイドル判定を行うため、リクエストごとに取得し直す。
+        """
+        self._session = await get_jquants_session()
 
     async def close(self) -> None:
-        """セッションのクローズ"""
-        if self._session and not self._session.closed:
-            await self._session.close()
-            # TCP コネクションが完全にクローズされるまで少し待つ
-            await asyncio.sleep(0.1)
+        """共有セッションへの参照を解放する
+
+        接続プールは他のクライアントと共有しているためここではクローズしない。
+        プール自体のクローズは ``close_jquants_sessions`` で行う。
+        """
+        self._session = None
 
     def _get_headers(self, additional_headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
         """リクエストヘッダーの生成"""
@@ -114,13 +114,38 @@ class JQuantsBaseClient:
 
         # ステータスコードによるエラーハンドリング
         if response.status == 429:
-            raise RateLimitError("レート制限に達しました。しばらく待ってから再試行してください。")
+            raise RateLimitError(
+                "レート制限に達しました。しばらく待ってから再試行してください。",
+                retry_after=self._parse_retry_after(response.headers.get("Retry-After")),
+            )
         elif response.status >= 400:
             error_message = data.get("message", f"API エラー: ステータスコード {response.status}")
             raise NetworkError(error_message)
 
         return data
 
+    @staticmethod
+    def _parse_retry_after(value: Any) -> Optional[float]:
+        """Retry-After ヘッダーの値を秒数に変換する
+
+        秒数形式と HTTP 日付形式の両方に対応する。解釈できない場合は None を返す。
+        """
+        if not isinstance(value, str) or not value.strip():
+            return None
+
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
     @with_rate_limit(lambda self: self._rate_limiter)
     async def _request_with_retry(
         self,
@@ -130,13 +155,19 @@ class JQuantsBaseClient:
         json_data: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
     ) -> Dict[str, Any]:
-        """リトライ機能付き HTTP リクエスト（レート制限適用）"""
+        """リトライ機能付き HTTP リクエスト（レート制限適用）
+
+        adaptive なレートリミッターの場合、429 はレートリミッターに通知して
+        Retry-After の経過後に再試行する（ネットワークエラーのリトライ回数とは別枠）。
+        """
         await self._ensure_session()
         
         url = f"{self.BASE_URL}{endpoint}"
         headers = self._get_headers(headers)
 
-        for attempt in range(self.MAX_RETRIES):
+        attempt = 0
+        rate_limit_retries = 0
+        while True:
             try:
                 async with self._session.request(
                     method=method,
@@ -146,15 +177,29 @@ class JQuantsBaseClient:
                     headers=headers,
                     # タイムアウトはセッションレベルで設定済み
                 ) as response:
-                    return await self._handle_response(response)
+                    data = await self._handle_response(response)
+                self._rate_limiter.on_success()
+                return data
 
-            except RateLimitError:
-                # レート制限エラーは即座に再発生
-                raise
+            except RateLimitError as e:
+                self._rate_limiter.on_rate_limited(e.retry_after)
+                if (
+                    not self._rate_limiter.adaptive
+                    or rate_limit_retries >= self._max_rate_limit_retries
+                ):
+                    raise
+                rate_limit_retries += 1
+                logger.info(
+                    f"Rate limited on {method} {endpoint}. "
+                    f"Retrying ({rate_limit_retries}/{self._max_rate_limit_retries})"
+                )
+                # 減少後のレートと Retry-After に従ってトークンを取得し直す
+                await self._rate_limiter.acquire()
             except (ClientError, NetworkError) as e:
+                attempt += 1
                 # 最後の試行でない場合はリトライ
-                if attempt < self.MAX_RETRIES - 1:
-                    await asyncio.sleep(self.RETRY_DELAY * (attempt + 1))
+                if attempt < self.MAX_RETRIES:
+                    await asyncio.sleep(self.RETRY_DELAY * attempt)
                     continue
                 # 最後の試行の場合はエラーを再発生
                 if isinstance(e, NetworkError):
@@ -182,15 +227,27 @@ class JQuantsBaseClient:
             "POST", endpoint, params=params, json_data=json_data, headers=headers
         )
 
-    async def get_paginated(
+    async def iter_pages(
         self,
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
         max_pages: Optional[int] = None,
-    ) -> list[Dict[str, Any]]:
-        """ページネーション対応の GET リクエスト"""
-        all_data = []
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """ページネーション対応の GET リクエスト（ページ単位のストリーミング）
+
+        レスポンスを 1 ページ受信するごとに yield するため、
+        呼び出し側は全ページの取得完了を待たずに処理を開始できる。
+
+        Args:
+            endpoint: API エンドポイント
+            params: クエリパラメータ
+            headers: 追加ヘッダー
+            max_pages: 取得する最大ページ数（None の場合は無制限）
+
+        Yields:
+            Dict[str, Any]: 各ページのレスポンス全体
+        """
         current_params = params.copy() if params else {}
         page_count = 0
 
@@ -201,21 +258,10 @@ class JQuantsBaseClient:
 
             # リクエスト実行
             response = await self.get(endpoint, params=current_params, headers=headers)
-            
-            # データを追加
-            if "data" in response:
-                data = response["data"]
-                if isinstance(data, list):
-                    all_data.extend(data)
-                else:
-                    all_data.append(data)
-            else:
-                # データフィールドがない場合はレスポンス全体を追加
-                all_data.append(response)
-
-            # ページカウントをインクリメント
             page_count += 1
-            
+
+            yield response
+
             # ページネーションキーの確認
             if "pagination_key" in response:
                 current_params["pagination_key"] = response["pagination_key"]
@@ -223,4 +269,47 @@ class JQuantsBaseClient:
                 # ページネーションキーがない場合は終了
                 break
 
-        return all_data
\ No newline at end of file
+    async def iter_records(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        max_pages: Optional[int] = None,
+        data_key: str = "data",
+    ) -> AsyncIterator[list[Dict[str, Any]]]:
+        """ページネーション対応の GET リクエスト（レコードのストリーミング）
+
+        Args:
+            endpoint: API エンドポイント
+            params: クエリパラメータ
+            headers: 追加ヘッダー
+            max_pages: 取得する最大ページ数（None の場合は無制限）
+            data_key: レコードのリストが格納されているレスポンスのキー
+
+        Yields:
+            list[Dict[str, Any]]: 各ページに含まれるレコードのリスト
+        """
+        async for response in self.iter_pages(
+            endpoint, params=params, headers=headers, max_pages=max_pages
+        ):
+            if data_key in response:
+                data = response[data_key]
+                yield data if isinstance(data, list) else [data]
+            else:
+                # データフィールドがない場合はレスポンス全体を 1 レコードとして扱う
+                yield [response]
+
+    async def get_paginated(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        max_pages: Optional[int] = None,
+    ) -> list[Dict[str, Any]]:
+        """ページネーション対応の GET リクエスト（全ページをまとめて返す）"""
+        all_data: list[Dict[str, Any]] = []
+        async for records in self.iter_records(
+            endpoint, params=params, headers=headers, max_pages=max_pages
+        ):
+            all_data.extend(records)
+        return all_data
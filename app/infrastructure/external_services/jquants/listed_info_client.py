@@ -1,7 +1,10 @@
 """J-Quants Listed Info API client."""
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, AsyncIterator, Dict, List, Optional, cast
 
-from app.application.interfaces.external.listed_info_client import ListedInfoClientInterface
+from app.application.interfaces.external.listed_info_client import (
+    ListedInfoClientInterface,
+    ListedInfoPage,
+)
 from app.core.logger import get_logger
 from app.infrastructure.external_services.jquants.base_client import JQuantsBaseClient
 from app.infrastructure.external_services.jquants.types.responses import JQuantsListedInfoResponse
@@ -61,16 +64,17 @@ class JQuantsListedInfoClient(ListedInfoClientInterface):
             logger.error(f"Failed to fetch listed info: {str(e)}")
             raise
 
-    async def get_all_listed_info(
-        self, date: Optional[str] = None
-    ) -> List[JQuantsListedInfoResponse]:
-        """全銘柄の上場情報を取得（ページネーション対応）
+    async def iter_listed_info_pages(
+        self, date: Optional[str] = None, pagination_key: Optional[str] = None
+    ) -> AsyncIterator[ListedInfoPage]:
+        """全銘柄の上場情報をページ単位で取得（ページネーション対応）
 
         Args:
             date: 基準日（YYYYMMDD または YYYY-MM-DD 形式）
+            pagination_key: 途中から再開する場合のページネーションキー
 
-        Returns:
-            List[JQuantsListedInfoResponse]: 全上場銘柄情報のリスト
+        Yields:
+            ListedInfoPage: 1 ページ分の上場銘柄情報（次ページのキー付き）
 
         Raises:
             NetworkError: ネットワークエラーが発生した場合
@@ -81,10 +85,12 @@ class JQuantsListedInfoClient(ListedInfoClientInterface):
         if date:
             params["date"] = date
 
-        logger.info(f"Fetching all listed info for date: {date}")
+        if pagination_key:
+            logger.info(f"Resuming listed info for date: {date} from saved pagination key")
+        else:
+            logger.info(f"Fetching all listed info for date: {date}")
 
-        all_info: List[JQuantsListedInfoResponse] = []
-        pagination_key = None
+        total_count = 0
 
         while True:
             if pagination_key:
@@ -92,17 +98,39 @@ class JQuantsListedInfoClient(ListedInfoClientInterface):
 
             response = await self._client.get("/listed/info", params=params)
             info_list = response.get("info", [])
-            
+
             # 型安全性のためにキャスト
             typed_info_list = cast(List[JQuantsListedInfoResponse], info_list)
-            all_info.extend(typed_info_list)
+            total_count += len(typed_info_list)
+            pagination_key = response.get("pagination_key")
+
+            yield ListedInfoPage(typed_info_list, next_pagination_key=pagination_key)
 
             # ページネーションキーがない場合は終了
-            pagination_key = response.get("pagination_key")
             if not pagination_key:
                 break
 
             logger.debug(f"Fetched {len(typed_info_list)} records, continuing with pagination")
 
-        logger.info(f"Successfully fetched total {len(all_info)} listed info records")
-        return all_info
\ No newline at end of file
+        logger.info(f"Successfully fetched total {total_count} listed info records")
+
+    async def get_all_listed_info(
+        self, date: Optional[str] = None
+    ) -> List[JQuantsListedInfoResponse]:
+        """全銘柄の上場情報を取得（ページネーション対応）
+
+        Args:
+            date: 基準日（YYYYMMDD または YYYY-MM-DD 形式）
+
+        Returns:
+            List[JQuantsListedInfoResponse]: 全上場銘柄情報のリスト
+
+        Raises:
+            NetworkError: ネットワークエラーが発生した場合
+            RateLimitError: レート制限に達した場合
+            ValidationError: データ形式エラーが発生した場合
+        """
+        all_info: List[JQuantsListedInfoResponse] = []
+        async for page in self.iter_listed_info_pages(date=date):
+            all_info.extend(page)
+        return all_info
@@ -0,0 +1,171 @@
+"""J-Quants API 用 HTTP セッションレジストリ
+
+プロセス内の J-Quants クライアント（上場銘柄情報クライアント、認証リポジトリなど）で
+keep-alive 接続プールを共有するためのモジュール。
+aiohttp のセッションはイベントループに紐づくため、イベントループごとに管理する。
+"""
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import aiohttp
+from aiohttp import ClientSession
+
+from app.core.logger import get_logger
+from app.infrastructure.config.settings import get_infrastructure_settings
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class _SessionEntry:
+    """レジストリが保持するセッションと最終利用時刻"""
+
+    session: ClientSession
+    last_used: float
+
+
+def _discard_session(session: ClientSession) -> None:
+    """クローズ済みのイベントループに属するセッションを待機せずに破棄する
+
+    ループが閉じているため session.close() は待機できない。コネクタをセッションから
+    切り離して同期的にクローズし、"Unclosed client session" / "Unclosed connector" の
+    警告と接続のリークを防ぐ。
+    """
+    connector = session.connector
+    session.detach()
+    if connector is None or connector.closed:
+        return
+    try:
+        # ループが閉じている場合、aiohttp はトランスポートに触れずにクローズ済みとする
+        connector._close()
+    except Exception as e:
+        logger.debug(f"Failed to close connector of a closed event loop: {str(e)}")
+
+
+class JQuantsSessionRegistry:
+    """イベントループ単位で共有 ClientSession を管理するレジストリ
+
+    - 接続は keep-alive で再利用され、ページごとの TCP/TLS ハンドシェイクを回避する
+    - ホストごとの同時接続数は設定で制御する
+    - 一定時間利用されていないセッションは次回取得時に破棄・再作成する
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        limit_per_host: int,
+        keepalive_timeout: float,
+        idle_timeout: float,
+        request_timeout: float,
+    ) -> None:
+        """
+        Args:
+            limit: コネクタ全体の最大接続数
+            limit_per_host: ホストごとの最大接続数
+            keepalive_timeout: アイドル接続を保持する秒数
+            idle_timeout: セッション自体を破棄するまでの未使用秒数
+            request_timeout: リクエスト全体のタイムアウト（秒）
+        """
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.idle_timeout = idle_timeout
+        self.request_timeout = request_timeout
+        self._entries: Dict[asyncio.AbstractEventLoop, _SessionEntry] = {}
+
+    def _create_session(self) -> ClientSession:
+        """keep-alive を有効にした新しいセッションを作成"""
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=300,
+        )
+        timeout = aiohttp.ClientTimeout(
+            total=self.request_timeout,
+            connect=10,
+            sock_read=10,
+        )
+        # aiohttp が Content-Encoding に基づいて自動的に Gzip 解凍を処理
+        return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+    def _evict_dead_loops(self) -> None:
+        """クローズ済みイベントループのエントリを破棄"""
+        for loop in [loop for loop in self._entries if loop.is_closed()]:
+            entry = self._entries.pop(loop)
+            _discard_session(entry.session)
+            logger.debug(f"Dropped J-Quants session for closed event loop {id(loop)}")
+
+    async def get_session(self) -> ClientSession:
+        """現在のイベントループ用の共有セッションを取得
+
+        Returns:
+            ClientSession: keep-alive 接続プールを持つ共有セッション
+        """
+        loop = asyncio.get_running_loop()
+        self._evict_dead_loops()
+
+        now = time.monotonic()
+        entry = self._entries.get(loop)
+        if entry is not None:
+            if entry.session.closed:
+                entry = None
+            elif now - entry.last_used > self.idle_timeout:
+                logger.debug(
+                    f"Closing idle J-Quants session for event loop {id(loop)} "
+                    f"(idle {now - entry.last_used:.1f}s)"
+                )
+                await entry.session.close()
+                entry = None
+
+        if entry is None:
+            entry = _SessionEntry(session=self._create_session(), last_used=now)
+            self._entries[loop] = entry
+            logger.info(f"J-Quants session created for event loop {id(loop)}")
+
+        entry.last_used = now
+        return entry.session
+
+    async def close(self) -> None:
+        """現在のイベントループに属するセッションをクローズ"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        entry = self._entries.pop(loop, None)
+        if entry is not None and not entry.session.closed:
+            await entry.session.close()
+            logger.info(f"J-Quants session closed for event loop {id(loop)}")
+        self._evict_dead_loops()
+
+
+_registry: Optional[JQuantsSessionRegistry] = None
+
+
+def get_session_registry() -> JQuantsSessionRegistry:
+    """プロセス共通のセッションレジストリを取得（シングルトン）"""
+    global _registry
+    if _registry is None:
+        jquants_settings = get_infrastructure_settings().jquants
+        _registry = JQuantsSessionRegistry(
+            limit=jquants_settings.connection_limit,
+            limit_per_host=jquants_settings.connection_limit_per_host,
+            keepalive_timeout=jquants_settings.keepalive_timeout,
+            idle_timeout=jquants_settings.session_idle_timeout,
+            request_timeout=jquants_settings.timeout,
+        )
+    return _registry
+
+
+async def get_jquants_session() -> ClientSession:
+    """現在のイベントループ用の共有 J-Quants セッションを取得"""
+    return await get_session_registry().get_session()
+
+
+async def close_jquants_sessions() -> None:
+    """現在のイベントループの共有 J-Quants セッションをクローズ"""
+    if _registry is not None:
+        await _registry.close()
@@ -0,0 +1,155 @@
+"""J-Quants 取引カレンダーのキャッシュ
+
+取引カレンダーは年単位で取得し、プロセス内メモリと Redis の 2 段でキャッシュする。
+過去の年のカレンダーは変わらないため長期間、当年以降は祝日の追加に備えて短期間保持する。
+API・Redis のいずれも利用できない場合は平日ベースの判定にフォールバックする。
+"""
+import json
+import time
+from datetime import date
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from redis.asyncio import Redis
+
+from app.application.interfaces.external.trading_calendar_client import (
+    TradingCalendarClientInterface,
+)
+from app.core.constants import CacheKeyPrefix
+from app.core.logger import get_logger
+from app.domain.value_objects.trading_calendar import TradingCalendar
+from app.infrastructure.config.settings import get_infrastructure_settings
+
+logger = get_logger(__name__)
+
+
+def _cache_key(year: int) -> str:
+    """年ごとの Redis キー"""
+    return f"{CacheKeyPrefix.MARKET_DATA.value}:trading_calendar:{year}"
+
+
+def _serialize(calendar: TradingCalendar) -> str:
+    return json.dumps(
+        {
+            "trading_days": sorted(d.isoformat() for d in calendar.trading_days),
+            "non_trading_days": sorted(d.isoformat() for d in calendar.non_trading_days),
+        }
+    )
+
+
+def _deserialize(raw: str) -> TradingCalendar:
+    data = json.loads(raw)
+    return TradingCalendar.from_days(
+        (date.fromisoformat(d) for d in data.get("trading_days", [])),
+        (date.fromisoformat(d) for d in data.get("non_trading_days", [])),
+    )
+
+
+class TradingCalendarCache:
+    """年単位の取引カレンダーキャッシュ（メモリ → Redis → API）"""
+
+    def __init__(
+        self,
+        current_year_ttl: int,
+        past_year_ttl: int,
+        redis_getter: Optional[Callable[[], Awaitable[Redis]]] = None,
+    ) -> None:
+        """
+        Args:
+            current_year_ttl: 当年以降のカレンダーの保持秒数
+            past_year_ttl: 過去の年のカレンダーの保持秒数
+            redis_getter: Redis クライアントを返す関数（None の場合は共通クライアント）
+        """
+        if redis_getter is None:
+            from app.infrastructure.redis.redis_client import get_redis_client
+
+            redis_getter = get_redis_client
+
+        self.current_year_ttl = current_year_ttl
+        self.past_year_ttl = past_year_ttl
+        self._redis_getter = redis_getter
+        # 年 -> (カレンダー, 有効期限の monotonic 時刻)
+        self._memory: Dict[int, Tuple[TradingCalendar, float]] = {}
+
+    def _ttl_for(self, year: int) -> int:
+        return self.past_year_ttl if year < date.today().year else self.current_year_ttl
+
+    async def get_calendar(
+        self,
+        from_date: date,
+        to_date: date,
+        client: TradingCalendarClientInterface,
+    ) -> TradingCalendar:
+        """期間をカバーする取引カレンダーを取得する
+
+        Args:
+            from_date: 開始日
+            to_date: 終了日
+            client: キャッシュにない年を取得する取引カレンダークライアント
+
+        Returns:
+            TradingCalendar: 取得できなかった年の日付は平日ベースで判定される
+        """
+        calendar = TradingCalendar()
+        for year in range(from_date.year, to_date.year + 1):
+            calendar = calendar.merge(await self._get_year(year, client))
+        return calendar
+
+    async def _get_year(
+        self, year: int, client: TradingCalendarClientInterface
+    ) -> TradingCalendar:
+        """1 年分のカレンダーを取得する（内部メソッド）"""
+        cached = self._memory.get(year)
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
+
+        calendar = await self._load_from_redis(year)
+        if calendar is None:
+            try:
+                calendar = await client.get_trading_calendar(date(year, 1, 1), date(year, 12, 31))
+            except Exception as e:
+                logger.warning(
+                    f"Failed to fetch trading calendar for {year}, "
+                    f"falling back to weekday rule: {str(e)}"
+                )
+                return TradingCalendar()
+            await self._store_to_redis(year, calendar)
+
+        self._memory[year] = (calendar, time.monotonic() + self._ttl_for(year))
+        return calendar
+
+    async def _load_from_redis(self, year: int) -> Optional[TradingCalendar]:
+        """Redis からカレンダーを読み込む（内部メソッド）"""
+        try:
+            redis = await self._redis_getter()
+            raw = await redis.get(_cache_key(year))
+            return _deserialize(raw) if raw else None
+        except Exception as e:
+            logger.warning(f"Failed to read trading calendar cache for {year}: {str(e)}")
+            return None
+
+    async def _store_to_redis(self, year: int, calendar: TradingCalendar) -> None:
+        """Redis にカレンダーを保存する（内部メソッド）"""
+        try:
+            redis = await self._redis_getter()
+            await redis.set(_cache_key(year), _serialize(calendar), ex=self._ttl_for(year))
+        except Exception as e:
+            logger.warning(f"Failed to write trading calendar cache for {year}: {str(e)}")
+
+    def clear(self) -> None:
+        """プロセス内キャッシュをクリアする"""
+        self._memory.clear()
+
+
+_cache: Optional[TradingCalendarCache] = None
+
+
+def get_trading_calendar_cache() -> TradingCalendarCache:
+    """プロセス共通の取引カレンダーキャッシュを取得（シングルトン）"""
+    global _cache
+    if _cache is None:
+        jquants_settings = get_infrastructure_settings().jquants
+        _cache = TradingCalendarCache(
+            current_year_ttl=jquants_settings.trading_calendar_cache_ttl,
+            past_year_ttl=jquants_settings.trading_calendar_past_year_cache_ttl,
+        )
+    return _cache
@@ -0,0 +1,65 @@
+"""J-Quants Trading Calendar API client."""
+from datetime import date
+from typing import List, cast
+
+from app.application.interfaces.external.trading_calendar_client import (
+    TradingCalendarClientInterface,
+)
+from app.core.logger import get_logger
+from app.domain.value_objects.trading_calendar import TradingCalendar
+from app.infrastructure.external_services.jquants.base_client import JQuantsBaseClient
+from app.infrastructure.external_services.jquants.types.responses import (
+    JQuantsTradingCalendarResponse,
+)
+
+logger = get_logger(__name__)
+
+# 休日区分: 0=非営業日, 1=営業日, 2=東証半日立会日, 3=非営業日（祝日取引あり）
+TRADING_HOLIDAY_DIVISIONS = frozenset({"1", "2"})
+
+
+class JQuantsTradingCalendarClient(TradingCalendarClientInterface):
+    """J-Quants 取引カレンダー API クライアント"""
+
+    def __init__(self, base_client: JQuantsBaseClient) -> None:
+        """Initialize trading calendar client.
+
+        Args:
+            base_client: Base J-Quants client instance
+        """
+        self._client = base_client
+
+    async def get_trading_calendar(self, from_date: date, to_date: date) -> TradingCalendar:
+        """取引カレンダーを取得
+
+        Args:
+            from_date: 開始日
+            to_date: 終了日
+
+        Returns:
+            TradingCalendar: API が返した日付の営業日・非営業日
+
+        Raises:
+            NetworkError: ネットワークエラーが発生した場合
+            RateLimitError: レート制限に達した場合
+        """
+        params = {"from": from_date.strftime("%Y%m%d"), "to": to_date.strftime("%Y%m%d")}
+        logger.info(f"Fetching trading calendar with params: {params}")
+
+        response = await self._client.get("/markets/trading_calendar", params=params)
+        items = cast(List[JQuantsTradingCalendarResponse], response.get("trading_calendar", []))
+
+        trading_days = []
+        non_trading_days = []
+        for item in items:
+            day = date.fromisoformat(item["Date"])
+            if str(item["HolidayDivision"]) in TRADING_HOLIDAY_DIVISIONS:
+                trading_days.append(day)
+            else:
+                non_trading_days.append(day)
+
+        logger.info(
+            f"Fetched trading calendar: {len(trading_days)} trading days, "
+            f"{len(non_trading_days)} non-trading days"
+        )
+        return TradingCalendar.from_days(trading_days, non_trading_days)
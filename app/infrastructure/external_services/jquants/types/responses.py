@@ -80,4 +80,11 @@ class JQuantsFinStatementsResponse(TypedDict):
 class JQuantsFinStatementsBulkResponse(TypedDict):
     """J-Quants 財務諸表一括取得レスポンス型."""
     
-    statements: list[JQuantsFinStatementsResponse]
\ No newline at end of file
+    statements: list[JQuantsFinStatementsResponse]
+
+
+class JQuantsTradingCalendarResponse(TypedDict):
+    """J-Quants 取引カレンダーレスポンス型."""
+
+    Date: str
+    HolidayDivision: str
@@ -1,13 +1,19 @@
 """レートリミッター関連モジュール"""
 from app.infrastructure.rate_limiter.rate_limiter import (
+    AdaptiveRateLimiter,
     RateLimiter,
+    RedisRateLimiter,
     with_rate_limit,
     create_rate_limiter,
 )
+from app.infrastructure.rate_limiter.redis_token_bucket import RedisTokenBucket
 from app.infrastructure.rate_limiter.token_bucket import TokenBucket
 
 __all__ = [
+    "AdaptiveRateLimiter",
     "RateLimiter",
+    "RedisRateLimiter",
+    "RedisTokenBucket",
     "TokenBucket",
     "with_rate_limit",
     "create_rate_limiter",
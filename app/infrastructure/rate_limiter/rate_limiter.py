@@ -1,10 +1,14 @@
 """汎用レートリミッター実装"""
 import asyncio
 import functools
-from typing import Callable, TypeVar, Any
+import time
+from typing import Awaitable, Callable, Optional, TypeVar, Any
 from functools import wraps
 
+from redis.asyncio import Redis
+
 from app.core.logger import get_logger
+from app.infrastructure.rate_limiter.redis_token_bucket import RedisTokenBucket
 from app.infrastructure.rate_limiter.token_bucket import TokenBucket
 
 logger = get_logger(__name__)
@@ -17,6 +21,9 @@ class RateLimiter:
     
     トークンバケットアルゴリズムを使用してリクエストレートを制限する。
     """
+
+    # サーバーからのフィードバック（429 など）でレートを調整するかどうか
+    adaptive = False
     
     def __init__(self, max_requests: int, window_seconds: float, name: str = "RateLimiter"):
         """
@@ -66,6 +73,16 @@ class RateLimiter:
         """
         return self._token_bucket.try_acquire(tokens)
     
+    def on_success(self) -> None:
+        """リクエスト成功の通知（固定レートのため何もしない）"""
+
+    def on_rate_limited(self, retry_after: Optional[float] = None) -> None:
+        """レート制限応答の通知（固定レートのため何もしない）
+
+        Args:
+            retry_after: サーバーが指定した再試行までの秒数
+        """
+
     @property
     def available_tokens(self) -> float:
         """現在利用可能なトークン数"""
@@ -86,6 +103,187 @@ class RateLimiter:
         }
 
 
+class AdaptiveRateLimiter(RateLimiter):
+    """サーバーの応答に応じて補充レートを自動調整するレートリミッター（AIMD）
+
+    - 429 を受けた場合はレートを乗法的に減少させ、Retry-After の間はトークンを払い出さない
+    - 成功が一定回数連続した場合はレートを加法的に増加させる
+
+    これにより設定値を手で調整しなくても、サーバーの実際の上限付近で動作する。
+    バースト量（バケットの容量）は max_requests のまま変更しない。
+    """
+
+    adaptive = True
+
+    DEFAULT_BACKOFF_SECONDS = 1.0
+
+    def __init__(
+        self,
+        max_requests: int,
+        window_seconds: float,
+        name: str = "RateLimiter",
+        ceiling_requests: Optional[int] = None,
+        floor_requests: float = 1.0,
+        decrease_factor: float = 0.5,
+        increase_requests: float = 1.0,
+        success_threshold: int = 10,
+    ):
+        """
+        Args:
+            max_requests: 時間窓内の最大リクエスト数（初期レートとバースト量）
+            window_seconds: 時間窓の長さ（秒）
+            name: レートリミッターの名前（ログ出力用）
+            ceiling_requests: 増加させる上限（時間窓あたり、None の場合は max_requests）
+            floor_requests: 減少させる下限（時間窓あたり）
+            decrease_factor: 429 受信時にレートに掛ける係数（0 < x < 1）
+            increase_requests: 増加時に加える量（時間窓あたり）
+            success_threshold: レートを増加させるまでに必要な連続成功回数
+        """
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+        if success_threshold <= 0:
+            raise ValueError("success_threshold must be positive")
+
+        super().__init__(max_requests, window_seconds, name)
+
+        ceiling = ceiling_requests if ceiling_requests is not None else max_requests
+        self.max_rate = ceiling / window_seconds
+        self.min_rate = min(floor_requests / window_seconds, self.max_rate)
+        self.decrease_factor = decrease_factor
+        self.increase_step = increase_requests / window_seconds
+        self.success_threshold = success_threshold
+
+        self._consecutive_successes = 0
+        # 同じ輻輳に対する複数の 429 で何度も減少させないための期限
+        self._cooldown_until = 0.0
+
+    @property
+    def current_rate(self) -> float:
+        """現在の補充レート（リクエスト/秒）"""
+        return self._token_bucket.refill_rate
+
+    def _set_rate(self, rate: float) -> None:
+        """補充レートを変更する（内部メソッド）"""
+        self._token_bucket.set_refill_rate(rate)
+
+    def on_success(self) -> None:
+        """リクエスト成功の通知（連続成功でレートを加法的に増加）"""
+        self._consecutive_successes += 1
+        if self._consecutive_successes < self.success_threshold:
+            return
+
+        self._consecutive_successes = 0
+        if self.current_rate >= self.max_rate:
+            return
+
+        new_rate = min(self.max_rate, self.current_rate + self.increase_step)
+        self._set_rate(new_rate)
+        logger.debug(f"{self.name}: Increased rate to {new_rate:.2f} req/s")
+
+    def on_rate_limited(self, retry_after: Optional[float] = None) -> None:
+        """レート制限応答の通知（レートを乗法的に減少し、待機を強制）
+
+        Args:
+            retry_after: サーバーが指定した再試行までの秒数（None の場合は既定値）
+        """
+        self._consecutive_successes = 0
+        delay = retry_after if retry_after is not None else self.DEFAULT_BACKOFF_SECONDS
+
+        now = time.monotonic()
+        if now >= self._cooldown_until:
+            old_rate = self.current_rate
+            new_rate = max(self.min_rate, old_rate * self.decrease_factor)
+            self._set_rate(new_rate)
+            logger.warning(
+                f"{self.name}: Rate limited by server. "
+                f"Decreased rate {old_rate:.2f} -> {new_rate:.2f} req/s, "
+                f"pausing {delay:.2f}s"
+            )
+            self._cooldown_until = now + max(delay, 1.0 / new_rate)
+
+        self._token_bucket.drain(delay)
+
+    def get_status(self) -> dict:
+        """レートリミッターの現在の状態を取得
+
+        Returns:
+            状態情報を含む辞書
+        """
+        status = super().get_status()
+        status["adaptive"] = True
+        status["current_requests_per_second"] = self.current_rate
+        status["max_requests_per_second"] = self.max_rate
+        status["min_requests_per_second"] = self.min_rate
+        return status
+
+
+class RedisRateLimiter(RateLimiter):
+    """Redis 上のトークンバケットを共有する分散レートリミッター
+
+    複数の Celery ワーカープロセスが同じキーを使用することで、
+    クラスタ全体で 1 つのレート制限予算を共有する。
+    同期メソッド用の try_acquire は Redis にアクセスできないため、
+    従来どおりプロセス内のトークンバケットで判定する。
+    """
+
+    def __init__(
+        self,
+        max_requests: int,
+        window_seconds: float,
+        key: str,
+        redis_getter: Optional[Callable[[], Awaitable[Redis]]] = None,
+        name: str = "RateLimiter",
+    ):
+        """
+        Args:
+            max_requests: 時間窓内の最大リクエスト数
+            window_seconds: 時間窓の長さ（秒）
+            key: バケットの状態を保存する Redis キー
+            redis_getter: Redis クライアントを返す関数（None の場合は共通クライアント）
+            name: レートリミッターの名前（ログ出力用）
+        """
+        super().__init__(max_requests, window_seconds, name)
+
+        if redis_getter is None:
+            from app.infrastructure.redis.redis_client import get_redis_client
+
+            redis_getter = get_redis_client
+
+        self._redis_bucket = RedisTokenBucket(
+            redis_getter=redis_getter,
+            key=key,
+            capacity=max_requests,
+            refill_period=window_seconds,
+        )
+
+    async def acquire(self, tokens: int = 1) -> None:
+        """Redis 上のバケットからトークンを取得（必要に応じて待機）
+
+        Args:
+            tokens: 取得するトークン数（デフォルト: 1）
+        """
+        if tokens > self.max_requests:
+            raise ValueError(f"Cannot acquire {tokens} tokens: exceeds capacity")
+
+        await self._redis_bucket.acquire(tokens)
+
+    @property
+    def available_tokens(self) -> float:
+        """最後に Redis から取得した利用可能トークン数"""
+        return self._redis_bucket.last_known_tokens
+
+    def get_status(self) -> dict:
+        """レートリミッターの現在の状態を取得
+
+        Returns:
+            状態情報を含む辞書
+        """
+        status = super().get_status()
+        status["backend"] = "redis"
+        status["key"] = self._redis_bucket.key
+        return status
+
+
 def with_rate_limit(limiter_getter: Callable[[Any], RateLimiter]):
     """レート制限を適用するデコレーター
     
@@ -126,15 +324,39 @@ def with_rate_limit(limiter_getter: Callable[[Any], RateLimiter]):
 
 
 # 簡易的な使用例
-def create_rate_limiter(max_requests: int, window_seconds: float, name: str = "API") -> RateLimiter:
+def create_rate_limiter(
+    max_requests: int,
+    window_seconds: float,
+    name: str = "API",
+    backend: str = "memory",
+    key: Optional[str] = None,
+    adaptive: bool = False,
+    ceiling_requests: Optional[int] = None,
+) -> RateLimiter:
     """レートリミッターを作成するヘルパー関数
     
     Args:
         max_requests: 時間窓内の最大リクエスト数
         window_seconds: 時間窓の長さ（秒）
         name: レートリミッターの名前
+        backend: "memory"（プロセス内）または "redis"（クラスタ共有）
+        key: Redis バックエンドで使用するキー
+        adaptive: 429 応答に応じてレートを自動調整するかどうか（memory のみ対応）
+        ceiling_requests: adaptive の場合に増加させる上限（時間窓あたり）
         
     Returns:
         設定されたレートリミッター
     """
-    return RateLimiter(max_requests, window_seconds, name)
\ No newline at end of file
+    if backend == "memory":
+        if adaptive:
+            return AdaptiveRateLimiter(
+                max_requests, window_seconds, name, ceiling_requests=ceiling_requests
+            )
+        return RateLimiter(max_requests, window_seconds, name)
+    if backend == "redis":
+        if adaptive:
+            raise ValueError("adaptive rate limiting is only supported by the memory backend")
+        if not key:
+            raise ValueError("key is required for redis rate limiter backend")
+        return RedisRateLimiter(max_requests, window_seconds, key=key, name=name)
+    raise ValueError(f"Unknown rate limiter backend: {backend}")
\ No newline at end of file
@@ -0,0 +1,153 @@
+"""Redis を使用した分散トークンバケットの実装"""
+import asyncio
+from typing import Awaitable, Callable, Optional, Tuple
+
+from redis.asyncio import Redis
+from redis.commands.core import AsyncScript
+
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+# トークンの補充と消費を Redis 上でアトミックに行う Lua スクリプト
+#
+# KEYS[1]: バケットのキー
+# ARGV[1]: 容量, ARGV[2]: 補充レート（トークン/秒）, ARGV[3]: 要求トークン数
+# 戻り値: {残りトークン数, 必要な待機時間（秒）}
+#
+# 時刻は Redis サーバーの TIME を使用するため、ワーカー間の時計のずれの影響を受けない。
+TOKEN_BUCKET_SCRIPT = """
+local key = KEYS[1]
+local capacity = tonumber(ARGV[1])
+local refill_rate = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+
+local state = redis.call('HMGET', key, 'tokens', 'ts')
+local tokens = tonumber(state[1])
+local ts = tonumber(state[2])
+if tokens == nil or ts == nil then
+    tokens = capacity
+    ts = now
+end
+
+local elapsed = math.max(0, now - ts)
+tokens = math.min(capacity, tokens + elapsed * refill_rate)
+
+local wait = 0
+if tokens >= requested then
+    tokens = tokens - requested
+else
+    wait = (requested - tokens) / refill_rate
+end
+
+redis.call('HSET', key, 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', key, math.ceil(capacity / refill_rate * 1000) + 1000)
+
+return {tostring(tokens), tostring(wait)}
+"""
+
+
+class RedisTokenBucket:
+    """Redis 上で状態を共有するトークンバケット
+
+    複数のワーカープロセスから同じキーを参照することで、
+    クラスタ全体で 1 つのレート制限予算を共有する。
+    """
+
+    def __init__(
+        self,
+        redis_getter: Callable[[], Awaitable[Redis]],
+        key: str,
+        capacity: int,
+        refill_period: float,
+    ):
+        """
+        Args:
+            redis_getter: 現在のイベントループ用の Redis クライアントを返す関数
+            key: バケットの状態を保存する Redis キー
+            capacity: バケットの容量（最大トークン数）
+            refill_period: トークン補充期間（秒）
+        """
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive")
+        if refill_period <= 0:
+            raise ValueError("Refill period must be positive")
+
+        self._redis_getter = redis_getter
+        self.key = key
+        self.capacity = capacity
+        self.refill_period = refill_period
+        self.refill_rate = capacity / refill_period
+        self._script: Optional[AsyncScript] = None
+        # 最後に Redis から取得した残りトークン数（同期的な状態参照用）
+        self.last_known_tokens = float(capacity)
+
+        logger.debug(
+            f"RedisTokenBucket initialized: key={key}, capacity={capacity}, "
+            f"refill_period={refill_period}s, refill_rate={self.refill_rate:.2f} tokens/s"
+        )
+
+    async def _eval(self, tokens: int) -> Tuple[float, float]:
+        """スクリプトを実行し、残りトークン数と待機時間を取得する（内部メソッド）"""
+        client = await self._redis_getter()
+        if self._script is None:
+            self._script = client.register_script(TOKEN_BUCKET_SCRIPT)
+
+        remaining, wait = await self._script(
+            keys=[self.key],
+            args=[self.capacity, self.refill_rate, tokens],
+            client=client,
+        )
+        self.last_known_tokens = float(remaining)
+        return float(remaining), float(wait)
+
+    async def acquire(self, tokens: int = 1) -> None:
+        """指定数のトークンを取得する（必要に応じて待機）
+
+        Args:
+            tokens: 取得するトークン数（デフォルト: 1）
+
+        Raises:
+            ValueError: 要求トークン数が容量を超える場合
+        """
+        if tokens > self.capacity:
+            raise ValueError(f"Cannot acquire {tokens} tokens from bucket with capacity {self.capacity}")
+
+        while True:
+            remaining, wait_time = await self._eval(tokens)
+            if wait_time <= 0:
+                logger.debug(
+                    f"Acquired {tokens} tokens from {self.key}. "
+                    f"Remaining: {remaining:.2f}/{self.capacity}"
+                )
+                return
+
+            logger.warning(
+                f"Rate limit reached on {self.key}. "
+                f"Waiting {wait_time:.2f} seconds..."
+            )
+            await asyncio.sleep(wait_time)
+
+    async def try_acquire(self, tokens: int = 1) -> bool:
+        """指定数のトークンの取得を試みる（待機なし）
+
+        Args:
+            tokens: 取得を試みるトークン数（デフォルト: 1）
+
+        Returns:
+            トークンが取得できた場合 True 、できなかった場合 False
+        """
+        if tokens > self.capacity:
+            return False
+
+        _, wait_time = await self._eval(tokens)
+        return wait_time <= 0
+
+    async def get_available_tokens(self) -> float:
+        """現在利用可能なトークン数を Redis から取得"""
+        remaining, _ = await self._eval(0)
+        return remaining
@@ -1,20 +1,36 @@
 """トークンバケットアルゴリズムの実装"""
 import asyncio
 import time
-from typing import Optional
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Optional
 
 from app.core.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 浮動小数点誤差でタイマーが空振りし続けないための許容誤差
+_EPSILON = 1e-9
+
+
+@dataclass
+class _Waiter:
+    """トークン待ちの要求"""
+
+    tokens: int
+    future: asyncio.Future
+
 
 class TokenBucket:
     """トークンバケットアルゴリズムによるレート制限実装
-    
+
     一定期間ごとにトークンが補充され、リクエスト時にトークンを消費する。
-    トークンがない場合は、次のトークンが利用可能になるまで待機する。
+    トークンがない場合は FIFO の待ち行列に並び、先頭の要求に必要なトークンが
+    貯まった時点で 1 つのタイマーが先頭から順に起こす。
+    ロックを保持したまま待機しないため、待機時間の計算が古くなることはなく、
+    キャンセルされた要求がトークンを消費したままになることもない。
     """
-    
+
     def __init__(self, capacity: int, refill_period: float):
         """
         Args:
@@ -25,115 +41,222 @@ class TokenBucket:
             raise ValueError("Capacity must be positive")
         if refill_period <= 0:
             raise ValueError("Refill period must be positive")
-            
+
         self.capacity = capacity
         self.tokens = float(capacity)
+        # drain() で前借りしたトークン数。補充分はまずこの返済に充てる
+        self._debt = 0.0
         self.refill_period = refill_period
         self.refill_rate = capacity / refill_period
         self.last_refill = time.monotonic()
-        self._lock = asyncio.Lock()
-        
+        self._waiters: Deque[_Waiter] = deque()
+        self._timer: Optional[asyncio.TimerHandle] = None
+
         logger.debug(
             f"TokenBucket initialized: capacity={capacity}, "
             f"refill_period={refill_period}s, refill_rate={self.refill_rate:.2f} tokens/s"
         )
-    
+
     def _refill(self) -> None:
         """経過時間に基づいてトークンを補充する（内部メソッド）"""
         now = time.monotonic()
         elapsed = now - self.last_refill
-        
+
         if elapsed > 0:
             # 経過時間に応じてトークンを補充
             refilled = elapsed * self.refill_rate
-            self.tokens = min(self.capacity, self.tokens + refilled)
+            self._credit(refilled)
             self.last_refill = now
-            
+
             if refilled > 0:
                 logger.debug(
                     f"Refilled {refilled:.2f} tokens. "
                     f"Current tokens: {self.tokens:.2f}/{self.capacity}"
                 )
-    
+
+    def _credit(self, amount: float) -> None:
+        """前借り分を返済した残りをトークンとして加える（内部メソッド）"""
+        repaid = min(self._debt, amount)
+        self._debt -= repaid
+        self.tokens = min(self.capacity, self.tokens + amount - repaid)
+
+    @property
+    def waiting_count(self) -> int:
+        """トークン待ちの要求数"""
+        return len(self._waiters)
+
     async def acquire(self, tokens: int = 1) -> None:
         """指定数のトークンを取得する（必要に応じて待機）
-        
+
+        待機中の要求がある場合は、トークンが残っていても待ち行列の末尾に並ぶ（FIFO）。
+
         Args:
             tokens: 取得するトークン数（デフォルト: 1）
-            
+
         Raises:
             ValueError: 要求トークン数が容量を超える場合
         """
         if tokens > self.capacity:
             raise ValueError(f"Cannot acquire {tokens} tokens from bucket with capacity {self.capacity}")
-        
-        async with self._lock:
-            while True:
-                self._refill()
-                
-                if self.tokens >= tokens:
-                    # トークンを消費
-                    self.tokens -= tokens
-                    logger.debug(f"Acquired {tokens} tokens. Remaining: {self.tokens:.2f}/{self.capacity}")
-                    return
-                
-                # 必要なトークンが貯まるまでの待機時間を計算
-                needed = tokens - self.tokens
-                wait_time = needed / self.refill_rate
-                
-                logger.warning(
-                    f"Rate limit reached. Need {needed:.2f} more tokens. "
-                    f"Waiting {wait_time:.2f} seconds..."
-                )
-                
-                # 待機
-                await asyncio.sleep(wait_time)
-    
+
+        self._refill()
+        if not self._waiters and self.tokens + _EPSILON >= tokens:
+            # トークンを消費
+            self.tokens -= tokens
+            logger.debug(f"Acquired {tokens} tokens. Remaining: {self.tokens:.2f}/{self.capacity}")
+            return
+
+        waiter = _Waiter(tokens=tokens, future=asyncio.get_running_loop().create_future())
+        self._waiters.append(waiter)
+        logger.debug(
+            f"Rate limit reached. Queued request for {tokens} tokens "
+            f"({len(self._waiters)} waiting)"
+        )
+        if len(self._waiters) == 1:
+            self._schedule_wakeup()
+
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # トークン付与後にキャンセルされた場合は返却する
+                self._credit(tokens)
+            else:
+                self._remove_waiter(waiter)
+            self._wake_waiters()
+            raise
+
+    def _remove_waiter(self, waiter: _Waiter) -> None:
+        """待ち行列から要求を取り除く（内部メソッド）"""
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+
+    def _wake_waiters(self) -> None:
+        """先頭から順にトークンが足りる要求を起こし、次のタイマーを設定する（内部メソッド）"""
+        self._refill()
+
+        while self._waiters:
+            head = self._waiters[0]
+            if head.future.done():
+                # キャンセル済みの要求は読み飛ばす
+                self._waiters.popleft()
+                continue
+            if self.tokens + _EPSILON < head.tokens:
+                break
+
+            self._waiters.popleft()
+            self.tokens -= head.tokens
+            head.future.set_result(None)
+            logger.debug(
+                f"Acquired {head.tokens} tokens. Remaining: {self.tokens:.2f}/{self.capacity}"
+            )
+
+        self._schedule_wakeup()
+
+    def _schedule_wakeup(self) -> None:
+        """先頭の要求に必要なトークンが貯まる時刻にタイマーを設定する（内部メソッド）"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if not self._waiters:
+            return
+
+        needed = self._waiters[0].tokens + self._debt - self.tokens
+        wait_time = max(0.0, needed / self.refill_rate)
+        self._timer = asyncio.get_running_loop().call_later(wait_time, self._on_timer)
+
+    def _on_timer(self) -> None:
+        """タイマー満了時のコールバック（内部メソッド）"""
+        self._timer = None
+        self._wake_waiters()
+
     def try_acquire(self, tokens: int = 1) -> bool:
         """指定数のトークンの取得を試みる（待機なし）
-        
+
+        待機中の要求がある場合は、その要求を追い越さないよう常に失敗する。
+
         Args:
             tokens: 取得を試みるトークン数（デフォルト: 1）
-            
+
         Returns:
             トークンが取得できた場合 True 、できなかった場合 False
         """
-        if tokens > self.capacity:
+        if tokens > self.capacity or self._waiters:
             return False
-        
-        # 非同期ロックは使用しない（try_acquire は同期的に即座に結果を返す）
+
         self._refill()
-        
+
         if self.tokens >= tokens:
             self.tokens -= tokens
             logger.debug(f"Acquired {tokens} tokens (try). Remaining: {self.tokens:.2f}/{self.capacity}")
             return True
-        
+
         logger.debug(f"Failed to acquire {tokens} tokens. Available: {self.tokens:.2f}/{self.capacity}")
         return False
-    
+
     def get_wait_time(self, tokens: int = 1) -> Optional[float]:
         """指定数のトークンが利用可能になるまでの待機時間を取得
-        
+
+        待ち行列に並んでいる要求の分も考慮した、末尾に並んだ場合の見込み時間を返す。
+
         Args:
             tokens: 必要なトークン数（デフォルト: 1）
-            
+
         Returns:
             待機時間（秒）。即座に取得可能な場合は 0 、容量超過の場合は None
         """
         if tokens > self.capacity:
             return None
-        
+
         self._refill()
-        
-        if self.tokens >= tokens:
+
+        queued = sum(waiter.tokens for waiter in self._waiters if not waiter.future.done())
+        needed = queued + tokens + self._debt - self.tokens
+        if needed <= 0:
             return 0.0
-        
-        needed = tokens - self.tokens
+
         return needed / self.refill_rate
-    
+
+    def set_refill_rate(self, refill_rate: float) -> None:
+        """補充レートを変更する（容量は変更しない）
+
+        変更前までの経過時間分は旧レートで補充してから切り替える。
+
+        Args:
+            refill_rate: 新しい補充レート（トークン/秒）
+        """
+        if refill_rate <= 0:
+            raise ValueError("Refill rate must be positive")
+
+        self._refill()
+        self.refill_rate = refill_rate
+        self.refill_period = self.capacity / refill_rate
+        if self._waiters:
+            self._schedule_wakeup()
+
+    def drain(self, seconds: float = 0.0) -> None:
+        """バケットを空にし、指定秒数の間はトークンが利用できないようにする
+
+        サーバーから Retry-After を指定された場合などに使用する。
+        現在のレートで seconds 秒分のトークンを前借りした状態にするため、
+        既により長い待機が必要な状態であればそのまま維持する。
+        前借り分はトークン数とは別に保持し、トークン数が負になることはない。
+
+        Args:
+            seconds: トークンが利用可能になるまでの秒数
+        """
+        self._refill()
+        self.tokens = 0.0
+        self._debt = max(self._debt, max(0.0, seconds) * self.refill_rate)
+        logger.debug(f"Drained bucket for {seconds:.2f}s. Debt: {self._debt:.2f} tokens")
+        if self._waiters:
+            self._schedule_wakeup()
+
     @property
     def available_tokens(self) -> float:
-        """現在利用可能なトークン数を取得"""
+        """現在利用可能なトークン数を取得（drain() による前借り中は 0）"""
         self._refill()
-        return self.tokens
\ No newline at end of file
+        return self.tokens
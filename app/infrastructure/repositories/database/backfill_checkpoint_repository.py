@@ -0,0 +1,111 @@
+"""Backfill checkpoint repository implementation."""
+from datetime import date
+from typing import Collection, Dict, Optional
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.entities.backfill_checkpoint import BackfillCheckpoint
+from app.domain.repositories.backfill_checkpoint_repository_interface import (
+    BackfillCheckpointRepositoryInterface,
+)
+from app.infrastructure.database.models.backfill_checkpoint import BackfillCheckpointModel
+
+
+class BackfillCheckpointRepository(BackfillCheckpointRepositoryInterface):
+    """Backfill checkpoint repository implementation."""
+
+    def __init__(self, session: AsyncSession):
+        """Initialize repository."""
+        self._session = session
+
+    async def get_by_task_id(self, task_id: str) -> Dict[date, BackfillCheckpoint]:
+        """Get checkpoints of a task keyed by target date."""
+        result = await self._session.execute(
+            select(BackfillCheckpointModel).where(BackfillCheckpointModel.task_id == task_id)
+        )
+        return {
+            model.target_date: self._to_entity(model) for model in result.scalars().all()
+        }
+
+    async def save_progress(
+        self,
+        task_id: str,
+        target_date: date,
+        pagination_key: Optional[str],
+        fetched_count: int,
+        saved_count: int,
+        listed_codes: Optional[Collection[str]] = None,
+        digest_state: Optional[bytes] = None,
+    ) -> None:
+        """Save in-progress checkpoint of a target date."""
+        await self._upsert(
+            task_id=task_id,
+            target_date=target_date,
+            completed=False,
+            pagination_key=pagination_key,
+            fetched_count=fetched_count,
+            saved_count=saved_count,
+            listed_codes=sorted(listed_codes) if listed_codes is not None else None,
+            digest_state=digest_state,
+        )
+
+    async def mark_completed(
+        self,
+        task_id: str,
+        target_date: date,
+        fetched_count: int,
+        saved_count: int,
+    ) -> None:
+        """Mark a target date as completed."""
+        await self._upsert(
+            task_id=task_id,
+            target_date=target_date,
+            completed=True,
+            pagination_key=None,
+            fetched_count=fetched_count,
+            saved_count=saved_count,
+            listed_codes=None,
+            digest_state=None,
+        )
+
+    async def delete_by_task_id(self, task_id: str) -> int:
+        """Delete all checkpoints of a task."""
+        result = await self._session.execute(
+            delete(BackfillCheckpointModel).where(BackfillCheckpointModel.task_id == task_id)
+        )
+        await self._session.flush()
+        return result.rowcount
+
+    async def _upsert(self, **values) -> None:
+        """Insert or update a checkpoint row (without committing)."""
+        stmt = insert(BackfillCheckpointModel).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["task_id", "target_date"],
+            set_={
+                "completed": stmt.excluded.completed,
+                "pagination_key": stmt.excluded.pagination_key,
+                "fetched_count": stmt.excluded.fetched_count,
+                "saved_count": stmt.excluded.saved_count,
+                "listed_codes": stmt.excluded.listed_codes,
+                "digest_state": stmt.excluded.digest_state,
+                "updated_at": func.now(),
+            },
+        )
+        await self._session.execute(stmt)
+        await self._session.flush()
+
+    def _to_entity(self, model: BackfillCheckpointModel) -> BackfillCheckpoint:
+        """Convert database model to domain entity."""
+        return BackfillCheckpoint(
+            task_id=model.task_id,
+            target_date=model.target_date,
+            completed=model.completed,
+            pagination_key=model.pagination_key,
+            fetched_count=model.fetched_count,
+            saved_count=model.saved_count,
+            listed_codes=model.listed_codes,
+            digest_state=model.digest_state,
+            updated_at=model.updated_at,
+        )
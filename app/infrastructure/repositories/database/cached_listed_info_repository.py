@@ -0,0 +1,160 @@
+"""Listed info repository with Redis snapshot caching."""
+import asyncio
+from datetime import date
+from typing import Collection, List, Optional, Set
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.logger import get_logger
+from app.domain.entities.jquants_listed_info import JQuantsListedInfo
+from app.domain.services.listed_info_frame import ListedInfoFrame, ListedInfoRow
+from app.domain.repositories.jquants_listed_info_repository_interface import (
+    JQuantsListedInfoRepositoryInterface,
+    ListedInfoSaveResult,
+)
+from app.domain.value_objects.stock_code import StockCode
+from app.infrastructure.repositories.redis.listed_info_snapshot_cache import ListedInfoSnapshotCache
+
+logger = get_logger(__name__)
+
+# コミット後に破棄する日付（None はすべての日付）を保持する Session.info のキー
+_PENDING_KEY = "listed_info_cache_pending"
+_CACHE_KEY = "listed_info_cache"
+
+# 実行中の破棄タスク（GC で回収されないよう参照を保持する）
+_invalidation_tasks: Set[asyncio.Task] = set()
+
+
+def _on_commit(session: Session) -> None:
+    """コミット後にキャッシュを破棄するタスクを起動する"""
+    pending = session.info.pop(_PENDING_KEY, None)
+    cache: Optional[ListedInfoSnapshotCache] = session.info.get(_CACHE_KEY)
+    if not pending or cache is None:
+        return
+
+    coroutine = cache.clear() if None in pending else cache.invalidate(pending)
+    try:
+        task = asyncio.get_running_loop().create_task(coroutine)
+    except RuntimeError:
+        coroutine.close()
+        return
+    _invalidation_tasks.add(task)
+    task.add_done_callback(_invalidation_tasks.discard)
+
+
+def _on_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+class CachedListedInfoRepository(JQuantsListedInfoRepositoryInterface):
+    """日付ごとのスナップショットを Redis にキャッシュするリポジトリ
+
+    find_all_by_date の結果をキャッシュし、同じ日付の単一銘柄の検索にも利用する。
+    書き込み時は対象日付のキャッシュを即座に破棄し、コミット後にもう一度破棄する
+    （コミット前に他の読み取りが古いデータをキャッシュし直す可能性があるため）。
+    履歴形式ではすべての日付をコミット後に一度だけ破棄する。
+    """
+
+    def __init__(
+        self,
+        repository: JQuantsListedInfoRepositoryInterface,
+        cache: ListedInfoSnapshotCache,
+        session: AsyncSession,
+        invalidate_all_on_write: bool = False,
+    ) -> None:
+        """
+        Args:
+            repository: 実際に読み書きするリポジトリ
+            cache: スナップショットキャッシュ
+            session: repository と同じ AsyncSession（コミット後の破棄に使用）
+            invalidate_all_on_write: 書き込み時にすべての日付を破棄する
+                （履歴形式では書き込んだ日以降の全日付の結果が変わるため）
+        """
+        self._repository = repository
+        self._cache = cache
+        self._session = session
+        self._invalidate_all_on_write = invalidate_all_on_write
+
+    async def _invalidate(self, target_dates: Collection[date]) -> None:
+        """キャッシュを破棄し、コミット後の破棄を予約する（内部メソッド）"""
+        if not target_dates:
+            return
+
+        info = self._session.info
+        if _CACHE_KEY not in info:
+            info[_CACHE_KEY] = self._cache
+            event.listen(self._session.sync_session, "after_commit", _on_commit)
+            event.listen(self._session.sync_session, "after_rollback", _on_rollback)
+
+        pending = info.setdefault(_PENDING_KEY, set())
+        if self._invalidate_all_on_write:
+            # 全日付の破棄（SCAN と DEL）は書き込みごとではなくコミット後に一度だけ行う
+            pending.add(None)
+        else:
+            pending.update(target_dates)
+            await self._cache.invalidate(target_dates)
+
+    async def save_all(
+        self, listed_infos: List[JQuantsListedInfo], only_changed: Optional[bool] = None
+    ) -> ListedInfoSaveResult:
+        """複数の上場銘柄情報を保存し、書き込んだ日付のキャッシュを破棄"""
+        result = await self._repository.save_all(listed_infos, only_changed=only_changed)
+        if result.inserted_count or result.updated_count:
+            await self._invalidate({listed_info.date for listed_info in listed_infos})
+        return result
+
+    async def save_rows(
+        self, rows: List[ListedInfoRow], only_changed: Optional[bool] = None
+    ) -> ListedInfoSaveResult:
+        """検証済みの行を保存し、書き込んだ日付のキャッシュを破棄"""
+        result = await self._repository.save_rows(rows, only_changed=only_changed)
+        if result.inserted_count or result.updated_count:
+            await self._invalidate({row[0] for row in rows})
+        return result
+
+    async def finalize_snapshot(self, target_date: date, listed_codes: Collection[str]) -> int:
+        """スナップショットの確定を委譲し、変更があればキャッシュを破棄"""
+        count = await self._repository.finalize_snapshot(target_date, listed_codes)
+        if count:
+            await self._invalidate({target_date})
+        return count
+
+    async def find_by_code_and_date(
+        self, code: StockCode, target_date: date
+    ) -> Optional[JQuantsListedInfo]:
+        """キャッシュ済みのスナップショットがあればそこから検索"""
+        cached, listed_info = await self._cache.get_code(target_date, code)
+        if not cached:
+            return await self._repository.find_by_code_and_date(code, target_date)
+        return listed_info
+
+    async def find_all_by_date(self, target_date: date) -> List[JQuantsListedInfo]:
+        """スナップショットをキャッシュから取得し、なければ検索してキャッシュ"""
+        snapshot = await self._cache.get(target_date)
+        if snapshot is not None:
+            return snapshot
+
+        snapshot = await self._repository.find_all_by_date(target_date)
+        if snapshot:
+            await self._cache.set(target_date, snapshot)
+        return snapshot
+
+    async def find_frame_by_dates(self, target_dates: Collection[date]) -> ListedInfoFrame:
+        """複数日付の検索はキャッシュを経由せずに委譲"""
+        return await self._repository.find_frame_by_dates(target_dates)
+
+    async def find_previous_snapshot_date(self, target_date: date) -> Optional[date]:
+        """直前のスナップショットの日付の検索を委譲"""
+        return await self._repository.find_previous_snapshot_date(target_date)
+
+    async def find_latest_by_code(self, code: StockCode) -> Optional[JQuantsListedInfo]:
+        """最新の情報はキャッシュせずに検索"""
+        return await self._repository.find_latest_by_code(code)
+
+    async def delete_by_date(self, target_date: date) -> int:
+        """指定日付のデータを削除し、キャッシュを破棄"""
+        deleted_count = await self._repository.delete_by_date(target_date)
+        await self._invalidate({target_date})
+        return deleted_count
@@ -0,0 +1,289 @@
+"""Listed info history (SCD type 2) repository implementation."""
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Any, Collection, Dict, List, Optional
+
+from sqlalchemy import delete, func, insert, not_, select, update
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from app.core.logger import get_logger
+from app.domain.entities.jquants_listed_info import JQuantsListedInfo
+from app.domain.entities.snapshot_digest import LISTED_INFO_DATASET
+from app.domain.repositories.jquants_listed_info_repository_interface import (
+    JQuantsListedInfoRepositoryInterface,
+    ListedInfoSaveResult,
+)
+from app.domain.value_objects.stock_code import StockCode
+from app.infrastructure.database.models.jquants_listed_info import LISTED_INFO_ATTRIBUTE_COLUMNS
+from app.infrastructure.database.models.jquants_listed_info_history import (
+    OPEN_VALID_TO,
+    JQuantsListedInfoHistoryModel,
+)
+from app.infrastructure.repositories.database.snapshot_digest_repository import (
+    SnapshotDigestRepository,
+)
+
+logger = get_logger(__name__)
+
+History = JQuantsListedInfoHistoryModel
+
+# 履歴への書き込みを直列化するアドバイザリロックのキー（任意の固定値）
+HISTORY_WRITE_LOCK_KEY = 0x4C495354494E47  # "LISTING"
+
+
+async def lock_history_writes(connection: AsyncConnection) -> None:
+    """接続を閉じるか unlock_history_writes を呼ぶまで履歴への書き込みのロックを保持する
+
+    トランザクション単位のロックは途中でコミットすると解放されるため、1 日分の保存の途中で
+    チェックポイントをコミットする場合は、その日付の処理全体をこのロックで囲む。
+    同じ接続からのトランザクション単位のロックの取得はブロックされない。
+    """
+    await connection.execute(select(func.pg_advisory_lock(HISTORY_WRITE_LOCK_KEY)))
+    await connection.commit()
+
+
+async def unlock_history_writes(connection: AsyncConnection) -> None:
+    """lock_history_writes で取得したロックを解放する"""
+    await connection.execute(select(func.pg_advisory_unlock(HISTORY_WRITE_LOCK_KEY)))
+    await connection.commit()
+
+
+def _attributes(source: Any) -> Dict[str, Any]:
+    """エンティティまたはモデルから業務項目を取り出す"""
+    return {column: getattr(source, column) for column in LISTED_INFO_ATTRIBUTE_COLUMNS}
+
+
+def _valid_on(target_date: date):
+    """target_date 時点で有効な版を表す条件"""
+    return (History.valid_from <= target_date) & (History.valid_to > target_date)
+
+
+class JQuantsListedInfoHistoryRepository(JQuantsListedInfoRepositoryInterface):
+    """銘柄ごとの有効期間（SCD type 2）で上場銘柄情報を保持するリポジトリ
+
+    日次スナップショットとの差分から、属性が変化した日にだけ新しい版を作成する。
+    検索は指定日時点で有効な版を返す（エンティティの date は指定日）。
+
+    版の分割は現在の版を読んでから書き換えるため、書き込みはトランザクション単位の
+    アドバイザリロックで直列化する（複数の日付・タスクを並行に保存しても版の期間は重ならない）。
+    1 日分を複数のトランザクションに分けて保存する場合は、lock_history_writes で
+    その日付の処理全体をロックする。
+    ただし上場廃止と再上場のような変化を正しく反映するには、日付の昇順に保存する必要がある。
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize repository.
+
+        Args:
+            session: AsyncSession instance
+        """
+        self._session = session
+
+    async def save_all(
+        self, listed_infos: List[JQuantsListedInfo], only_changed: Optional[bool] = None
+    ) -> ListedInfoSaveResult:
+        """スナップショットの差分を履歴に反映する
+
+        属性が前の版と同じ銘柄は書き込まないため、only_changed は常に有効として扱う。
+        """
+        if not listed_infos:
+            return ListedInfoSaveResult()
+
+        await self._lock()
+        by_date: Dict[date, Dict[str, JQuantsListedInfo]] = defaultdict(dict)
+        for listed_info in listed_infos:
+            by_date[listed_info.date][listed_info.code.value] = listed_info
+
+        result = ListedInfoSaveResult()
+        for target_date in sorted(by_date):
+            result += await self._apply_snapshot(target_date, by_date[target_date])
+        await self._session.flush()
+
+        logger.info(
+            f"Applied {len(listed_infos)} listed info records to history - "
+            f"new: {result.inserted_count}, changed: {result.updated_count}, "
+            f"unchanged: {result.unchanged_count}"
+        )
+        return result
+
+    async def _lock(self) -> None:
+        """トランザクションの終了まで履歴への書き込みのロックを取得する（内部メソッド）"""
+        await self._session.scalar(select(func.pg_advisory_xact_lock(HISTORY_WRITE_LOCK_KEY)))
+
+    async def _apply_snapshot(
+        self, target_date: date, listed_infos: Dict[str, JQuantsListedInfo]
+    ) -> ListedInfoSaveResult:
+        """1 日分（の一部）のスナップショットを反映する（内部メソッド）"""
+        codes = list(listed_infos)
+        current = {
+            model.code: model
+            for model in (
+                await self._session.execute(
+                    select(History).where(History.code.in_(codes), _valid_on(target_date))
+                )
+            ).scalars()
+        }
+
+        missing = [code for code in codes if code not in current]
+        previous: Dict[str, JQuantsListedInfoHistoryModel] = {}
+        next_valid_from: Dict[str, date] = {}
+        if missing:
+            # 直前で終了した版（同じ属性なら延長する）と、後続の版の開始日
+            previous = {
+                model.code: model
+                for model in (
+                    await self._session.execute(
+                        select(History).where(
+                            History.code.in_(missing), History.valid_to == target_date
+                        )
+                    )
+                ).scalars()
+            }
+            next_valid_from = dict(
+                (
+                    await self._session.execute(
+                        select(History.code, func.min(History.valid_from))
+                        .where(History.code.in_(missing), History.valid_from > target_date)
+                        .group_by(History.code)
+                    )
+                ).all()
+            )
+
+        new_versions: List[Dict[str, Any]] = []
+        inserted = updated = unchanged = 0
+        for code, listed_info in listed_infos.items():
+            attributes = _attributes(listed_info)
+            version = current.get(code)
+
+            if version is None:
+                valid_to = next_valid_from.get(code, OPEN_VALID_TO)
+                prior = previous.get(code)
+                if prior is not None and _attributes(prior) == attributes:
+                    prior.valid_to = valid_to
+                else:
+                    new_versions.append(
+                        {"code": code, "valid_from": target_date, "valid_to": valid_to, **attributes}
+                    )
+                inserted += 1
+            elif _attributes(version) == attributes:
+                unchanged += 1
+            elif version.valid_from == target_date:
+                # 同じ日に保存し直した場合は版を上書き
+                for column, value in attributes.items():
+                    setattr(version, column, value)
+                updated += 1
+            else:
+                # 現在の版を前日までで終了し、新しい版を開始する
+                new_versions.append(
+                    {
+                        "code": code,
+                        "valid_from": target_date,
+                        "valid_to": version.valid_to,
+                        **attributes,
+                    }
+                )
+                version.valid_to = target_date
+                updated += 1
+
+        if new_versions:
+            await self._session.execute(insert(History), new_versions)
+
+        return ListedInfoSaveResult(
+            inserted_count=inserted, updated_count=updated, unchanged_count=unchanged
+        )
+
+    async def finalize_snapshot(self, target_date: date, listed_codes: Collection[str]) -> int:
+        """スナップショットに含まれない銘柄の有効期間を基準日で終了する"""
+        if not listed_codes:
+            # 空のスナップショット（非営業日など）で全銘柄を終了させない
+            return 0
+
+        await self._lock()
+        codes = list(listed_codes)
+        closed = await self._session.execute(
+            update(History)
+            .where(_valid_on(target_date), History.valid_from < target_date, not_(History.code.in_(codes)))
+            .values(valid_to=target_date, updated_at=func.now())
+        )
+        removed = await self._session.execute(
+            delete(History).where(History.valid_from == target_date, not_(History.code.in_(codes)))
+        )
+        await self._session.flush()
+
+        count = closed.rowcount + removed.rowcount
+        if count:
+            logger.info(f"Closed {count} listed info histories not listed on {target_date}")
+        return count
+
+    async def find_by_code_and_date(
+        self, code: StockCode, target_date: date
+    ) -> Optional[JQuantsListedInfo]:
+        """指定日時点で有効な版を検索"""
+        result = await self._session.execute(
+            select(History).where(History.code == code.value, _valid_on(target_date))
+        )
+        model = result.scalar_one_or_none()
+        return self._to_entity(model, target_date) if model else None
+
+    async def find_all_by_date(self, target_date: date) -> List[JQuantsListedInfo]:
+        """指定日時点で有効な全銘柄の版を検索"""
+        result = await self._session.execute(
+            select(History).where(_valid_on(target_date)).order_by(History.code)
+        )
+        return [self._to_entity(model, target_date) for model in result.scalars().all()]
+
+    async def find_previous_snapshot_date(self, target_date: date) -> Optional[date]:
+        """target_date の前日（それ以前に開始した版がある場合）
+
+        履歴からは任意の日付時点の状態を復元できるため、前日時点の状態を直前のスナップショットとする。
+        """
+        result = await self._session.execute(
+            select(History.code).where(History.valid_from < target_date).limit(1)
+        )
+        if result.scalar_one_or_none() is None:
+            return None
+        return target_date - timedelta(days=1)
+
+    async def find_latest_by_code(self, code: StockCode) -> Optional[JQuantsListedInfo]:
+        """最新の版を検索（date は版の開始日）"""
+        result = await self._session.execute(
+            select(History)
+            .where(History.code == code.value)
+            .order_by(History.valid_from.desc())
+            .limit(1)
+        )
+        model = result.scalar_one_or_none()
+        return self._to_entity(model, model.valid_from) if model else None
+
+    async def delete_by_date(self, target_date: date) -> int:
+        """指定日に開始した版を削除し、直前の版の有効期間を延長する
+
+        再取得した同じ内容のスナップショットが省略されないよう、その日付のダイジェストも削除する。
+        """
+        await self._lock()
+        removed = History.__table__.alias("removed")
+        await self._session.execute(
+            update(History)
+            .where(
+                removed.c.valid_from == target_date,
+                History.code == removed.c.code,
+                History.valid_to == target_date,
+            )
+            .values(valid_to=removed.c.valid_to, updated_at=func.now())
+        )
+        result = await self._session.execute(
+            delete(History).where(History.valid_from == target_date)
+        )
+        await SnapshotDigestRepository(self._session).delete_range(
+            LISTED_INFO_DATASET, target_date, target_date + timedelta(days=1)
+        )
+        await self._session.flush()
+
+        deleted_count = result.rowcount
+        logger.info(f"Deleted {deleted_count} history versions starting on {target_date}")
+        return deleted_count
+
+    @staticmethod
+    def _to_entity(model: JQuantsListedInfoHistoryModel, as_of: date) -> JQuantsListedInfo:
+        """版を指定日時点のエンティティに変換"""
+        return JQuantsListedInfo(date=as_of, code=StockCode(model.code), **_attributes(model))
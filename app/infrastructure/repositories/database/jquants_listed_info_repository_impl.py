@@ -1,20 +1,79 @@
 """Listed info repository implementation."""
-from datetime import date
-from typing import List, Optional
+from datetime import date, timedelta
+from typing import Collection, List, Optional, Tuple
 
-from sqlalchemy import delete, select
+from sqlalchemy import Boolean, delete, func, literal_column, or_, select, text
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.logger import get_logger
 from app.domain.entities.jquants_listed_info import JQuantsListedInfo
+from app.domain.entities.snapshot_digest import LISTED_INFO_DATASET
+from app.domain.services.listed_info_frame import (
+    ListedInfoFrame,
+    ListedInfoFrameBuilder,
+    ListedInfoRow,
+)
 from app.domain.value_objects.stock_code import StockCode
-from app.domain.repositories.jquants_listed_info_repository_interface import JQuantsListedInfoRepositoryInterface
-from app.infrastructure.database.models.jquants_listed_info import JQuantsListedInfoModel
+from app.domain.repositories.jquants_listed_info_repository_interface import (
+    JQuantsListedInfoRepositoryInterface,
+    ListedInfoSaveResult,
+)
+from app.infrastructure.database.models.jquants_listed_info import (
+    LISTED_INFO_ATTRIBUTE_COLUMNS,
+    JQuantsListedInfoModel,
+)
 from app.infrastructure.database.mappers.jquants_listed_info_mapper import JQuantsListedInfoMapper
+from app.infrastructure.config.settings import get_infrastructure_settings
+from app.infrastructure.repositories.database.snapshot_digest_repository import (
+    SnapshotDigestRepository,
+)
 
 logger = get_logger(__name__)
 
+_KEY_COLUMNS = ("date", "code")
+_UPDATE_COLUMNS = LISTED_INFO_ATTRIBUTE_COLUMNS
+_DATA_COLUMNS = _KEY_COLUMNS + _UPDATE_COLUMNS
+
+# asyncpg は 1 文あたり 32767 個までしかバインドパラメータを扱えない
+_INSERT_BATCH_SIZE = 32767 // len(_DATA_COLUMNS)
+
+_STAGING_TABLE = "jquants_listed_info_staging"
+
+_CREATE_STAGING_SQL = (
+    f"CREATE TEMP TABLE IF NOT EXISTS {_STAGING_TABLE} "
+    f"(LIKE {JQuantsListedInfoModel.__tablename__} INCLUDING DEFAULTS) ON COMMIT DELETE ROWS"
+)
+
+# find_frame_by_dates でサーバーサイドカーソルから一度に取得する行数
+_FRAME_FETCH_SIZE = 10000
+
+# 新規挿入された行は xmax が 0 になることを利用して新規・更新を区別する
+_INSERTED_FLAG = "(xmax = 0)"
+
+
+def _merge_staging_sql(only_changed: bool) -> str:
+    """ステージングテーブルから本テーブルへマージし、新規・更新件数を返す SQL"""
+    table = JQuantsListedInfoModel.__tablename__
+    sql = (
+        f"WITH merged AS ("
+        f"INSERT INTO {table} AS t ({', '.join(_DATA_COLUMNS)}) "
+        f"SELECT {', '.join(_DATA_COLUMNS)} FROM {_STAGING_TABLE} "
+        f"ON CONFLICT ({', '.join(_KEY_COLUMNS)}) DO UPDATE SET "
+        + ", ".join(f"{column} = EXCLUDED.{column}" for column in _UPDATE_COLUMNS)
+        + ", updated_at = now()"
+    )
+    if only_changed:
+        sql += (
+            f" WHERE ({', '.join(f't.{column}' for column in _UPDATE_COLUMNS)})"
+            f" IS DISTINCT FROM ({', '.join(f'EXCLUDED.{column}' for column in _UPDATE_COLUMNS)})"
+        )
+    return (
+        sql
+        + f" RETURNING {_INSERTED_FLAG} AS inserted) "
+        "SELECT count(*) FILTER (WHERE inserted), count(*) FROM merged"
+    )
+
 
 class JQuantsListedInfoRepositoryImpl(JQuantsListedInfoRepositoryInterface):
     """Listed info repository implementation using SQLAlchemy."""
@@ -29,58 +88,151 @@ class JQuantsListedInfoRepositoryImpl(JQuantsListedInfoRepositoryInterface):
         self._session = session
         self._mapper = mapper or JQuantsListedInfoMapper()
 
-    async def save_all(self, listed_infos: List[JQuantsListedInfo]) -> None:
-        """複数の上場銘柄情報を保存（UPSERT）"""
+    async def save_all(
+        self,
+        listed_infos: List[JQuantsListedInfo],
+        only_changed: Optional[bool] = None,
+        use_copy: Optional[bool] = None,
+    ) -> ListedInfoSaveResult:
+        """複数の上場銘柄情報を保存（UPSERT）
+
+        Args:
+            listed_infos: 保存する上場銘柄情報のリスト
+            only_changed: True の場合、既存行は業務項目が異なる場合のみ更新する
+                （updated_at も変わらず、WAL も生成されない）。
+                None の場合は ``database.upsert_only_changed`` に従う。
+            use_copy: True の場合は COPY でステージングテーブルに流し込んでからマージし、
+                False の場合は複数行 INSERT を使用する。
+                None の場合は件数が ``database.copy_threshold`` 以上なら COPY を使用する。
+
+        Returns:
+            ListedInfoSaveResult: 新規・更新・変更なしの件数
+        """
         if not listed_infos:
-            return
+            return ListedInfoSaveResult()
 
         # エンティティをモデルに変換（Mapper を使用）
         models = self._mapper.to_models(listed_infos)
+        records = [tuple(getattr(model, column) for column in _DATA_COLUMNS) for model in models]
+        return await self._save_records(records, only_changed, use_copy)
+
+    async def save_rows(
+        self,
+        rows: List[ListedInfoRow],
+        only_changed: Optional[bool] = None,
+        use_copy: Optional[bool] = None,
+    ) -> ListedInfoSaveResult:
+        """検証済みの行をエンティティ・モデルを経由せずに保存（UPSERT）
+
+        行の列順は _DATA_COLUMNS と同じため、そのまま INSERT・COPY に渡す。
+        only_changed・use_copy は save_all と同じ。
+        """
+        if not rows:
+            return ListedInfoSaveResult()
+        return await self._save_records(rows, only_changed, use_copy)
+
+    async def _save_records(
+        self,
+        records: List[Tuple],
+        only_changed: Optional[bool],
+        use_copy: Optional[bool],
+    ) -> ListedInfoSaveResult:
+        """_DATA_COLUMNS の順のタプルを保存する（内部メソッド）"""
+        database_settings = get_infrastructure_settings().database
+        if only_changed is None:
+            only_changed = database_settings.upsert_only_changed
+        if use_copy is None:
+            threshold = database_settings.copy_threshold
+            use_copy = 0 < threshold <= len(records)
+
+        if use_copy:
+            inserted, written = await self._save_all_copy(records, only_changed)
+        else:
+            inserted, written = await self._save_all_insert(records, only_changed)
 
+        result = ListedInfoSaveResult(
+            inserted_count=inserted,
+            updated_count=written - inserted,
+            unchanged_count=len(records) - written,
+        )
+        logger.info(
+            f"Saved {len(records)} listed info records ({'copy' if use_copy else 'insert'}) - "
+            f"inserted: {result.inserted_count}, updated: {result.updated_count}, "
+            f"unchanged: {result.unchanged_count}"
+        )
+        return result
+
+    async def _save_all_insert(
+        self, records: List[Tuple], only_changed: bool
+    ) -> Tuple[int, int]:
+        """複数行 INSERT ... ON CONFLICT で保存する（内部メソッド）
+
+        Returns:
+            (新規件数, 新規・更新を合わせた書き込み件数)
+        """
+        table = JQuantsListedInfoModel.__table__
         # バルク UPSERT 用のデータ準備
-        values = [
-            {
-                "date": model.date,
-                "code": model.code,
-                "company_name": model.company_name,
-                "company_name_english": model.company_name_english,
-                "sector_17_code": model.sector_17_code,
-                "sector_17_code_name": model.sector_17_code_name,
-                "sector_33_code": model.sector_33_code,
-                "sector_33_code_name": model.sector_33_code_name,
-                "scale_category": model.scale_category,
-                "market_code": model.market_code,
-                "market_code_name": model.market_code_name,
-                "margin_code": model.margin_code,
-                "margin_code_name": model.margin_code_name,
-            }
-            for model in models
-        ]
+        values = [dict(zip(_DATA_COLUMNS, record)) for record in records]
 
+        inserted = 0
+        written = 0
         # PostgreSQL の ON CONFLICT を使用した UPSERT
-        stmt = insert(JQuantsListedInfoModel).values(values)
-        stmt = stmt.on_conflict_do_update(
-            index_elements=["date", "code"],
-            set_={
-                "company_name": stmt.excluded.company_name,
-                "company_name_english": stmt.excluded.company_name_english,
-                "sector_17_code": stmt.excluded.sector_17_code,
-                "sector_17_code_name": stmt.excluded.sector_17_code_name,
-                "sector_33_code": stmt.excluded.sector_33_code,
-                "sector_33_code_name": stmt.excluded.sector_33_code_name,
-                "scale_category": stmt.excluded.scale_category,
-                "market_code": stmt.excluded.market_code,
-                "market_code_name": stmt.excluded.market_code_name,
-                "margin_code": stmt.excluded.margin_code,
-                "margin_code_name": stmt.excluded.margin_code_name,
-                "updated_at": stmt.excluded.updated_at,
-            },
-        )
+        # asyncpg のバインドパラメータ数の上限を超えないよう分割して実行
+        for start in range(0, len(values), _INSERT_BATCH_SIZE):
+            stmt = insert(table).values(values[start:start + _INSERT_BATCH_SIZE])
+            where = None
+            if only_changed:
+                where = or_(
+                    *(table.c[column].is_distinct_from(stmt.excluded[column]) for column in _UPDATE_COLUMNS)
+                )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=list(_KEY_COLUMNS),
+                set_={
+                    **{column: stmt.excluded[column] for column in _UPDATE_COLUMNS},
+                    "updated_at": stmt.excluded.updated_at,
+                },
+                where=where,
+            )
+            merged = stmt.returning(
+                literal_column(_INSERTED_FLAG, Boolean).label("inserted")
+            ).cte("merged")
+            counts = await self._session.execute(
+                select(func.count().filter(merged.c.inserted), func.count()).select_from(merged)
+            )
+            batch_inserted, batch_written = counts.one()
+            inserted += batch_inserted
+            written += batch_written
 
-        await self._session.execute(stmt)
         await self._session.flush()
+        return inserted, written
+
+    async def _save_all_copy(
+        self, records: List[Tuple], only_changed: bool
+    ) -> Tuple[int, int]:
+        """COPY でステージングテーブルに投入し、1 文でマージする（内部メソッド）
+
+        ステージングテーブルは接続ごとの一時テーブルで、セッションと同じ
+        トランザクション内で使用するため、ロールバック時は本テーブルも変更されない。
+
+        Returns:
+            (新規件数, 新規・更新を合わせた書き込み件数)
+        """
+        # SQLAlchemy 経由で実行してトランザクションを開始させてから生の接続を使う
+        await self._session.execute(text(_CREATE_STAGING_SQL))
+        await self._session.execute(text(f"TRUNCATE {_STAGING_TABLE}"))
+
+        connection = await self._session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            _STAGING_TABLE,
+            records=records,
+            columns=list(_DATA_COLUMNS),
+        )
 
-        logger.info(f"Saved {len(listed_infos)} listed info records")
+        counts = await self._session.execute(text(_merge_staging_sql(only_changed)))
+        inserted, written = counts.one()
+        await self._session.flush()
+        return inserted, written
 
     async def find_by_code_and_date(
         self, code: StockCode, target_date: date
@@ -109,6 +261,36 @@ class JQuantsListedInfoRepositoryImpl(JQuantsListedInfoRepositoryInterface):
 
         return self._mapper.to_entities(models)
 
+    async def find_frame_by_dates(self, target_dates: Collection[date]) -> ListedInfoFrame:
+        """複数日付の全銘柄を列指向の ListedInfoFrame として検索
+
+        ORM モデルやエンティティを作成せずに列の値だけを取得し、
+        サーバーサイドカーソルから読み込んだ分ずつ ListedInfoFrame に変換する。
+        """
+        builder = ListedInfoFrameBuilder()
+        if not target_dates:
+            return builder.build()
+
+        columns = [getattr(JQuantsListedInfoModel, column) for column in _DATA_COLUMNS]
+        result = await self._session.stream(
+            select(*columns)
+            .where(JQuantsListedInfoModel.date.in_(sorted(set(target_dates))))
+            .order_by(JQuantsListedInfoModel.date, JQuantsListedInfoModel.code)
+            .execution_options(yield_per=_FRAME_FETCH_SIZE)
+        )
+        async for rows in result.partitions():
+            builder.extend(rows)
+        return builder.build()
+
+    async def find_previous_snapshot_date(self, target_date: date) -> Optional[date]:
+        """target_date より前で最も新しい保存済みの日付を検索"""
+        result = await self._session.execute(
+            select(func.max(JQuantsListedInfoModel.date)).where(
+                JQuantsListedInfoModel.date < target_date
+            )
+        )
+        return result.scalar_one_or_none()
+
     async def find_latest_by_code(self, code: StockCode) -> Optional[JQuantsListedInfo]:
         """銘柄コードで最新の情報を検索"""
         result = await self._session.execute(
@@ -124,9 +306,20 @@ class JQuantsListedInfoRepositoryImpl(JQuantsListedInfoRepositoryInterface):
         return None
 
     async def delete_by_date(self, target_date: date) -> int:
-        """指定日付のデータを削除"""
+        """指定日付のデータを削除
+
+        日付はバインドパラメータではなくリテラルとして埋め込み、
+        汎用プランでも計画時に対象パーティション以外を除外できるようにする。
+        再取得した同じ内容のスナップショットが省略されないよう、同じトランザクションで
+        その日付のダイジェストも削除する。
+        """
         result = await self._session.execute(
-            delete(JQuantsListedInfoModel).where(JQuantsListedInfoModel.date == target_date)
+            delete(JQuantsListedInfoModel).where(
+                JQuantsListedInfoModel.date == literal_column(f"DATE '{target_date.isoformat()}'")
+            )
+        )
+        await SnapshotDigestRepository(self._session).delete_range(
+            LISTED_INFO_DATASET, target_date, target_date + timedelta(days=1)
         )
         await self._session.flush()
 
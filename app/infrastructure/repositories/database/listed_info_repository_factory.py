@@ -0,0 +1,48 @@
+"""Listed info repository factory."""
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.repositories.jquants_listed_info_repository_interface import (
+    JQuantsListedInfoRepositoryInterface,
+)
+from app.infrastructure.config.settings import get_infrastructure_settings
+
+
+def create_listed_info_repository(session: AsyncSession) -> JQuantsListedInfoRepositoryInterface:
+    """設定された保存方式の上場銘柄情報リポジトリを作成
+
+    - snapshot: 日付ごとに全銘柄を保持する（jquants_listed_info）
+    - history: 銘柄ごとの有効期間で保持する（jquants_listed_info_history）
+
+    スナップショットキャッシュが有効な場合は、日付ごとの検索結果を Redis にキャッシュし、
+    書き込み時に破棄するリポジトリでラップする。
+    """
+    from app.infrastructure.repositories.redis.listed_info_snapshot_cache import (
+        get_listed_info_snapshot_cache,
+    )
+
+    storage = get_infrastructure_settings().database.listed_info_storage
+    repository: JQuantsListedInfoRepositoryInterface
+    if storage == "history":
+        from app.infrastructure.repositories.database.jquants_listed_info_history_repository import (
+            JQuantsListedInfoHistoryRepository,
+        )
+
+        repository = JQuantsListedInfoHistoryRepository(session)
+    else:
+        from app.infrastructure.repositories.database.jquants_listed_info_repository_impl import (
+            JQuantsListedInfoRepositoryImpl,
+        )
+
+        repository = JQuantsListedInfoRepositoryImpl(session)
+
+    cache = get_listed_info_snapshot_cache()
+    if cache is None:
+        return repository
+
+    from app.infrastructure.repositories.database.cached_listed_info_repository import (
+        CachedListedInfoRepository,
+    )
+
+    return CachedListedInfoRepository(
+        repository, cache, session, invalidate_all_on_write=storage == "history"
+    )
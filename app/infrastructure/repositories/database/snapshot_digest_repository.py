@@ -0,0 +1,73 @@
+"""Snapshot digest repository implementation."""
+from datetime import date
+from typing import Optional
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.entities.snapshot_digest import SnapshotDigest
+from app.domain.repositories.snapshot_digest_repository_interface import (
+    SnapshotDigestRepositoryInterface,
+)
+from app.infrastructure.database.models.snapshot_digest import SnapshotDigestModel
+
+
+class SnapshotDigestRepository(SnapshotDigestRepositoryInterface):
+    """Snapshot digest repository implementation."""
+
+    def __init__(self, session: AsyncSession):
+        """Initialize repository."""
+        self._session = session
+
+    async def get(self, dataset: str, target_date: date) -> Optional[SnapshotDigest]:
+        """Get the digest of a dataset snapshot."""
+        result = await self._session.execute(
+            select(SnapshotDigestModel).where(
+                SnapshotDigestModel.dataset == dataset,
+                SnapshotDigestModel.target_date == target_date,
+            )
+        )
+        model = result.scalar_one_or_none()
+        return self._to_entity(model) if model else None
+
+    async def save(self, snapshot_digest: SnapshotDigest) -> None:
+        """Insert or update a digest row (without committing)."""
+        stmt = insert(SnapshotDigestModel).values(
+            dataset=snapshot_digest.dataset,
+            target_date=snapshot_digest.target_date,
+            digest=snapshot_digest.digest,
+            record_count=snapshot_digest.record_count,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["dataset", "target_date"],
+            set_={
+                "digest": stmt.excluded.digest,
+                "record_count": stmt.excluded.record_count,
+                "updated_at": func.now(),
+            },
+        )
+        await self._session.execute(stmt)
+        await self._session.flush()
+
+    async def delete_range(self, dataset: str, start: date, end: date) -> int:
+        """Delete digests of dates in [start, end) (without committing)."""
+        result = await self._session.execute(
+            delete(SnapshotDigestModel).where(
+                SnapshotDigestModel.dataset == dataset,
+                SnapshotDigestModel.target_date >= start,
+                SnapshotDigestModel.target_date < end,
+            )
+        )
+        await self._session.flush()
+        return result.rowcount
+
+    def _to_entity(self, model: SnapshotDigestModel) -> SnapshotDigest:
+        """Convert database model to domain entity."""
+        return SnapshotDigest(
+            dataset=model.dataset,
+            target_date=model.target_date,
+            digest=model.digest,
+            record_count=model.record_count,
+            updated_at=model.updated_at,
+        )
@@ -1,4 +1,3 @@
-import asyncio
 import json
 from datetime import datetime, timedelta
 from typing import Dict, Optional
@@ -14,6 +13,9 @@ from app.domain.exceptions.jquants_exceptions import (
     TokenRefreshError,
 )
 from app.domain.repositories.auth_repository_interface import AuthRepositoryInterface
+from app.infrastructure.external_services.jquants.session_registry import (
+    get_jquants_session,
+)
 
 
 class JQuantsAuthRepository(AuthRepositoryInterface):
@@ -35,27 +37,9 @@ class JQuantsAuthRepository(AuthRepositoryInterface):
         self, email: str, password: str
     ) -> Optional[RefreshToken]:
         """メールアドレスとパスワードからリフレッシュトークンを取得"""
-        # TCP コネクターの設定
-        connector = aiohttp.TCPConnector(
-            force_close=True,  # 接続を強制的にクローズ
-            limit=100,         # 接続数の制限
-            ttl_dns_cache=300  # DNS キャッシュの TTL
-        )
-        
-        # タイムアウトの設定
-        timeout = aiohttp.ClientTimeout(
-            total=30,      # 全体のタイムアウト
-            connect=10,    # 接続タイムアウト
-            sock_read=10   # 読み取りタイムアウト
-        )
-        
-        session = None
         try:
-            session = aiohttp.ClientSession(
-                connector=connector,
-                timeout=timeout
-            )
-            
+            session = await get_jquants_session()
+
             payload = {"mailaddress": email, "password": password}
             
             async with session.post(
@@ -77,36 +61,12 @@ class JQuantsAuthRepository(AuthRepositoryInterface):
             raise NetworkError(f"ネットワークエラーが発生しました: {str(e)}")
         except (KeyError, json.JSONDecodeError) as e:
             raise AuthenticationError(f"レスポンスの解析に失敗しました: {str(e)}")
-        finally:
-            # セッションを確実にクローズ
-            if session:
-                await session.close()
-                # TCP コネクションが完全にクローズされるまで少し待つ
-                await asyncio.sleep(0.1)
 
     async def get_id_token(self, refresh_token: RefreshToken) -> Optional[IdToken]:
         """リフレッシュトークンから ID トークンを取得"""
-        # TCP コネクターの設定
-        connector = aiohttp.TCPConnector(
-            force_close=True,  # 接続を強制的にクローズ
-            limit=100,         # 接続数の制限
-            ttl_dns_cache=300  # DNS キャッシュの TTL
-        )
-        
-        # タイムアウトの設定
-        timeout = aiohttp.ClientTimeout(
-            total=30,      # 全体のタイムアウト
-            connect=10,    # 接続タイムアウト
-            sock_read=10   # 読み取りタイムアウト
-        )
-        
-        session = None
         try:
-            session = aiohttp.ClientSession(
-                connector=connector,
-                timeout=timeout
-            )
-            
+            session = await get_jquants_session()
+
             params = {"refreshtoken": refresh_token.value}
             
             async with session.post(
@@ -129,12 +89,6 @@ class JQuantsAuthRepository(AuthRepositoryInterface):
             raise NetworkError(f"ネットワークエラーが発生しました: {str(e)}")
         except (KeyError, json.JSONDecodeError) as e:
             raise TokenRefreshError(f"レスポンスの解析に失敗しました: {str(e)}")
-        finally:
-            # セッションを確実にクローズ
-            if session:
-                await session.close()
-                # TCP コネクションが完全にクローズされるまで少し待つ
-                await asyncio.sleep(0.1)
 
     async def save_credentials(self, credentials: JQuantsCredentials) -> None:
         """認証情報を永続化"""
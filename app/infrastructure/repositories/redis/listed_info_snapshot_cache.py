@@ -0,0 +1,156 @@
+"""上場銘柄情報の日次スナップショットキャッシュ
+
+日付ごとの全銘柄分の上場銘柄情報を、銘柄コードをフィールドとする Redis のハッシュに保持する
+（各フィールドの値は 1 銘柄分の JSON）。単一銘柄の検索は HMGET で該当の銘柄だけを取得する。
+Redis を利用できない場合はキャッシュなしとして動作し、呼び出し側はデータベースを参照する。
+"""
+import json
+from datetime import date
+from typing import Awaitable, Callable, Iterable, List, Optional, Tuple
+
+from redis.asyncio import Redis
+
+from app.core.constants import CacheKeyPrefix
+from app.core.logger import get_logger
+from app.domain.entities.jquants_listed_info import JQuantsListedInfo
+from app.domain.value_objects.stock_code import StockCode
+from app.infrastructure.config.settings import get_infrastructure_settings
+from app.infrastructure.database.models.jquants_listed_info import LISTED_INFO_ATTRIBUTE_COLUMNS
+
+logger = get_logger(__name__)
+
+_KEY_PREFIX = f"{CacheKeyPrefix.STOCK_INFO.value}:listed_info"
+
+# SCAN で一度に削除するキーの数
+_SCAN_COUNT = 500
+
+# スナップショットがキャッシュ済みであることを示すフィールド（空のスナップショットも保持するため）
+_MARKER_FIELD = "_"
+
+
+def _cache_key(target_date: date) -> str:
+    """日付ごとの Redis キー"""
+    return f"{_KEY_PREFIX}:{target_date.isoformat()}"
+
+
+def _serialize(info: JQuantsListedInfo) -> str:
+    return json.dumps(
+        [getattr(info, column) for column in LISTED_INFO_ATTRIBUTE_COLUMNS],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+
+
+def _deserialize(target_date: date, code: str, raw: str) -> JQuantsListedInfo:
+    return JQuantsListedInfo(
+        date=target_date,
+        code=StockCode(code),
+        **dict(zip(LISTED_INFO_ATTRIBUTE_COLUMNS, json.loads(raw))),
+    )
+
+
+class ListedInfoSnapshotCache:
+    """日付ごとの上場銘柄情報スナップショットの Redis キャッシュ"""
+
+    def __init__(
+        self,
+        ttl: int,
+        redis_getter: Optional[Callable[[], Awaitable[Redis]]] = None,
+    ) -> None:
+        """
+        Args:
+            ttl: スナップショットの保持秒数
+            redis_getter: Redis クライアントを返す関数（None の場合は共通クライアント）
+        """
+        if redis_getter is None:
+            from app.infrastructure.redis.redis_client import get_redis_client
+
+            redis_getter = get_redis_client
+
+        self.ttl = ttl
+        self._redis_getter = redis_getter
+
+    async def get(self, target_date: date) -> Optional[List[JQuantsListedInfo]]:
+        """キャッシュ済みのスナップショットを取得する（未キャッシュの場合は None）"""
+        try:
+            redis = await self._redis_getter()
+            fields = await redis.hgetall(_cache_key(target_date))
+        except Exception as e:
+            logger.warning(f"Failed to read listed info cache for {target_date}: {str(e)}")
+            return None
+        if fields.pop(_MARKER_FIELD, None) is None:
+            return None
+        return [_deserialize(target_date, code, fields[code]) for code in sorted(fields)]
+
+    async def get_code(
+        self, target_date: date, code: StockCode
+    ) -> Tuple[bool, Optional[JQuantsListedInfo]]:
+        """キャッシュ済みのスナップショットから単一銘柄を取得する
+
+        Returns:
+            (キャッシュ済みか, 銘柄の情報) のタプル。キャッシュ済みで該当の銘柄がない場合は (True, None)
+        """
+        try:
+            redis = await self._redis_getter()
+            raw, marker = await redis.hmget(_cache_key(target_date), [code.value, _MARKER_FIELD])
+        except Exception as e:
+            logger.warning(f"Failed to read listed info cache for {target_date}: {str(e)}")
+            return False, None
+        if marker is None:
+            return False, None
+        return True, _deserialize(target_date, code.value, raw) if raw is not None else None
+
+    async def set(self, target_date: date, listed_infos: List[JQuantsListedInfo]) -> None:
+        """スナップショットをキャッシュする（同じ日付の既存のキャッシュは置き換える）"""
+        key = _cache_key(target_date)
+        mapping = {info.code.value: _serialize(info) for info in listed_infos}
+        mapping[_MARKER_FIELD] = "1"
+        try:
+            redis = await self._redis_getter()
+            async with redis.pipeline(transaction=True) as pipe:
+                pipe.delete(key)
+                pipe.hset(key, mapping=mapping)
+                pipe.expire(key, self.ttl)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Failed to write listed info cache for {target_date}: {str(e)}")
+
+    async def invalidate(self, target_dates: Iterable[date]) -> None:
+        """指定日のスナップショットを破棄する"""
+        keys = [_cache_key(target_date) for target_date in target_dates]
+        if not keys:
+            return
+        try:
+            redis = await self._redis_getter()
+            await redis.delete(*keys)
+        except Exception as e:
+            logger.warning(f"Failed to invalidate listed info cache: {str(e)}")
+
+    async def clear(self) -> None:
+        """すべての日付のスナップショットを破棄する"""
+        try:
+            redis = await self._redis_getter()
+            keys = []
+            async for key in redis.scan_iter(match=f"{_KEY_PREFIX}:*", count=_SCAN_COUNT):
+                keys.append(key)
+                if len(keys) >= _SCAN_COUNT:
+                    await redis.delete(*keys)
+                    keys = []
+            if keys:
+                await redis.delete(*keys)
+        except Exception as e:
+            logger.warning(f"Failed to clear listed info cache: {str(e)}")
+
+
+_cache: Optional[ListedInfoSnapshotCache] = None
+
+
+def get_listed_info_snapshot_cache() -> Optional[ListedInfoSnapshotCache]:
+    """プロセス共通のスナップショットキャッシュを取得（TTL が 0 の場合は None）"""
+    global _cache
+    ttl = get_infrastructure_settings().redis.listed_info_cache_ttl
+    if ttl <= 0:
+        return None
+    if _cache is None:
+        _cache = ListedInfoSnapshotCache(ttl=ttl)
+    return _cache
@@ -4,6 +4,9 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import settings
+from app.infrastructure.external_services.jquants.session_registry import (
+    close_jquants_sessions,
+)
 from app.infrastructure.redis.redis_client import redis_client
 from app.presentation.api.v1 import api_router
 from app.presentation.middleware import (
@@ -31,6 +34,11 @@ async def lifespan(app: FastAPI):
     except Exception:
         pass
 
+    try:
+        await close_jquants_sessions()
+    except Exception:
+        pass
+
 
 app = FastAPI(
     title=settings.app_name,
@@ -0,0 +1,70 @@
+"""Listed info read endpoints."""
+from datetime import date
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+
+from app.application.dtos.jquants_listed_info_dto import JQuantsListedInfoSearchCriteria
+from app.application.use_cases.query_listed_info import QueryListedInfoUseCase
+from app.presentation.api.v1.schemas.listed_info import ListedInfoResponse
+from app.presentation.dependencies.use_cases import get_query_listed_info_use_case
+from app.presentation.exceptions import ResourceNotFoundError
+from app.presentation.schemas import PaginatedResponse, SuccessResponse
+
+router = APIRouter(prefix="/listed-info", tags=["listed-info"])
+
+
+@router.get("/", response_model=PaginatedResponse[ListedInfoResponse])
+async def list_listed_info(
+    target_date: date = Query(..., alias="date", description="基準日（YYYY-MM-DD）"),
+    market_code: Optional[str] = None,
+    sector_17_code: Optional[str] = None,
+    sector_33_code: Optional[str] = None,
+    scale_category: Optional[str] = None,
+    page: int = Query(1, ge=1),
+    per_page: int = Query(100, ge=1, le=1000),
+    use_case: QueryListedInfoUseCase = Depends(get_query_listed_info_use_case),
+) -> PaginatedResponse[ListedInfoResponse]:
+    """List listed companies on a date, filtered by market, sector and scale."""
+    criteria = JQuantsListedInfoSearchCriteria(
+        date=target_date,
+        market_code=market_code,
+        sector_17_code=sector_17_code,
+        sector_33_code=sector_33_code,
+        scale_category=scale_category,
+    )
+    items, total = await use_case.search(criteria, offset=(page - 1) * per_page, limit=per_page)
+
+    return PaginatedResponse.from_data(
+        data=[ListedInfoResponse.model_validate(item) for item in items],
+        page=page,
+        per_page=per_page,
+        total=total,
+    )
+
+
+@router.get("/{code}/latest", response_model=SuccessResponse[ListedInfoResponse])
+async def get_latest_listed_info(
+    code: str,
+    use_case: QueryListedInfoUseCase = Depends(get_query_listed_info_use_case),
+) -> SuccessResponse[ListedInfoResponse]:
+    """Get the latest listed info of a stock."""
+    listed_info = await use_case.get_latest_by_code(code)
+    if listed_info is None:
+        raise ResourceNotFoundError("ListedInfo", code)
+
+    return SuccessResponse(data=ListedInfoResponse.model_validate(listed_info))
+
+
+@router.get("/{code}", response_model=SuccessResponse[ListedInfoResponse])
+async def get_listed_info(
+    code: str,
+    target_date: date = Query(..., alias="date", description="基準日（YYYY-MM-DD）"),
+    use_case: QueryListedInfoUseCase = Depends(get_query_listed_info_use_case),
+) -> SuccessResponse[ListedInfoResponse]:
+    """Get listed info of a stock on a date."""
+    listed_info = await use_case.get_by_code(code, target_date)
+    if listed_info is None:
+        raise ResourceNotFoundError("ListedInfo", f"{code}@{target_date.isoformat()}")
+
+    return SuccessResponse(data=ListedInfoResponse.model_validate(listed_info))
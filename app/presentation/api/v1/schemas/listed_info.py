@@ -0,0 +1,27 @@
+"""Listed info API schemas."""
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class ListedInfoResponse(BaseModel):
+    """Listed info response schema."""
+
+    date: str = Field(..., description="基準日（YYYY-MM-DD）")
+    code: str = Field(..., description="銘柄コード")
+    company_name: str = Field(..., description="会社名")
+    company_name_english: Optional[str] = Field(None, description="会社名（英語）")
+    sector_17_code: Optional[str] = Field(None, description="17 業種コード")
+    sector_17_code_name: Optional[str] = Field(None, description="17 業種名")
+    sector_33_code: Optional[str] = Field(None, description="33 業種コード")
+    sector_33_code_name: Optional[str] = Field(None, description="33 業種名")
+    scale_category: Optional[str] = Field(None, description="規模区分")
+    market_code: Optional[str] = Field(None, description="市場区分コード")
+    market_code_name: Optional[str] = Field(None, description="市場区分名")
+    margin_code: Optional[str] = Field(None, description="貸借信用区分")
+    margin_code_name: Optional[str] = Field(None, description="貸借信用区分名")
+
+    class Config:
+        """Pydantic config."""
+
+        from_attributes = True
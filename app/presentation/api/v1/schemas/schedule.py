@@ -4,7 +4,8 @@ from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field, field_validator
-from croniter import croniter
+
+from app.domain.helpers.compiled_cron import compile_cron
 
 
 class TaskParams(BaseModel):
@@ -57,7 +58,7 @@ class ScheduleBase(BaseModel):
     def validate_cron_expression(cls, v: str) -> str:
         """Validate cron expression."""
         try:
-            croniter(v)
+            compile_cron(v)
             return v
         except Exception as e:
             raise ValueError(f"Invalid cron expression: {str(e)}")
@@ -91,7 +92,7 @@ class ScheduleUpdate(BaseModel):
         """Validate cron expression if provided."""
         if v is not None:
             try:
-                croniter(v)
+                compile_cron(v)
             except Exception as e:
                 raise ValueError(f"Invalid cron expression: {str(e)}")
         return v
@@ -21,6 +21,7 @@ from app.presentation.dependencies.cli import (
     get_cli_auth_repository,
     get_cli_listed_info_repository,
     get_cli_jquants_client,
+    close_cli_http_sessions,
 )
 
 logger = get_logger(__name__)
@@ -140,48 +141,53 @@ async def _fetch_listed_info_async(
 
     click.echo("J-Quants API に接続中...")
 
-    # 認証処理
-    credentials = await authenticate_jquants(jquants_email, jquants_password)
-    click.echo("認証成功")
-
-    # データベースセッションとリポジトリの初期化
-    async for session in get_cli_session():
-        # クライアントとリポジトリの初期化
-        jquants_client = await get_cli_jquants_client(credentials)
-        repository = await get_cli_listed_info_repository(session)
-
-        # ユースケースの実行
-        use_case = FetchJQuantsListedInfoUseCase(
-            jquants_client=jquants_client,
-            listed_info_repository=repository,
-            logger=logger,
-        )
-
-        click.echo(f"データ取得中... (code: {code or '全銘柄'}, date: {date or '最新'})")
-
-        # 実行
-        result = await use_case.execute(code=code, target_date=target_date)
-
-        # 結果の表示
-        if result.success:
-            click.echo(
-                f"\n✅ 処理完了:\n"
-                f"  - 取得件数: {result.fetched_count}件\n"
-                f"  - 保存件数: {result.saved_count}件"
-            )
-        else:
-            from app.presentation.exceptions import PresentationError
-            raise PresentationError(
-                f"処理失敗: {result.error_message}",
-                error_code="FETCH_FAILED",
-                details={
-                    "fetched_count": result.fetched_count,
-                    "saved_count": result.saved_count
-                }
+    try:
+        # 認証処理
+        credentials = await authenticate_jquants(jquants_email, jquants_password)
+        click.echo("認証成功")
+
+        # データベースセッションとリポジトリの初期化
+        async for session in get_cli_session():
+            # クライアントとリポジトリの初期化
+            jquants_client = await get_cli_jquants_client(credentials)
+            repository = await get_cli_listed_info_repository(session)
+
+            # ユースケースの実行
+            use_case = FetchJQuantsListedInfoUseCase(
+                jquants_client=jquants_client,
+                listed_info_repository=repository,
+                logger=logger,
             )
 
-        # セッションのコミット
-        await session.commit()
+            click.echo(f"データ取得中... (code: {code or '全銘柄'}, date: {date or '最新'})")
+
+            # 実行
+            result = await use_case.execute(code=code, target_date=target_date)
+
+            # 結果の表示
+            if result.success:
+                click.echo(
+                    f"\n✅ 処理完了:\n"
+                    f"  - 取得件数: {result.fetched_count}件\n"
+                    f"  - 保存件数: {result.saved_count}件"
+                )
+            else:
+                from app.presentation.exceptions import PresentationError
+                raise PresentationError(
+                    f"処理失敗: {result.error_message}",
+                    error_code="FETCH_FAILED",
+                    details={
+                        "fetched_count": result.fetched_count,
+                        "saved_count": result.saved_count
+                    }
+                )
+
+            # セッションのコミット
+            await session.commit()
+            await use_case.publish_events(result)
+    finally:
+        # 共有 HTTP セッションはイベントループ終了前にクローズする
+        await close_cli_http_sessions()
 
 
 if __name__ == "__main__":
@@ -29,11 +29,11 @@ async def get_cli_listed_info_repository(
     session: AsyncSession,
 ) -> JQuantsListedInfoRepositoryInterface:
     """Get listed info repository for CLI commands."""
-    from app.infrastructure.repositories.database.jquants_listed_info_repository_impl import (
-        JQuantsListedInfoRepositoryImpl,
+    from app.infrastructure.repositories.database.listed_info_repository_factory import (
+        create_listed_info_repository,
     )
 
-    return JQuantsListedInfoRepositoryImpl(session)
+    return create_listed_info_repository(session)
 
 
 async def get_cli_jquants_client(credentials: JQuantsCredentials):
@@ -44,4 +44,13 @@ async def get_cli_jquants_client(credentials: JQuantsCredentials):
     )
 
     base_client = JQuantsBaseClient(credentials)
-    return JQuantsListedInfoClient(base_client)
\ No newline at end of file
+    return JQuantsListedInfoClient(base_client)
+
+
+async def close_cli_http_sessions() -> None:
+    """Close shared J-Quants HTTP sessions before the CLI event loop ends."""
+    from app.infrastructure.external_services.jquants.session_registry import (
+        close_jquants_sessions,
+    )
+
+    await close_jquants_sessions()
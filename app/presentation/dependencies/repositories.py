@@ -7,6 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.domain.repositories.schedule_repository_interface import ScheduleRepositoryInterface
 from app.domain.repositories.task_log_repository_interface import TaskLogRepositoryInterface
 from app.domain.repositories.auth_repository_interface import AuthRepositoryInterface
+from app.domain.repositories.jquants_listed_info_repository_interface import JQuantsListedInfoRepositoryInterface
 from app.infrastructure.database.connection import get_session
 from app.infrastructure.redis.redis_client import get_redis_client
 
@@ -29,6 +30,17 @@ def get_task_log_repository(
     return TaskLogRepository(session)
 
 
+def get_listed_info_repository(
+    session: AsyncSession = Depends(get_session)
+) -> JQuantsListedInfoRepositoryInterface:
+    """上場銘柄情報リポジトリの依存性注入（設定に応じてキャッシュ付き）"""
+    # 動的インポートで循環参照を回避
+    from app.infrastructure.repositories.database.listed_info_repository_factory import (
+        create_listed_info_repository,
+    )
+    return create_listed_info_repository(session)
+
+
 async def get_auth_repository() -> AuthRepositoryInterface:
     """認証リポジトリの依存性注入"""
     # 動的インポートで循環参照を回避
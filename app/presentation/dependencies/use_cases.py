@@ -6,11 +6,12 @@ from fastapi import Depends
 from app.application.use_cases.manage_schedule import ManageScheduleUseCase
 from app.application.use_cases.auth_use_case import AuthUseCase
 from app.application.use_cases.manage_listed_info_schedule import ManageListedInfoScheduleUseCase
+from app.application.use_cases.query_listed_info import QueryListedInfoUseCase
 from app.domain.repositories.schedule_repository_interface import ScheduleRepositoryInterface
 from app.domain.repositories.auth_repository_interface import AuthRepositoryInterface
 from app.domain.repositories.jquants_listed_info_repository_interface import JQuantsListedInfoRepositoryInterface
 from app.infrastructure.events.schedule_event_publisher import ScheduleEventPublisher
-from .repositories import get_schedule_repository, get_auth_repository
+from .repositories import get_schedule_repository, get_auth_repository, get_listed_info_repository
 from .services import get_schedule_event_publisher
 
 
@@ -38,4 +39,11 @@ def get_manage_listed_info_schedule_use_case(
     return ManageListedInfoScheduleUseCase(
         schedule_repository,
         event_publisher=event_publisher,
-    )
\ No newline at end of file
+    )
+
+
+def get_query_listed_info_use_case(
+    listed_info_repository: JQuantsListedInfoRepositoryInterface = Depends(get_listed_info_repository),
+) -> QueryListedInfoUseCase:
+    """上場銘柄情報参照ユースケースの依存性注入"""
+    return QueryListedInfoUseCase(listed_info_repository)
@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+"""Celery Beat の tick（実行時刻の判定とタスクの送信）を比較するベンチマーク
+
+DatabaseSchedulerAsyncPG に合成したスケジュールを読み込み、次の 2 つの方式で
+1 回の tick の所要時間と、実行時刻を迎えたタスクが送信されるまでの遅れ（ジッター）を計測する。
+
+- scan: 従来の方式（すべてのエントリで is_due を評価する）
+- heap: 次回実行時刻のヒープの先頭から、実行時刻を迎えたエントリだけを評価する
+
+データベース・ブローカーには接続しない（スケジュールの読み込みと送信はスタブに置き換える）。
+
+使用例:
+    python scripts/benchmarks/beat_tick_benchmark.py
+    python scripts/benchmarks/beat_tick_benchmark.py --schedules 1000,10000 --due 0,100 --repeat 5
+"""
+import argparse
+import logging
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, List, Tuple
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+# プロジェクトのルートディレクトリを Python パスに追加
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from celery.beat import Scheduler
+
+from app.infrastructure.celery.app import celery_app
+from app.infrastructure.celery.schedulers import database_scheduler_asyncpg as scheduler_module
+from app.infrastructure.celery.schedulers.database_scheduler_asyncpg import DatabaseSchedulerAsyncPG
+from app.infrastructure.database.models.schedule import CeleryBeatSchedule
+
+
+def build_models(schedules: int, due: int) -> List[CeleryBeatSchedule]:
+    """ベンチマーク用のスケジュールを生成（due 件は実行時刻を過ぎた状態にする）"""
+    now = datetime.now(timezone.utc)
+    step = schedules // due if due else 0
+    models = []
+    for i in range(schedules):
+        is_due = bool(step) and i % step == 0 and i // step < due
+        models.append(
+            CeleryBeatSchedule(
+                id=uuid4(),
+                name=f"benchmark-{i}",
+                task_name="fetch_listed_info_task",
+                # 実行時刻を迎えていないスケジュールは翌日以降の時刻にばらけさせる
+                cron_expression="* * * * *" if is_due else f"{i % 60} {i % 24} {1 + i % 28} * *",
+                enabled=True,
+                args=[],
+                kwargs={},
+                updated_at=now,
+                last_run_at=now - timedelta(days=1) if is_due else now,
+            )
+        )
+    return models
+
+
+def build_scheduler(models: List[CeleryBeatSchedule]) -> DatabaseSchedulerAsyncPG:
+    """スケジュールを読み込んだスケジューラーを作成"""
+    with patch.object(scheduler_module.settings, "celery_beat_redis_sync_enabled", False):
+        scheduler = DatabaseSchedulerAsyncPG(app=celery_app, lazy=True)
+    scheduler._load_schedules_from_db = AsyncMock(return_value=models)
+    scheduler._write_last_run_at_async = AsyncMock()
+    scheduler.sync_schedules()
+    return scheduler
+
+
+def scan_tick(scheduler: DatabaseSchedulerAsyncPG) -> None:
+    """従来の tick（すべてのエントリを評価する）"""
+    for entry in list(scheduler.schedule.values()):
+        is_due, _ = entry.is_due()
+        if is_due:
+            scheduler.apply_entry(entry)
+
+
+def heap_tick(scheduler: DatabaseSchedulerAsyncPG) -> None:
+    scheduler.tick()
+
+
+def measure(
+    tick: Callable[[DatabaseSchedulerAsyncPG], None], schedules: int, due: int, repeat: int
+) -> Tuple[float, float, float]:
+    """tick の所要時間と、送信までの遅れの中央値・最大値（いずれも秒の中央値）"""
+    ticks, p50s, maxes = [], [], []
+    for _ in range(repeat):
+        scheduler = build_scheduler(build_models(schedules, due))
+        dispatched: List[float] = []
+        with patch.object(
+            Scheduler, "apply_entry",
+            lambda self, entry, producer=None: dispatched.append(time.perf_counter()),
+        ):
+            started = time.perf_counter()
+            tick(scheduler)
+            ticks.append(time.perf_counter() - started)
+        scheduler.close()
+
+        assert len(dispatched) == due
+        delays = [at - started for at in dispatched] or [0.0]
+        p50s.append(statistics.median(delays))
+        maxes.append(max(delays))
+    return statistics.median(ticks), statistics.median(p50s), statistics.median(maxes)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--schedules", type=str, default="1000,10000", help="スケジュール数（カンマ区切り）")
+    parser.add_argument("--due", type=str, default="0,100", help="実行時刻を迎えたスケジュール数（カンマ区切り）")
+    parser.add_argument("--repeat", type=int, default=5, help="繰り返し回数（中央値を表示）")
+    args = parser.parse_args()
+
+    # 送信ごとのログ出力は計測から除く
+    logging.getLogger(scheduler_module.__name__).setLevel(logging.WARNING)
+    scheduler_module.logger.setLevel(logging.WARNING)
+
+    print(f"{'schedules':>10}{'due':>6}{'path':>6}{'tick[ms]':>10}{'jitter p50[ms]':>16}{'jitter max[ms]':>16}")
+    for schedules in (int(s) for s in args.schedules.split(",")):
+        for due in (int(d) for d in args.due.split(",")):
+            for name, tick in (("scan", scan_tick), ("heap", heap_tick)):
+                elapsed, p50, worst = measure(tick, schedules, due, args.repeat)
+                print(
+                    f"{schedules:>10}{due:>6}{name:>6}{elapsed * 1000:>10.2f}"
+                    f"{p50 * 1000:>16.2f}{worst * 1000:>16.2f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
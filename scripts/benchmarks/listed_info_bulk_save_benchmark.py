@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+"""上場銘柄情報の一括保存（複数行 INSERT と COPY）を比較するベンチマーク
+
+JQuantsListedInfoRepositoryImpl.save_all の 2 つの経路について、
+新規挿入（insert）と既存行の更新（upsert）の所要時間を計測する。
+行数は 1 日あたり約 4,000 銘柄として日付をまたいで生成する。
+
+計測はすべて 1 つのトランザクション内で行い、最後にロールバックするため
+データベースにデータは残らない（DATABASE_URL の接続先を使用する）。
+
+使用例:
+    python scripts/benchmarks/listed_info_bulk_save_benchmark.py
+    python scripts/benchmarks/listed_info_bulk_save_benchmark.py --rows 4000,400000 --repeat 3
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import List
+
+# プロジェクトのルートディレクトリを Python パスに追加
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from app.domain.entities.jquants_listed_info import JQuantsListedInfo
+from app.domain.value_objects.stock_code import StockCode
+from app.infrastructure.database.connection import close_database, get_sessionmaker
+from app.infrastructure.repositories.database.jquants_listed_info_repository_impl import (
+    JQuantsListedInfoRepositoryImpl,
+)
+
+CODES_PER_DAY = 4000
+
+
+def build_entities(rows: int, suffix: str = "") -> List[JQuantsListedInfo]:
+    """ベンチマーク用のエンティティを生成"""
+    start = date(1990, 1, 1)
+    return [
+        JQuantsListedInfo(
+            date=start + timedelta(days=i // CODES_PER_DAY),
+            code=StockCode(f"{1000 + i % CODES_PER_DAY}"),
+            company_name=f"Benchmark Company {i % CODES_PER_DAY}{suffix}",
+            company_name_english=f"BENCHMARK COMPANY {i % CODES_PER_DAY}{suffix}",
+            sector_17_code="6",
+            sector_17_code_name="自動車・輸送機",
+            sector_33_code="3700",
+            sector_33_code_name="輸送用機器",
+            scale_category="TOPIX Small 1",
+            market_code="0111",
+            market_code_name="プライム",
+            margin_code="1",
+            margin_code_name="信用",
+        )
+        for i in range(rows)
+    ]
+
+
+async def measure(entities: List[JQuantsListedInfo], updates: List[JQuantsListedInfo], use_copy: bool) -> dict:
+    """1 トランザクション内で insert と upsert の時間を計測（ロールバックする）"""
+    async with get_sessionmaker()() as session:
+        repository = JQuantsListedInfoRepositoryImpl(session)
+        try:
+            started = time.perf_counter()
+            await repository.save_all(entities, use_copy=use_copy)
+            inserted = time.perf_counter() - started
+
+            started = time.perf_counter()
+            await repository.save_all(updates, use_copy=use_copy)
+            upserted = time.perf_counter() - started
+        finally:
+            await session.rollback()
+
+    return {"insert": inserted, "upsert": upserted}
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=str, default="4000,400000", help="行数（カンマ区切り）")
+    parser.add_argument("--repeat", type=int, default=3, help="繰り返し回数（中央値を表示）")
+    args = parser.parse_args()
+
+    print(
+        f"{'rows':>10}{'method':>10}{'insert[s]':>12}{'upsert[s]':>12}"
+        f"{'insert rows/s':>16}{'upsert rows/s':>16}"
+    )
+    try:
+        for rows in (int(r) for r in args.rows.split(",")):
+            entities = build_entities(rows)
+            updates = build_entities(rows, suffix=" (updated)")
+            for method, use_copy in (("insert", False), ("copy", True)):
+                results = [await measure(entities, updates, use_copy) for _ in range(args.repeat)]
+                insert = statistics.median(r["insert"] for r in results)
+                upsert = statistics.median(r["upsert"] for r in results)
+                print(
+                    f"{rows:>10}{method:>10}{insert:>12.3f}{upsert:>12.3f}"
+                    f"{rows / insert:>16.0f}{rows / upsert:>16.0f}"
+                )
+    finally:
+        await close_database()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
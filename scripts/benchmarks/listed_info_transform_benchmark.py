@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+"""上場銘柄情報の API レスポンスから保存用の値への変換を比較するベンチマーク
+
+FetchJQuantsListedInfoUseCase と JQuantsListedInfoRepositoryImpl.save_all が
+1 レコードごとに行う変換について、次の 2 つの経路の所要時間を計測する。
+
+- entity: DTO → ListedInfoFactory → エンティティ → ORM モデル → 保存用のタプル
+- row: ListedInfoFactory.row_from_jquants_response で保存用のタプルに直接変換
+
+データベースには接続しない（INSERT・COPY 自体の比較は
+listed_info_bulk_save_benchmark.py を使用する）。
+
+使用例:
+    python scripts/benchmarks/listed_info_transform_benchmark.py
+    python scripts/benchmarks/listed_info_transform_benchmark.py --rows 4000,40000 --repeat 5
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+# プロジェクトのルートディレクトリを Python パスに追加
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from app.application.dtos.jquants_listed_info_dto import JQuantsListedInfoDTO
+from app.domain.factories.jquants_listed_info_factory import ListedInfoFactory
+from app.infrastructure.database.mappers.jquants_listed_info_mapper import JQuantsListedInfoMapper
+from app.infrastructure.repositories.database.jquants_listed_info_repository_impl import (
+    _DATA_COLUMNS,
+)
+
+CODES_PER_DAY = 4000
+
+
+def build_records(rows: int) -> List[Dict[str, Any]]:
+    """ベンチマーク用の API レスポンスのレコードを生成"""
+    return [
+        {
+            "Date": "20240104",
+            "Code": f"{10000 + i % CODES_PER_DAY}",
+            "CompanyName": f"ベンチマーク株式会社 {i % CODES_PER_DAY}",
+            "CompanyNameEnglish": f"BENCHMARK COMPANY {i % CODES_PER_DAY}",
+            "Sector17Code": "6",
+            "Sector17CodeName": "自動車・輸送機",
+            "Sector33Code": "3700",
+            "Sector33CodeName": "輸送用機器",
+            "ScaleCategory": "TOPIX Small 1",
+            "MarketCode": "0111",
+            "MarketCodeName": "プライム",
+            "MarginCode": "1",
+            "MarginCodeName": "信用",
+        }
+        for i in range(rows)
+    ]
+
+
+def entity_path(records: List[Dict[str, Any]]) -> List[tuple]:
+    """従来の経路（ユースケースでエンティティ化し、リポジトリでモデル経由のタプルにする）"""
+    entities = [JQuantsListedInfoDTO.from_api_response(data).to_entity() for data in records]
+    models = JQuantsListedInfoMapper().to_models(entities)
+    return [tuple(getattr(model, column) for column in _DATA_COLUMNS) for model in models]
+
+
+def row_path(records: List[Dict[str, Any]]) -> List[tuple]:
+    """行への直接変換の経路"""
+    return ListedInfoFactory.rows_from_jquants_response(records)
+
+
+def measure(path: Callable[[List[Dict[str, Any]]], List[tuple]], records: List[Dict[str, Any]], repeat: int) -> float:
+    """変換の所要時間の中央値（秒）"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        path(records)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=str, default="4000,40000", help="行数（カンマ区切り）")
+    parser.add_argument("--repeat", type=int, default=5, help="繰り返し回数（中央値を表示）")
+    args = parser.parse_args()
+
+    print(f"{'rows':>10}{'path':>10}{'total[ms]':>12}{'per row[us]':>14}{'speedup':>10}")
+    for rows in (int(r) for r in args.rows.split(",")):
+        records = build_records(rows)
+        # 2 つの経路が同じ値を生成することを確認してから計測する
+        assert entity_path(records[:100]) == row_path(records[:100])
+
+        baseline = measure(entity_path, records, args.repeat)
+        for name, path in (("entity", entity_path), ("row", row_path)):
+            elapsed = baseline if path is entity_path else measure(path, records, args.repeat)
+            print(
+                f"{rows:>10}{name:>10}{elapsed * 1000:>12.1f}"
+                f"{elapsed / rows * 1_000_000:>14.2f}{baseline / elapsed:>9.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+"""TokenBucket のスループットと公平性を計測するマイクロベンチマーク
+
+多数のタスクが同時に acquire した場合について、
+従来のロック保持型実装（ロックを保持したまま sleep）と
+FIFO 待ち行列型の現行実装を比較する。
+
+tokens/s は acquire した側のスループット（try_acquire で奪われた分は含まない）、
+inversions は到着順と取得順が入れ替わった組の数。
+
+使用例:
+    python scripts/benchmarks/token_bucket_benchmark.py --acquirers 1000
+    python scripts/benchmarks/token_bucket_benchmark.py --weights 1,3,1,5 --stealer
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+# プロジェクトのルートディレクトリを Python パスに追加
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from app.infrastructure.rate_limiter.token_bucket import TokenBucket
+
+
+class LockHoldingTokenBucket:
+    """比較用: ロックを保持したまま待機する従来の実装"""
+
+    def __init__(self, capacity: int, refill_period: float):
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.refill_rate = capacity / refill_period
+        self.last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+        self.last_refill = now
+
+    async def acquire(self, tokens: int = 1) -> None:
+        async with self._lock:
+            while True:
+                self._refill()
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self.tokens) / self.refill_rate)
+
+    def try_acquire(self, tokens: int = 1) -> bool:
+        self._refill()
+        if self.tokens >= tokens:
+            self.tokens -= tokens
+            return True
+        return False
+
+
+def count_inversions(order: List[int]) -> int:
+    """到着順に対して完了順が入れ替わった組の数を数える（マージソート）"""
+
+    def sort(items: List[int]) -> Tuple[List[int], int]:
+        if len(items) <= 1:
+            return items, 0
+        mid = len(items) // 2
+        left, left_count = sort(items[:mid])
+        right, right_count = sort(items[mid:])
+        merged: List[int] = []
+        count = left_count + right_count
+        i = j = 0
+        while i < len(left) and j < len(right):
+            if left[i] <= right[j]:
+                merged.append(left[i])
+                i += 1
+            else:
+                merged.append(right[j])
+                count += len(left) - i
+                j += 1
+        merged.extend(left[i:])
+        merged.extend(right[j:])
+        return merged, count
+
+    return sort(order)[1]
+
+
+async def run(bucket, acquirers: int, weights: List[int], with_stealer: bool) -> dict:
+    """acquirers 個のタスクを同時に起動して計測する
+
+    with_stealer が True の場合、同期メソッド用の try_acquire を 1ms ごとに呼ぶ
+    タスクを並行させ、待機中の要求が追い越される量を計測する。
+    """
+    completion_order: List[int] = []
+    waits: List[float] = []
+    stolen = 0
+    done = False
+
+    async def steal() -> None:
+        nonlocal stolen
+        while not done:
+            if bucket.try_acquire(1):
+                stolen += 1
+            await asyncio.sleep(0.001)
+
+    async def acquire(index: int) -> None:
+        started = time.perf_counter()
+        await bucket.acquire(weights[index % len(weights)])
+        waits.append(time.perf_counter() - started)
+        completion_order.append(index)
+
+    started = time.perf_counter()
+    stealer = asyncio.create_task(steal()) if with_stealer else None
+    tasks = []
+    for i in range(acquirers):
+        tasks.append(asyncio.create_task(acquire(i)))
+        # 到着順を確定させる
+        await asyncio.sleep(0)
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - started
+    done = True
+    if stealer is not None:
+        await stealer
+
+    total_tokens = sum(weights[i % len(weights)] for i in range(acquirers))
+    waits.sort()
+    return {
+        "elapsed": elapsed,
+        "tokens_per_second": total_tokens / elapsed,
+        "inversions": count_inversions(completion_order),
+        "p50_wait": statistics.median(waits),
+        "p99_wait": waits[int(len(waits) * 0.99) - 1],
+        "max_wait": waits[-1],
+        "stolen": stolen,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--acquirers", type=int, default=1000, help="同時に acquire するタスク数")
+    parser.add_argument("--capacity", type=int, default=50, help="バケット容量")
+    parser.add_argument("--refill-period", type=float, default=0.05, help="補充期間（秒）")
+    parser.add_argument(
+        "--weights", type=str, default="1", help="要求トークン数（カンマ区切りで循環使用、例: 1,3,1,5）"
+    )
+    parser.add_argument(
+        "--stealer", action="store_true", help="try_acquire で割り込むタスクを並行させる"
+    )
+    args = parser.parse_args()
+    weights = [int(w) for w in args.weights.split(",")]
+    rate = args.capacity / args.refill_period
+
+    print(
+        f"acquirers={args.acquirers} capacity={args.capacity} "
+        f"refill_period={args.refill_period}s rate={rate:.0f} tokens/s weights={weights} "
+        f"stealer={args.stealer}"
+    )
+    print(
+        f"{'implementation':<16}{'elapsed[s]':>12}{'tokens/s':>12}{'inversions':>12}"
+        f"{'p50 wait':>12}{'p99 wait':>12}{'max wait':>12}{'stolen':>10}"
+    )
+
+    for name, factory in (
+        ("lock-holding", LockHoldingTokenBucket),
+        ("fifo-queue", TokenBucket),
+    ):
+        # 初期バースト分を消費してから計測する
+        bucket = factory(args.capacity, args.refill_period)
+        await bucket.acquire(args.capacity)
+        result = await run(bucket, args.acquirers, weights, args.stealer)
+        print(
+            f"{name:<16}{result['elapsed']:>12.3f}{result['tokens_per_second']:>12.1f}"
+            f"{result['inversions']:>12}{result['p50_wait']:>12.3f}"
+            f"{result['p99_wait']:>12.3f}{result['max_wait']:>12.3f}{result['stolen']:>10}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+"""日次スナップショット（jquants_listed_info）を履歴テーブルへ移行するスクリプト
+
+jquants_listed_info に保存済みの日付を昇順に読み出し、
+JQuantsListedInfoHistoryRepository で jquants_listed_info_history に反映する。
+日付ごとにコミットするため、途中で中断しても --from-date を指定して再開できる。
+
+移行後に DATABASE__LISTED_INFO_STORAGE=history を設定すると、
+以降の取得結果は履歴テーブルに保存される。
+
+使用例:
+    python scripts/migrate_listed_info_history.py
+    python scripts/migrate_listed_info_history.py --from-date 2024-01-01 --to-date 2024-12-31
+"""
+import argparse
+import asyncio
+import sys
+from datetime import date
+from pathlib import Path
+from typing import List, Optional
+
+# プロジェクトのルートディレクトリを Python パスに追加
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import func, select
+
+from app.infrastructure.database.connection import close_database, get_sessionmaker
+from app.infrastructure.database.models.jquants_listed_info import JQuantsListedInfoModel
+from app.infrastructure.database.models.jquants_listed_info_history import (
+    JQuantsListedInfoHistoryModel,
+)
+from app.infrastructure.repositories.database.jquants_listed_info_history_repository import (
+    JQuantsListedInfoHistoryRepository,
+)
+from app.infrastructure.repositories.database.jquants_listed_info_repository_impl import (
+    JQuantsListedInfoRepositoryImpl,
+)
+
+
+async def count_rows(model) -> int:
+    """テーブルの行数を取得"""
+    async with get_sessionmaker()() as session:
+        return (await session.execute(select(func.count()).select_from(model))).scalar_one()
+
+
+async def load_dates(from_date: Optional[date], to_date: Optional[date]) -> List[date]:
+    """移行対象の日付を昇順に取得"""
+    query = select(JQuantsListedInfoModel.date).distinct().order_by(JQuantsListedInfoModel.date)
+    if from_date is not None:
+        query = query.where(JQuantsListedInfoModel.date >= from_date)
+    if to_date is not None:
+        query = query.where(JQuantsListedInfoModel.date <= to_date)
+
+    async with get_sessionmaker()() as session:
+        return list((await session.execute(query)).scalars().all())
+
+
+async def migrate(from_date: Optional[date], to_date: Optional[date]) -> None:
+    """日付ごとにスナップショットを履歴へ反映"""
+    snapshot_rows = await count_rows(JQuantsListedInfoModel)
+    history_rows = await count_rows(JQuantsListedInfoHistoryModel)
+    print(f"jquants_listed_info: {snapshot_rows:,} rows")
+    print(f"jquants_listed_info_history (before): {history_rows:,} rows")
+
+    target_dates = await load_dates(from_date, to_date)
+    print(f"Migrating {len(target_dates)} dates")
+
+    for i, target_date in enumerate(target_dates, start=1):
+        async with get_sessionmaker()() as session:
+            listed_infos = await JQuantsListedInfoRepositoryImpl(session).find_all_by_date(target_date)
+            history_repository = JQuantsListedInfoHistoryRepository(session)
+            result = await history_repository.save_all(listed_infos)
+            closed = await history_repository.finalize_snapshot(
+                target_date, {listed_info.code.value for listed_info in listed_infos}
+            )
+            await session.commit()
+
+        print(
+            f"[{i}/{len(target_dates)}] {target_date}: {len(listed_infos)} records - "
+            f"new: {result.inserted_count}, changed: {result.updated_count}, "
+            f"unchanged: {result.unchanged_count}, closed: {closed}"
+        )
+
+    history_rows = await count_rows(JQuantsListedInfoHistoryModel)
+    print(f"jquants_listed_info_history (after): {history_rows:,} rows")
+    if snapshot_rows:
+        print(f"Compression ratio: {history_rows / snapshot_rows:.2%}")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Migrate listed info snapshots to history table")
+    parser.add_argument("--from-date", type=date.fromisoformat, default=None, help="YYYY-MM-DD")
+    parser.add_argument("--to-date", type=date.fromisoformat, default=None, help="YYYY-MM-DD")
+    args = parser.parse_args()
+
+    try:
+        await migrate(args.from_date, args.to_date)
+    finally:
+        await close_database()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
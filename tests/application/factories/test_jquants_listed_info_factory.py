@@ -130,4 +130,72 @@ class TestListedInfoFactory:
 
         # 属性の変更を試みる
         with pytest.raises(AttributeError):
-            listed_info.company_name = "新しい会社名"  # type: ignore
\ No newline at end of file
+            listed_info.company_name = "新しい会社名"  # type: ignore
+
+
+class TestRowFromJQuantsResponse:
+    """row_from_jquants_response（保存用の行への直接変換）のテスト"""
+
+    FULL_DATA = {
+        "Date": "20240104",
+        "Code": "7203",
+        "CompanyName": "トヨタ自動車",
+        "CompanyNameEnglish": "TOYOTA MOTOR CORPORATION",
+        "Sector17Code": "6",
+        "Sector17CodeName": "自動車・輸送機",
+        "Sector33Code": "3700",
+        "Sector33CodeName": "輸送用機器",
+        "ScaleCategory": "TOPIX Large70",
+        "MarketCode": "0111",
+        "MarketCodeName": "プライム",
+        "MarginCode": "1",
+        "MarginCodeName": "信用",
+    }
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            FULL_DATA,
+            {"Date": "2024-01-04", "Code": "7203", "CompanyName": "トヨタ自動車"},
+            {"Date": "20240229", "Code": "130A0", "CompanyName": "Company", "MarketCode": "0113"},
+        ],
+    )
+    def test_matches_entity_path(self, data):
+        """エンティティを経由した場合と同じ値の行を返す"""
+        from app.domain.services.listed_info_frame import ATTRIBUTE_COLUMNS
+
+        entity = ListedInfoFactory.from_jquants_response(data)
+
+        row = ListedInfoFactory.row_from_jquants_response(data)
+
+        assert row == (entity.date, entity.code.value) + tuple(
+            getattr(entity, column) for column in ATTRIBUTE_COLUMNS
+        )
+
+    @pytest.mark.parametrize(
+        "data, error",
+        [
+            ({"Code": "7203", "CompanyName": "A"}, KeyError),
+            ({"Date": "20240104", "CompanyName": "A"}, KeyError),
+            ({"Date": "20240104", "Code": "7203"}, KeyError),
+            ({"Date": "20240230", "Code": "7203", "CompanyName": "A"}, ValueError),
+            ({"Date": "2024/01/04", "Code": "7203", "CompanyName": "A"}, ValueError),
+            ({"Date": "2024W011", "Code": "7203", "CompanyName": "A"}, ValueError),
+            ({"Date": "20240104", "Code": "", "CompanyName": "A"}, ValueError),
+            ({"Date": "20240104", "Code": "72 03", "CompanyName": "A"}, ValueError),
+            ({"Date": "20240104", "Code": "12345678901", "CompanyName": "A"}, ValueError),
+            ({"Date": "20240104", "Code": "7203", "CompanyName": ""}, ValueError),
+        ],
+    )
+    def test_same_validation_as_entity_path(self, data, error):
+        """不正なデータはエンティティを経由した場合と同じ例外になる"""
+        with pytest.raises(error):
+            ListedInfoFactory.from_jquants_response(data)
+        with pytest.raises(error):
+            ListedInfoFactory.row_from_jquants_response(data)
+
+    def test_rows_from_jquants_response(self):
+        rows = ListedInfoFactory.rows_from_jquants_response([self.FULL_DATA, self.FULL_DATA])
+
+        assert len(rows) == 2
+        assert rows[0][:3] == (date(2024, 1, 4), "7203", "トヨタ自動車")
@@ -1,11 +1,20 @@
 """Tests for FetchJQuantsListedInfoUseCase."""
+import asyncio
+from collections import deque
+
 import pytest
 from datetime import date
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import DEFAULT, AsyncMock, Mock
 from typing import List
 
+from celery.exceptions import SoftTimeLimitExceeded
+
 from app.application.dtos.jquants_listed_info_dto import FetchJQuantsListedInfoResult
-from app.application.use_cases.fetch_jquants_listed_info import FetchJQuantsListedInfoUseCase
+from app.application.interfaces.external.listed_info_client import ListedInfoPage
+from app.application.use_cases.fetch_jquants_listed_info import (
+    FetchJQuantsListedInfoUseCase,
+    SnapshotProgress,
+)
 from app.domain.entities.jquants_listed_info import JQuantsListedInfo
 from app.domain.value_objects.stock_code import StockCode
 from app.domain.exceptions.jquants_listed_info_exceptions import (
@@ -15,6 +24,18 @@ from app.domain.exceptions.jquants_listed_info_exceptions import (
 )
 
 
+def _paged_response(*pages, error=None):
+    """iter_listed_info_pages のモックを作成"""
+
+    async def _iter_pages(date=None):
+        for page in pages:
+            yield page if isinstance(page, ListedInfoPage) else ListedInfoPage(page)
+        if error is not None:
+            raise error
+
+    return Mock(side_effect=_iter_pages)
+
+
 class TestFetchJQuantsListedInfoUseCase:
     """FetchJQuantsListedInfoUseCase tests."""
 
@@ -61,7 +82,7 @@ class TestFetchJQuantsListedInfoUseCase:
                 "MarketCodeName": "プライム",
             },
         ]
-        self.jquants_client.get_all_listed_info.return_value = api_data
+        self.jquants_client.iter_listed_info_pages = _paged_response(api_data)
 
         # 実行
         result = await self.use_case.execute()
@@ -75,7 +96,7 @@ class TestFetchJQuantsListedInfoUseCase:
         assert result.code is None
 
         # メソッド呼び出しの検証
-        self.jquants_client.get_all_listed_info.assert_called_once_with(date=None)
+        self.jquants_client.iter_listed_info_pages.assert_called_once_with(date=None)
         self.repository.save_all.assert_called_once()
 
     @pytest.mark.asyncio
@@ -120,7 +141,7 @@ class TestFetchJQuantsListedInfoUseCase:
     async def test_execute_empty_response(self):
         """空のレスポンスの場合の処理を確認"""
         # API レスポンスのモック
-        self.jquants_client.get_all_listed_info.return_value = []
+        self.jquants_client.iter_listed_info_pages = _paged_response([])
 
         # 実行
         result = await self.use_case.execute()
@@ -146,7 +167,7 @@ class TestFetchJQuantsListedInfoUseCase:
             }
             for i in range(1, 2001)
         ]
-        self.jquants_client.get_all_listed_info.return_value = api_data
+        self.jquants_client.iter_listed_info_pages = _paged_response(api_data)
 
         # 実行
         result = await self.use_case.execute()
@@ -159,12 +180,177 @@ class TestFetchJQuantsListedInfoUseCase:
         # save_all が 2 回呼ばれることを確認（1000 件ずつ）
         assert self.repository.save_all.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_execute_streams_pages(self):
+        """ページを受信するごとにバッチ単位で保存されることを確認"""
+        pages = [
+            [
+                {
+                    "Date": "20240104",
+                    "Code": f"{page_no}{i:03d}",
+                    "CompanyName": f"会社{page_no}-{i}",
+                }
+                for i in range(600)
+            ]
+            for page_no in range(1, 4)
+        ]
+        self.jquants_client.iter_listed_info_pages = _paged_response(*pages)
+
+        # 実行
+        result = await self.use_case.execute(target_date=date(2024, 1, 4))
+
+        # 検証
+        assert result.success is True
+        assert result.fetched_count == 1800
+        assert result.saved_count == 1800
+        self.jquants_client.iter_listed_info_pages.assert_called_once_with(
+            date="20240104"
+        )
+        # 1000 件貯まった時点で保存され、残りは最後にまとめて保存される
+        batch_sizes = [len(c.args[0]) for c in self.repository.save_all.call_args_list]
+        assert batch_sizes == [1000, 800]
+
+    @pytest.mark.asyncio
+    async def test_execute_fetches_next_page_while_saving(self):
+        """保存中に次ページの取得が並行して進むことを確認"""
+        self.use_case.BATCH_SIZE = 1
+        second_page_requested = asyncio.Event()
+
+        async def _iter_pages(date=None):
+            yield [{"Date": "20240104", "Code": "7203", "CompanyName": "トヨタ自動車"}]
+            second_page_requested.set()
+            yield [{"Date": "20240104", "Code": "9984", "CompanyName": "ソフトバンクグループ"}]
+
+        async def _save_all(batch):
+            if batch[0].code.value == "7203":
+                # 逐次実行なら次ページは要求されずタイムアウトする
+                await asyncio.wait_for(second_page_requested.wait(), timeout=1)
+
+        self.jquants_client.iter_listed_info_pages = Mock(side_effect=_iter_pages)
+        self.repository.save_all.side_effect = _save_all
+
+        # 実行
+        result = await self.use_case.execute()
+
+        # 検証
+        assert result.success is True
+        assert result.saved_count == 2
+
+    @pytest.mark.asyncio
+    async def test_execute_backpressure_limits_prefetch(self):
+        """保存が遅い場合に先読みページ数が pipeline_depth で制限されることを確認"""
+        use_case = FetchJQuantsListedInfoUseCase(
+            jquants_client=self.jquants_client,
+            listed_info_repository=self.repository,
+            logger=self.logger,
+            pipeline_depth=1,
+        )
+        use_case.BATCH_SIZE = 1
+        fetched_pages = []
+        prefetched_at_first_save = []
+
+        async def _iter_pages(date=None):
+            for i in range(5):
+                fetched_pages.append(i)
+                yield [{"Date": "20240104", "Code": f"{1000 + i}", "CompanyName": f"会社{i}"}]
+
+        async def _save_all(batch):
+            if not prefetched_at_first_save:
+                # 保存側を遅らせて取得側を先行させる
+                for _ in range(10):
+                    await asyncio.sleep(0)
+                prefetched_at_first_save.append(len(fetched_pages))
+
+        self.jquants_client.iter_listed_info_pages = Mock(side_effect=_iter_pages)
+        self.repository.save_all.side_effect = _save_all
+
+        # 実行
+        result = await use_case.execute()
+
+        # 検証: 処理中 1 ページ + キュー 1 ページ + キュー投入待ち 1 ページ
+        assert result.saved_count == 5
+        assert prefetched_at_first_save == [3]
+
+    @pytest.mark.asyncio
+    async def test_execute_reports_stage_timings(self):
+        """ステージごとの所要時間が結果に含まれることを確認"""
+        api_data = [{"Date": "20240104", "Code": "7203", "CompanyName": "トヨタ自動車"}]
+        self.jquants_client.iter_listed_info_pages = _paged_response(api_data)
+
+        # 実行
+        result = await self.use_case.execute()
+
+        # 検証
+        assert result.fetch_seconds >= 0
+        assert result.transform_seconds > 0
+        assert result.save_seconds >= 0
+        assert result.elapsed_seconds >= result.transform_seconds
+
+    @pytest.mark.asyncio
+    async def test_execute_storage_error_stops_fetching(self):
+        """保存ステージでエラーが発生した場合に取得ステージが停止することを確認"""
+        self.use_case.BATCH_SIZE = 1
+        fetched_pages = []
+
+        async def _iter_pages(date=None):
+            for i in range(100):
+                fetched_pages.append(i)
+                yield [{"Date": "20240104", "Code": f"{1000 + i}", "CompanyName": f"会社{i}"}]
+
+        self.jquants_client.iter_listed_info_pages = Mock(side_effect=_iter_pages)
+        self.repository.save_all.side_effect = JQuantsListedInfoStorageError(
+            "Database connection failed"
+        )
+
+        # 実行
+        result = await self.use_case.execute()
+
+        # 検証
+        assert result.success is False
+        assert result.error_message == "Storage error: Database connection failed"
+        assert len(fetched_pages) < 100
+
+    @pytest.mark.asyncio
+    async def test_execute_api_error_after_partial_save(self):
+        """途中のページで API エラーが発生した場合に保存済み件数が返ることを確認"""
+        first_page = [
+            {
+                "Date": "20240104",
+                "Code": f"{i:04d}",
+                "CompanyName": f"会社{i}",
+            }
+            for i in range(1, 1001)
+        ]
+        self.jquants_client.iter_listed_info_pages = _paged_response(
+            first_page, error=JQuantsListedInfoAPIError("API connection failed")
+        )
+
+        # 実行
+        result = await self.use_case.execute()
+
+        # 検証
+        assert result.success is False
+        assert result.fetched_count == 1000
+        assert result.saved_count == 1000
+        assert result.error_message == "API error: API connection failed"
+
+    @pytest.mark.asyncio
+    async def test_execute_soft_time_limit_propagates(self):
+        """取得中に時間制限を超えた場合はエラー結果にせず呼び出し元へ送出する"""
+        self.jquants_client.iter_listed_info_pages = _paged_response(
+            [{"Date": "20240104", "Code": "1000", "CompanyName": "会社"}],
+            error=SoftTimeLimitExceeded(),
+        )
+
+        with pytest.raises(SoftTimeLimitExceeded):
+            await self.use_case.execute(target_date=date(2024, 1, 4))
+
     @pytest.mark.asyncio
     async def test_execute_api_error(self):
         """API エラーが発生した場合の処理を確認"""
         # API エラーを設定
-        self.jquants_client.get_all_listed_info.side_effect = JQuantsListedInfoAPIError(
-            "API connection failed"
+        self.jquants_client.iter_listed_info_pages = _paged_response(
+            error=JQuantsListedInfoAPIError("API connection failed")
         )
 
         # 実行
@@ -181,7 +367,7 @@ class TestFetchJQuantsListedInfoUseCase:
         """データエラーが発生した場合の処理を確認"""
         # 不正な API レスポンス
         api_data = [{"InvalidKey": "InvalidValue"}]
-        self.jquants_client.get_all_listed_info.return_value = api_data
+        self.jquants_client.iter_listed_info_pages = _paged_response(api_data)
 
         # 実行（KeyError が発生して JQuantsListedInfoDataError として処理されることを想定）
         result = await self.use_case.execute()
@@ -203,7 +389,7 @@ class TestFetchJQuantsListedInfoUseCase:
                 "CompanyName": "トヨタ自動車",
             }
         ]
-        self.jquants_client.get_all_listed_info.return_value = api_data
+        self.jquants_client.iter_listed_info_pages = _paged_response(api_data)
 
         # リポジトリエラーを設定
         self.repository.save_all.side_effect = JQuantsListedInfoStorageError(
@@ -230,7 +416,7 @@ class TestFetchJQuantsListedInfoUseCase:
                 "CompanyName": "トヨタ自動車",
             }
         ]
-        self.jquants_client.get_all_listed_info.return_value = api_data
+        self.jquants_client.iter_listed_info_pages = _paged_response(api_data)
 
         # 実行
         result = await self.use_case.fetch_and_update_all(target_date=date(2024, 1, 4))
@@ -242,6 +428,52 @@ class TestFetchJQuantsListedInfoUseCase:
         assert result.target_date == date(2024, 1, 4)
         assert result.code is None
 
+    @pytest.mark.asyncio
+    async def test_checkpoint_after_pages_are_saved(self):
+        """ページの全レコードが保存された時点で次ページのキーが通知されることを確認"""
+        pages = [
+            ListedInfoPage(
+                [
+                    {"Date": "20240104", "Code": f"{page_no}{i:03d}", "CompanyName": "会社"}
+                    for i in range(600)
+                ],
+                next_pagination_key=key,
+            )
+            for page_no, key in ((1, "key-2"), (2, "key-3"), (3, None))
+        ]
+        self.jquants_client.iter_listed_info_pages = _paged_response(*pages)
+        checkpoints = []
+
+        async def on_checkpoint(next_key, count, progress):
+            checkpoints.append((next_key, count, self.repository.save_all.call_count))
+
+        result = await self.use_case.fetch_and_update_all(
+            target_date=date(2024, 1, 4), on_checkpoint=on_checkpoint
+        )
+
+        assert result.success is True
+        # 1 バッチ目（1000 件）で 1 ページ目（600 件）が保存済みになり、
+        # 2 ページ目の残りは最後のバッチで保存される。最終ページはキーなし。
+        assert checkpoints == [("key-2", 600, 1), ("key-3", 1200, 2)]
+
+    @pytest.mark.asyncio
+    async def test_resume_from_pagination_key(self):
+        """再開キーを指定した場合はそのページから取得することを確認"""
+        calls = []
+
+        async def _iter_pages(date=None, pagination_key=None):
+            calls.append((date, pagination_key))
+            yield [{"Date": "20240104", "Code": "7203", "CompanyName": "トヨタ自動車"}]
+
+        self.jquants_client.iter_listed_info_pages = Mock(side_effect=_iter_pages)
+
+        result = await self.use_case.fetch_and_update_all(
+            target_date=date(2024, 1, 4), resume_pagination_key="key-2"
+        )
+
+        assert result.success is True
+        assert calls == [("20240104", "key-2")]
+
     @pytest.mark.asyncio
     async def test_fetch_by_code(self):
         """fetch_by_code メソッドが正しく動作することを確認"""
@@ -265,6 +497,41 @@ class TestFetchJQuantsListedInfoUseCase:
         assert result.target_date == date(2024, 1, 4)
         assert result.code == "7203"
 
+    @pytest.mark.asyncio
+    async def test_save_counts_and_stored_event(self):
+        """保存件数の内訳を集計し、ListedInfoStored イベントに設定する"""
+        from app.domain.repositories.jquants_listed_info_repository_interface import (
+            ListedInfoSaveResult,
+        )
+
+        api_data = [
+            {"Date": "20240104", "Code": f"{1000 + i}", "CompanyName": f"Company {i}"}
+            for i in range(3)
+        ]
+        self.jquants_client.iter_listed_info_pages = _paged_response(api_data[:2], api_data[2:])
+        self.repository.save_all.return_value = ListedInfoSaveResult(
+            inserted_count=1, updated_count=0, unchanged_count=2
+        )
+        publisher = AsyncMock()
+        self.use_case = FetchJQuantsListedInfoUseCase(
+            jquants_client=self.jquants_client,
+            listed_info_repository=self.repository,
+            logger=self.logger,
+            event_publisher=publisher,
+        )
+        self.use_case.BATCH_SIZE = 2
+
+        result = await self.use_case.execute(target_date=date(2024, 1, 4))
+
+        assert (result.inserted_count, result.updated_count, result.unchanged_count) == (2, 0, 4)
+        # イベントはコミット後の publish_events で発行する
+        publisher.publish_batch.assert_not_awaited()
+        await self.use_case.publish_events(result)
+        (event,) = publisher.publish_batch.await_args.args[0]
+        assert event.event_type == "listed_info.stored"
+        assert event.store_date == date(2024, 1, 4)
+        assert (event.count, event.new_count, event.updated_count) == (3, 2, 0)
+
     @pytest.mark.asyncio
     async def test_logging(self):
         """ログ出力が正しく行われることを確認"""
@@ -276,7 +543,7 @@ class TestFetchJQuantsListedInfoUseCase:
                 "CompanyName": "トヨタ自動車",
             }
         ]
-        self.jquants_client.get_all_listed_info.return_value = api_data
+        self.jquants_client.iter_listed_info_pages = _paged_response(api_data)
 
         # 実行
         await self.use_case.execute()
@@ -285,4 +552,435 @@ class TestFetchJQuantsListedInfoUseCase:
         self.logger.info.assert_any_call("Fetching listed info - code: None, date: None")
         self.logger.info.assert_any_call("Fetched 1 records from API")
         self.logger.info.assert_any_call("Saved batch 1 - 1 records")
-        self.logger.info.assert_any_call("Successfully saved 1 listed info records")
\ No newline at end of file
+        self.logger.info.assert_any_call("Successfully saved 1 listed info records")
+
+
+class TestSnapshotDigest:
+    """スナップショットのダイジェストによる書き込み省略のテスト"""
+
+    API_DATA = [
+        {"Date": "20240104", "Code": f"{1000 + i}", "CompanyName": f"Company {i}"}
+        for i in range(3)
+    ]
+
+    def setup_method(self):
+        """テストのセットアップ"""
+        self.jquants_client = AsyncMock()
+        self.repository = AsyncMock()
+        self.snapshots = AsyncMock()
+        self.snapshots.get.return_value = None
+        self.use_case = FetchJQuantsListedInfoUseCase(
+            jquants_client=self.jquants_client,
+            listed_info_repository=self.repository,
+            logger=Mock(),
+            snapshot_repository=self.snapshots,
+        )
+
+    async def _run_first(self):
+        self.jquants_client.iter_listed_info_pages = _paged_response(
+            self.API_DATA[:2], self.API_DATA[2:]
+        )
+        return await self.use_case.execute(target_date=date(2024, 1, 4))
+
+    @pytest.mark.asyncio
+    async def test_first_run_streams_and_stores_digest(self):
+        """ダイジェスト未登録の場合はストリーミングで保存し、ダイジェストを記録する"""
+        result = await self._run_first()
+
+        assert result.saved_count == 3
+        assert result.snapshot_unchanged is False
+        stored = self.snapshots.save.await_args.args[0]
+        assert stored.dataset == "jquants_listed_info"
+        assert stored.target_date == date(2024, 1, 4)
+        assert stored.record_count == 3
+
+    @pytest.mark.asyncio
+    async def test_unchanged_snapshot_skips_save(self):
+        """前回と同じ内容（順序違いを含む）の場合は保存しない"""
+        await self._run_first()
+        self.snapshots.get.return_value = self.snapshots.save.await_args.args[0]
+        self.snapshots.save.reset_mock()
+        self.repository.save_all.reset_mock()
+
+        self.jquants_client.iter_listed_info_pages = _paged_response(list(reversed(self.API_DATA)))
+        result = await self.use_case.execute(target_date=date(2024, 1, 4))
+
+        assert result.success is True
+        assert result.snapshot_unchanged is True
+        assert result.fetched_count == 3
+        assert result.saved_count == 0
+        assert result.unchanged_count == 3
+        self.repository.save_all.assert_not_awaited()
+        self.snapshots.save.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_changed_snapshot_is_saved(self):
+        """内容が変わった場合は保存してダイジェストを更新する"""
+        await self._run_first()
+        previous = self.snapshots.save.await_args.args[0]
+        self.snapshots.get.return_value = previous
+        self.repository.save_all.reset_mock()
+
+        changed = [dict(self.API_DATA[0], CompanyName="Renamed")] + self.API_DATA[1:]
+        self.jquants_client.iter_listed_info_pages = _paged_response(changed)
+        result = await self.use_case.execute(target_date=date(2024, 1, 4))
+
+        assert result.snapshot_unchanged is False
+        assert result.fetched_count == 3
+        assert result.saved_count == 3
+        self.repository.save_all.assert_awaited()
+        assert self.snapshots.save.await_args.args[0].digest != previous.digest
+
+    @pytest.mark.asyncio
+    async def test_more_records_than_stored_streams_rest(self):
+        """保存済みより件数が多くなった時点で残りのページをストリーミングで保存する"""
+        await self._run_first()
+        previous = self.snapshots.save.await_args.args[0]
+        self.snapshots.get.return_value = previous
+        self.repository.save_all.reset_mock()
+        self.use_case.BATCH_SIZE = 1
+
+        # 保存済みは 3 件のため、4 ページ目を受信した時点で変更ありと判断できる
+        added = (
+            [{"Date": "20240104", "Code": "8888", "CompanyName": "New"}]
+            + self.API_DATA
+            + [{"Date": "20240104", "Code": "9999", "CompanyName": "New"}]
+        )
+        saved_before_last_page = []
+
+        async def _iter_pages(date=None):
+            for record in added:
+                if record is added[-1]:
+                    saved_before_last_page.append(self.repository.save_all.await_count)
+                yield ListedInfoPage([record])
+
+        self.jquants_client.iter_listed_info_pages = Mock(side_effect=_iter_pages)
+
+        result = await self.use_case.execute(target_date=date(2024, 1, 4))
+
+        assert result.fetched_count == 5
+        assert result.saved_count == 5
+        # 件数の超過で判断した後は、最後のページを受信する前に保存が始まる
+        assert saved_before_last_page[0] > 0
+        stored = self.snapshots.save.await_args.args[0]
+        assert stored.record_count == 5
+        assert stored.digest != previous.digest
+
+    @pytest.mark.asyncio
+    async def test_replayed_pages_are_released(self):
+        """保持したページはパイプラインに渡した時点で手放す"""
+        buffered = deque([ListedInfoPage([{"Code": "1000"}]), ListedInfoPage([{"Code": "2000"}])])
+
+        replay = FetchJQuantsListedInfoUseCase._replay_pages(buffered)
+        first = await replay.__anext__()
+
+        assert first == [{"Code": "1000"}]
+        assert len(buffered) == 1
+
+    @pytest.mark.asyncio
+    async def test_resume_does_not_use_digest(self):
+        """途中から再開する場合はダイジェストを計算しない"""
+        self.jquants_client.iter_listed_info_pages = Mock(
+            side_effect=lambda date=None, pagination_key=None: _paged_response(self.API_DATA)()
+        )
+        await self.use_case.execute(target_date=date(2024, 1, 4), resume_pagination_key="k")
+
+        self.snapshots.get.assert_not_awaited()
+        self.snapshots.save.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_resume_with_progress_stores_digest(self):
+        """途中経過を引き継いで再開した場合は、通しで取得した場合と同じダイジェストを記録する"""
+        await self._run_first()
+        expected = self.snapshots.save.await_args.args[0]
+        self.snapshots.save.reset_mock()
+
+        # 1 ページ目だけ保存したところで中断された実行
+        self.use_case.BATCH_SIZE = 2
+        self.jquants_client.iter_listed_info_pages = _paged_response(
+            ListedInfoPage(self.API_DATA[:2], next_pagination_key="key-2"),
+            error=JQuantsListedInfoAPIError("timeout"),
+        )
+        checkpoints = []
+
+        async def on_checkpoint(next_key, count, progress):
+            checkpoints.append((next_key, count, progress))
+
+        await self.use_case.execute(target_date=date(2024, 1, 4), on_checkpoint=on_checkpoint)
+        ((next_key, count, progress),) = checkpoints
+        assert (next_key, count) == ("key-2", 2)
+        assert progress.listed_codes == {"1000", "1001"}
+
+        self.jquants_client.iter_listed_info_pages = Mock(
+            side_effect=lambda date=None, pagination_key=None: _paged_response(self.API_DATA[2:])()
+        )
+        self.snapshots.get.reset_mock()
+        result = await self.use_case.execute(
+            target_date=date(2024, 1, 4), resume_pagination_key=next_key, resume_progress=progress
+        )
+
+        assert result.success is True
+        self.snapshots.get.assert_not_awaited()
+        stored = self.snapshots.save.await_args.args[0]
+        assert stored.digest == expected.digest
+        assert stored.record_count == 3
+
+    @pytest.mark.asyncio
+    async def test_resume_after_buffered_mismatch_stores_digest(self):
+        """全ページを保持して変更ありと判断した実行から再開しても、正しいダイジェストを記録する"""
+        changed = [dict(self.API_DATA[0], CompanyName="Renamed")] + self.API_DATA[1:]
+        self.jquants_client.iter_listed_info_pages = _paged_response(changed)
+        await self.use_case.execute(target_date=date(2024, 1, 4))
+        expected = self.snapshots.save.await_args.args[0]
+
+        await self._run_first()
+        self.snapshots.get.return_value = self.snapshots.save.await_args.args[0]
+        self.snapshots.save.reset_mock()
+
+        # 全ページを保持した後、1 ページ目だけ保存したところで中断された実行
+        self.use_case.BATCH_SIZE = 2
+        self.jquants_client.iter_listed_info_pages = _paged_response(
+            ListedInfoPage(changed[:2], next_pagination_key="key-2"), changed[2:]
+        )
+        self.repository.save_all.side_effect = [
+            DEFAULT,
+            JQuantsListedInfoStorageError("Database connection failed"),
+        ]
+        checkpoints = []
+
+        async def on_checkpoint(next_key, count, progress):
+            checkpoints.append((next_key, count, progress))
+
+        result = await self.use_case.execute(
+            target_date=date(2024, 1, 4), on_checkpoint=on_checkpoint
+        )
+        assert result.success is False
+        ((next_key, count, progress),) = checkpoints
+        assert (next_key, count) == ("key-2", 2)
+
+        self.repository.save_all.side_effect = None
+        self.jquants_client.iter_listed_info_pages = Mock(
+            side_effect=lambda date=None, pagination_key=None: _paged_response(changed[2:])()
+        )
+        result = await self.use_case.execute(
+            target_date=date(2024, 1, 4), resume_pagination_key=next_key, resume_progress=progress
+        )
+
+        assert result.success is True
+        stored = self.snapshots.save.await_args.args[0]
+        assert stored.digest == expected.digest
+        assert stored.record_count == 3
+
+
+class TestFinalizeSnapshot:
+    """全銘柄スナップショット保存後の上場銘柄の通知のテスト"""
+
+    API_DATA = TestSnapshotDigest.API_DATA
+
+    def setup_method(self):
+        """テストのセットアップ"""
+        self.jquants_client = AsyncMock()
+        self.jquants_client.iter_listed_info_pages = _paged_response(
+            self.API_DATA[:2], self.API_DATA[2:]
+        )
+        self.repository = AsyncMock()
+        self.use_case = FetchJQuantsListedInfoUseCase(
+            jquants_client=self.jquants_client,
+            listed_info_repository=self.repository,
+            logger=Mock(),
+        )
+
+    @pytest.mark.asyncio
+    async def test_full_snapshot_finalizes_listed_codes(self):
+        """全銘柄を取得した場合は受信した銘柄コードを通知する"""
+        await self.use_case.execute(target_date=date(2024, 1, 4))
+
+        self.repository.finalize_snapshot.assert_awaited_once_with(
+            date(2024, 1, 4), {"1000", "1001", "1002"}
+        )
+
+    @pytest.mark.asyncio
+    async def test_partial_fetch_does_not_finalize(self):
+        """銘柄指定・日付なし・再開時は一部の銘柄しか含まないため通知しない"""
+        await self.use_case.execute(code="1000", target_date=date(2024, 1, 4))
+        await self.use_case.execute()
+        self.jquants_client.iter_listed_info_pages = Mock(
+            side_effect=lambda date=None, pagination_key=None: _paged_response(self.API_DATA)()
+        )
+        await self.use_case.execute(target_date=date(2024, 1, 4), resume_pagination_key="k")
+
+        self.repository.finalize_snapshot.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_resume_with_progress_finalizes_all_codes(self):
+        """途中経過を引き継いで再開した場合は、前回の実行で保存した銘柄も含めて通知する"""
+        self.jquants_client.iter_listed_info_pages = Mock(
+            side_effect=lambda date=None, pagination_key=None: _paged_response(self.API_DATA[2:])()
+        )
+
+        await self.use_case.execute(
+            target_date=date(2024, 1, 4),
+            resume_pagination_key="k",
+            resume_progress=SnapshotProgress(listed_codes={"1000", "1001"}),
+        )
+
+        self.repository.finalize_snapshot.assert_awaited_once_with(
+            date(2024, 1, 4), {"1000", "1001", "1002"}
+        )
+
+    @pytest.mark.asyncio
+    async def test_empty_snapshot_does_not_finalize(self):
+        """データがない日は通知しない"""
+        self.jquants_client.iter_listed_info_pages = _paged_response([])
+
+        await self.use_case.execute(target_date=date(2024, 1, 4))
+
+        self.repository.finalize_snapshot.assert_not_awaited()
+
+
+class TestListingChangeEvents:
+    """全銘柄スナップショット保存後の変更イベントの発行のテスト"""
+
+    API_DATA = TestSnapshotDigest.API_DATA
+
+    def setup_method(self):
+        """テストのセットアップ"""
+        from app.domain.services.listed_info_frame import ListedInfoFrame
+
+        self.jquants_client = AsyncMock()
+        self.jquants_client.iter_listed_info_pages = _paged_response(self.API_DATA)
+        self.repository = AsyncMock()
+        self.repository.find_previous_snapshot_date.return_value = date(2024, 1, 4)
+        self.repository.find_frame_by_dates.return_value = ListedInfoFrame.from_rows(
+            [
+                (date(2024, 1, 4), "1000", "Company 0") + (None,) * 10,
+                (date(2024, 1, 4), "2000", "Delisted") + (None,) * 10,
+                (date(2024, 1, 5), "1000", "Renamed") + (None,) * 10,
+            ]
+        )
+        self.publisher = AsyncMock()
+        self.use_case = FetchJQuantsListedInfoUseCase(
+            jquants_client=self.jquants_client,
+            listed_info_repository=self.repository,
+            logger=Mock(),
+            event_publisher=self.publisher,
+        )
+
+    @pytest.mark.asyncio
+    async def test_changes_against_previous_snapshot_are_published(self):
+        """直前のスナップショットとの差分をイベントとして発行する"""
+        result = await self.use_case.execute(target_date=date(2024, 1, 5))
+
+        self.repository.find_frame_by_dates.assert_awaited_once_with(
+            [date(2024, 1, 4), date(2024, 1, 5)]
+        )
+        self.publisher.publish_batch.assert_not_awaited()
+        await self.use_case.publish_events(result)
+        events = self.publisher.publish_batch.await_args.args[0]
+        assert [event.event_type for event in events] == [
+            "listed_info.stored",
+            "listed_info.delisting_detected",
+            "listed_info.company_name_change_detected",
+            "listed_info.bulk_changes_detected",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_first_snapshot_is_not_compared(self):
+        """直前のスナップショットがなければ比較しない"""
+        self.repository.find_previous_snapshot_date.return_value = None
+
+        result = await self.use_case.execute(target_date=date(2024, 1, 5))
+
+        self.repository.find_frame_by_dates.assert_not_awaited()
+        assert [event.event_type for event in result.events] == ["listed_info.stored"]
+
+    @pytest.mark.asyncio
+    async def test_detection_can_be_disabled(self):
+        """detect_changes が無効なら比較しない（バックフィルなど）"""
+        use_case = FetchJQuantsListedInfoUseCase(
+            jquants_client=self.jquants_client,
+            listed_info_repository=self.repository,
+            logger=Mock(),
+            event_publisher=self.publisher,
+            detect_changes=False,
+        )
+
+        await use_case.execute(target_date=date(2024, 1, 5))
+
+        self.repository.find_previous_snapshot_date.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_publish_failure_is_logged(self):
+        """イベントの発行に失敗しても例外にしない"""
+        result = await self.use_case.execute(target_date=date(2024, 1, 5))
+        self.publisher.publish_batch.side_effect = RuntimeError("redis down")
+
+        await self.use_case.publish_events(result)
+
+        self.use_case._logger.warning.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_partial_fetch_is_not_compared(self):
+        """銘柄指定の取得では比較しない"""
+        await self.use_case.execute(code="1000", target_date=date(2024, 1, 5))
+
+        self.repository.find_previous_snapshot_date.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_failure_does_not_fail_fetch(self):
+        """差分の検出に失敗しても取得は成功とする"""
+        self.repository.find_frame_by_dates.side_effect = RuntimeError("boom")
+
+        result = await self.use_case.execute(target_date=date(2024, 1, 5))
+
+        assert result.success
+
+
+class TestRowFastPath:
+    """API レスポンスを行に直接変換して保存する経路のテスト"""
+
+    API_DATA = TestSnapshotDigest.API_DATA
+
+    def setup_method(self):
+        """テストのセットアップ"""
+        from app.domain.repositories.jquants_listed_info_repository_interface import (
+            ListedInfoSaveResult,
+        )
+
+        self.jquants_client = AsyncMock()
+        self.jquants_client.iter_listed_info_pages = _paged_response(
+            self.API_DATA[:2], self.API_DATA[2:]
+        )
+        self.repository = AsyncMock()
+        self.repository.save_rows.return_value = ListedInfoSaveResult(inserted_count=2)
+        self.use_case = FetchJQuantsListedInfoUseCase(
+            jquants_client=self.jquants_client,
+            listed_info_repository=self.repository,
+            logger=Mock(),
+            row_fast_path=True,
+        )
+        self.use_case.BATCH_SIZE = 2
+
+    @pytest.mark.asyncio
+    async def test_rows_are_saved_without_entities(self):
+        """エンティティを作成せずに行のまま保存する"""
+        result = await self.use_case.execute(target_date=date(2024, 1, 4))
+
+        assert result.success
+        assert result.saved_count == 3
+        self.repository.save_all.assert_not_awaited()
+        batches = [c.args[0] for c in self.repository.save_rows.await_args_list]
+        assert [len(batch) for batch in batches] == [2, 1]
+        assert batches[0][0][:3] == (date(2024, 1, 4), "1000", "Company 0")
+
+    @pytest.mark.asyncio
+    async def test_invalid_record_fails_like_entity_path(self):
+        """不正なレコードはエンティティを経由する場合と同様に失敗する"""
+        self.jquants_client.iter_listed_info_pages = _paged_response(
+            [{"Date": "20240104", "Code": "1000", "CompanyName": ""}]
+        )
+
+        result = await self.use_case.execute(target_date=date(2024, 1, 4))
+
+        assert not result.success
+        self.repository.save_rows.assert_not_awaited()
@@ -0,0 +1,91 @@
+"""QueryListedInfoUseCase のテスト"""
+from datetime import date
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.application.dtos.jquants_listed_info_dto import JQuantsListedInfoSearchCriteria
+from app.application.use_cases.query_listed_info import QueryListedInfoUseCase
+from app.domain.entities.jquants_listed_info import JQuantsListedInfo
+from app.domain.value_objects.stock_code import StockCode
+
+TARGET_DATE = date(2024, 1, 4)
+
+
+def _entity(code: str, market_code: str = "0111", scale_category: str = "TOPIX Small 1") -> JQuantsListedInfo:
+    return JQuantsListedInfo(
+        date=TARGET_DATE,
+        code=StockCode(code),
+        company_name=f"Company {code}",
+        company_name_english=None,
+        sector_17_code="6",
+        sector_17_code_name="自動車・輸送機",
+        sector_33_code="3700",
+        sector_33_code_name="輸送用機器",
+        scale_category=scale_category,
+        market_code=market_code,
+        market_code_name=None,
+        margin_code=None,
+        margin_code_name=None,
+    )
+
+
+class TestQueryListedInfoUseCase:
+    """QueryListedInfoUseCase tests."""
+
+    def setup_method(self):
+        """テストのセットアップ"""
+        self.repository = AsyncMock()
+        self.repository.find_all_by_date.return_value = [
+            _entity("9984", market_code="0111"),
+            _entity("7203", market_code="0111", scale_category="TOPIX Core30"),
+            _entity("4385", market_code="0113"),
+        ]
+        self.use_case = QueryListedInfoUseCase(self.repository)
+
+    @pytest.mark.asyncio
+    async def test_search_filters_and_sorts(self):
+        """市場で絞り込み、銘柄コード順に返す"""
+        items, total = await self.use_case.search(
+            JQuantsListedInfoSearchCriteria(date=TARGET_DATE, market_code="0111")
+        )
+
+        assert total == 2
+        assert [item.code for item in items] == ["7203", "9984"]
+        self.repository.find_all_by_date.assert_awaited_once_with(TARGET_DATE)
+
+    @pytest.mark.asyncio
+    async def test_search_by_scale_with_paging(self):
+        """規模区分の絞り込みとページング"""
+        items, total = await self.use_case.search(
+            JQuantsListedInfoSearchCriteria(date=TARGET_DATE, scale_category="TOPIX Small 1"),
+            offset=1,
+            limit=1,
+        )
+
+        assert total == 2
+        assert [item.code for item in items] == ["9984"]
+
+    @pytest.mark.asyncio
+    async def test_search_requires_date(self):
+        """日付の指定は必須"""
+        with pytest.raises(ValueError):
+            await self.use_case.search(JQuantsListedInfoSearchCriteria(market_code="0111"))
+
+    @pytest.mark.asyncio
+    async def test_get_by_code(self):
+        """銘柄コードと日付で取得する"""
+        self.repository.find_by_code_and_date.return_value = _entity("7203")
+
+        dto = await self.use_case.get_by_code("7203", TARGET_DATE)
+
+        assert dto.code == "7203"
+        assert dto.date == "2024-01-04"
+        self.repository.find_by_code_and_date.assert_awaited_once_with(StockCode("7203"), TARGET_DATE)
+
+    @pytest.mark.asyncio
+    async def test_get_latest_not_found(self):
+        """データがない場合は None"""
+        self.repository.find_latest_by_code.return_value = None
+
+        assert await self.use_case.get_latest_by_code("7203") is None
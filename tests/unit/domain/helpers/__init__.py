@@ -0,0 +1 @@
+"""Domain helpers tests."""
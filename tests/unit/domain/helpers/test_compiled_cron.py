@@ -0,0 +1,116 @@
+"""CompiledCron のテスト"""
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+from croniter import croniter
+
+from app.domain.exceptions.schedule_exceptions import InvalidCronExpressionException
+from app.domain.helpers.compiled_cron import compile_cron
+from app.domain.validators.cron_validator import (
+    get_next_run_time,
+    get_next_run_times,
+    validate_cron_expression,
+)
+
+BASES = [
+    datetime(2024, 1, 1, 0, 0),
+    datetime(2024, 2, 28, 23, 59, 30),
+    datetime(2024, 3, 15, 9, 0),
+    datetime(2023, 12, 31, 18, 0, 0, 1),
+    datetime(2024, 6, 30, 12, 34, 56, tzinfo=timezone.utc),
+]
+
+
+def _croniter_times(expression, base, count):
+    cron = croniter(expression, base)
+    return [cron.get_next(datetime) for _ in range(count)]
+
+
+class TestNextTimes:
+    """次回以降の実行時刻の計算のテスト（croniter と同じ結果になる）"""
+
+    @pytest.mark.parametrize(
+        "expression",
+        [
+            "0 9 * * *",
+            "* * * * *",
+            "*/15 9-17 * * 1-5",
+            "0 18 28-31 * *",
+            "0 9 1 * 1",
+            "0 9 1-7 * 1",
+            "0 0 29 2 *",
+            "30 23 31 * *",
+            "59 23 * * 0,6",
+            "0 9 * jan mon",
+            "0 9 * * 7",
+            # L（月末）・#（第 n 曜日）は croniter で計算する
+            "0 0 L * *",
+            "0 9 * * 1#2",
+        ],
+    )
+    @pytest.mark.parametrize("base", BASES)
+    def test_matches_croniter(self, expression, base):
+        assert compile_cron(expression).next_times(base, 40) == _croniter_times(expression, base, 40)
+
+    def test_next_time_is_strictly_after_base(self):
+        assert compile_cron("0 9 * * *").next_time(datetime(2024, 1, 1, 9, 0)) == datetime(2024, 1, 2, 9, 0)
+
+    def test_timezone_aware_base(self):
+        """UTC 以外のタイムゾーンは croniter で計算する（夏時間の切り替えを含む）"""
+        base = datetime(2024, 3, 9, 12, 0, tzinfo=ZoneInfo("America/New_York"))
+
+        assert compile_cron("30 2 * * *").next_times(base, 3) == _croniter_times("30 2 * * *", base, 3)
+
+    def test_many_times_across_years(self):
+        base = datetime(2024, 1, 1)
+
+        times = compile_cron("0 18 28-31 * *").next_times(base, 500)
+
+        assert times == _croniter_times("0 18 28-31 * *", base, 500)
+        assert times[-1] - times[0] > timedelta(days=365 * 10)
+
+    def test_no_fire_time(self):
+        with pytest.raises(ValueError):
+            compile_cron("0 0 30 2 *").next_time(datetime(2024, 1, 1))
+
+    def test_zero_count(self):
+        assert compile_cron("0 9 * * *").next_times(datetime(2024, 1, 1), 0) == []
+
+
+class TestCompileCron:
+    """cron 式の解析とキャッシュのテスト"""
+
+    def test_cached_by_expression(self):
+        assert compile_cron("0 9 * * 1-5") is compile_cron("0 9 * * 1-5")
+
+    @pytest.mark.parametrize("expression", ["invalid", "61 * * * *", "* * *", ""])
+    def test_invalid_expression(self, expression):
+        with pytest.raises(ValueError):
+            compile_cron(expression)
+
+    def test_not_a_string(self):
+        with pytest.raises(TypeError):
+            compile_cron(None)
+
+
+class TestCronValidator:
+    """cron_validator からの利用のテスト"""
+
+    def test_validate(self):
+        assert validate_cron_expression("0 9 * * *") is True
+        with pytest.raises(InvalidCronExpressionException):
+            validate_cron_expression("invalid")
+
+    def test_next_run_times(self):
+        base = datetime(2024, 1, 5, 10, 0)
+
+        assert get_next_run_times("0 9 * * 1-5", 2, base) == [
+            datetime(2024, 1, 8, 9, 0),
+            datetime(2024, 1, 9, 9, 0),
+        ]
+        assert get_next_run_time("0 9 * * 1-5", base) == datetime(2024, 1, 8, 9, 0)
+
+    def test_next_run_times_without_fire_time(self):
+        with pytest.raises(InvalidCronExpressionException):
+            get_next_run_times("0 0 30 2 *", 1, datetime(2024, 1, 1))
@@ -0,0 +1,151 @@
+"""ListedInfoDiffEngine のテスト"""
+from datetime import date
+from typing import Optional
+
+import pytest
+
+from app.domain.events.jquants_listed_info_events import (
+    CompanyNameChangeDetected,
+    DelistingDetected,
+    ListedInfoBulkChangesDetected,
+    MarginChangeDetected,
+    MarketChangeDetected,
+    NewListingDetected,
+    SectorChangeDetected,
+)
+from app.domain.services.listed_info_diff_engine import ListedInfoDiffEngine
+from app.domain.services.listed_info_frame import ListedInfoFrame
+
+DAY_1 = date(2024, 1, 4)
+DAY_2 = date(2024, 1, 5)
+
+
+def _row(
+    code: str,
+    target_date: date = DAY_1,
+    company_name: Optional[str] = None,
+    sector_17_code: str = "6",
+    sector_33_code: str = "3700",
+    market_code: str = "0111",
+    market_code_name: str = "プライム",
+    margin_code: str = "1",
+    margin_code_name: str = "信用",
+):
+    return (
+        target_date,
+        code,
+        company_name or f"Company {code}",
+        None,
+        sector_17_code,
+        None,
+        sector_33_code,
+        None,
+        None,
+        market_code,
+        market_code_name,
+        margin_code,
+        margin_code_name,
+    )
+
+
+def _by_type(events, event_class):
+    return [event for event in events if isinstance(event, event_class)]
+
+
+class TestListedInfoDiffEngine:
+    """スナップショットの差分からのイベント生成のテスト"""
+
+    def test_detects_each_kind_of_change(self):
+        old = ListedInfoFrame.from_rows(
+            [
+                _row("1000"),
+                _row("2000"),
+                _row("3000"),
+                _row("4000"),
+                _row("5000"),
+                _row("9000"),
+            ]
+        )
+        new = ListedInfoFrame.from_rows(
+            [
+                _row("1000", DAY_2),
+                _row("2000", DAY_2, market_code="0112", market_code_name="スタンダード"),
+                _row("3000", DAY_2, sector_33_code="3650"),
+                _row("4000", DAY_2, company_name="New Name"),
+                _row("5000", DAY_2, margin_code="2", margin_code_name="貸借"),
+                _row("6000", DAY_2),
+            ]
+        )
+
+        events = ListedInfoDiffEngine.detect(old, new, DAY_2)
+
+        (listing,) = _by_type(events, NewListingDetected)
+        assert (listing.code.value, listing.company_name, listing.market_code) == (
+            "6000", "Company 6000", "0111"
+        )
+        (delisting,) = _by_type(events, DelistingDetected)
+        assert (delisting.code.value, delisting.company_name) == ("9000", "Company 9000")
+        (market,) = _by_type(events, MarketChangeDetected)
+        assert (market.old_market_code, market.new_market_code) == ("0111", "0112")
+        assert (market.old_market_name, market.new_market_name) == ("プライム", "スタンダード")
+        (sector,) = _by_type(events, SectorChangeDetected)
+        assert (sector.old_sector_17_code, sector.new_sector_17_code) == ("6", "6")
+        assert (sector.old_sector_33_code, sector.new_sector_33_code) == ("3700", "3650")
+        (name,) = _by_type(events, CompanyNameChangeDetected)
+        assert (name.old_name, name.new_name) == ("Company 4000", "New Name")
+        (margin,) = _by_type(events, MarginChangeDetected)
+        assert (margin.old_margin_code, margin.new_margin_name) == ("1", "貸借")
+        assert all(
+            event.change_date == DAY_2 for event in events if hasattr(event, "change_date")
+        )
+
+        bulk = events[-1]
+        assert isinstance(bulk, ListedInfoBulkChangesDetected)
+        assert bulk.new_listings == ["6000"]
+        assert bulk.delistings == ["9000"]
+        assert bulk.market_changes == ["2000"]
+        assert bulk.sector_changes == ["3000"]
+        assert bulk.name_changes == ["4000"]
+        assert bulk.margin_changes == ["5000"]
+        assert bulk.to_dict()["total_changes"] == 6
+
+    def test_both_sector_codes_changed_is_one_event(self):
+        """17 業種と 33 業種が同時に変わっても 1 件のイベントにする"""
+        old = ListedInfoFrame.from_rows([_row("1000"), _row("2000")])
+        new = ListedInfoFrame.from_rows(
+            [
+                _row("2000", DAY_2, sector_17_code="10", sector_33_code="5250"),
+                _row("1000", DAY_2, sector_33_code="3650"),
+            ]
+        )
+
+        events = ListedInfoDiffEngine.detect(old, new, DAY_2, include_bulk=False)
+
+        assert [(e.code.value, e.new_sector_17_code, e.new_sector_33_code) for e in events] == [
+            ("1000", "6", "3650"),
+            ("2000", "10", "5250"),
+        ]
+
+    def test_unchanged_snapshot_has_no_events(self):
+        old = ListedInfoFrame.from_rows([_row("1000"), _row("2000")])
+        new = ListedInfoFrame.from_rows([_row("2000", DAY_2), _row("1000", DAY_2)])
+
+        assert ListedInfoDiffEngine.detect(old, new, DAY_2) == []
+
+    def test_full_market_snapshot(self):
+        """全市場規模のスナップショットでも変更のあった銘柄だけを返す"""
+        old = ListedInfoFrame.from_rows([_row(str(1000 + i)) for i in range(4000)])
+        new = ListedInfoFrame.from_rows(
+            [_row(str(1000 + i), DAY_2, company_name="Renamed" if i % 1000 == 0 else None)
+             for i in range(4000)]
+        )
+
+        events = ListedInfoDiffEngine.detect(old, new, DAY_2, include_bulk=False)
+
+        assert [event.code.value for event in events] == ["1000", "2000", "3000", "4000"]
+
+    def test_duplicate_codes_are_rejected(self):
+        frame = ListedInfoFrame.from_rows([_row("1000"), _row("1000", DAY_2)])
+
+        with pytest.raises(ValueError):
+            ListedInfoDiffEngine.detect(frame, frame, DAY_2)
@@ -0,0 +1,232 @@
+"""ListedInfoFrame のテスト"""
+from datetime import date
+from typing import List, Optional
+
+import numpy as np
+import pytest
+
+from app.domain.entities.jquants_listed_info import JQuantsListedInfo
+from app.domain.repositories.jquants_listed_info_repository_interface import (
+    JQuantsListedInfoRepositoryInterface,
+)
+from app.domain.services.listed_info_frame import ATTRIBUTE_COLUMNS, ListedInfoFrame
+from app.domain.value_objects.stock_code import StockCode
+
+DAY_1 = date(2024, 1, 4)
+DAY_2 = date(2024, 1, 5)
+
+
+def _info(
+    code: str,
+    target_date: date = DAY_1,
+    company_name: Optional[str] = None,
+    market_code: Optional[str] = "0111",
+    sector_17_code: Optional[str] = "6",
+    scale_category: Optional[str] = None,
+) -> JQuantsListedInfo:
+    return JQuantsListedInfo(
+        date=target_date,
+        code=StockCode(code),
+        company_name=company_name or f"Company {code}",
+        company_name_english=None,
+        sector_17_code=sector_17_code,
+        sector_17_code_name=None,
+        sector_33_code=None,
+        sector_33_code_name=None,
+        scale_category=scale_category,
+        market_code=market_code,
+        market_code_name=None,
+        margin_code="1",
+        margin_code_name=None,
+    )
+
+
+@pytest.fixture
+def snapshot_1():
+    return [
+        _info("7203", scale_category="TOPIX Large70"),
+        _info("9984", sector_17_code="10", scale_category="TOPIX Large70"),
+        _info("2371", market_code="0112", sector_17_code=None),
+        _info("3990", market_code="0113"),
+    ]
+
+
+@pytest.fixture
+def snapshot_2():
+    return [
+        _info("3990", DAY_2, market_code="0112"),
+        _info("7203", DAY_2, scale_category="TOPIX Large70"),
+        _info("9984", DAY_2, company_name="SoftBank", sector_17_code="10", scale_category="TOPIX Large70"),
+        _info("4755", DAY_2),
+    ]
+
+
+def _codes(frame: ListedInfoFrame) -> List[str]:
+    return frame.codes.tolist()
+
+
+class TestConstruction:
+    """作成と変換のテスト"""
+
+    def test_round_trip_entities(self, snapshot_1):
+        """エンティティに戻すと元と等しい"""
+        frame = ListedInfoFrame.from_entities(snapshot_1)
+
+        assert len(frame) == 4
+        assert frame.to_entities() == snapshot_1
+
+    def test_columns_are_categorical(self, snapshot_1):
+        """属性列はカテゴリ番号で保持し、None は -1 とする"""
+        column = ListedInfoFrame.from_entities(snapshot_1).column("sector_17_code")
+
+        assert column.codes.dtype == np.int32
+        assert column.categories == ("6", "10")
+        assert column.codes.tolist() == [0, 1, -1, 0]
+
+    def test_from_rows(self):
+        """(date, code, 属性...) の行から作成する"""
+        row = (DAY_1, "7203", "Toyota") + (None,) * 10
+
+        frame = ListedInfoFrame.from_rows([row])
+
+        assert frame.unique_dates() == [DAY_1]
+        assert frame.values("company_name").tolist() == ["Toyota"]
+
+    def test_empty(self):
+        frame = ListedInfoFrame.from_rows([])
+
+        assert len(frame) == 0
+        assert frame.to_entities() == []
+        assert frame.count_by("market_code") == {}
+
+
+class TestFilter:
+    """絞り込みのテスト"""
+
+    def test_filter_by_multiple_columns(self, snapshot_1):
+        frame = ListedInfoFrame.from_entities(snapshot_1)
+
+        result = frame.filter(market_code="0111", scale_category="TOPIX Large70")
+
+        assert _codes(result) == ["7203", "9984"]
+
+    def test_unknown_value_matches_nothing(self, snapshot_1):
+        frame = ListedInfoFrame.from_entities(snapshot_1)
+
+        assert len(frame.filter(market_code="9999")) == 0
+        assert len(frame.filter(market_code=None)) == 4
+
+    def test_unknown_column(self, snapshot_1):
+        with pytest.raises(KeyError):
+            ListedInfoFrame.from_entities(snapshot_1).filter(unknown="x")
+
+    def test_on_date(self, snapshot_1, snapshot_2):
+        frame = ListedInfoFrame.from_entities(snapshot_1 + snapshot_2)
+
+        assert frame.unique_dates() == [DAY_1, DAY_2]
+        assert _codes(frame.on(DAY_2)) == ["3990", "7203", "9984", "4755"]
+
+
+class TestCount:
+    """集計のテスト"""
+
+    def test_count_by(self, snapshot_1):
+        counts = ListedInfoFrame.from_entities(snapshot_1).count_by("sector_17_code")
+
+        assert counts == {"6": 2, "10": 1, None: 1}
+
+    def test_count_by_date(self, snapshot_1, snapshot_2):
+        counts = ListedInfoFrame.from_entities(snapshot_1 + snapshot_2).count_by_date("market_code")
+
+        assert counts == {
+            DAY_1: {"0111": 2, "0112": 1, "0113": 1},
+            DAY_2: {"0111": 3, "0112": 1},
+        }
+
+
+class TestDiff:
+    """2 日間の差分のテスト"""
+
+    def test_diff(self, snapshot_1, snapshot_2):
+        old = ListedInfoFrame.from_entities(snapshot_1)
+        new = ListedInfoFrame.from_entities(snapshot_2)
+
+        diff = old.diff(new)
+
+        assert diff.added.tolist() == ["4755"]
+        assert diff.removed.tolist() == ["2371"]
+        assert set(diff.changed) == {"company_name", "market_code"}
+        market = diff.changed["market_code"]
+        assert market.codes.tolist() == ["3990"]
+        assert market.old_values.tolist() == ["0113"]
+        assert market.new_values.tolist() == ["0112"]
+        assert diff.changed_codes.tolist() == ["3990", "9984"]
+
+    def test_diff_within_one_frame(self, snapshot_1, snapshot_2):
+        """同じフレームから取り出した日付同士も比較できる"""
+        frame = ListedInfoFrame.from_entities(snapshot_1 + snapshot_2)
+
+        diff = frame.on(DAY_1).diff(frame.on(DAY_2))
+
+        assert diff.changed_codes.tolist() == ["3990", "9984"]
+
+    def test_identical_snapshots(self, snapshot_1):
+        frame = ListedInfoFrame.from_entities(snapshot_1)
+
+        assert frame.diff(frame).is_empty()
+
+    def test_duplicate_codes_are_rejected(self, snapshot_1, snapshot_2):
+        frame = ListedInfoFrame.from_entities(snapshot_1 + snapshot_2)
+
+        with pytest.raises(ValueError):
+            frame.diff(frame)
+
+
+class _InMemoryRepository(JQuantsListedInfoRepositoryInterface):
+    def __init__(self, listed_infos: List[JQuantsListedInfo]) -> None:
+        self._listed_infos = listed_infos
+
+    async def save_all(self, listed_infos, only_changed=None):
+        raise NotImplementedError
+
+    async def find_by_code_and_date(self, code, target_date):
+        raise NotImplementedError
+
+    async def find_all_by_date(self, target_date):
+        return [info for info in self._listed_infos if info.date == target_date]
+
+    async def find_latest_by_code(self, code):
+        raise NotImplementedError
+
+    async def delete_by_date(self, target_date):
+        raise NotImplementedError
+
+
+class TestRepositoryDefault:
+    """リポジトリインターフェースの既定の実装のテスト"""
+
+    @pytest.mark.asyncio
+    async def test_loads_dates_in_order(self, snapshot_1, snapshot_2):
+        repository = _InMemoryRepository(snapshot_2 + snapshot_1)
+
+        frame = await repository.find_frame_by_dates([DAY_2, DAY_1, DAY_2])
+
+        assert frame.to_entities() == snapshot_1 + snapshot_2
+
+    @pytest.mark.asyncio
+    async def test_save_rows_defaults_to_save_all(self, snapshot_1):
+        """既定の save_rows は行をエンティティに変換して save_all に渡す"""
+        saved = []
+
+        class _Repository(_InMemoryRepository):
+            async def save_all(self, listed_infos, only_changed=None):
+                saved.extend(listed_infos)
+
+        rows = [
+            (info.date, info.code.value, *(getattr(info, column) for column in ATTRIBUTE_COLUMNS))
+            for info in snapshot_1
+        ]
+
+        await _Repository([]).save_rows(rows)
+
+        assert saved == snapshot_1
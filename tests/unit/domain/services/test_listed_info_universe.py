@@ -0,0 +1,156 @@
+"""ListedInfoUniverse のテスト"""
+from datetime import date
+
+import pytest
+
+from app.domain.entities.jquants_listed_info import JQuantsListedInfo
+from app.domain.services.jquants_listed_info_service import ListedInfoService
+from app.domain.services.listed_info_universe import ListedInfoUniverse
+from app.domain.value_objects.stock_code import StockCode
+
+
+def _info(
+    code: str,
+    market_code: str = "0111",
+    sector_17_code: str = "6",
+    scale_category: str = "TOPIX Small",
+    margin_code: str = "1",
+    target_date: date = date(2024, 1, 4),
+) -> JQuantsListedInfo:
+    return JQuantsListedInfo(
+        date=target_date,
+        code=StockCode(code),
+        company_name=f"Company {code}",
+        company_name_english=None,
+        sector_17_code=sector_17_code,
+        sector_17_code_name=None,
+        sector_33_code=None,
+        sector_33_code_name=None,
+        scale_category=scale_category,
+        market_code=market_code,
+        market_code_name=None,
+        margin_code=margin_code,
+        margin_code_name=None,
+    )
+
+
+@pytest.fixture
+def listed_infos():
+    return [
+        _info("9984", sector_17_code="10", scale_category="TOPIX Large70"),
+        _info("7203", scale_category="TOPIX Large70"),
+        _info("2371", market_code="0112", sector_17_code="10", margin_code="2"),
+        _info("3990", market_code="0113", sector_17_code="10"),
+        _info("4755", sector_17_code="10", scale_category="TOPIX Mid400"),
+    ]
+
+
+def _codes(infos):
+    return [info.code.value for info in infos]
+
+
+class TestListedInfoUniverse:
+    """索引付きの上場銘柄集合のテスト"""
+
+    def test_composed_filter_keeps_original_order(self, listed_infos):
+        """複数条件の共通部分を元の順序で返す"""
+        universe = ListedInfoUniverse(listed_infos)
+
+        result = universe.filter(market_code="0111", sector_17_code="10")
+
+        assert _codes(result) == ["9984", "4755"]
+
+    def test_filter_matches_linear_scan(self, listed_infos):
+        """条件の組み合わせごとに走査と同じ結果を返す"""
+        universe = ListedInfoUniverse(listed_infos)
+
+        for market_code in ("0111", "0112", "0113", "9999", None):
+            for margin_code in ("1", "2", None):
+                expected = [
+                    info
+                    for info in listed_infos
+                    if (market_code is None or info.market_code == market_code)
+                    and (margin_code is None or info.margin_code == margin_code)
+                ]
+                assert universe.filter(market_code=market_code, margin_code=margin_code) == expected
+
+    def test_filter_by_codes(self, listed_infos):
+        """銘柄コードと属性の条件を組み合わせる"""
+        universe = ListedInfoUniverse(listed_infos)
+        codes = [StockCode("4755"), StockCode("2371"), StockCode("1111")]
+
+        assert _codes(universe.filter(codes=codes)) == ["2371", "4755"]
+        assert _codes(universe.filter(codes=codes, market_code="0111")) == ["4755"]
+        assert universe.filter(codes=[]) == []
+
+    def test_no_criteria_returns_all(self, listed_infos):
+        """条件がなければすべての銘柄を返す"""
+        assert ListedInfoUniverse(listed_infos).filter() == listed_infos
+
+    def test_unsupported_attribute(self, listed_infos):
+        """索引のない属性は指定できない"""
+        with pytest.raises(ValueError):
+            ListedInfoUniverse(listed_infos).filter(company_name="Company 7203")
+
+    def test_find_by_code_returns_first_match(self, listed_infos):
+        """同じ銘柄コードが複数ある場合は最初のものを返す"""
+        later = _info("7203", target_date=date(2024, 1, 5))
+        universe = ListedInfoUniverse(listed_infos + [later])
+
+        assert universe.find_by_code(StockCode("7203")) is listed_infos[1]
+        assert universe.find_by_code(StockCode("9999")) is None
+        assert universe.find_by_codes([StockCode("7203")]) == [listed_infos[1], later]
+
+    def test_group_by(self, listed_infos):
+        """属性の値ごとに最初に現れた順でグループ化する"""
+        grouped = ListedInfoUniverse(listed_infos).group_by("sector_17_code")
+
+        assert list(grouped) == ["10", "6"]
+        assert _codes(grouped["10"]) == ["9984", "2371", "3990", "4755"]
+
+    def test_indexes_are_built_lazily(self, listed_infos):
+        """索引は使用した属性の分だけ作成する"""
+        universe = ListedInfoUniverse(listed_infos)
+
+        universe.filter(market_code="0111")
+
+        assert set(universe._indexes) == {"market_code"}
+        assert universe._by_code is None
+
+    def test_posting_sets_are_reused(self, listed_infos):
+        """共通部分を取るための集合は属性と値の組ごとに一度だけ作成する"""
+        universe = ListedInfoUniverse(listed_infos)
+
+        universe.filter(market_code="0111", sector_17_code="10")
+        cached = dict(universe._posting_sets)
+        result = universe.filter(market_code="0111", sector_17_code="10")
+
+        assert _codes(result) == ["9984", "4755"]
+        assert list(cached) == [("sector_17_code", "10")]
+        assert universe._posting_sets[("sector_17_code", "10")] is cached[("sector_17_code", "10")]
+
+    def test_sequence_protocol(self, listed_infos):
+        """リストと同様に扱える"""
+        universe = ListedInfoUniverse(listed_infos)
+
+        assert len(universe) == 5
+        assert universe[0] is listed_infos[0]
+        assert list(universe) == listed_infos
+        assert ListedInfoUniverse.of(universe) is universe
+
+
+class TestServiceDelegation:
+    """ListedInfoService からの委譲のテスト"""
+
+    def test_service_accepts_universe(self, listed_infos):
+        """作成済みの集合を渡すと索引を再利用する"""
+        universe = ListedInfoUniverse(listed_infos)
+
+        assert _codes(ListedInfoService.filter_prime_market(universe)) == ["9984", "7203", "4755"]
+        assert _codes(ListedInfoService.filter_large_cap(universe)) == ["9984", "7203"]
+        assert _codes(ListedInfoService.filter_marginable(universe)) == [
+            "9984", "7203", "3990", "4755"
+        ]
+        assert ListedInfoService.find_by_code(universe, StockCode("3990")) is listed_infos[3]
+        assert set(universe._indexes) == {"market_code", "scale_category", "margin_code"}
+        assert universe._by_code is not None
@@ -0,0 +1,43 @@
+"""SnapshotDigestBuilder のテスト"""
+from app.domain.services.snapshot_digest_builder import SnapshotDigestBuilder
+
+
+def _digest(*records) -> str:
+    builder = SnapshotDigestBuilder()
+    for record in records:
+        builder.add(record)
+    return builder.hexdigest()
+
+
+class TestSnapshotDigestBuilder:
+    """SnapshotDigestBuilder tests."""
+
+    def test_independent_of_record_order(self):
+        assert _digest(["7203", "トヨタ"], ["9984", "SBG"]) == _digest(["9984", "SBG"], ["7203", "トヨタ"])
+
+    def test_value_change_changes_digest(self):
+        assert _digest(["7203", "トヨタ"]) != _digest(["7203", "トヨタ自動車"])
+
+    def test_none_differs_from_empty_string(self):
+        assert _digest(["7203", None]) != _digest(["7203", ""])
+
+    def test_duplicate_records_are_counted(self):
+        assert _digest(["7203"]) != _digest(["7203"], ["7203"])
+
+    def test_record_count_and_format(self):
+        builder = SnapshotDigestBuilder()
+        builder.add(["7203"])
+        builder.add(["9984"])
+        assert builder.record_count == 2
+        assert len(builder.hexdigest()) == 64
+
+    def test_resume_from_exported_state(self):
+        builder = SnapshotDigestBuilder()
+        for record in (["7203"], ["9984"], ["6758"]):
+            builder.add(record)
+
+        resumed = SnapshotDigestBuilder.from_state(builder.export_state(2))
+        resumed.add(["6758"])
+
+        assert resumed.record_count == 3
+        assert resumed.hexdigest() == builder.hexdigest()
@@ -249,6 +249,43 @@ class TestTimePeriod:
         assert splits[1].start_date == date(2024, 3, 1)
         assert splits[1].end_date == date(2024, 3, 15)
     
+    def test_split_by_days(self):
+        """Test split_by_days into single days."""
+        period = TimePeriod(date(2023, 1, 30), date(2023, 2, 1))
+        splits = list(period.split_by_days())
+        
+        assert [s.start_date for s in splits] == [
+            date(2023, 1, 30), date(2023, 1, 31), date(2023, 2, 1)
+        ]
+        assert all(s.is_single_day for s in splits)
+    
+    def test_split_by_days_with_remainder(self):
+        """Test split_by_days where the last chunk is shorter."""
+        period = TimePeriod(date(2023, 1, 1), date(2023, 1, 10))
+        splits = list(period.split_by_days(4))
+        
+        assert len(splits) == 3
+        assert splits[0] == TimePeriod(date(2023, 1, 1), date(2023, 1, 4))
+        assert splits[2] == TimePeriod(date(2023, 1, 9), date(2023, 1, 10))
+    
+    def test_split_by_days_invalid(self):
+        """Test split_by_days rejects non-positive chunk size."""
+        period = TimePeriod(date(2023, 1, 1), date(2023, 1, 10))
+        
+        with pytest.raises(ValueError, match="Days must be positive"):
+            list(period.split_by_days(0))
+    
+    def test_split_by_weeks(self):
+        """Test split_by_weeks aligns chunks to Monday-Sunday weeks."""
+        # 2023-01-04 is Wednesday
+        period = TimePeriod(date(2023, 1, 4), date(2023, 1, 17))
+        splits = list(period.split_by_weeks())
+        
+        assert len(splits) == 3
+        assert splits[0] == TimePeriod(date(2023, 1, 4), date(2023, 1, 8))
+        assert splits[1] == TimePeriod(date(2023, 1, 9), date(2023, 1, 15))
+        assert splits[2] == TimePeriod(date(2023, 1, 16), date(2023, 1, 17))
+    
     # Datetime range tests
     def test_to_datetime_range(self):
         """Test conversion to datetime range."""
@@ -0,0 +1,80 @@
+"""Unit tests for TradingCalendar value object."""
+from datetime import date
+
+import pytest
+
+from app.domain.value_objects.time_period import TimePeriod
+from app.domain.value_objects.trading_calendar import TradingCalendar, is_default_trading_day
+
+
+class TestDefaultTradingDay:
+    """Test cases for the weekday fallback rule."""
+
+    def test_weekday_is_trading_day(self):
+        assert is_default_trading_day(date(2024, 1, 10))  # Wednesday
+
+    def test_weekend_is_not_trading_day(self):
+        assert not is_default_trading_day(date(2024, 1, 13))  # Saturday
+        assert not is_default_trading_day(date(2024, 1, 14))  # Sunday
+
+    def test_year_end_holidays(self):
+        assert not is_default_trading_day(date(2024, 12, 31))  # Tuesday
+        assert not is_default_trading_day(date(2025, 1, 2))  # Thursday
+        assert not is_default_trading_day(date(2025, 1, 3))  # Friday
+        assert is_default_trading_day(date(2025, 1, 6))  # Monday
+
+
+class TestTradingCalendar:
+    """Test cases for TradingCalendar."""
+
+    def test_known_days_take_precedence(self):
+        calendar = TradingCalendar.from_days(
+            trading_days=[date(2024, 1, 4)],
+            non_trading_days=[date(2024, 1, 8)],  # Coming of Age Day (Monday)
+        )
+        assert calendar.is_trading_day(date(2024, 1, 4))
+        assert not calendar.is_trading_day(date(2024, 1, 8))
+        assert calendar.is_known(date(2024, 1, 8))
+
+    def test_unknown_days_fall_back_to_weekday_rule(self):
+        calendar = TradingCalendar()
+        assert not calendar.is_known(date(2024, 1, 9))
+        assert calendar.is_trading_day(date(2024, 1, 9))
+        assert not calendar.is_trading_day(date(2024, 1, 13))
+
+    def test_overlapping_days_rejected(self):
+        with pytest.raises(ValueError, match="both trading and non-trading"):
+            TradingCalendar.from_days([date(2024, 1, 4)], [date(2024, 1, 4)])
+
+    def test_merge(self):
+        first = TradingCalendar.from_days([date(2023, 12, 29)], [date(2023, 12, 31)])
+        second = TradingCalendar.from_days([date(2024, 1, 4)], [date(2024, 1, 1)])
+        merged = first.merge(second)
+        assert merged.trading_days == {date(2023, 12, 29), date(2024, 1, 4)}
+        assert merged.non_trading_days == {date(2023, 12, 31), date(2024, 1, 1)}
+
+
+class TestTimePeriodTradingDays:
+    """Test cases for TimePeriod day iteration."""
+
+    def test_iter_days(self):
+        period = TimePeriod(date(2024, 1, 30), date(2024, 2, 2))
+        assert list(period.iter_days()) == [
+            date(2024, 1, 30), date(2024, 1, 31), date(2024, 2, 1), date(2024, 2, 2)
+        ]
+
+    def test_iter_trading_days_without_calendar(self):
+        period = TimePeriod(date(2024, 1, 1), date(2024, 1, 9))
+        assert list(period.iter_trading_days()) == [
+            date(2024, 1, 4), date(2024, 1, 5), date(2024, 1, 8), date(2024, 1, 9)
+        ]
+
+    def test_iter_trading_days_with_calendar(self):
+        calendar = TradingCalendar.from_days(
+            trading_days=[date(2024, 1, 4), date(2024, 1, 5), date(2024, 1, 9)],
+            non_trading_days=[date(2024, 1, 6), date(2024, 1, 7), date(2024, 1, 8)],
+        )
+        period = TimePeriod(date(2024, 1, 4), date(2024, 1, 9))
+        assert list(period.iter_trading_days(calendar)) == [
+            date(2024, 1, 4), date(2024, 1, 5), date(2024, 1, 9)
+        ]
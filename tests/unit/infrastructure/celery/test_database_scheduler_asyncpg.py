@@ -0,0 +1,417 @@
+"""DatabaseSchedulerAsyncPG のテスト"""
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from celery.beat import Scheduler
+
+from app.infrastructure.celery.app import celery_app
+from app.infrastructure.celery.schedulers import database_scheduler_asyncpg as scheduler_module
+from app.infrastructure.celery.schedulers.database_scheduler_asyncpg import (
+    SYNC_OVERLAP,
+    TOMBSTONE_RETENTION,
+    DatabaseSchedulerAsyncPG,
+)
+from app.infrastructure.database.models.schedule import CeleryBeatSchedule
+
+BASE_TIME = datetime(2024, 1, 4, 9, 0, tzinfo=timezone.utc)
+
+
+def _model(name: str, minutes: int = 0, schedule_id=None, enabled: bool = True,
+           cron_expression: str = "0 9 * * *") -> CeleryBeatSchedule:
+    return CeleryBeatSchedule(
+        id=schedule_id or uuid4(),
+        name=name,
+        task_name="fetch_listed_info_task",
+        cron_expression=cron_expression,
+        enabled=enabled,
+        args=[],
+        kwargs={},
+        updated_at=BASE_TIME + timedelta(minutes=minutes),
+        last_run_at=None,
+    )
+
+
+@pytest.fixture
+def scheduler():
+    with patch.object(scheduler_module.settings, "celery_beat_redis_sync_enabled", False):
+        scheduler = DatabaseSchedulerAsyncPG(app=celery_app, lazy=True)
+    scheduler._load_schedules_from_db = AsyncMock(return_value=[])
+    scheduler._load_changes_from_db = AsyncMock(return_value=([], []))
+    scheduler._prune_tombstones_async = AsyncMock(return_value=0)
+    yield scheduler
+    with patch.object(scheduler_module, "dispose_engine", AsyncMock()):
+        scheduler.close()
+
+
+def _full_sync(scheduler, models):
+    scheduler._load_schedules_from_db.return_value = models
+    scheduler.sync_schedules()
+
+
+def _delta_sync(scheduler, models, tombstones=()):
+    scheduler._load_changes_from_db.return_value = (models, list(tombstones))
+    scheduler.sync_schedules()
+
+
+class TestIncrementalSync:
+    """updated_at の基準時刻と墓標による差分同期のテスト"""
+
+    def test_first_sync_loads_all_enabled_schedules(self, scheduler):
+        _full_sync(scheduler, [_model("a"), _model("b", minutes=5)])
+
+        assert set(scheduler.schedule) == {"a", "b"}
+        assert scheduler._watermark == BASE_TIME + timedelta(minutes=5)
+        scheduler._load_changes_from_db.assert_not_called()
+
+    def test_delta_sync_reads_past_watermark_with_overlap(self, scheduler):
+        _full_sync(scheduler, [_model("a", minutes=5)])
+
+        _delta_sync(scheduler, [])
+
+        scheduler._load_changes_from_db.assert_awaited_once_with(
+            BASE_TIME + timedelta(minutes=5) - SYNC_OVERLAP
+        )
+
+    def test_unchanged_entries_keep_in_memory_state(self, scheduler):
+        """変更されていないエントリは作り直さない"""
+        a, b = _model("a"), _model("b")
+        _full_sync(scheduler, [a, b])
+        entry_a = scheduler.schedule["a"]
+        entry_b = scheduler.schedule["b"]
+
+        changed_b = _model("b", minutes=1, schedule_id=b.id, cron_expression="30 9 * * *")
+        # 重複期間の再読み込みで同じ版の a も返ってくる
+        _delta_sync(scheduler, [a, changed_b])
+
+        assert scheduler.schedule["a"] is entry_a
+        assert scheduler.schedule["b"] is not entry_b
+        assert scheduler.schedule["b"].model.cron_expression == "30 9 * * *"
+        assert scheduler._watermark == BASE_TIME + timedelta(minutes=1)
+
+    def test_new_schedule_is_added(self, scheduler):
+        _full_sync(scheduler, [_model("a")])
+
+        _delta_sync(scheduler, [_model("b", minutes=1)])
+
+        assert set(scheduler.schedule) == {"a", "b"}
+
+    def test_disabled_schedule_is_removed(self, scheduler):
+        a = _model("a")
+        _full_sync(scheduler, [a, _model("b")])
+
+        _delta_sync(scheduler, [_model("a", minutes=1, schedule_id=a.id, enabled=False)])
+
+        assert set(scheduler.schedule) == {"b"}
+
+    def test_tombstone_removes_entry(self, scheduler):
+        a = _model("a")
+        _full_sync(scheduler, [a, _model("b")])
+
+        _delta_sync(scheduler, [], tombstones=[(a.id, BASE_TIME + timedelta(minutes=2))])
+
+        assert set(scheduler.schedule) == {"b"}
+        assert scheduler._watermark == BASE_TIME + timedelta(minutes=2)
+
+    def test_renamed_schedule_replaces_old_entry(self, scheduler):
+        a = _model("a")
+        _full_sync(scheduler, [a])
+
+        _delta_sync(scheduler, [_model("renamed", minutes=1, schedule_id=a.id)])
+
+        assert set(scheduler.schedule) == {"renamed"}
+
+    def test_full_sync_removes_missing_schedules(self, scheduler):
+        a = _model("a")
+        _full_sync(scheduler, [a, _model("b")])
+        entry_a = scheduler.schedule["a"]
+
+        scheduler._load_schedules_from_db.return_value = [a]
+        scheduler.sync_schedules(full=True)
+
+        assert set(scheduler.schedule) == {"a"}
+        assert scheduler.schedule["a"] is entry_a
+
+    def test_periodic_full_sync_prunes_tombstones(self, scheduler):
+        _full_sync(scheduler, [_model("a")])
+        scheduler._prune_tombstones_async.assert_awaited_once_with(TOMBSTONE_RETENTION)
+
+        _delta_sync(scheduler, [])
+        assert scheduler._load_schedules_from_db.await_count == 1
+
+        scheduler._last_full_sync_time -= scheduler_module.settings.celery_beat_full_sync_interval
+        scheduler.sync_schedules()
+
+        assert scheduler._load_schedules_from_db.await_count == 2
+        assert scheduler._prune_tombstones_async.await_count == 2
+
+    def test_load_schedules_from_db(self, scheduler):
+        """全件読み込みは有効なスケジュールを返す"""
+        models = [_model("a")]
+        session = MagicMock()
+        session.execute = AsyncMock(
+            return_value=MagicMock(scalars=MagicMock(return_value=MagicMock(all=lambda: models)))
+        )
+
+        @asynccontextmanager
+        async def _session_context():
+            yield session
+
+        with patch.object(scheduler_module, "get_async_session_context", _session_context):
+            loaded = scheduler._run_db(DatabaseSchedulerAsyncPG._load_schedules_from_db(scheduler))
+
+        assert loaded == models
+        assert "enabled" in str(session.execute.await_args.args[0])
+
+    def test_failed_prune_does_not_fail_sync(self, scheduler):
+        scheduler._prune_tombstones_async.side_effect = RuntimeError("connection lost")
+
+        _full_sync(scheduler, [_model("a")])
+
+        assert set(scheduler.schedule) == {"a"}
+
+    def test_failed_delta_sync_keeps_schedule(self, scheduler):
+        _full_sync(scheduler, [_model("a")])
+        scheduler._load_changes_from_db.side_effect = RuntimeError("connection lost")
+
+        scheduler.sync_schedules()
+
+        assert set(scheduler.schedule) == {"a"}
+        assert scheduler._watermark == BASE_TIME
+
+
+class TestDatabaseEventLoop:
+    """データベース処理用のイベントループスレッドのテスト"""
+
+    def test_database_work_shares_one_loop(self, scheduler):
+        """同期と last_run_at の更新は同じループ（同じ接続プール）で実行される"""
+        loops = []
+
+        async def _load():
+            loops.append(asyncio.get_running_loop())
+            return [_model("a")]
+
+        async def _write(pending):
+            loops.append(asyncio.get_running_loop())
+
+        scheduler._load_schedules_from_db = _load
+        scheduler._write_last_run_at_async = _write
+
+        scheduler.sync_schedules()
+        scheduler._buffer_last_run_at(scheduler.schedule["a"])
+        scheduler.sync()
+        scheduler.sync_schedules(full=True)
+
+        assert loops == [scheduler._event_loop] * 3
+        assert scheduler._event_loop_thread.is_alive()
+
+    def test_close_disposes_engine_and_stops_thread(self, scheduler):
+        dispose = AsyncMock()
+
+        with patch.object(scheduler_module, "dispose_engine", dispose):
+            scheduler.close()
+
+        dispose.assert_awaited_once()
+        assert not scheduler._event_loop_thread.is_alive()
+        assert scheduler._event_loop.is_closed()
+
+
+class TestWriteBehindLastRunAt:
+    """last_run_at の書き込みをまとめるバッファのテスト"""
+
+    @pytest.fixture
+    def writes(self, scheduler):
+        writes = []
+
+        async def _write(pending):
+            writes.append(dict(pending))
+
+        scheduler._write_last_run_at_async = _write
+        return writes
+
+    def test_apply_entry_buffers_instead_of_writing(self, scheduler, writes):
+        a = _model("a")
+        _full_sync(scheduler, [a])
+        entry = scheduler.schedule["a"]
+        before = entry.last_run_at
+
+        with patch.object(Scheduler, "apply_entry"):
+            scheduler.apply_entry(entry)
+            scheduler.apply_entry(entry)
+
+        assert entry.last_run_at > before
+        assert entry.total_run_count == 2
+        assert scheduler._pending_last_run == {a.id: entry.last_run_at}
+        assert writes == []
+
+    def test_flush_writes_all_pending_runs_at_once(self, scheduler, writes):
+        a, b = _model("a"), _model("b")
+        _full_sync(scheduler, [a, b])
+        for entry in scheduler.schedule.values():
+            scheduler._buffer_last_run_at(entry)
+
+        scheduler.sync()
+
+        assert writes == [{
+            a.id: scheduler.schedule["a"].last_run_at,
+            b.id: scheduler.schedule["b"].last_run_at,
+        }]
+        assert scheduler._pending_last_run == {}
+
+    def test_tick_flushes_after_interval(self, scheduler, writes):
+        _full_sync(scheduler, [_model("a")])
+        scheduler._buffer_last_run_at(scheduler.schedule["a"])
+
+        with patch.object(scheduler_module.settings, "celery_beat_last_run_flush_interval", 3600.0):
+            interval = scheduler.tick()
+        assert scheduler._pending_last_run
+        assert interval <= 3600.0
+
+        with patch.object(scheduler_module.settings, "celery_beat_last_run_flush_interval", 0.0):
+            scheduler.tick()
+        # バックグラウンドでの書き込みの完了を待つ
+        asyncio.run_coroutine_threadsafe(asyncio.sleep(0), scheduler._event_loop).result(5)
+
+        assert len(writes) == 1
+        assert scheduler._pending_last_run == {}
+
+    def test_failed_flush_is_requeued(self, scheduler):
+        a = _model("a")
+        _full_sync(scheduler, [a])
+        scheduler._buffer_last_run_at(scheduler.schedule["a"])
+        scheduler._write_last_run_at_async = AsyncMock(side_effect=RuntimeError("connection lost"))
+
+        scheduler.sync()
+
+        assert scheduler._pending_last_run == {a.id: scheduler.schedule["a"].last_run_at}
+
+    def test_close_flushes_pending_runs(self, scheduler, writes):
+        _full_sync(scheduler, [_model("a")])
+        scheduler._buffer_last_run_at(scheduler.schedule["a"])
+
+        with patch.object(scheduler_module, "dispose_engine", AsyncMock()):
+            scheduler.close()
+
+        assert len(writes) == 1
+
+    def test_rebuilt_entry_keeps_newer_run(self, scheduler, writes):
+        """データベースへの書き込み前に作り直されても last_run_at を戻さない"""
+        a = _model("a")
+        a.last_run_at = BASE_TIME
+        _full_sync(scheduler, [a])
+        entry = scheduler.schedule["a"]
+        with patch.object(Scheduler, "apply_entry"):
+            scheduler.apply_entry(entry)
+
+        changed = _model("a", minutes=1, schedule_id=a.id, cron_expression="30 9 * * *")
+        changed.last_run_at = BASE_TIME
+        _delta_sync(scheduler, [changed])
+
+        assert scheduler.schedule["a"] is not entry
+        assert scheduler.schedule["a"].last_run_at == entry.last_run_at
+
+    def test_rebuilt_entry_keeps_unflushed_first_run(self, scheduler, writes):
+        """初回の実行がデータベースに書き込まれる前（NULL）でも last_run_at を戻さない"""
+        a = _model("a")
+        _full_sync(scheduler, [a])
+        entry = scheduler.schedule["a"]
+        with patch.object(Scheduler, "apply_entry"):
+            scheduler.apply_entry(entry)
+
+        changed = _model("a", minutes=1, schedule_id=a.id, cron_expression="30 9 * * *")
+        _delta_sync(scheduler, [changed])
+
+        assert scheduler.schedule["a"] is not entry
+        assert scheduler.schedule["a"].last_run_at == entry.last_run_at
+        assert scheduler.schedule["a"].total_run_count == 1
+
+
+class TestHeapTick:
+    """次回実行時刻のヒープによる tick のテスト"""
+
+    @pytest.fixture
+    def applied(self, scheduler):
+        applied = []
+        scheduler._write_last_run_at_async = AsyncMock()
+        with patch.object(Scheduler, "apply_entry", lambda self, entry, producer=None: applied.append(entry.name)):
+            yield applied
+
+    @staticmethod
+    def _due_model(name: str) -> CeleryBeatSchedule:
+        """毎分実行で、前回実行から時間が経っているスケジュール"""
+        model = _model(name, cron_expression="* * * * *")
+        model.last_run_at = datetime.now(timezone.utc) - timedelta(days=1)
+        return model
+
+    def test_only_due_entries_are_evaluated(self, scheduler, applied):
+        _full_sync(scheduler, [self._due_model("due")] + [_model(f"later-{i}") for i in range(20)])
+
+        with patch.object(
+            scheduler_module.DatabaseScheduleEntry, "is_due",
+            autospec=True, side_effect=scheduler_module.DatabaseScheduleEntry.is_due,
+        ) as is_due:
+            scheduler.tick()
+
+        assert applied == ["due"]
+        # 取り出した 1 件の判定と、実行後の再登録の判定だけが行われる
+        assert [call.args[0].name for call in is_due.call_args_list] == ["due", "due"]
+
+    def test_fired_entry_is_rescheduled(self, scheduler, applied):
+        _full_sync(scheduler, [self._due_model("due")])
+
+        interval = scheduler.tick()
+        scheduler.tick()
+
+        assert applied == ["due"]
+        assert 0 < interval <= 60
+        assert scheduler._due_heap[0][0] > time.time()
+
+    def test_changed_entry_replaces_heap_item(self, scheduler, applied):
+        """変更前のエントリのヒープ要素は読み飛ばす"""
+        a = self._due_model("a")
+        _full_sync(scheduler, [a])
+
+        renamed = self._due_model("b")
+        renamed.id = a.id
+        renamed.updated_at = BASE_TIME + timedelta(minutes=1)
+        _delta_sync(scheduler, [renamed])
+        scheduler.tick()
+
+        assert len(scheduler._due_heap) == 1
+        assert applied == ["b"]
+
+    def test_removed_entry_is_not_applied(self, scheduler, applied):
+        due = self._due_model("due")
+        _full_sync(scheduler, [due])
+
+        _delta_sync(scheduler, [], tombstones=[(due.id, BASE_TIME + timedelta(minutes=1))])
+        scheduler.tick()
+
+        assert applied == []
+
+    def test_heap_is_compacted(self, scheduler, applied):
+        a = _model("a")
+        _full_sync(scheduler, [a])
+
+        for minutes in range(1, 200):
+            _delta_sync(scheduler, [_model("a", minutes=minutes, schedule_id=a.id)])
+
+        assert len(scheduler._due_heap) <= 2 * len(scheduler.schedule) + 64
+
+
+class TestCronToCrontab:
+    """crontab への変換のキャッシュのテスト"""
+
+    def test_entries_share_parsed_crontab(self, scheduler):
+        _full_sync(scheduler, [_model("a"), _model("b")])
+
+        assert scheduler.schedule["a"].schedule is scheduler.schedule["b"].schedule
+
+    @pytest.mark.parametrize("expression", ["0 9 * *", "61 9 * * *"])
+    def test_invalid_expression(self, expression):
+        with pytest.raises(ValueError):
+            scheduler_module.cron_to_crontab(expression)
@@ -0,0 +1,553 @@
+"""fetch_listed_info_task の日付並行処理のテスト"""
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from celery.exceptions import SoftTimeLimitExceeded
+
+from app.application.dtos.jquants_listed_info_dto import FetchJQuantsListedInfoResult
+from app.application.use_cases.fetch_jquants_listed_info import SnapshotProgress
+from app.domain.entities.backfill_checkpoint import BackfillCheckpoint
+from app.infrastructure.celery.tasks import jquants_listed_info_task as task_module
+
+TASK_MODULE = "app.infrastructure.celery.tasks.jquants_listed_info_task"
+USE_CASE = "app.application.use_cases.fetch_jquants_listed_info.FetchJQuantsListedInfoUseCase"
+
+
+class _FakeUseCase:
+    """日付ごとの処理時間と同時実行数を記録するユースケース"""
+
+    active = 0
+    max_active = 0
+    failing_dates: set = set()
+    calls: list = []
+    raise_on: dict = {}
+    published: list = []
+    resume_progress: list = []
+
+    def __init__(
+        self, jquants_client, listed_info_repository, logger, snapshot_repository=None,
+        row_fast_path=False, detect_changes=True,
+    ):
+        self.detect_changes = detect_changes
+
+    async def fetch_and_update_all(
+        self, target_date=None, resume_pagination_key=None, on_checkpoint=None,
+        resume_progress=None,
+    ):
+        cls = type(self)
+        cls.calls.append((target_date, resume_pagination_key))
+        cls.resume_progress.append(resume_progress)
+        if target_date in cls.raise_on:
+            raise cls.raise_on[target_date]
+        if on_checkpoint is not None:
+            await on_checkpoint(
+                "next-key", 4, SnapshotProgress(listed_codes={"7203"}, digest_state=b"state")
+            )
+        cls.active += 1
+        cls.max_active = max(cls.max_active, cls.active)
+        try:
+            await asyncio.sleep(0.02)
+        finally:
+            cls.active -= 1
+        if target_date in cls.failing_dates:
+            return FetchJQuantsListedInfoResult(
+                success=False, fetched_count=0, saved_count=0, error_message="API error"
+            )
+        return FetchJQuantsListedInfoResult(success=True, fetched_count=10, saved_count=10)
+
+    async def fetch_by_code(self, code, target_date=None):
+        return FetchJQuantsListedInfoResult(success=True, fetched_count=1, saved_count=1)
+
+    async def publish_events(self, result):
+        type(self).published.append((result, self.detect_changes))
+
+
+@pytest.fixture
+def sessions():
+    """日付ごとに作成されたセッションを記録する"""
+    created = []
+
+    @asynccontextmanager
+    async def session_context():
+        session = AsyncMock(name=f"session-{len(created)}")
+        created.append(session)
+        yield session
+
+    with patch(f"{TASK_MODULE}.get_async_session_context", session_context):
+        yield created
+
+
+@pytest.fixture(autouse=True)
+def fake_use_case():
+    """ユースケースを差し替える"""
+    _FakeUseCase.active = 0
+    _FakeUseCase.max_active = 0
+    _FakeUseCase.failing_dates = set()
+    _FakeUseCase.calls = []
+    _FakeUseCase.raise_on = {}
+    _FakeUseCase.published = []
+    _FakeUseCase.resume_progress = []
+    with patch(USE_CASE, _FakeUseCase):
+        yield _FakeUseCase
+
+
+class TestProcessDates:
+    """_process_dates のテスト"""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, sessions, fake_use_case):
+        """同時に処理される日付数が上限を超えない"""
+        dates = [date(2024, 1, d) for d in range(1, 11)]
+
+        results = await task_module._process_dates(MagicMock(), dates, None, 3)
+
+        assert fake_use_case.max_active == 3
+        assert [r.target_date for r in results] == dates
+        assert sum(r.saved_count for r in results) == 100
+
+    @pytest.mark.asyncio
+    async def test_history_storage_processes_dates_in_ascending_order(
+        self, sessions, fake_use_case, monkeypatch
+    ):
+        """履歴方式では日付の昇順に 1 件ずつ処理し、結果は指定順で返す"""
+        from app.infrastructure.config.settings import get_infrastructure_settings
+
+        monkeypatch.setattr(get_infrastructure_settings().database, "listed_info_storage", "history")
+        monkeypatch.setattr(get_infrastructure_settings().redis, "listed_info_cache_ttl", 0)
+        dates = [date(2024, 1, d) for d in (5, 4, 3, 2, 1)]
+
+        results = await task_module._process_dates(MagicMock(), dates, None, 4)
+
+        assert fake_use_case.max_active == 1
+        assert [call[0] for call in fake_use_case.calls] == sorted(dates)
+        assert [r.target_date for r in results] == dates
+
+    @pytest.mark.asyncio
+    async def test_events_are_published_after_commit(self, fake_use_case):
+        """イベントは日付のセッションを抜けた（コミットした）後に発行する"""
+        order = []
+
+        @asynccontextmanager
+        async def session_context():
+            yield AsyncMock()
+            order.append("commit")
+
+        original = _FakeUseCase.publish_events
+
+        async def publish_events(self, result):
+            order.append("publish")
+            await original(self, result)
+
+        with patch(f"{TASK_MODULE}.get_async_session_context", session_context), \
+                patch.object(_FakeUseCase, "publish_events", publish_events):
+            await task_module._process_dates(
+                MagicMock(), [date(2024, 1, 1)], None, 1, detect_changes=True
+            )
+
+        assert order == ["commit", "publish"]
+        assert [detect for _, detect in fake_use_case.published] == [True]
+
+    @pytest.mark.asyncio
+    async def test_change_detection_is_disabled_by_default(self, sessions, fake_use_case):
+        """複数日付の処理（バックフィル）では変更イベントを検出しない"""
+        await task_module._process_dates(MagicMock(), [date(2024, 1, 1), date(2024, 1, 2)], None, 2)
+
+        assert [detect for _, detect in fake_use_case.published] == [False, False]
+
+    @pytest.mark.asyncio
+    async def test_each_date_uses_own_session(self, sessions):
+        """日付ごとに専用のセッションが使用される"""
+        dates = [date(2024, 1, d) for d in range(1, 5)]
+
+        await task_module._process_dates(MagicMock(), dates, None, 4)
+
+        assert len(sessions) == 4
+        assert len({id(s) for s in sessions}) == 4
+
+    @pytest.mark.asyncio
+    async def test_failed_date_does_not_stop_others(self, sessions, fake_use_case):
+        """1 日付の失敗はエラーとして集計され、他の日付は処理される"""
+        dates = [date(2024, 1, d) for d in range(1, 4)]
+        fake_use_case.failing_dates = {date(2024, 1, 2)}
+
+        results = await task_module._process_dates(MagicMock(), dates, None, 2)
+
+        assert [r.saved_count for r in results] == [10, 0, 10]
+        assert results[1].errors == ["Date 2024-01-02: API error"]
+
+    @pytest.mark.asyncio
+    async def test_session_error_recorded_per_date(self, fake_use_case):
+        """セッションのエラーはその日付のエラーとして記録される"""
+
+        @asynccontextmanager
+        async def broken_session():
+            raise RuntimeError("connection refused")
+            yield
+
+        with patch(f"{TASK_MODULE}.get_async_session_context", broken_session):
+            results = await task_module._process_dates(
+                MagicMock(), [date(2024, 1, 1)], None, 1
+            )
+
+        assert results[0].errors == ["Date 2024-01-01: connection refused"]
+
+    @pytest.mark.asyncio
+    async def test_codes_processed_per_date(self, sessions):
+        """銘柄コード指定時は日付ごとに各銘柄を処理する"""
+        dates = [date(2024, 1, 1), date(2024, 1, 2)]
+
+        results = await task_module._process_dates(MagicMock(), dates, ["7203", "6758"], 2)
+
+        assert [r.saved_count for r in results] == [2, 2]
+
+    def test_date_result_to_dict(self):
+        """タスクログ用の辞書に変換できる"""
+        result = task_module._DateFetchResult(
+            target_date=date(2024, 1, 1), fetched_count=5, saved_count=4, elapsed_seconds=1.23456
+        )
+        result.add_save_counts(
+            FetchJQuantsListedInfoResult(
+                success=True, fetched_count=5, saved_count=4,
+                inserted_count=1, updated_count=1, unchanged_count=2,
+            )
+        )
+
+        assert result.to_dict() == {
+            "date": "2024-01-01",
+            "fetched": 5,
+            "saved": 4,
+            "inserted": 1,
+            "updated": 1,
+            "unchanged": 2,
+            "errors": [],
+            "elapsed_seconds": 1.235,
+            "skipped": False,
+            "resumed": False,
+            "snapshot_unchanged": False,
+        }
+
+
+class _FakeCheckpointRepository:
+    """メモリ上にチェックポイントを保持するリポジトリ"""
+
+    store: dict = {}
+    progress: list = []
+
+    def __init__(self, session):
+        self.session = session
+
+    async def get_by_task_id(self, task_id):
+        return {c.target_date: c for c in self.store.values() if c.task_id == task_id}
+
+    async def save_progress(
+        self, task_id, target_date, pagination_key, fetched_count, saved_count,
+        listed_codes=None, digest_state=None,
+    ):
+        type(self).progress.append((target_date, pagination_key, saved_count))
+        self.store[(task_id, target_date)] = BackfillCheckpoint(
+            task_id=task_id,
+            target_date=target_date,
+            pagination_key=pagination_key,
+            fetched_count=fetched_count,
+            saved_count=saved_count,
+            listed_codes=sorted(listed_codes) if listed_codes is not None else None,
+            digest_state=digest_state,
+        )
+
+    async def mark_completed(self, task_id, target_date, fetched_count, saved_count):
+        self.store[(task_id, target_date)] = BackfillCheckpoint(
+            task_id=task_id,
+            target_date=target_date,
+            completed=True,
+            fetched_count=fetched_count,
+            saved_count=saved_count,
+        )
+
+    async def delete_by_task_id(self, task_id):
+        keys = [k for k in self.store if k[0] == task_id]
+        for key in keys:
+            del self.store[key]
+        return len(keys)
+
+
+@pytest.fixture
+def checkpoints():
+    """チェックポイントリポジトリを差し替える"""
+    _FakeCheckpointRepository.store = {}
+    _FakeCheckpointRepository.progress = []
+    with patch(f"{TASK_MODULE}.BackfillCheckpointRepository", _FakeCheckpointRepository):
+        yield _FakeCheckpointRepository
+
+
+class TestCheckpointedProcessDates:
+    """チェックポイントからの再開のテスト"""
+
+    @pytest.mark.asyncio
+    async def test_completed_dates_are_skipped(self, sessions, checkpoints, fake_use_case):
+        """前回完了した日付は API を呼ばずに結果を引き継ぐ"""
+        checkpoints.store[("task-1", date(2024, 1, 1))] = BackfillCheckpoint(
+            task_id="task-1", target_date=date(2024, 1, 1), completed=True,
+            fetched_count=7, saved_count=7,
+        )
+        dates = [date(2024, 1, 1), date(2024, 1, 2)]
+
+        results = await task_module._process_dates(
+            MagicMock(), dates, None, 2, checkpoint_task_id="task-1"
+        )
+
+        assert [c[0] for c in fake_use_case.calls] == [date(2024, 1, 2)]
+        assert results[0].skipped is True
+        assert results[0].saved_count == 7
+        assert results[1].skipped is False
+
+    @pytest.mark.asyncio
+    async def test_resume_from_pagination_key(self, sessions, checkpoints, fake_use_case):
+        """途中まで保存済みの日付は保存済みページの次から再開する"""
+        checkpoints.store[("task-1", date(2024, 1, 1))] = BackfillCheckpoint(
+            task_id="task-1", target_date=date(2024, 1, 1),
+            pagination_key="saved-key", fetched_count=5, saved_count=5,
+        )
+
+        results = await task_module._process_dates(
+            MagicMock(), [date(2024, 1, 1)], None, 1, checkpoint_task_id="task-1"
+        )
+
+        assert fake_use_case.calls == [(date(2024, 1, 1), "saved-key")]
+        assert results[0].resumed is True
+        # 前回分 5 件 + 今回分 10 件
+        assert results[0].saved_count == 15
+        # 途中経過を記録していないチェックポイントではスナップショットを確定しない
+        assert fake_use_case.resume_progress == [None]
+
+    @pytest.mark.asyncio
+    async def test_resume_passes_snapshot_progress(self, sessions, checkpoints, fake_use_case):
+        """保存済みページまでの銘柄とダイジェストの途中経過を記録し、再開時に引き継ぐ"""
+        fake_use_case.failing_dates = {date(2024, 1, 1)}
+        await task_module._process_dates(
+            MagicMock(), [date(2024, 1, 1)], None, 1, checkpoint_task_id="task-1"
+        )
+        checkpoint = checkpoints.store[("task-1", date(2024, 1, 1))]
+        assert checkpoint.listed_codes == ["7203"]
+        assert checkpoint.digest_state == b"state"
+
+        fake_use_case.failing_dates = set()
+        await task_module._process_dates(
+            MagicMock(), [date(2024, 1, 1)], None, 1, checkpoint_task_id="task-1"
+        )
+
+        assert fake_use_case.resume_progress[-1] == SnapshotProgress(
+            listed_codes={"7203"}, digest_state=b"state"
+        )
+
+    @pytest.mark.asyncio
+    async def test_progress_committed_and_completion_recorded(
+        self, sessions, checkpoints, fake_use_case
+    ):
+        """ページの保存ごとに進捗をコミットし、成功した日付は完了として記録する"""
+        fake_use_case.failing_dates = {date(2024, 1, 2)}
+        dates = [date(2024, 1, 1), date(2024, 1, 2)]
+
+        await task_module._process_dates(
+            MagicMock(), dates, None, 1, checkpoint_task_id="task-1"
+        )
+
+        assert (date(2024, 1, 1), "next-key", 4) in checkpoints.progress
+        assert sessions[1].commit.await_count >= 1
+        assert checkpoints.store[("task-1", date(2024, 1, 1))].completed is True
+        # 失敗した日付は完了扱いにせず、保存済みのページから再開できるようにする
+        failed = checkpoints.store[("task-1", date(2024, 1, 2))]
+        assert failed.completed is False
+        assert failed.pagination_key == "next-key"
+
+    @pytest.mark.asyncio
+    async def test_history_lock_is_held_across_checkpoint_commits(
+        self, sessions, checkpoints, fake_use_case, monkeypatch
+    ):
+        """履歴方式では日付の途中のコミットをまたいで書き込みのロックを保持する"""
+        from app.infrastructure.config.settings import get_infrastructure_settings
+
+        monkeypatch.setattr(get_infrastructure_settings().database, "listed_info_storage", "history")
+        monkeypatch.setattr(get_infrastructure_settings().redis, "listed_info_cache_ttl", 0)
+        order = []
+        connection = AsyncMock(name="connection")
+        engine = MagicMock()
+        engine.connect.return_value.__aenter__.return_value = connection
+        date_session = AsyncMock(name="date-session")
+        date_session.commit.side_effect = lambda: order.append("commit")
+        session_factory = MagicMock()
+        session_factory.return_value.__aenter__.return_value = date_session
+        history_module = (
+            "app.infrastructure.repositories.database.jquants_listed_info_history_repository"
+        )
+
+        with patch("app.infrastructure.database.connection.get_engine", return_value=engine), \
+                patch("sqlalchemy.ext.asyncio.AsyncSession", session_factory), \
+                patch(f"{history_module}.lock_history_writes",
+                      AsyncMock(side_effect=lambda c: order.append("lock"))) as lock, \
+                patch(f"{history_module}.unlock_history_writes",
+                      AsyncMock(side_effect=lambda c: order.append("unlock"))) as unlock:
+            await task_module._process_dates(
+                MagicMock(), [date(2024, 1, 1)], None, 1, checkpoint_task_id="task-1"
+            )
+
+        lock.assert_awaited_once_with(connection)
+        unlock.assert_awaited_once_with(connection)
+        assert session_factory.call_args.kwargs["bind"] is connection
+        # チェックポイントと最後のコミットはロックを保持したまま行う
+        assert order[0] == "lock" and order[-1] == "unlock"
+        assert order.count("commit") >= 2
+        assert checkpoints.store[("task-1", date(2024, 1, 1))].completed is True
+
+    @pytest.mark.asyncio
+    async def test_soft_time_limit_aborts_and_keeps_checkpoints(
+        self, sessions, checkpoints, fake_use_case
+    ):
+        """時間制限は日付単位のエラーにせず中断し、チェックポイントを残す"""
+        fake_use_case.raise_on = {date(2024, 1, 2): SoftTimeLimitExceeded()}
+        dates = [date(2024, 1, 1), date(2024, 1, 2), date(2024, 1, 3)]
+
+        with pytest.raises(SoftTimeLimitExceeded):
+            await task_module._process_dates(
+                MagicMock(), dates, None, 1, checkpoint_task_id="task-1"
+            )
+
+        assert checkpoints.store[("task-1", date(2024, 1, 1))].completed is True
+        # 中断された日付は完了扱いにならない
+        for target_date in (date(2024, 1, 2), date(2024, 1, 3)):
+            checkpoint = checkpoints.store.get(("task-1", target_date))
+            assert checkpoint is None or checkpoint.completed is False
+
+    @pytest.mark.asyncio
+    async def test_without_task_id_no_checkpoint(self, sessions, checkpoints, fake_use_case):
+        """task_id を指定しない場合はチェックポイントを使用しない"""
+        await task_module._process_dates(MagicMock(), [date(2024, 1, 1)], None, 1)
+
+        assert checkpoints.store == {}
+        assert checkpoints.progress == []
+
+    @pytest.mark.asyncio
+    async def test_clear_checkpoints(self, sessions, checkpoints):
+        """正常終了後にチェックポイントを削除する"""
+        checkpoints.store[("task-1", date(2024, 1, 1))] = BackfillCheckpoint(
+            task_id="task-1", target_date=date(2024, 1, 1), completed=True
+        )
+
+        await task_module._clear_checkpoints("task-1")
+
+        assert checkpoints.store == {}
+
+
+class TestFilterTradingDays:
+    """_filter_trading_days のテスト"""
+
+    CACHE = "app.infrastructure.external_services.jquants.trading_calendar_cache.get_trading_calendar_cache"
+
+    @pytest.mark.asyncio
+    async def test_non_trading_days_removed_in_order(self):
+        """非営業日を除外し、元の順序を維持する"""
+        from app.domain.value_objects.trading_calendar import TradingCalendar
+
+        cache = MagicMock()
+        cache.get_calendar = AsyncMock(
+            return_value=TradingCalendar.from_days(
+                [date(2024, 1, 5), date(2024, 1, 9)], [date(2024, 1, 8)]
+            )
+        )
+        dates = [date(2024, 1, 9), date(2024, 1, 8), date(2024, 1, 7), date(2024, 1, 6), date(2024, 1, 5)]
+
+        with patch(self.CACHE, return_value=cache):
+            result = await task_module._filter_trading_days(MagicMock(), dates)
+
+        assert result == [date(2024, 1, 9), date(2024, 1, 5)]
+        assert cache.get_calendar.call_args.args[:2] == (date(2024, 1, 5), date(2024, 1, 9))
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_setting(self, monkeypatch):
+        """設定で無効化した場合はカレンダーを参照しない"""
+        from app.infrastructure.config.settings import get_infrastructure_settings
+
+        monkeypatch.setattr(get_infrastructure_settings().jquants, "skip_non_trading_days", False)
+        dates = [date(2024, 1, 6), date(2024, 1, 7)]
+
+        with patch(self.CACHE) as get_cache:
+            result = await task_module._filter_trading_days(MagicMock(), dates)
+
+        assert result == dates
+        get_cache.assert_not_called()
+
+
+class TestFetchListedInfoAsync:
+    """タスク全体の結果とチェックポイントの扱いのテスト"""
+
+    @pytest.fixture
+    def task_env(self, sessions):
+        """日付の処理以外の依存関係を差し替える"""
+        base_client = AsyncMock()
+        task_log_repo = AsyncMock()
+        with patch(
+            "app.infrastructure.external_services.jquants.client_factory.create_authenticated_client",
+            AsyncMock(return_value=(base_client, MagicMock())),
+        ), patch(f"{TASK_MODULE}._filter_trading_days", AsyncMock(side_effect=lambda _, d: d)), \
+                patch(f"{TASK_MODULE}.TaskLogRepository", return_value=task_log_repo), \
+                patch(f"{TASK_MODULE}._process_dates") as process_dates, \
+                patch(f"{TASK_MODULE}._clear_checkpoints") as clear_checkpoints:
+            yield process_dates, clear_checkpoints, task_log_repo
+
+    @staticmethod
+    async def _run():
+        return await task_module._fetch_listed_info_async(
+            task_id="task-1", log_id=uuid4(), period_type="custom",
+            from_date="2024-01-01", to_date="2024-01-02",
+        )
+
+    @pytest.mark.asyncio
+    async def test_success_clears_checkpoints(self, task_env):
+        process_dates, clear_checkpoints, task_log_repo = task_env
+        process_dates.return_value = [
+            task_module._DateFetchResult(target_date=date(2024, 1, d), saved_count=10)
+            for d in (1, 2)
+        ]
+
+        result = await self._run()
+
+        assert result["total_saved"] == 20
+        clear_checkpoints.assert_awaited_once_with("task-1")
+        assert task_log_repo.update_status.await_args.kwargs["status"] == "success"
+
+    @pytest.mark.asyncio
+    async def test_failed_date_raises_for_retry_and_keeps_checkpoints(self, task_env):
+        """失敗した日付があれば例外で自動リトライさせ、チェックポイントを残す"""
+        process_dates, clear_checkpoints, task_log_repo = task_env
+        process_dates.return_value = [
+            task_module._DateFetchResult(target_date=date(2024, 1, 1), saved_count=10),
+            task_module._DateFetchResult(
+                target_date=date(2024, 1, 2), errors=["Date 2024-01-02: API error"]
+            ),
+        ]
+
+        with pytest.raises(task_module.ListedInfoDatesFailedError):
+            await self._run()
+
+        clear_checkpoints.assert_not_awaited()
+        (update,) = task_log_repo.update_status.await_args_list
+        assert update.kwargs["status"] == "failed"
+        assert update.kwargs["result"]["errors"] == ["Date 2024-01-02: API error"]
+
+    def test_final_failure_clears_checkpoints(self):
+        """リトライを使い切って失敗したらチェックポイントを削除する"""
+        loop = asyncio.new_event_loop()
+        try:
+            with patch(f"{TASK_MODULE}._clear_checkpoints", AsyncMock()) as clear_checkpoints, \
+                    patch(f"{TASK_MODULE}.get_or_create_event_loop", return_value=loop):
+                task_module.fetch_listed_info_task.on_failure(
+                    RuntimeError("boom"), "task-1", (), {}, None
+                )
+        finally:
+            loop.close()
+
+        clear_checkpoints.assert_awaited_once_with("task-1")
@@ -0,0 +1,288 @@
+"""バックフィルの group/chord タスクのテスト"""
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from celery.exceptions import Retry
+
+from app.domain.value_objects.time_period import TimePeriod
+from app.infrastructure.celery.tasks import listed_info_backfill_task as backfill_module
+from app.infrastructure.celery.tasks.jquants_listed_info_task import (
+    ListedInfoDatesFailedError,
+    _DateFetchResult,
+)
+
+MODULE = "app.infrastructure.celery.tasks.listed_info_backfill_task"
+
+
+class TestSplitPeriod:
+    """_split_period のテスト"""
+
+    def test_split_by_day(self):
+        """日単位に分割される"""
+        period = TimePeriod(date(2024, 1, 1), date(2024, 1, 3))
+
+        chunks = backfill_module._split_period(period, "day")
+
+        assert [c.start_date for c in chunks] == [
+            date(2024, 1, 1), date(2024, 1, 2), date(2024, 1, 3)
+        ]
+
+    def test_split_by_week(self):
+        """週単位に分割される"""
+        period = TimePeriod(date(2024, 1, 1), date(2024, 1, 20))
+
+        chunks = backfill_module._split_period(period, "week")
+
+        assert len(chunks) == 3
+        assert chunks[-1] == TimePeriod(date(2024, 1, 15), date(2024, 1, 20))
+
+    def test_invalid_chunk(self):
+        """不正な分割単位はエラー"""
+        period = TimePeriod(date(2024, 1, 1), date(2024, 1, 3))
+
+        with pytest.raises(ValueError, match="Invalid chunk"):
+            backfill_module._split_period(period, "year")
+
+
+class TestBackfillCoordinator:
+    """コーディネータータスクのテスト"""
+
+    def test_dispatches_chord_per_chunk(self):
+        """チャンクごとのサブタスクと集計コールバックを chord で投入する"""
+        chord_mock = MagicMock()
+        chord_mock.return_value.return_value.id = "chord-id"
+
+        with patch(f"{MODULE}._create_backfill_log", AsyncMock()) as create_log, \
+                patch(f"{MODULE}.chord", chord_mock):
+            result = backfill_module.backfill_listed_info_task.run(
+                from_date="2024-01-01", to_date="2024-01-14", chunk="week", codes=["7203"]
+            )
+
+        header = chord_mock.call_args.args[0]
+        subtasks = list(header.tasks)
+        assert [s.kwargs["from_date"] for s in subtasks] == ["2024-01-01", "2024-01-08"]
+        assert [s.kwargs["to_date"] for s in subtasks] == ["2024-01-07", "2024-01-14"]
+        assert all(s.kwargs["codes"] == ["7203"] for s in subtasks)
+
+        callback = chord_mock.return_value.call_args.args[0]
+        assert callback.task == "aggregate_listed_info_backfill_task"
+        assert callback.kwargs["log_id"] == result["log_id"]
+        (errback,) = callback.options["link_error"]
+        assert errback.task == "fail_listed_info_backfill_task"
+        assert errback.kwargs["log_id"] == result["log_id"]
+
+        create_log.assert_awaited_once()
+        assert create_log.call_args.kwargs["chunk_count"] == 2
+        assert result["subtasks"] == 2
+        assert result["chord_id"] == "chord-id"
+
+    def test_history_storage_chains_chunks_in_date_order(self):
+        """履歴方式ではチャンクを並行に実行せず、日付の昇順の chain で投入する"""
+        chain_mock = MagicMock()
+        chain_mock.return_value.apply_async.return_value.id = "chain-id"
+
+        with patch(f"{MODULE}._create_backfill_log", AsyncMock()), \
+                patch(f"{MODULE}._is_history_storage", return_value=True), \
+                patch(f"{MODULE}.chain", chain_mock), \
+                patch(f"{MODULE}.chord") as chord_mock:
+            result = backfill_module.backfill_listed_info_task.run(
+                from_date="2024-01-01", to_date="2024-01-02", chunk="day"
+            )
+
+        chord_mock.assert_not_called()
+        *links, callback = chain_mock.call_args.args
+        assert [s.task for s in links] == ["fetch_listed_info_chunk_in_order_task"] * 2
+        assert [s.kwargs["from_date"] for s in links] == ["2024-01-01", "2024-01-02"]
+        # 先頭のチャンクだけが空の結果を受け取り、以降は前のチャンクの結果を受け取る
+        assert links[0].args == ([],)
+        assert links[1].args == ()
+        for link in links:
+            (errback,) = link.options["link_error"]
+            assert errback.task == "fail_listed_info_backfill_task"
+            assert errback.kwargs["log_id"] == result["log_id"]
+        assert callback.task == "aggregate_listed_info_backfill_task"
+        assert result["chain_id"] == "chain-id"
+
+
+class TestChunkTask:
+    """チャンクサブタスクのテスト"""
+
+    @pytest.mark.asyncio
+    async def test_fetch_chunk_processes_each_date(self):
+        """チャンク内の各日付を処理して結果を返す"""
+        base_client = AsyncMock()
+        date_results = [
+            _DateFetchResult(target_date=date(2024, 1, 1), fetched_count=3, saved_count=3),
+            _DateFetchResult(
+                target_date=date(2024, 1, 2), errors=["Date 2024-01-02: API error"]
+            ),
+        ]
+
+        with patch(
+            "app.infrastructure.external_services.jquants.client_factory.create_authenticated_client",
+            AsyncMock(return_value=(base_client, MagicMock())),
+        ), patch(f"{MODULE}._process_dates", AsyncMock(return_value=date_results)) as process, \
+                patch(f"{MODULE}._filter_trading_days", AsyncMock(side_effect=lambda c, d: d)), \
+                patch(f"{MODULE}._clear_checkpoints", AsyncMock()) as clear:
+            result = await backfill_module._fetch_chunk_async(
+                TimePeriod(date(2024, 1, 1), date(2024, 1, 2)), None, 2, task_id="chunk-1"
+            )
+
+        assert process.call_args.args[1] == [date(2024, 1, 1), date(2024, 1, 2)]
+        assert process.call_args.kwargs["checkpoint_task_id"] == "chunk-1"
+        # 失敗した日付はリトライで再開するためチェックポイントを残す
+        clear.assert_not_awaited()
+        assert result["fetched"] == 3
+        assert result["saved"] == 3
+        assert result["errors"] == ["Date 2024-01-02: API error"]
+        assert len(result["date_results"]) == 2
+        base_client.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_fetch_chunk_success_clears_checkpoints(self):
+        """すべての日付が成功したらチェックポイントを削除する"""
+        date_results = [_DateFetchResult(target_date=date(2024, 1, 1), saved_count=3)]
+
+        with patch(
+            "app.infrastructure.external_services.jquants.client_factory.create_authenticated_client",
+            AsyncMock(return_value=(AsyncMock(), MagicMock())),
+        ), patch(f"{MODULE}._process_dates", AsyncMock(return_value=date_results)), \
+                patch(f"{MODULE}._filter_trading_days", AsyncMock(side_effect=lambda c, d: d)), \
+                patch(f"{MODULE}._clear_checkpoints", AsyncMock()) as clear:
+            result = await backfill_module._fetch_chunk_async(
+                TimePeriod(date(2024, 1, 1), date(2024, 1, 1)), None, 1, task_id="chunk-1"
+            )
+
+        assert result["errors"] == []
+        clear.assert_awaited_once_with("chunk-1")
+
+    def test_chunk_with_errors_is_retried(self):
+        """失敗した日付があればリトライする"""
+        chunk_result = {"errors": ["Date 2024-01-02: API error"]}
+        task = backfill_module.fetch_listed_info_chunk_task
+
+        with patch(f"{MODULE}._fetch_chunk_async", AsyncMock(return_value=chunk_result)), \
+                patch.object(task, "retry", side_effect=Retry()) as retry, \
+                patch(f"{MODULE}._clear_checkpoints", AsyncMock()) as clear:
+            with pytest.raises(Retry):
+                task.run(from_date="2024-01-01", to_date="2024-01-02")
+
+        assert isinstance(retry.call_args.kwargs["exc"], ListedInfoDatesFailedError)
+        clear.assert_not_awaited()
+
+    def test_chunk_errors_are_returned_on_last_attempt(self):
+        """リトライを使い切ったらエラーを結果として返し、チェックポイントを削除する"""
+        chunk_result = {"errors": ["Date 2024-01-02: API error"]}
+        task = backfill_module.fetch_listed_info_chunk_task
+        task.push_request(id="chunk-1", retries=task.max_retries)
+        try:
+            with patch(f"{MODULE}._fetch_chunk_async", AsyncMock(return_value=chunk_result)), \
+                    patch(f"{MODULE}._clear_checkpoints", AsyncMock()) as clear:
+                result = task.run(from_date="2024-01-01", to_date="2024-01-02")
+        finally:
+            task.pop_request()
+
+        assert result == chunk_result
+        clear.assert_awaited_once_with("chunk-1")
+
+    @pytest.mark.asyncio
+    async def test_fetch_chunk_returns_auth_error(self):
+        """認証エラーは例外ではなく結果のエラーとして返す"""
+        with patch(
+            "app.infrastructure.external_services.jquants.client_factory.create_authenticated_client",
+            AsyncMock(side_effect=RuntimeError("auth failed")),
+        ):
+            result = await backfill_module._fetch_chunk_async(
+                TimePeriod(date(2024, 1, 1), date(2024, 1, 1)), None, 1
+            )
+
+        assert result["errors"] == ["Chunk 2024-01-01: auth failed"]
+        assert result["saved"] == 0
+
+    def test_in_order_chunks_run_in_date_order(self):
+        """chain のチャンクは日付の昇順に処理され、結果が次のチャンクに引き継がれる"""
+        task = backfill_module.fetch_listed_info_chunk_in_order_task
+
+        def fetch(period, codes, max_concurrency, task_id=None):
+            return {"from_date": period.start_date.isoformat(), "errors": []}
+
+        with patch(f"{MODULE}._fetch_chunk_async", AsyncMock(side_effect=fetch)) as fetch_mock:
+            results = task.run([], from_date="2024-01-01", to_date="2024-01-01")
+            results = task.run(results, from_date="2024-01-02", to_date="2024-01-02")
+
+        assert [c.kwargs["period"].start_date for c in fetch_mock.call_args_list] == [
+            date(2024, 1, 1), date(2024, 1, 2)
+        ]
+        assert [r["from_date"] for r in results] == ["2024-01-01", "2024-01-02"]
+
+    def test_later_date_is_not_applied_after_failed_earlier_date(self):
+        """前の日付が失敗した場合、後の日付を先に履歴へ反映しない"""
+        task = backfill_module.fetch_listed_info_chunk_in_order_task
+        failed = {"from_date": "2024-01-01", "errors": ["Date 2024-01-01: API error"]}
+
+        with patch(f"{MODULE}._fetch_chunk_async", AsyncMock()) as fetch_mock:
+            results = task.run([failed], from_date="2024-01-02", to_date="2024-01-02")
+
+        fetch_mock.assert_not_awaited()
+        assert results[0] is failed
+        assert results[1]["from_date"] == "2024-01-02"
+        assert "earlier chunk failed" in results[1]["errors"][0]
+        assert backfill_module._aggregate_chunk_results(results)["status"] == "failed"
+
+
+class TestAggregateChunkResults:
+    """_aggregate_chunk_results のテスト"""
+
+    def test_aggregate(self):
+        """件数とエラーが日付順に集計される"""
+        chunk_results = [
+            {
+                "from_date": "2024-01-08",
+                "fetched": 5,
+                "saved": 5,
+                "errors": ["Date 2024-01-08: API error"],
+                "date_results": [{"date": "2024-01-08"}],
+            },
+            {
+                "from_date": "2024-01-01",
+                "fetched": 10,
+                "saved": 9,
+                "errors": [],
+                "date_results": [{"date": "2024-01-01"}, {"date": "2024-01-02"}],
+            },
+        ]
+
+        result = backfill_module._aggregate_chunk_results(chunk_results)
+
+        assert result["status"] == "failed"
+        assert result["total_fetched"] == 15
+        assert result["total_saved"] == 14
+        assert result["subtasks"] == 2
+        assert result["dates_processed"] == ["2024-01-01", "2024-01-02", "2024-01-08"]
+        assert result["errors"] == ["Date 2024-01-08: API error"]
+
+    def test_aggregate_success(self):
+        """エラーがなければ success"""
+        result = backfill_module._aggregate_chunk_results(
+            [{"from_date": "2024-01-01", "fetched": 1, "saved": 1, "errors": [], "date_results": []}]
+        )
+
+        assert result["status"] == "success"
+
+
+class TestBackfillErrback:
+    """chord のエラーコールバックのテスト"""
+
+    def test_marks_log_failed(self):
+        """サブタスクの失敗でタスクログを失敗として記録する"""
+        with patch(f"{MODULE}._finish_backfill_log", AsyncMock()) as finish:
+            backfill_module.fail_listed_info_backfill_task.run(
+                MagicMock(id="callback-id"), RuntimeError("soft time limit"), None,
+                log_id="00000000-0000-0000-0000-000000000001",
+            )
+
+        log_id, result_data = finish.call_args.args
+        assert str(log_id) == "00000000-0000-0000-0000-000000000001"
+        assert result_data["status"] == "failed"
+        assert "soft time limit" in result_data["errors"][0]
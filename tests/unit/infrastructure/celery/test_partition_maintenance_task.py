@@ -0,0 +1,61 @@
+"""パーティション保守タスクのテスト"""
+from contextlib import asynccontextmanager
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.infrastructure.celery.tasks import partition_maintenance_task as task_module
+from app.infrastructure.database.partitioning import Partition
+
+MODULE = "app.infrastructure.celery.tasks.partition_maintenance_task"
+
+
+@pytest.fixture
+def manager():
+    manager = MagicMock()
+    manager.ensure_partitions = AsyncMock(
+        return_value=[Partition.containing("jquants_listed_info", date(2024, 9, 1), "month")]
+    )
+    manager.detach_partitions_before = AsyncMock(return_value=[])
+
+    @asynccontextmanager
+    async def _session_context():
+        yield MagicMock()
+
+    with patch(f"{MODULE}.RangePartitionManager", return_value=manager), \
+            patch(f"{MODULE}.get_async_session_context", _session_context):
+        yield manager
+
+
+class TestMaintainPartitions:
+    """_maintain_partitions_async のテスト"""
+
+    @pytest.mark.asyncio
+    async def test_premakes_future_partitions(self, manager):
+        """現在の月から premake か月先までのパーティションを作成する"""
+        result = await task_module._maintain_partitions_async(
+            premake=3, retention_months=0, today=date(2024, 6, 15)
+        )
+
+        manager.ensure_partitions.assert_awaited_once_with(date(2024, 6, 15), date(2024, 9, 1))
+        manager.detach_partitions_before.assert_not_awaited()
+        assert result == {"created": ["jquants_listed_info_p2024_09"], "detached": []}
+
+    @pytest.mark.asyncio
+    async def test_from_date_creates_past_partitions(self, manager):
+        """from_date を指定すると過去の期間のパーティションも作成する"""
+        await task_module._maintain_partitions_async(
+            premake=0, retention_months=0, from_date=date(2020, 1, 1), today=date(2024, 6, 15)
+        )
+
+        manager.ensure_partitions.assert_awaited_once_with(date(2020, 1, 1), date(2024, 6, 1))
+
+    @pytest.mark.asyncio
+    async def test_detaches_expired_partitions(self, manager):
+        """保持期間より前のパーティションを切り離す"""
+        await task_module._maintain_partitions_async(
+            premake=0, retention_months=24, today=date(2024, 6, 15)
+        )
+
+        manager.detach_partitions_before.assert_awaited_once_with(date(2022, 6, 1))
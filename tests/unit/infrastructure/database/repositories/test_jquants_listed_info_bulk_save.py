@@ -0,0 +1,153 @@
+"""JQuantsListedInfoRepositoryImpl.save_all の一括保存経路と差分更新のテスト"""
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.entities.jquants_listed_info import JQuantsListedInfo
+from app.domain.repositories.jquants_listed_info_repository_interface import ListedInfoSaveResult
+from app.domain.value_objects.stock_code import StockCode
+from app.infrastructure.config.settings import get_infrastructure_settings
+from app.infrastructure.repositories.database import jquants_listed_info_repository_impl as repo_module
+from app.infrastructure.repositories.database.jquants_listed_info_repository_impl import (
+    JQuantsListedInfoRepositoryImpl,
+)
+
+
+def _entity(code: str) -> JQuantsListedInfo:
+    return JQuantsListedInfo(
+        date=date(2024, 1, 4),
+        code=StockCode(code),
+        company_name=f"Company {code}",
+        company_name_english=None,
+        sector_17_code="6",
+        sector_17_code_name="自動車・輸送機",
+        sector_33_code="3700",
+        sector_33_code_name="輸送用機器",
+        scale_category=None,
+        market_code="0111",
+        market_code_name="プライム",
+        margin_code="1",
+        margin_code_name="信用",
+    )
+
+
+def _entities(count: int):
+    return [_entity(f"{1000 + i}") for i in range(count)]
+
+
+def _counts(inserted: int, written: int) -> MagicMock:
+    """マージ結果（新規件数, 書き込み件数）を返す Result のモック"""
+    result = MagicMock()
+    result.one.return_value = (inserted, written)
+    return result
+
+
+@pytest.fixture
+def session():
+    session = AsyncMock(spec=AsyncSession)
+    session.execute.return_value = _counts(0, 0)
+    driver = MagicMock()
+    driver.copy_records_to_table = AsyncMock()
+    raw_connection = MagicMock(driver_connection=driver)
+    connection = MagicMock()
+    connection.get_raw_connection = AsyncMock(return_value=raw_connection)
+    session.connection.return_value = connection
+    session.driver = driver
+    return session
+
+
+class TestSaveAllInsert:
+    """複数行 INSERT 経路のテスト"""
+
+    @pytest.mark.asyncio
+    async def test_batches_under_bind_parameter_limit(self, session, monkeypatch):
+        """バインドパラメータ数の上限を超えないよう分割する"""
+        monkeypatch.setattr(repo_module, "_INSERT_BATCH_SIZE", 2)
+        session.execute.side_effect = [_counts(2, 2), _counts(0, 1), _counts(1, 1)]
+
+        result = await JQuantsListedInfoRepositoryImpl(session).save_all(_entities(5), use_copy=False)
+
+        assert session.execute.await_count == 3
+        session.flush.assert_awaited_once()
+        session.driver.copy_records_to_table.assert_not_awaited()
+        assert result == ListedInfoSaveResult(inserted_count=3, updated_count=1, unchanged_count=1)
+
+    @pytest.mark.asyncio
+    async def test_only_changed_adds_distinct_condition(self, session):
+        """差分更新では業務項目が異なる行のみ更新する条件を付ける"""
+        await JQuantsListedInfoRepositoryImpl(session).save_all(
+            _entities(1), only_changed=True, use_copy=False
+        )
+        sql = str(session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "IS DISTINCT FROM excluded.company_name" in sql
+        assert "RETURNING (xmax = 0) AS inserted" in sql
+
+        await JQuantsListedInfoRepositoryImpl(session).save_all(
+            _entities(1), only_changed=False, use_copy=False
+        )
+        sql = str(session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "IS DISTINCT FROM" not in sql
+
+    @pytest.mark.asyncio
+    async def test_empty_list(self, session):
+        assert await JQuantsListedInfoRepositoryImpl(session).save_all([]) == ListedInfoSaveResult()
+        session.execute.assert_not_awaited()
+
+    def test_batch_size_within_limit(self):
+        assert repo_module._INSERT_BATCH_SIZE * len(repo_module._DATA_COLUMNS) <= 32767
+
+    def test_merge_sql_without_only_changed(self):
+        assert "IS DISTINCT FROM" not in repo_module._merge_staging_sql(False)
+
+
+class TestSaveAllCopy:
+    """COPY 経路のテスト"""
+
+    @pytest.mark.asyncio
+    async def test_copy_into_staging_then_merge(self, session):
+        """ステージングテーブルに COPY してから 1 文でマージする"""
+        session.execute.side_effect = [MagicMock(), MagicMock(), _counts(1, 2)]
+
+        result = await JQuantsListedInfoRepositoryImpl(session).save_all(
+            _entities(3), only_changed=True, use_copy=True
+        )
+
+        statements = [str(call.args[0]) for call in session.execute.await_args_list]
+        assert statements[0].startswith("CREATE TEMP TABLE IF NOT EXISTS jquants_listed_info_staging")
+        assert statements[1] == "TRUNCATE jquants_listed_info_staging"
+        assert statements[2].startswith("WITH merged AS (INSERT INTO jquants_listed_info AS t")
+        assert "ON CONFLICT (date, code) DO UPDATE" in statements[2]
+        assert "IS DISTINCT FROM (EXCLUDED.company_name" in statements[2]
+        assert result == ListedInfoSaveResult(inserted_count=1, updated_count=1, unchanged_count=1)
+
+        copy = session.driver.copy_records_to_table
+        copy.assert_awaited_once()
+        assert copy.await_args.args[0] == "jquants_listed_info_staging"
+        assert copy.await_args.kwargs["columns"] == list(repo_module._DATA_COLUMNS)
+        records = copy.await_args.kwargs["records"]
+        assert len(records) == 3
+        assert records[0][:3] == (date(2024, 1, 4), "1000", "Company 1000")
+        session.flush.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_auto_selects_copy_above_threshold(self, session, monkeypatch):
+        """use_copy 未指定の場合は件数で経路を選択する"""
+        monkeypatch.setattr(get_infrastructure_settings().database, "copy_threshold", 3)
+        repository = JQuantsListedInfoRepositoryImpl(session)
+
+        await repository.save_all(_entities(2))
+        session.driver.copy_records_to_table.assert_not_awaited()
+
+        await repository.save_all(_entities(3))
+        session.driver.copy_records_to_table.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_threshold_zero_disables_copy(self, session, monkeypatch):
+        monkeypatch.setattr(get_infrastructure_settings().database, "copy_threshold", 0)
+
+        await JQuantsListedInfoRepositoryImpl(session).save_all(_entities(3))
+
+        session.driver.copy_records_to_table.assert_not_awaited()
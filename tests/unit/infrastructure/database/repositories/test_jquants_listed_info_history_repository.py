@@ -0,0 +1,359 @@
+"""JQuantsListedInfoHistoryRepository（SCD type 2）のテスト"""
+import asyncio
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.entities.jquants_listed_info import JQuantsListedInfo
+from app.domain.repositories.jquants_listed_info_repository_interface import ListedInfoSaveResult
+from app.domain.value_objects.stock_code import StockCode
+from app.infrastructure.config.settings import get_infrastructure_settings
+from app.infrastructure.database.models.jquants_listed_info_history import (
+    OPEN_VALID_TO,
+    JQuantsListedInfoHistoryModel,
+)
+from app.infrastructure.repositories.database.cached_listed_info_repository import (
+    CachedListedInfoRepository,
+)
+from app.infrastructure.repositories.database.jquants_listed_info_history_repository import (
+    JQuantsListedInfoHistoryRepository,
+)
+from app.infrastructure.repositories.database.jquants_listed_info_repository_impl import (
+    JQuantsListedInfoRepositoryImpl,
+)
+from app.infrastructure.repositories.database.listed_info_repository_factory import (
+    create_listed_info_repository,
+)
+
+TARGET_DATE = date(2024, 1, 10)
+
+
+def _entity(code: str, company_name: str = "Company", target_date: date = TARGET_DATE) -> JQuantsListedInfo:
+    return JQuantsListedInfo(
+        date=target_date,
+        code=StockCode(code),
+        company_name=company_name,
+        company_name_english=None,
+        sector_17_code="6",
+        sector_17_code_name="自動車・輸送機",
+        sector_33_code="3700",
+        sector_33_code_name="輸送用機器",
+        scale_category=None,
+        market_code="0111",
+        market_code_name="プライム",
+        margin_code="1",
+        margin_code_name="信用",
+    )
+
+
+def _version(
+    code: str,
+    valid_from: date,
+    valid_to: date = OPEN_VALID_TO,
+    company_name: str = "Company",
+) -> JQuantsListedInfoHistoryModel:
+    entity = _entity(code, company_name)
+    return JQuantsListedInfoHistoryModel(
+        code=code,
+        valid_from=valid_from,
+        valid_to=valid_to,
+        company_name=entity.company_name,
+        company_name_english=entity.company_name_english,
+        sector_17_code=entity.sector_17_code,
+        sector_17_code_name=entity.sector_17_code_name,
+        sector_33_code=entity.sector_33_code,
+        sector_33_code_name=entity.sector_33_code_name,
+        scale_category=entity.scale_category,
+        market_code=entity.market_code,
+        market_code_name=entity.market_code_name,
+        margin_code=entity.margin_code,
+        margin_code_name=entity.margin_code_name,
+    )
+
+
+def _scalars(*models) -> MagicMock:
+    result = MagicMock()
+    result.scalars.return_value = iter(models)
+    return result
+
+
+def _rows(*rows) -> MagicMock:
+    result = MagicMock()
+    result.all.return_value = list(rows)
+    return result
+
+
+def _sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+@pytest.fixture
+def session():
+    return AsyncMock(spec=AsyncSession)
+
+
+def _inserted_versions(session):
+    """INSERT に渡された新しい版"""
+    calls = [c for c in session.execute.await_args_list if _sql(c.args[0]).startswith("INSERT")]
+    assert len(calls) <= 1
+    return calls[0].args[1] if calls else []
+
+
+class TestSaveAll:
+    """スナップショットの差分反映のテスト"""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_attributes_are_not_written(self, session):
+        """属性が同じ銘柄は新しい版を作らない"""
+        current = _version("1000", date(2024, 1, 4))
+        session.execute.side_effect = [_scalars(current)]
+
+        result = await JQuantsListedInfoHistoryRepository(session).save_all([_entity("1000")])
+
+        assert result == ListedInfoSaveResult(unchanged_count=1)
+        assert session.execute.await_count == 1
+        assert current.valid_to == OPEN_VALID_TO
+
+    @pytest.mark.asyncio
+    async def test_changed_attributes_split_version(self, session):
+        """属性が変わった銘柄は現在の版を終了して新しい版を開始する"""
+        current = _version("1000", date(2024, 1, 4))
+        session.execute.side_effect = [_scalars(current), MagicMock()]
+
+        result = await JQuantsListedInfoHistoryRepository(session).save_all(
+            [_entity("1000", company_name="Renamed")]
+        )
+
+        assert result == ListedInfoSaveResult(updated_count=1)
+        assert current.valid_to == TARGET_DATE
+        (version,) = _inserted_versions(session)
+        assert version["valid_from"] == TARGET_DATE
+        assert version["valid_to"] == OPEN_VALID_TO
+        assert version["company_name"] == "Renamed"
+
+    @pytest.mark.asyncio
+    async def test_same_day_version_is_overwritten(self, session):
+        """同じ日に開始した版は上書きする"""
+        current = _version("1000", TARGET_DATE)
+        session.execute.side_effect = [_scalars(current)]
+
+        result = await JQuantsListedInfoHistoryRepository(session).save_all(
+            [_entity("1000", company_name="Renamed")]
+        )
+
+        assert result == ListedInfoSaveResult(updated_count=1)
+        assert current.company_name == "Renamed"
+        assert _inserted_versions(session) == []
+
+    @pytest.mark.asyncio
+    async def test_new_code_inserts_open_version(self, session):
+        """履歴のない銘柄は無期限の版を作成する"""
+        session.execute.side_effect = [_scalars(), _scalars(), _rows(), MagicMock()]
+
+        result = await JQuantsListedInfoHistoryRepository(session).save_all([_entity("1000")])
+
+        assert result == ListedInfoSaveResult(inserted_count=1)
+        (version,) = _inserted_versions(session)
+        assert version["code"] == "1000"
+        assert version["valid_from"] == TARGET_DATE
+        assert version["valid_to"] == OPEN_VALID_TO
+
+    @pytest.mark.asyncio
+    async def test_relisted_with_same_attributes_extends_previous(self, session):
+        """直前で終了した版と同じ属性であれば版を延長する"""
+        previous = _version("1000", date(2024, 1, 4), valid_to=TARGET_DATE)
+        session.execute.side_effect = [_scalars(), _scalars(previous), _rows()]
+
+        await JQuantsListedInfoHistoryRepository(session).save_all([_entity("1000")])
+
+        assert previous.valid_to == OPEN_VALID_TO
+        assert _inserted_versions(session) == []
+
+    @pytest.mark.asyncio
+    async def test_out_of_order_insert_ends_before_next_version(self, session):
+        """後続の版がある場合は、その開始日までの版を作成する"""
+        next_start = date(2024, 1, 20)
+        session.execute.side_effect = [_scalars(), _scalars(), _rows(("1000", next_start)), MagicMock()]
+
+        await JQuantsListedInfoHistoryRepository(session).save_all([_entity("1000")])
+
+        (version,) = _inserted_versions(session)
+        assert version["valid_to"] == next_start
+
+    @pytest.mark.asyncio
+    async def test_dates_are_applied_in_ascending_order(self, session):
+        """複数日のスナップショットは日付の昇順に反映する"""
+        session.execute.side_effect = [
+            _scalars(), _scalars(), _rows(), MagicMock(),
+            _scalars(_version("1000", date(2024, 1, 4))),
+        ]
+
+        await JQuantsListedInfoHistoryRepository(session).save_all(
+            [_entity("1000", target_date=TARGET_DATE), _entity("1000", target_date=date(2024, 1, 4))]
+        )
+
+        first_query = _sql(session.execute.await_args_list[0].args[0])
+        assert "valid_from <=" in first_query
+        params = session.execute.await_args_list[0].args[0].compile().params
+        assert date(2024, 1, 4) in params.values()
+
+    @pytest.mark.asyncio
+    async def test_empty_list(self, session):
+        """空のリストでは何もしない"""
+        result = await JQuantsListedInfoHistoryRepository(session).save_all([])
+
+        assert result == ListedInfoSaveResult()
+        session.execute.assert_not_awaited()
+
+
+class TestConcurrentWrites:
+    """複数の日付を並行に保存する場合のテスト"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_dates_are_serialized(self):
+        """同じ版を分割する 2 つのトランザクションは、先のコミットまで後の読み込みを待つ"""
+        advisory_lock = asyncio.Lock()  # pg_advisory_xact_lock の代わり
+        events = []
+        current = _version("1000", date(2024, 1, 4))
+
+        def _session(name: str):
+            session = AsyncMock(spec=AsyncSession)
+
+            async def lock(statement):
+                assert "pg_advisory_xact_lock" in _sql(statement)
+                await advisory_lock.acquire()
+                events.append((name, "LOCK"))
+
+            async def execute(statement, *args):
+                events.append((name, _sql(statement).split()[0]))
+                await asyncio.sleep(0)
+                return _scalars(current)
+
+            async def commit():
+                events.append((name, "COMMIT"))
+                advisory_lock.release()
+
+            session.scalar.side_effect = lock
+            session.execute.side_effect = execute
+            session.commit.side_effect = commit
+            return session
+
+        async def write(session, target_date: date):
+            await JQuantsListedInfoHistoryRepository(session).save_all(
+                [_entity("1000", company_name=f"Renamed {target_date}", target_date=target_date)]
+            )
+            await session.commit()
+
+        await asyncio.gather(
+            write(_session("a"), date(2024, 1, 10)), write(_session("b"), date(2024, 1, 11))
+        )
+
+        assert events == [
+            ("a", "LOCK"), ("a", "SELECT"), ("a", "INSERT"), ("a", "COMMIT"),
+            ("b", "LOCK"), ("b", "SELECT"), ("b", "INSERT"), ("b", "COMMIT"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_finalize_and_delete_take_lock(self, session):
+        """版を書き換える操作はすべてロックを取得する"""
+        session.execute.return_value = MagicMock(rowcount=0)
+        repository = JQuantsListedInfoHistoryRepository(session)
+
+        await repository.finalize_snapshot(TARGET_DATE, {"1000"})
+        await repository.delete_by_date(TARGET_DATE)
+
+        assert session.scalar.await_count == 2
+        assert all(
+            "pg_advisory_xact_lock" in _sql(c.args[0]) for c in session.scalar.await_args_list
+        )
+
+
+class TestFinalizeSnapshot:
+    """上場していない銘柄の版の終了のテスト"""
+
+    @pytest.mark.asyncio
+    async def test_closes_and_removes_unlisted_versions(self, session):
+        """スナップショットにない銘柄の版を終了し、当日開始の版は削除する"""
+        session.execute.side_effect = [MagicMock(rowcount=2), MagicMock(rowcount=1)]
+
+        count = await JQuantsListedInfoHistoryRepository(session).finalize_snapshot(
+            TARGET_DATE, {"1000"}
+        )
+
+        assert count == 3
+        update_sql, delete_sql = (_sql(c.args[0]) for c in session.execute.await_args_list)
+        assert update_sql.startswith("UPDATE jquants_listed_info_history SET valid_to=")
+        assert "NOT IN" in update_sql
+        assert delete_sql.startswith("DELETE FROM jquants_listed_info_history")
+
+    @pytest.mark.asyncio
+    async def test_empty_snapshot_is_ignored(self, session):
+        """空のスナップショットで全銘柄を終了させない"""
+        count = await JQuantsListedInfoHistoryRepository(session).finalize_snapshot(TARGET_DATE, set())
+
+        assert count == 0
+        session.execute.assert_not_awaited()
+
+
+class TestDeleteByDate:
+    """指定日に開始した版の削除のテスト"""
+
+    @pytest.mark.asyncio
+    async def test_deletes_digest_of_date(self, session):
+        """同じトランザクションでその日付のスナップショットのダイジェストも削除する"""
+        session.execute.return_value = MagicMock(rowcount=3)
+
+        deleted = await JQuantsListedInfoHistoryRepository(session).delete_by_date(TARGET_DATE)
+
+        assert deleted == 3
+        statements = [_sql(c.args[0]) for c in session.execute.await_args_list]
+        assert statements[-1].startswith("DELETE FROM snapshot_digests")
+        params = session.execute.await_args_list[-1].args[0].compile().params
+        assert params["dataset_1"] == "jquants_listed_info"
+        assert params["target_date_1"] == TARGET_DATE
+        assert params["target_date_2"] == date(2024, 1, 11)
+
+
+class TestFind:
+    """指定日時点の検索のテスト"""
+
+    @pytest.mark.asyncio
+    async def test_find_all_by_date_returns_point_in_time_entities(self, session):
+        """指定日時点で有効な版を指定日のエンティティとして返す"""
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = [_version("1000", date(2024, 1, 4))]
+        session.execute.return_value = result
+
+        entities = await JQuantsListedInfoHistoryRepository(session).find_all_by_date(TARGET_DATE)
+
+        assert [(e.code.value, e.date) for e in entities] == [("1000", TARGET_DATE)]
+        query = _sql(session.execute.await_args.args[0])
+        assert "valid_from <=" in query and "valid_to >" in query
+
+
+class TestFactory:
+    """保存方式に応じたリポジトリ生成のテスト"""
+
+    @pytest.fixture(autouse=True)
+    def disable_cache(self, monkeypatch):
+        monkeypatch.setattr(get_infrastructure_settings().redis, "listed_info_cache_ttl", 0)
+
+    def test_snapshot_storage(self, session, monkeypatch):
+        monkeypatch.setattr(get_infrastructure_settings().database, "listed_info_storage", "snapshot")
+
+        assert isinstance(create_listed_info_repository(session), JQuantsListedInfoRepositoryImpl)
+
+    def test_history_storage(self, session, monkeypatch):
+        monkeypatch.setattr(get_infrastructure_settings().database, "listed_info_storage", "history")
+
+        assert isinstance(create_listed_info_repository(session), JQuantsListedInfoHistoryRepository)
+
+    def test_cached_storage(self, monkeypatch):
+        """キャッシュが有効な場合はキャッシュ付きのリポジトリでラップする"""
+        monkeypatch.setattr(get_infrastructure_settings().redis, "listed_info_cache_ttl", 60)
+        monkeypatch.setattr(get_infrastructure_settings().database, "listed_info_storage", "snapshot")
+
+        assert isinstance(create_listed_info_repository(AsyncSession()), CachedListedInfoRepository)
@@ -241,8 +241,12 @@ class TestJQuantsListedInfoRepositoryImpl:
 
         # 検証
         assert deleted_count == 5
-        self.session.execute.assert_called_once()
-        self.session.flush.assert_called_once()
+        # データと同じトランザクションでその日付のダイジェストも削除する
+        statements = [str(c.args[0]) for c in self.session.execute.call_args_list]
+        assert len(statements) == 2
+        assert statements[0].startswith("DELETE FROM jquants_listed_info ")
+        assert statements[1].startswith("DELETE FROM snapshot_digests")
+        self.session.flush.assert_called()
 
     @pytest.mark.asyncio
     async def test_delete_by_date_no_records(self):
@@ -257,8 +261,8 @@ class TestJQuantsListedInfoRepositoryImpl:
 
         # 検証
         assert deleted_count == 0
-        self.session.execute.assert_called_once()
-        self.session.flush.assert_called_once()
+        assert self.session.execute.call_count == 2
+        self.session.flush.assert_called()
 
     def test_mapper_integration(self):
         """Mapper が正しく統合されていることを確認"""
@@ -10,6 +10,7 @@ from app.infrastructure.database.connection import (
     create_tables,
     drop_tables,
     close_database,
+    dispose_engine,
     get_async_session_context,
     get_async_session_sync,
     Base
@@ -224,6 +225,31 @@ class TestDatabaseConnection:
         assert len(conn_module._engines) == 0
         assert len(conn_module._sessionmakers) == 0
 
+    @pytest.mark.asyncio
+    async def test_dispose_engine_only_closes_current_loop(self):
+        """dispose_engine が現在のイベントループのエンジンだけを破棄することのテスト"""
+        # Arrange
+        import asyncio
+        import app.infrastructure.database.connection as conn_module
+
+        current_engine = AsyncMock(spec=AsyncEngine)
+        other_loop = MagicMock()
+        other_engine = AsyncMock(spec=AsyncEngine)
+        conn_module._engines = {
+            asyncio.get_running_loop(): current_engine,
+            other_loop: other_engine,
+        }
+        conn_module._sessionmakers = {asyncio.get_running_loop(): MagicMock()}
+
+        # Act
+        await dispose_engine()
+
+        # Assert
+        current_engine.dispose.assert_called_once()
+        other_engine.dispose.assert_not_called()
+        assert list(conn_module._engines) == [other_loop]
+        assert len(conn_module._sessionmakers) == 0
+
     @pytest.mark.asyncio
     async def test_close_database_without_engine(self):
         """エンジンがない場合の close_database のテスト"""
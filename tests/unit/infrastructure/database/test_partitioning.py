@@ -0,0 +1,147 @@
+"""レンジパーティション管理のテスト"""
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.database.partitioning import Partition, RangePartitionManager
+
+TABLE = "jquants_listed_info"
+
+
+def _names(*names) -> MagicMock:
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = list(names)
+    return result
+
+
+def _scalar(value) -> MagicMock:
+    result = MagicMock()
+    result.scalar.return_value = value
+    return result
+
+
+def _statements(session):
+    return [str(c.args[0]) for c in session.execute.await_args_list]
+
+
+class TestPartition:
+    """Partition のテスト"""
+
+    def test_monthly_covering(self):
+        """期間を含む月ごとのパーティション（年をまたぐ）"""
+        partitions = Partition.covering(TABLE, date(2023, 11, 15), date(2024, 1, 2), "month")
+
+        assert [p.name for p in partitions] == [
+            "jquants_listed_info_p2023_11",
+            "jquants_listed_info_p2023_12",
+            "jquants_listed_info_p2024_01",
+        ]
+        assert partitions[1].end == date(2024, 1, 1)
+
+    def test_yearly_partition(self):
+        """年単位のパーティション"""
+        partition = Partition.containing(TABLE, date(2024, 6, 1), "year")
+
+        assert partition.name == "jquants_listed_info_p2024"
+        assert (partition.start, partition.end) == (date(2024, 1, 1), date(2025, 1, 1))
+
+    def test_from_name_round_trip(self):
+        """パーティション名から範囲を復元できる"""
+        for partition in (
+            Partition.containing(TABLE, date(2024, 12, 3), "month"),
+            Partition.containing(TABLE, date(2024, 12, 3), "year"),
+        ):
+            assert Partition.from_name(TABLE, partition.name) == partition
+
+        assert Partition.from_name(TABLE, "jquants_listed_info_default") is None
+
+    def test_overlaps(self):
+        """年単位と月単位の範囲の重なり"""
+        year = Partition.containing(TABLE, date(2024, 1, 1), "year")
+
+        assert year.overlaps(Partition.containing(TABLE, date(2024, 12, 1), "month"))
+        assert not year.overlaps(Partition.containing(TABLE, date(2025, 1, 1), "month"))
+
+
+class TestRangePartitionManager:
+    """RangePartitionManager のテスト"""
+
+    @pytest.fixture
+    def session(self):
+        return AsyncMock(spec=AsyncSession)
+
+    @pytest.mark.asyncio
+    async def test_ensure_creates_missing_partitions(self, session):
+        """存在しないパーティションだけを作成する"""
+        session.execute.side_effect = [
+            _names("jquants_listed_info_p2024_01", "jquants_listed_info_default"),
+            _scalar(False),
+            MagicMock(),
+        ]
+
+        created = await RangePartitionManager(session).ensure_partitions(
+            date(2024, 1, 1), date(2024, 2, 1)
+        )
+
+        assert [p.name for p in created] == ["jquants_listed_info_p2024_02"]
+        assert _statements(session)[-1] == (
+            "CREATE TABLE jquants_listed_info_p2024_02 PARTITION OF jquants_listed_info "
+            "FOR VALUES FROM ('2024-02-01') TO ('2024-03-01')"
+        )
+
+    @pytest.mark.asyncio
+    async def test_ensure_moves_rows_from_default(self, session):
+        """DEFAULT パーティションに範囲内の行がある場合は移してからアタッチする"""
+        session.execute.side_effect = [_names(), _scalar(True), MagicMock(), MagicMock(rowcount=5), MagicMock()]
+
+        await RangePartitionManager(session).ensure_partitions(date(2024, 1, 1), date(2024, 1, 1))
+
+        statements = _statements(session)
+        assert statements[2].startswith("CREATE TABLE jquants_listed_info_p2024_01 (LIKE")
+        assert "DELETE FROM jquants_listed_info_default" in statements[3]
+        assert statements[4].startswith(
+            "ALTER TABLE jquants_listed_info ATTACH PARTITION jquants_listed_info_p2024_01"
+        )
+
+    @pytest.mark.asyncio
+    async def test_ensure_skips_overlapping_interval(self, session):
+        """単位を変更しても既存の範囲と重なるパーティションは作らない"""
+        session.execute.side_effect = [_names("jquants_listed_info_p2024_03")]
+
+        created = await RangePartitionManager(session, interval="year").ensure_partitions(
+            date(2024, 1, 1), date(2024, 12, 31)
+        )
+
+        assert created == []
+        assert session.execute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_detach_partitions_before_cutoff(self, session):
+        """終了日が基準日以前のパーティションを古い順に切り離す"""
+        session.execute.side_effect = [
+            _names("jquants_listed_info_p2024_02", "jquants_listed_info_p2024_01", "jquants_listed_info_p2024_03"),
+            MagicMock(),
+            MagicMock(),
+            MagicMock(),
+            MagicMock(),
+        ]
+
+        detached = await RangePartitionManager(session).detach_partitions_before(date(2024, 3, 1))
+
+        assert [p.name for p in detached] == ["jquants_listed_info_p2024_01", "jquants_listed_info_p2024_02"]
+        statements = _statements(session)
+        assert statements[1::2] == [
+            "ALTER TABLE jquants_listed_info DETACH PARTITION jquants_listed_info_p2024_01",
+            "ALTER TABLE jquants_listed_info DETACH PARTITION jquants_listed_info_p2024_02",
+        ]
+        # 切り離した範囲のダイジェストも削除し、再取得が「変更なし」で省略されないようにする
+        assert all(s.startswith("DELETE FROM snapshot_digests") for s in statements[2::2])
+        deleted_ranges = [
+            c.args[0].compile().params for c in session.execute.await_args_list[2::2]
+        ]
+        assert [(p["dataset_1"], p["target_date_1"], p["target_date_2"]) for p in deleted_ranges] == [
+            (TABLE, date(2024, 1, 1), date(2024, 2, 1)),
+            (TABLE, date(2024, 2, 1), date(2024, 3, 1)),
+        ]
@@ -1,7 +1,8 @@
 import asyncio
 import gzip
 import json
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -14,6 +15,9 @@ from app.domain.exceptions.jquants_exceptions import (
     ValidationError,
 )
 from app.infrastructure.external_services.jquants.base_client import JQuantsBaseClient
+from app.infrastructure.external_services.jquants.session_registry import (
+    close_jquants_sessions,
+)
 
 
 @pytest.fixture
@@ -29,6 +33,13 @@ def mock_credentials():
     )
 
 
+@pytest.fixture(autouse=True)
+async def shared_sessions():
+    """テストごとに共有セッションをクローズ"""
+    yield
+    await close_jquants_sessions()
+
+
 @pytest.fixture
 async def client():
     """テスト用のクライアント"""
@@ -55,6 +66,21 @@ class TestJQuantsBaseClient:
             assert client._session is not None
             assert not client._session.closed
 
+    def test_redis_rate_limiter_backend(self, monkeypatch):
+        """設定で Redis バックエンドのレートリミッターが選択されるテスト"""
+        from app.infrastructure.config.settings import get_infrastructure_settings
+        from app.infrastructure.rate_limiter import RedisRateLimiter
+
+        rate_limit_settings = get_infrastructure_settings().rate_limit
+        monkeypatch.setattr(rate_limit_settings, "jquants_backend", "redis")
+
+        client = JQuantsBaseClient()
+
+        assert isinstance(client._rate_limiter, RedisRateLimiter)
+        assert client._rate_limiter._redis_bucket.key == (
+            f"{rate_limit_settings.redis_key_prefix}jquants"
+        )
+
     @pytest.mark.asyncio
     async def test_headers_without_auth(self, client):
         """認証情報なしのヘッダー生成テスト"""
@@ -129,6 +155,116 @@ class TestJQuantsBaseClient:
             await client._handle_response(mock_response)
         assert "レート制限に達しました" in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    async def test_rate_limit_error_with_retry_after(self, client):
+        """Retry-After ヘッダーの秒数が例外に設定されるテスト"""
+        mock_response = MagicMock()
+        mock_response.status = 429
+        mock_response.headers = {"Retry-After": "7"}
+        mock_response.text = AsyncMock(return_value=json.dumps({}))
+
+        with pytest.raises(RateLimitError) as exc_info:
+            await client._handle_response(mock_response)
+        assert exc_info.value.retry_after == 7.0
+
+    def test_parse_retry_after(self):
+        """Retry-After ヘッダーの解釈テスト"""
+        future = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+        assert JQuantsBaseClient._parse_retry_after("3") == 3.0
+        assert JQuantsBaseClient._parse_retry_after("-1") == 0.0
+        assert 25 <= JQuantsBaseClient._parse_retry_after(format_datetime(future, usegmt=True)) <= 30
+        assert JQuantsBaseClient._parse_retry_after("soon") is None
+        assert JQuantsBaseClient._parse_retry_after(None) is None
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_retried_in_adaptive_mode(self, monkeypatch):
+        """adaptive モードでは 429 後にレートを下げて再試行するテスト"""
+        from app.infrastructure.config.settings import get_infrastructure_settings
+        from app.infrastructure.rate_limiter import AdaptiveRateLimiter
+
+        rate_limit_settings = get_infrastructure_settings().rate_limit
+        monkeypatch.setattr(rate_limit_settings, "jquants_adaptive", True)
+        # 再試行時のペーシング待ちを短くするため高いレートにする
+        monkeypatch.setattr(rate_limit_settings, "jquants_window_seconds", 1)
+        client = JQuantsBaseClient()
+        assert isinstance(client._rate_limiter, AdaptiveRateLimiter)
+        initial_rate = client._rate_limiter.current_rate
+
+        side_effects = [
+            MagicMock(
+                status=429,
+                headers={"Retry-After": "0"},
+                text=AsyncMock(return_value=json.dumps({})),
+            ),
+            MagicMock(
+                status=200,
+                headers={},
+                text=AsyncMock(return_value=json.dumps({"data": "success"})),
+            ),
+        ]
+
+        with patch.object(client, "_ensure_session", AsyncMock()):
+            client._session = MagicMock()
+            mock_request = MagicMock()
+            mock_request.__aenter__.side_effect = side_effects
+            client._session.request.return_value = mock_request
+
+            result = await client.get("/test")
+
+        assert result == {"data": "success"}
+        assert client._session.request.call_count == 2
+        assert client._rate_limiter.current_rate < initial_rate
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_retries_exhausted(self, monkeypatch):
+        """adaptive モードでも再試行回数を超えた場合は例外を送出するテスト"""
+        from app.infrastructure.config.settings import get_infrastructure_settings
+
+        rate_limit_settings = get_infrastructure_settings().rate_limit
+        monkeypatch.setattr(rate_limit_settings, "jquants_adaptive", True)
+        # 再試行時のペーシング待ちを短くするため高いレートにする
+        monkeypatch.setattr(rate_limit_settings, "jquants_window_seconds", 1)
+        monkeypatch.setattr(rate_limit_settings, "jquants_max_rate_limit_retries", 2)
+        client = JQuantsBaseClient()
+
+        response = MagicMock(
+            status=429,
+            headers={"Retry-After": "0"},
+            text=AsyncMock(return_value=json.dumps({})),
+        )
+
+        with patch.object(client, "_ensure_session", AsyncMock()):
+            client._session = MagicMock()
+            mock_request = MagicMock()
+            mock_request.__aenter__.return_value = response
+            client._session.request.return_value = mock_request
+
+            with pytest.raises(RateLimitError):
+                await client.get("/test")
+
+        assert client._session.request.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_not_retried_without_adaptive(self, client):
+        """固定レートの場合は 429 を即座に送出するテスト"""
+        response = MagicMock(
+            status=429,
+            headers={},
+            text=AsyncMock(return_value=json.dumps({})),
+        )
+
+        with patch.object(client, "_ensure_session", AsyncMock()):
+            client._session = MagicMock()
+            mock_request = MagicMock()
+            mock_request.__aenter__.return_value = response
+            client._session.request.return_value = mock_request
+
+            with pytest.raises(RateLimitError):
+                await client.get("/test")
+
+        assert client._session.request.call_count == 1
+
     @pytest.mark.asyncio
     async def test_network_error(self, client):
         """ネットワークエラーのテスト"""
@@ -260,6 +396,45 @@ class TestJQuantsBaseClient:
             assert result == [{"id": 1}, {"id": 2}, {"id": 3}]
             assert mock_get.call_count == 3
 
+    @pytest.mark.asyncio
+    async def test_iter_pages_streams_responses(self, client):
+        """iter_pages がページを受信するごとに yield するテスト"""
+        pages = [
+            {"data": [{"id": 1}], "pagination_key": "key1"},
+            {"data": [{"id": 2}]},
+        ]
+
+        with patch.object(client, "get", AsyncMock(side_effect=pages)) as mock_get:
+            iterator = client.iter_pages("/test", params={"date": "20240104"})
+
+            first = await iterator.__anext__()
+            assert first == pages[0]
+            assert mock_get.call_count == 1
+
+            rest = [page async for page in iterator]
+            assert rest == [pages[1]]
+            assert mock_get.call_count == 2
+            mock_get.assert_called_with(
+                "/test",
+                params={"date": "20240104", "pagination_key": "key1"},
+                headers=None,
+            )
+
+    @pytest.mark.asyncio
+    async def test_iter_records_with_data_key(self, client):
+        """iter_records が指定キーのレコードをページ単位で返すテスト"""
+        pages = [
+            {"info": [{"id": 1}, {"id": 2}], "pagination_key": "key1"},
+            {"info": {"id": 3}},
+        ]
+
+        with patch.object(client, "get", AsyncMock(side_effect=pages)):
+            result = [
+                records async for records in client.iter_records("/test", data_key="info")
+            ]
+
+        assert result == [[{"id": 1}, {"id": 2}], [{"id": 3}]]
+
     @pytest.mark.asyncio
     async def test_session_reuse(self, client):
         """セッションの再利用テスト"""
@@ -271,14 +446,36 @@ class TestJQuantsBaseClient:
 
         assert session1 is session2
 
+    @pytest.mark.asyncio
+    async def test_session_shared_between_clients(self, client, auth_client):
+        """複数クライアント間でのセッション共有テスト"""
+        await client._ensure_session()
+        await auth_client._ensure_session()
+
+        assert client._session is auth_client._session
+
+    @pytest.mark.asyncio
+    async def test_close_keeps_shared_session_open(self, client, auth_client):
+        """クライアントのクローズで共有セッションが閉じられないことのテスト"""
+        await client._ensure_session()
+        shared_session = client._session
+
+        await client.close()
+
+        assert client._session is None
+        assert not shared_session.closed
+        await auth_client._ensure_session()
+        assert auth_client._session is shared_session
+
     @pytest.mark.asyncio
     async def test_session_recreation_after_close(self, client):
-        """セッションクローズ後の再作成テスト"""
+        """共有セッションクローズ後の再作成テスト"""
         await client._ensure_session()
         session1 = client._session
 
-        await client.close()
+        await close_jquants_sessions()
         await client._ensure_session()
         session2 = client._session
 
-        assert session1 is not session2
\ No newline at end of file
+        assert session1.closed
+        assert session1 is not session2
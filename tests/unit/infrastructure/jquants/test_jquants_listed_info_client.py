@@ -304,4 +304,52 @@ class TestJQuantsListedInfoClient:
         
         # 呼び出し回数の検証のみ行う
         # 注: params 辞書が参照で保持されるため、個別のパラメータ検証は困難
-        # 実装が正しく動作していることは、返されるデータで確認済み
\ No newline at end of file
+        # 実装が正しく動作していることは、返されるデータで確認済み
+    @pytest.mark.asyncio
+    async def test_iter_listed_info_pages_yields_each_page(self):
+        """iter_listed_info_pages がページごとに yield することを確認"""
+        # モックの設定
+        first_response = {
+            "info": [{"Date": "20240104", "Code": "7203", "CompanyName": "トヨタ自動車"}],
+            "pagination_key": "next_page_key",
+        }
+        second_response = {
+            "info": [{"Date": "20240104", "Code": "9984", "CompanyName": "ソフトバンクグループ"}],
+        }
+        self.base_client.get.side_effect = [first_response, second_response]
+
+        # 実行（1 ページ目を受け取った時点では 2 ページ目は未取得）
+        pages = self.client.iter_listed_info_pages(date="20240104")
+        first_page = await pages.__anext__()
+        assert [info["Code"] for info in first_page] == ["7203"]
+        assert self.base_client.get.call_count == 1
+
+        remaining = [page async for page in pages]
+
+        # 検証
+        assert [[info["Code"] for info in page] for page in remaining] == [["9984"]]
+        assert self.base_client.get.call_count == 2
+        self.base_client.get.assert_called_with(
+            "/listed/info",
+            params={"date": "20240104", "pagination_key": "next_page_key"},
+        )
+
+    @pytest.mark.asyncio
+    async def test_iter_listed_info_pages_carries_next_key(self):
+        """各ページが次ページのキーを保持し、キーを指定して再開できることを確認"""
+        self.base_client.get.side_effect = [
+            {"info": [{"Code": "9984"}], "pagination_key": "key-3"},
+            {"info": [{"Code": "6758"}]},
+        ]
+
+        pages = [
+            page
+            async for page in self.client.iter_listed_info_pages(
+                date="20240104", pagination_key="key-2"
+            )
+        ]
+
+        assert [page.next_pagination_key for page in pages] == ["key-3", None]
+        first_call = self.base_client.get.call_args_list[0]
+        assert first_call.args == ("/listed/info",)
+        assert self.base_client.get.call_count == 2
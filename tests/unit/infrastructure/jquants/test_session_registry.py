@@ -0,0 +1,158 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from app.infrastructure.external_services.jquants.session_registry import (
+    JQuantsSessionRegistry,
+)
+
+
+@pytest.fixture
+async def registry():
+    """テスト用のセッションレジストリ"""
+    registry = JQuantsSessionRegistry(
+        limit=10,
+        limit_per_host=2,
+        keepalive_timeout=15.0,
+        idle_timeout=60.0,
+        request_timeout=30.0,
+    )
+    yield registry
+    await registry.close()
+
+
+class TestJQuantsSessionRegistry:
+    """JQuantsSessionRegistry のテスト"""
+
+    @pytest.mark.asyncio
+    async def test_get_session_reuses_session(self, registry):
+        """同一イベントループではセッションを再利用するテスト"""
+        session1 = await registry.get_session()
+        session2 = await registry.get_session()
+
+        assert session1 is session2
+        assert not session1.closed
+
+    @pytest.mark.asyncio
+    async def test_connector_uses_keep_alive(self, registry):
+        """コネクタが keep-alive と接続数制限で構成されるテスト"""
+        session = await registry.get_session()
+        connector = session.connector
+
+        assert connector.force_close is False
+        assert connector.limit == 10
+        assert connector.limit_per_host == 2
+
+    @pytest.mark.asyncio
+    async def test_closed_session_is_recreated(self, registry):
+        """クローズされたセッションが再作成されるテスト"""
+        session1 = await registry.get_session()
+        await session1.close()
+
+        session2 = await registry.get_session()
+
+        assert session2 is not session1
+        assert not session2.closed
+
+    @pytest.mark.asyncio
+    async def test_idle_session_is_evicted(self, registry):
+        """アイドルタイムアウトを超えたセッションが破棄されるテスト"""
+        with patch(
+            "app.infrastructure.external_services.jquants.session_registry.time.monotonic",
+            return_value=1000.0,
+        ):
+            session1 = await registry.get_session()
+
+        with patch(
+            "app.infrastructure.external_services.jquants.session_registry.time.monotonic",
+            return_value=1000.0 + registry.idle_timeout + 1,
+        ):
+            session2 = await registry.get_session()
+
+        assert session1.closed
+        assert session2 is not session1
+
+    def test_sessions_are_per_event_loop(self):
+        """イベントループごとに別のセッションが作成されるテスト"""
+        registry = JQuantsSessionRegistry(
+            limit=10,
+            limit_per_host=2,
+            keepalive_timeout=15.0,
+            idle_timeout=60.0,
+            request_timeout=30.0,
+        )
+        loop1 = asyncio.new_event_loop()
+        loop2 = asyncio.new_event_loop()
+        try:
+            session1 = loop1.run_until_complete(registry.get_session())
+            session2 = loop2.run_until_complete(registry.get_session())
+
+            assert session1 is not session2
+
+            loop2.run_until_complete(registry.close())
+            assert session2.closed
+            assert not session1.closed
+            loop1.run_until_complete(registry.close())
+        finally:
+            loop1.close()
+            loop2.close()
+
+    def test_entries_for_closed_loops_are_dropped(self):
+        """クローズ済みイベントループのエントリが破棄されるテスト"""
+        registry = JQuantsSessionRegistry(
+            limit=10,
+            limit_per_host=2,
+            keepalive_timeout=15.0,
+            idle_timeout=60.0,
+            request_timeout=30.0,
+        )
+        old_loop = asyncio.new_event_loop()
+        session = old_loop.run_until_complete(registry.get_session())
+        old_loop.run_until_complete(session.close())
+        old_loop.close()
+
+        new_loop = asyncio.new_event_loop()
+        try:
+            new_loop.run_until_complete(registry.get_session())
+
+            assert old_loop not in registry._entries
+            assert list(registry._entries) == [new_loop]
+            new_loop.run_until_complete(registry.close())
+        finally:
+            new_loop.close()
+
+    def test_sessions_of_closed_loops_are_closed_on_eviction(self):
+        """クローズ済みイベントループのセッションはコネクタごとクローズして破棄されるテスト"""
+        registry = JQuantsSessionRegistry(
+            limit=10,
+            limit_per_host=2,
+            keepalive_timeout=15.0,
+            idle_timeout=60.0,
+            request_timeout=30.0,
+        )
+        old_loop = asyncio.new_event_loop()
+        session = old_loop.run_until_complete(registry.get_session())
+        connector = session.connector
+        old_loop.close()
+
+        new_loop = asyncio.new_event_loop()
+        try:
+            new_loop.run_until_complete(registry.get_session())
+
+            assert session.closed
+            assert session.connector is None
+            assert connector.closed
+            new_loop.run_until_complete(registry.close())
+        finally:
+            new_loop.close()
+
+    @pytest.mark.asyncio
+    async def test_close_closes_current_loop_session(self, registry):
+        """close で現在のループのセッションがクローズされるテスト"""
+        session = await registry.get_session()
+
+        await registry.close()
+
+        assert session.closed
+        assert registry._entries == {}
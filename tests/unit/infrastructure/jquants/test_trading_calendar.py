@@ -0,0 +1,147 @@
+"""取引カレンダークライアントとキャッシュのテスト"""
+from datetime import date
+from unittest.mock import AsyncMock
+
+import pytest
+from fakeredis import aioredis
+
+from app.domain.value_objects.trading_calendar import TradingCalendar
+from app.infrastructure.external_services.jquants.base_client import JQuantsBaseClient
+from app.infrastructure.external_services.jquants.trading_calendar_cache import (
+    TradingCalendarCache,
+)
+from app.infrastructure.external_services.jquants.trading_calendar_client import (
+    JQuantsTradingCalendarClient,
+)
+
+
+class TestJQuantsTradingCalendarClient:
+    """JQuantsTradingCalendarClient のテスト"""
+
+    @pytest.mark.asyncio
+    async def test_get_trading_calendar(self):
+        """休日区分から営業日・非営業日を判定する"""
+        base_client = AsyncMock(spec=JQuantsBaseClient)
+        base_client.get.return_value = {
+            "trading_calendar": [
+                {"Date": "2024-01-03", "HolidayDivision": "0"},
+                {"Date": "2024-01-04", "HolidayDivision": "1"},
+                {"Date": "2024-01-05", "HolidayDivision": "2"},
+                {"Date": "2024-01-08", "HolidayDivision": "3"},
+            ]
+        }
+
+        calendar = await JQuantsTradingCalendarClient(base_client).get_trading_calendar(
+            date(2024, 1, 3), date(2024, 1, 8)
+        )
+
+        base_client.get.assert_awaited_once_with(
+            "/markets/trading_calendar", params={"from": "20240103", "to": "20240108"}
+        )
+        assert calendar.trading_days == {date(2024, 1, 4), date(2024, 1, 5)}
+        assert calendar.non_trading_days == {date(2024, 1, 3), date(2024, 1, 8)}
+
+
+@pytest.fixture
+async def redis():
+    """fakeredis のクライアント"""
+    client = aioredis.FakeRedis(decode_responses=True)
+    yield client
+    await client.flushall()
+    await client.aclose()
+
+
+def _calendar_client(calendar: TradingCalendar) -> AsyncMock:
+    client = AsyncMock()
+    client.get_trading_calendar.return_value = calendar
+    return client
+
+
+YEAR_2023 = TradingCalendar.from_days([date(2023, 12, 29)], [date(2023, 12, 31)])
+YEAR_2024 = TradingCalendar.from_days([date(2024, 1, 4)], [date(2024, 1, 8)])
+
+
+class TestTradingCalendarCache:
+    """TradingCalendarCache のテスト"""
+
+    def _cache(self, redis) -> TradingCalendarCache:
+        async def getter():
+            return redis
+
+        return TradingCalendarCache(
+            current_year_ttl=3600, past_year_ttl=86400, redis_getter=getter
+        )
+
+    @pytest.mark.asyncio
+    async def test_fetches_each_year_and_merges(self, redis):
+        """期間にかかる年ごとに取得して結合する"""
+        client = AsyncMock()
+        client.get_trading_calendar.side_effect = [YEAR_2023, YEAR_2024]
+
+        calendar = await self._cache(redis).get_calendar(
+            date(2023, 12, 28), date(2024, 1, 10), client
+        )
+
+        assert client.get_trading_calendar.await_count == 2
+        client.get_trading_calendar.assert_any_await(date(2023, 1, 1), date(2023, 12, 31))
+        assert calendar == YEAR_2023.merge(YEAR_2024)
+
+    @pytest.mark.asyncio
+    async def test_memory_cache(self, redis):
+        """2 回目はプロセス内キャッシュから返す"""
+        cache = self._cache(redis)
+        client = _calendar_client(YEAR_2024)
+
+        await cache.get_calendar(date(2024, 1, 1), date(2024, 1, 31), client)
+        await redis.flushall()
+        calendar = await cache.get_calendar(date(2024, 1, 1), date(2024, 1, 31), client)
+
+        client.get_trading_calendar.assert_awaited_once()
+        assert calendar == YEAR_2024
+
+    @pytest.mark.asyncio
+    async def test_redis_cache_shared_between_processes(self, redis):
+        """別インスタンスでも Redis のキャッシュを利用する"""
+        await self._cache(redis).get_calendar(
+            date(2023, 1, 1), date(2023, 1, 31), _calendar_client(YEAR_2023)
+        )
+        assert await redis.ttl("market:data:trading_calendar:2023") > 3600
+
+        client = _calendar_client(TradingCalendar())
+        calendar = await self._cache(redis).get_calendar(
+            date(2023, 1, 1), date(2023, 1, 31), client
+        )
+
+        client.get_trading_calendar.assert_not_awaited()
+        assert calendar == YEAR_2023
+
+    @pytest.mark.asyncio
+    async def test_api_failure_falls_back_to_weekday_rule(self, redis):
+        """API エラー時は平日ベースで判定し、結果はキャッシュしない"""
+        cache = self._cache(redis)
+        client = AsyncMock()
+        client.get_trading_calendar.side_effect = RuntimeError("API down")
+
+        calendar = await cache.get_calendar(date(2024, 1, 1), date(2024, 1, 31), client)
+
+        assert calendar == TradingCalendar()
+        assert not calendar.is_trading_day(date(2024, 1, 6))
+        assert await redis.get("market:data:trading_calendar:2024") is None
+
+        client.get_trading_calendar.side_effect = None
+        client.get_trading_calendar.return_value = YEAR_2024
+        assert await cache.get_calendar(date(2024, 1, 1), date(2024, 1, 31), client) == YEAR_2024
+
+    @pytest.mark.asyncio
+    async def test_redis_failure_uses_api(self):
+        """Redis が利用できなくても API から取得する"""
+        async def broken_getter():
+            raise ConnectionError("redis down")
+
+        cache = TradingCalendarCache(
+            current_year_ttl=3600, past_year_ttl=86400, redis_getter=broken_getter
+        )
+        calendar = await cache.get_calendar(
+            date(2024, 1, 1), date(2024, 1, 31), _calendar_client(YEAR_2024)
+        )
+        assert calendar == YEAR_2024
@@ -3,8 +3,15 @@ import asyncio
 from unittest.mock import Mock, patch, AsyncMock
 
 import pytest
+from pydantic import ValidationError
 
-from app.infrastructure.rate_limiter import RateLimiter, with_rate_limit
+from app.infrastructure.config.settings import InfrastructureSettings, RateLimitSettings
+from app.infrastructure.rate_limiter import (
+    AdaptiveRateLimiter,
+    RateLimiter,
+    create_rate_limiter,
+    with_rate_limit,
+)
 
 
 class TestRateLimiter:
@@ -159,4 +166,143 @@ class TestRateLimiter:
                         "TestAPI: Rate limit approaching. "
                         "Waiting 0.50s for 1 token(s). "
                         "Current: 0.0/1"
-                    )
\ No newline at end of file
+                    )
+
+
+class TestAdaptiveRateLimiter:
+    """AdaptiveRateLimiter クラスのテスト"""
+
+    def test_decrease_on_rate_limited(self):
+        """429 の通知でレートが乗法的に減少する"""
+        limiter = AdaptiveRateLimiter(max_requests=60, window_seconds=60)
+
+        limiter.on_rate_limited(retry_after=0)
+
+        assert limiter.current_rate == pytest.approx(0.5)
+        assert limiter.max_requests == 60
+
+    def test_repeated_rate_limited_within_cooldown(self):
+        """同じ輻輳による連続した 429 では 1 回だけ減少する"""
+        limiter = AdaptiveRateLimiter(max_requests=60, window_seconds=60)
+
+        limiter.on_rate_limited(retry_after=5)
+        limiter.on_rate_limited(retry_after=5)
+
+        assert limiter.current_rate == pytest.approx(0.5)
+
+    def test_decrease_stops_at_floor(self):
+        """下限より小さくはならない"""
+        limiter = AdaptiveRateLimiter(
+            max_requests=60, window_seconds=60, floor_requests=20
+        )
+
+        for _ in range(5):
+            limiter._cooldown_until = 0.0
+            limiter.on_rate_limited(retry_after=0)
+
+        assert limiter.current_rate == pytest.approx(20 / 60)
+
+    def test_retry_after_blocks_tokens(self):
+        """Retry-After の間はトークンが払い出されない"""
+        limiter = AdaptiveRateLimiter(max_requests=10, window_seconds=1)
+
+        limiter.on_rate_limited(retry_after=2)
+
+        assert limiter.try_acquire() is False
+        assert limiter._token_bucket.get_wait_time(1) >= 2.0
+
+    def test_increase_on_sustained_success(self):
+        """連続成功でレートが加法的に増加し、上限で止まる"""
+        limiter = AdaptiveRateLimiter(
+            max_requests=60,
+            window_seconds=60,
+            ceiling_requests=62,
+            success_threshold=3,
+        )
+
+        for _ in range(2):
+            limiter.on_success()
+        assert limiter.current_rate == pytest.approx(1.0)
+
+        limiter.on_success()
+        assert limiter.current_rate == pytest.approx(61 / 60)
+
+        for _ in range(9):
+            limiter.on_success()
+        assert limiter.current_rate == pytest.approx(62 / 60)
+
+    def test_rate_limited_resets_success_streak(self):
+        """429 で連続成功回数がリセットされる"""
+        limiter = AdaptiveRateLimiter(
+            max_requests=60, window_seconds=60, success_threshold=3
+        )
+
+        limiter.on_success()
+        limiter.on_success()
+        limiter.on_rate_limited(retry_after=0)
+        limiter.on_success()
+
+        assert limiter.current_rate == pytest.approx(0.5)
+
+    def test_invalid_decrease_factor(self):
+        """減少係数は 0 より大きく 1 未満"""
+        with pytest.raises(ValueError, match="decrease_factor"):
+            AdaptiveRateLimiter(max_requests=10, window_seconds=1, decrease_factor=1.0)
+
+    def test_get_status(self):
+        """get_status に現在のレートが含まれる"""
+        limiter = AdaptiveRateLimiter(
+            max_requests=60, window_seconds=60, ceiling_requests=120
+        )
+
+        status = limiter.get_status()
+
+        assert status["adaptive"] is True
+        assert status["current_requests_per_second"] == pytest.approx(1.0)
+        assert status["max_requests_per_second"] == pytest.approx(2.0)
+
+    def test_fixed_rate_limiter_ignores_feedback(self):
+        """通常の RateLimiter はフィードバックを無視する"""
+        limiter = RateLimiter(max_requests=10, window_seconds=1)
+
+        limiter.on_rate_limited(retry_after=10)
+        limiter.on_success()
+
+        assert limiter.adaptive is False
+        assert limiter.try_acquire() is True
+
+    def test_create_adaptive_rate_limiter(self):
+        """create_rate_limiter で adaptive を選択できる"""
+        limiter = create_rate_limiter(10, 1, adaptive=True, ceiling_requests=20)
+
+        assert isinstance(limiter, AdaptiveRateLimiter)
+        assert limiter.max_rate == pytest.approx(20.0)
+
+    def test_create_adaptive_redis_rate_limiter_not_supported(self):
+        """redis バックエンドでは adaptive を選択できない"""
+        with pytest.raises(ValueError, match="adaptive"):
+            create_rate_limiter(10, 1, backend="redis", key="test", adaptive=True)
+
+    def test_settings_reject_adaptive_redis_backend(self, monkeypatch):
+        """redis バックエンドと adaptive の組み合わせは設定の読み込み時に拒否する"""
+        monkeypatch.setenv("RATE_LIMIT_JQUANTS_BACKEND", "redis")
+        monkeypatch.setenv("RATE_LIMIT_JQUANTS_ADAPTIVE", "true")
+
+        with pytest.raises(ValidationError, match="jquants_adaptive"):
+            RateLimitSettings()
+
+        monkeypatch.setenv("RATE_LIMIT_JQUANTS_BACKEND", "memory")
+        assert RateLimitSettings().jquants_adaptive is True
+
+    def test_infrastructure_settings_reject_adaptive_redis_backend_from_env(self, monkeypatch):
+        """JQUANTS_RATE_LIMIT_* 環境変数で指定した組み合わせも読み込み時に拒否する"""
+        monkeypatch.setenv("JQUANTS_RATE_LIMIT_BACKEND", "redis")
+        monkeypatch.setenv("JQUANTS_RATE_LIMIT_ADAPTIVE", "true")
+
+        with pytest.raises(ValidationError, match="jquants_adaptive"):
+            InfrastructureSettings()
+
+        monkeypatch.setenv("JQUANTS_RATE_LIMIT_BACKEND", "memory")
+        settings = InfrastructureSettings()
+        assert settings.rate_limit.jquants_backend == "memory"
+        assert settings.rate_limit.jquants_adaptive is True
@@ -0,0 +1,228 @@
+"""Redis ベースのレートリミッターのテスト（fakeredis 使用）"""
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fakeredis import aioredis
+
+from app.infrastructure.rate_limiter import (
+    RateLimiter,
+    RedisRateLimiter,
+    RedisTokenBucket,
+    create_rate_limiter,
+)
+
+
+@pytest.fixture
+async def redis():
+    """fakeredis のクライアント"""
+    client = aioredis.FakeRedis(decode_responses=True)
+    yield client
+    await client.flushall()
+    await client.aclose()
+
+
+def make_getter(client):
+    """Redis クライアント取得関数を作成"""
+
+    async def _get_redis():
+        return client
+
+    return _get_redis
+
+
+class TestRedisTokenBucket:
+    """RedisTokenBucket クラスのテスト"""
+
+    def test_init_invalid_params(self):
+        """無効なパラメータでの初期化"""
+        with pytest.raises(ValueError, match="Capacity must be positive"):
+            RedisTokenBucket(make_getter(None), "key", capacity=0, refill_period=1.0)
+
+        with pytest.raises(ValueError, match="Refill period must be positive"):
+            RedisTokenBucket(make_getter(None), "key", capacity=10, refill_period=0)
+
+    @pytest.mark.asyncio
+    async def test_try_acquire_consumes_tokens(self, redis):
+        """try_acquire: トークンが Redis 上で消費される"""
+        bucket = RedisTokenBucket(make_getter(redis), "test:bucket", capacity=5, refill_period=60)
+
+        assert await bucket.try_acquire(3) is True
+        assert await bucket.try_acquire(3) is False
+        assert 1.9 <= await bucket.get_available_tokens() <= 2.1
+
+    @pytest.mark.asyncio
+    async def test_try_acquire_exceeds_capacity(self, redis):
+        """try_acquire: 容量を超える要求"""
+        bucket = RedisTokenBucket(make_getter(redis), "test:bucket", capacity=5, refill_period=60)
+
+        assert await bucket.try_acquire(6) is False
+
+    @pytest.mark.asyncio
+    async def test_buckets_with_same_key_share_budget(self, redis):
+        """同じキーを使う複数のバケット（別プロセス相当）が予算を共有する"""
+        worker1 = RedisTokenBucket(make_getter(redis), "test:shared", capacity=4, refill_period=60)
+        worker2 = RedisTokenBucket(make_getter(redis), "test:shared", capacity=4, refill_period=60)
+
+        assert await worker1.try_acquire(2) is True
+        assert await worker2.try_acquire(2) is True
+        assert await worker1.try_acquire() is False
+        assert await worker2.try_acquire() is False
+
+    @pytest.mark.asyncio
+    async def test_buckets_with_different_keys_are_independent(self, redis):
+        """キーが異なるバケットは独立している"""
+        bucket1 = RedisTokenBucket(make_getter(redis), "test:a", capacity=1, refill_period=60)
+        bucket2 = RedisTokenBucket(make_getter(redis), "test:b", capacity=1, refill_period=60)
+
+        assert await bucket1.try_acquire() is True
+        assert await bucket2.try_acquire() is True
+
+    @pytest.mark.asyncio
+    async def test_refill_over_time(self, redis):
+        """時間経過でトークンが補充される"""
+        bucket = RedisTokenBucket(make_getter(redis), "test:refill", capacity=10, refill_period=0.1)
+
+        assert await bucket.try_acquire(10) is True
+        await asyncio.sleep(0.05)
+
+        assert 4 <= await bucket.get_available_tokens() <= 10
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits_for_refill(self, redis):
+        """acquire: トークン不足時は補充まで待機する"""
+        bucket = RedisTokenBucket(make_getter(redis), "test:wait", capacity=2, refill_period=1.0)
+        await bucket.acquire(2)
+
+        with patch(
+            "app.infrastructure.rate_limiter.redis_token_bucket.asyncio.sleep",
+            new_callable=AsyncMock,
+        ) as mock_sleep:
+            # 1 回目は待機時間が返り、2 回目で取得できるようにする
+            original_eval = bucket._eval
+            results = [(0.0, 0.5)]
+
+            async def fake_eval(tokens):
+                if results:
+                    return results.pop(0)
+                return await original_eval(0)
+
+            with patch.object(bucket, "_eval", side_effect=fake_eval):
+                await bucket.acquire()
+
+            mock_sleep.assert_awaited_once_with(0.5)
+
+    @pytest.mark.asyncio
+    async def test_acquire_reports_wait_time(self, redis):
+        """トークン不足時に正しい待機時間が計算される"""
+        bucket = RedisTokenBucket(make_getter(redis), "test:wait_time", capacity=2, refill_period=2.0)
+        await bucket.acquire(2)
+
+        _, wait_time = await bucket._eval(1)
+
+        # 補充レートは 1 トークン/秒
+        assert 0.9 <= wait_time <= 1.0
+
+    @pytest.mark.asyncio
+    async def test_acquire_exceeds_capacity(self, redis):
+        """acquire: 容量を超える要求はエラー"""
+        bucket = RedisTokenBucket(make_getter(redis), "test:bucket", capacity=5, refill_period=60)
+
+        with pytest.raises(ValueError, match="Cannot acquire 6 tokens"):
+            await bucket.acquire(6)
+
+    @pytest.mark.asyncio
+    async def test_key_has_expiry(self, redis):
+        """使われなくなったバケットのキーは期限切れで削除される"""
+        bucket = RedisTokenBucket(make_getter(redis), "test:ttl", capacity=5, refill_period=60)
+        await bucket.acquire()
+
+        ttl = await redis.pttl("test:ttl")
+        assert 0 < ttl <= 61000
+
+
+class TestRedisRateLimiter:
+    """RedisRateLimiter クラスのテスト"""
+
+    @pytest.mark.asyncio
+    async def test_acquire_updates_shared_state(self, redis):
+        """acquire: Redis 上の状態が更新される"""
+        limiter = RedisRateLimiter(
+            max_requests=10,
+            window_seconds=60,
+            key="test:limiter",
+            redis_getter=make_getter(redis),
+            name="Test API",
+        )
+
+        await limiter.acquire(3)
+
+        assert 6.9 <= limiter.available_tokens <= 7.1
+        assert 6.9 <= float(await redis.hget("test:limiter", "tokens")) <= 7.1
+
+    @pytest.mark.asyncio
+    async def test_limiters_share_budget(self, redis):
+        """複数のリミッター（ワーカー相当）で予算を共有する"""
+        limiters = [
+            RedisRateLimiter(
+                max_requests=3,
+                window_seconds=60,
+                key="test:cluster",
+                redis_getter=make_getter(redis),
+            )
+            for _ in range(3)
+        ]
+
+        for limiter in limiters:
+            await limiter.acquire()
+
+        assert await limiters[0]._redis_bucket.try_acquire() is False
+
+    @pytest.mark.asyncio
+    async def test_acquire_exceeds_capacity(self, redis):
+        """acquire: 容量を超えるトークン要求"""
+        limiter = RedisRateLimiter(
+            max_requests=10, window_seconds=1, key="test:limiter", redis_getter=make_getter(redis)
+        )
+
+        with pytest.raises(ValueError, match="Cannot acquire 11 tokens: exceeds capacity"):
+            await limiter.acquire(11)
+
+    def test_get_status(self, redis):
+        """get_status: バックエンド情報を含む"""
+        limiter = RedisRateLimiter(
+            max_requests=100, window_seconds=60, key="test:limiter", redis_getter=make_getter(redis), name="Test"
+        )
+
+        status = limiter.get_status()
+
+        assert status["backend"] == "redis"
+        assert status["key"] == "test:limiter"
+        assert status["max_tokens"] == 100
+
+
+class TestCreateRateLimiter:
+    """create_rate_limiter のテスト"""
+
+    def test_memory_backend(self):
+        """memory バックエンド"""
+        limiter = create_rate_limiter(10, 1, name="Test")
+
+        assert type(limiter) is RateLimiter
+
+    def test_redis_backend(self):
+        """redis バックエンド"""
+        limiter = create_rate_limiter(10, 1, name="Test", backend="redis", key="test:key")
+
+        assert isinstance(limiter, RedisRateLimiter)
+        assert limiter._redis_bucket.key == "test:key"
+
+    def test_redis_backend_requires_key(self):
+        """redis バックエンドはキーが必須"""
+        with pytest.raises(ValueError, match="key is required"):
+            create_rate_limiter(10, 1, backend="redis")
+
+    def test_unknown_backend(self):
+        """未知のバックエンド"""
+        with pytest.raises(ValueError, match="Unknown rate limiter backend"):
+            create_rate_limiter(10, 1, backend="memcached")
@@ -202,4 +202,225 @@ class TestTokenBucket:
             
             # プロパティアクセス時に自動的に refill される
             tokens = bucket.available_tokens
-            assert tokens == 10.0  # 7 + 5 = 12 だが容量でキャップ
\ No newline at end of file
+            assert tokens == 10.0  # 7 + 5 = 12 だが容量でキャップ
+
+
+class TestTokenBucketWaiterQueue:
+    """TokenBucket の待ち行列（FIFO）のテスト"""
+
+    @pytest.mark.asyncio
+    async def test_waiters_are_served_in_fifo_order(self):
+        """待機中の要求は到着順に処理される"""
+        bucket = TokenBucket(capacity=5, refill_period=0.05)  # 100 tokens/s
+        bucket.try_acquire(5)
+        order = []
+
+        async def acquire(i):
+            await bucket.acquire(1)
+            order.append(i)
+
+        await asyncio.gather(*(acquire(i) for i in range(20)))
+
+        assert order == list(range(20))
+
+    @pytest.mark.asyncio
+    async def test_weighted_head_is_not_overtaken(self):
+        """大きな要求が先頭にある場合、後続の小さな要求は追い越さない"""
+        bucket = TokenBucket(capacity=4, refill_period=0.1)  # 40 tokens/s
+        bucket.try_acquire(4)
+        order = []
+
+        async def acquire(name, tokens):
+            await bucket.acquire(tokens)
+            order.append(name)
+
+        big = asyncio.create_task(acquire("big", 4))
+        await asyncio.sleep(0)
+        small = asyncio.create_task(acquire("small", 1))
+
+        await asyncio.gather(big, small)
+
+        assert order == ["big", "small"]
+
+    @pytest.mark.asyncio
+    async def test_new_request_queues_behind_waiters(self):
+        """待機中の要求があれば、トークンが残っていても新しい要求は後ろに並ぶ"""
+        bucket = TokenBucket(capacity=3, refill_period=0.3)  # 10 tokens/s
+        bucket.try_acquire(2)
+        order = []
+
+        async def acquire(name, tokens):
+            await bucket.acquire(tokens)
+            order.append(name)
+
+        first = asyncio.create_task(acquire("first", 3))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(acquire("second", 1))
+
+        await asyncio.gather(first, second)
+
+        assert order == ["first", "second"]
+
+    @pytest.mark.asyncio
+    async def test_try_acquire_fails_while_waiters_queued(self):
+        """待機中の要求がある場合、try_acquire は追い越さない"""
+        bucket = TokenBucket(capacity=2, refill_period=1.0)
+        bucket.try_acquire(2)
+
+        waiter = asyncio.create_task(bucket.acquire(2))
+        await asyncio.sleep(0)
+        bucket.tokens = 1.0  # 1 トークンだけ補充された状態
+
+        assert bucket.waiting_count == 1
+        assert bucket.try_acquire(1) is False
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak_tokens(self):
+        """待機中にキャンセルされた要求はトークンを消費しない"""
+        bucket = TokenBucket(capacity=10, refill_period=1.0)
+        bucket.try_acquire(10)
+
+        waiter = asyncio.create_task(bucket.acquire(5))
+        await asyncio.sleep(0)
+        assert bucket.waiting_count == 1
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert bucket.waiting_count == 0
+        assert bucket._timer is None
+        assert bucket.available_tokens <= 1.0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_head_lets_next_waiter_proceed(self):
+        """先頭の要求がキャンセルされると、次の要求の待機時間で再スケジュールされる"""
+        bucket = TokenBucket(capacity=10, refill_period=1.0)  # 10 tokens/s
+        bucket.try_acquire(10)
+
+        big = asyncio.create_task(bucket.acquire(10))
+        await asyncio.sleep(0)
+        small = asyncio.create_task(bucket.acquire(1))
+        await asyncio.sleep(0)
+
+        start = time.monotonic()
+        big.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await big
+        await small
+        elapsed = time.monotonic() - start
+
+        # 10 トークン分（1 秒）ではなく 1 トークン分（0.1 秒）程度で取得できる
+        assert elapsed < 0.5
+
+    @pytest.mark.asyncio
+    async def test_tokens_refunded_when_cancelled_after_grant(self):
+        """トークン付与後、再開前にキャンセルされた場合はトークンが返却される"""
+        bucket = TokenBucket(capacity=2, refill_period=1.0)
+        bucket.try_acquire(2)
+
+        waiter = asyncio.create_task(bucket.acquire(2))
+        await asyncio.sleep(0)
+
+        # タイマー満了と同時にキャンセルされた状況を再現
+        bucket.tokens = 2.0
+        bucket._wake_waiters()
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert 1.9 <= bucket.available_tokens <= 2.0
+
+    @pytest.mark.asyncio
+    async def test_get_wait_time_includes_queued_demand(self):
+        """待機時間の見込みには待ち行列の要求分が含まれる"""
+        bucket = TokenBucket(capacity=10, refill_period=1.0)  # 10 tokens/s
+        bucket.try_acquire(10)
+
+        waiter = asyncio.create_task(bucket.acquire(5))
+        await asyncio.sleep(0)
+
+        wait_time = bucket.get_wait_time(1)
+        assert 0.55 <= wait_time <= 0.6
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+
+class TestTokenBucketRateAdjustment:
+    """補充レートの変更と強制待機のテスト"""
+
+    def test_set_refill_rate(self):
+        """補充レートを変更しても容量は変わらない"""
+        bucket = TokenBucket(capacity=10, refill_period=1.0)
+
+        bucket.set_refill_rate(5.0)
+
+        assert bucket.capacity == 10
+        assert bucket.refill_rate == 5.0
+        assert bucket.refill_period == 2.0
+
+    def test_set_refill_rate_invalid(self):
+        """0 以下の補充レートはエラー"""
+        bucket = TokenBucket(capacity=10, refill_period=1.0)
+
+        with pytest.raises(ValueError, match="Refill rate must be positive"):
+            bucket.set_refill_rate(0)
+
+    def test_drain_blocks_for_given_seconds(self):
+        """drain 後は指定秒数分のトークンが補充されるまで取得できない"""
+        bucket = TokenBucket(capacity=10, refill_period=1.0)  # 10 tokens/s
+
+        bucket.drain(0.5)
+
+        assert bucket.try_acquire(1) is False
+        wait_time = bucket.get_wait_time(1)
+        assert 0.55 <= wait_time <= 0.6
+
+    def test_drain_keeps_longer_pause(self):
+        """既により長い待機が必要な場合は短い drain で上書きしない"""
+        bucket = TokenBucket(capacity=10, refill_period=1.0)
+
+        bucket.drain(2.0)
+        bucket.drain(0.5)
+
+        assert bucket.get_wait_time(1) >= 2.0
+
+    def test_drain_does_not_report_negative_tokens(self):
+        """drain 中も利用可能なトークン数は 0 として報告され、前借り分の返済後に補充される"""
+        with patch('time.monotonic') as mock_time:
+            mock_time.return_value = 100.0
+            bucket = TokenBucket(capacity=10, refill_period=1.0)  # 10 tokens/s
+
+            bucket.drain(0.5)
+
+            assert bucket.available_tokens == 0.0
+            assert bucket.tokens == 0.0
+
+            # 3 トークン補充されるが前借り分（5 トークン）の返済に充てられる
+            mock_time.return_value = 100.3
+            assert bucket.available_tokens == 0.0
+
+            # 残りの前借り分 2 トークンを返済し、2 トークンが利用可能になる
+            mock_time.return_value = 100.7
+            assert bucket.available_tokens == pytest.approx(2.0)
+
+    @pytest.mark.asyncio
+    async def test_rate_change_reschedules_waiters(self):
+        """補充レートを上げると待機中の要求が早く起こされる"""
+        bucket = TokenBucket(capacity=1, refill_period=10.0)  # 0.1 tokens/s
+        bucket.try_acquire(1)
+
+        waiter = asyncio.create_task(bucket.acquire(1))
+        await asyncio.sleep(0)
+
+        start = time.monotonic()
+        bucket.set_refill_rate(20.0)
+        await waiter
+
+        assert time.monotonic() - start < 0.5
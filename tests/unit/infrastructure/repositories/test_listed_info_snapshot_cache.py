@@ -0,0 +1,238 @@
+"""上場銘柄情報スナップショットキャッシュのテスト（fakeredis 使用）"""
+from datetime import date
+from unittest.mock import AsyncMock
+
+import pytest
+from fakeredis import aioredis
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.entities.jquants_listed_info import JQuantsListedInfo
+from app.domain.repositories.jquants_listed_info_repository_interface import ListedInfoSaveResult
+from app.domain.value_objects.stock_code import StockCode
+from app.infrastructure.repositories.database import cached_listed_info_repository as cached_module
+from app.infrastructure.repositories.database.cached_listed_info_repository import (
+    CachedListedInfoRepository,
+)
+from app.infrastructure.repositories.redis.listed_info_snapshot_cache import ListedInfoSnapshotCache
+
+TARGET_DATE = date(2024, 1, 4)
+
+
+def _entity(code: str, target_date: date = TARGET_DATE) -> JQuantsListedInfo:
+    return JQuantsListedInfo(
+        date=target_date,
+        code=StockCode(code),
+        company_name=f"会社 {code}",
+        company_name_english=None,
+        sector_17_code="6",
+        sector_17_code_name="自動車・輸送機",
+        sector_33_code="3700",
+        sector_33_code_name="輸送用機器",
+        scale_category="TOPIX Core30",
+        market_code="0111",
+        market_code_name="プライム",
+        margin_code="1",
+        margin_code_name="信用",
+    )
+
+
+@pytest.fixture
+async def redis():
+    """fakeredis のクライアント"""
+    client = aioredis.FakeRedis(decode_responses=True)
+    yield client
+    await client.flushall()
+    await client.aclose()
+
+
+@pytest.fixture
+def cache(redis):
+    async def _getter():
+        return redis
+
+    return ListedInfoSnapshotCache(ttl=60, redis_getter=_getter)
+
+
+class TestListedInfoSnapshotCache:
+    """ListedInfoSnapshotCache のテスト"""
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self, cache, redis):
+        """保存したスナップショットを同じ内容で取得できる"""
+        snapshot = [_entity("6758"), _entity("7203")]
+
+        await cache.set(TARGET_DATE, snapshot)
+
+        assert await cache.get(TARGET_DATE) == snapshot
+        assert await redis.ttl("stock:info:listed_info:2024-01-04") == 60
+
+    @pytest.mark.asyncio
+    async def test_get_code(self, cache):
+        """単一銘柄はハッシュの該当フィールドだけを取得する"""
+        assert await cache.get_code(TARGET_DATE, StockCode("7203")) == (False, None)
+
+        await cache.set(TARGET_DATE, [_entity("7203"), _entity("6758")])
+
+        assert await cache.get_code(TARGET_DATE, StockCode("7203")) == (True, _entity("7203"))
+        assert await cache.get_code(TARGET_DATE, StockCode("9984")) == (True, None)
+
+    @pytest.mark.asyncio
+    async def test_set_replaces_snapshot(self, cache):
+        """同じ日付を保存し直すと以前の銘柄は残らない"""
+        await cache.set(TARGET_DATE, [_entity("7203"), _entity("6758")])
+        await cache.set(TARGET_DATE, [_entity("7203")])
+
+        assert await cache.get(TARGET_DATE) == [_entity("7203")]
+
+    @pytest.mark.asyncio
+    async def test_legacy_string_value_is_replaced(self, cache, redis):
+        """以前の形式（文字列）のキーはキャッシュなしとして扱い、保存時に置き換える"""
+        await redis.set("stock:info:listed_info:2024-01-04", "[]")
+
+        assert await cache.get(TARGET_DATE) is None
+        assert await cache.get_code(TARGET_DATE, StockCode("7203")) == (False, None)
+
+        await cache.set(TARGET_DATE, [_entity("7203")])
+        assert await cache.get(TARGET_DATE) == [_entity("7203")]
+
+    @pytest.mark.asyncio
+    async def test_miss_and_empty_snapshot(self, cache):
+        """未キャッシュは None 、空のスナップショットは空リスト"""
+        assert await cache.get(TARGET_DATE) is None
+
+        await cache.set(TARGET_DATE, [])
+
+        assert await cache.get(TARGET_DATE) == []
+
+    @pytest.mark.asyncio
+    async def test_invalidate_and_clear(self, cache):
+        """指定日のみ、またはすべての日付を破棄する"""
+        other_date = date(2024, 1, 5)
+        await cache.set(TARGET_DATE, [_entity("7203")])
+        await cache.set(other_date, [_entity("7203", other_date)])
+
+        await cache.invalidate([TARGET_DATE])
+        assert await cache.get(TARGET_DATE) is None
+        assert await cache.get(other_date) is not None
+
+        await cache.clear()
+        assert await cache.get(other_date) is None
+
+    @pytest.mark.asyncio
+    async def test_redis_error_is_treated_as_miss(self):
+        """Redis に接続できない場合はキャッシュなしとして動作する"""
+        cache = ListedInfoSnapshotCache(ttl=60, redis_getter=AsyncMock(side_effect=ConnectionError()))
+
+        assert await cache.get(TARGET_DATE) is None
+        assert await cache.get_code(TARGET_DATE, StockCode("7203")) == (False, None)
+        await cache.set(TARGET_DATE, [_entity("7203")])
+        await cache.invalidate([TARGET_DATE])
+
+
+class TestCachedListedInfoRepository:
+    """CachedListedInfoRepository のテスト"""
+
+    @pytest.fixture
+    def inner(self):
+        repository = AsyncMock()
+        repository.find_all_by_date.return_value = [_entity("6758"), _entity("7203")]
+        repository.save_all.return_value = ListedInfoSaveResult(inserted_count=1)
+        return repository
+
+    @pytest.fixture
+    def session(self):
+        # 接続は行わず、Session.info とイベントの登録先としてのみ使用する
+        return AsyncSession()
+
+    @pytest.fixture
+    def repository(self, inner, cache, session):
+        return CachedListedInfoRepository(inner, cache, session)
+
+    @pytest.mark.asyncio
+    async def test_find_all_by_date_is_cached(self, repository, inner):
+        """2 回目以降はキャッシュから取得する"""
+        first = await repository.find_all_by_date(TARGET_DATE)
+        second = await repository.find_all_by_date(TARGET_DATE)
+
+        assert first == second
+        inner.find_all_by_date.assert_awaited_once_with(TARGET_DATE)
+
+    @pytest.mark.asyncio
+    async def test_find_by_code_uses_cached_snapshot(self, repository, inner):
+        """キャッシュ済みの日付は単一銘柄の検索もキャッシュから返す"""
+        await repository.find_by_code_and_date(StockCode("7203"), TARGET_DATE)
+        inner.find_by_code_and_date.assert_awaited_once()
+
+        await repository.find_all_by_date(TARGET_DATE)
+        found = await repository.find_by_code_and_date(StockCode("6758"), TARGET_DATE)
+
+        missing = await repository.find_by_code_and_date(StockCode("9984"), TARGET_DATE)
+
+        assert found.code == StockCode("6758")
+        assert missing is None
+        inner.find_by_code_and_date.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_save_all_invalidates_written_dates(self, repository, inner, cache, session):
+        """書き込んだ日付のキャッシュを破棄し、コミット後の破棄を予約する"""
+        await repository.find_all_by_date(TARGET_DATE)
+
+        await repository.save_all([_entity("7203")])
+
+        assert await cache.get(TARGET_DATE) is None
+        assert session.info[cached_module._PENDING_KEY] == {TARGET_DATE}
+        assert event.contains(session.sync_session, "after_commit", cached_module._on_commit)
+
+    @pytest.mark.asyncio
+    async def test_save_rows_invalidates_written_dates(self, repository, inner, cache, session):
+        """行の保存でも書き込んだ日付のキャッシュを破棄する"""
+        inner.save_rows.return_value = ListedInfoSaveResult(updated_count=1)
+        await repository.find_all_by_date(TARGET_DATE)
+
+        await repository.save_rows([(TARGET_DATE, "7203", "Toyota") + (None,) * 10])
+
+        assert await cache.get(TARGET_DATE) is None
+        assert session.info[cached_module._PENDING_KEY] == {TARGET_DATE}
+
+    @pytest.mark.asyncio
+    async def test_unchanged_save_keeps_cache(self, repository, inner, cache):
+        """書き込みがなかった場合はキャッシュを維持する"""
+        inner.save_all.return_value = ListedInfoSaveResult(unchanged_count=1)
+        await repository.find_all_by_date(TARGET_DATE)
+
+        await repository.save_all([_entity("7203")])
+
+        assert await cache.get(TARGET_DATE) is not None
+
+    @pytest.mark.asyncio
+    async def test_commit_invalidates_again(self, repository, cache, session):
+        """コミット前にキャッシュし直されたスナップショットもコミット後に破棄する"""
+        await repository.save_all([_entity("7203")])
+        await repository.find_all_by_date(TARGET_DATE)
+
+        cached_module._on_commit(session.sync_session)
+        await next(iter(cached_module._invalidation_tasks))
+
+        assert await cache.get(TARGET_DATE) is None
+        assert cached_module._PENDING_KEY not in session.info
+
+    @pytest.mark.asyncio
+    async def test_history_storage_clears_all_dates_after_commit(self, inner, cache, session):
+        """履歴形式では書き込みごとではなく、コミット後にすべての日付を破棄する"""
+        repository = CachedListedInfoRepository(inner, cache, session, invalidate_all_on_write=True)
+        other_date = date(2024, 1, 10)
+        await cache.set(other_date, [_entity("7203", other_date)])
+        cache.clear = AsyncMock(wraps=cache.clear)
+
+        await repository.save_all([_entity("7203")])
+        await repository.save_all([_entity("6758")])
+
+        cache.clear.assert_not_awaited()
+        assert None in session.info[cached_module._PENDING_KEY]
+
+        cached_module._on_commit(session.sync_session)
+        await next(iter(cached_module._invalidation_tasks))
+
+        cache.clear.assert_awaited_once()
+        assert await cache.get(other_date) is None
@@ -0,0 +1,84 @@
+"""Listed info API エンドポイントのユニットテスト"""
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.application.dtos.jquants_listed_info_dto import JQuantsListedInfoDTO
+from app.presentation.api.v1.endpoints import listed_info as listed_info_module
+from app.presentation.dependencies.use_cases import get_query_listed_info_use_case
+from app.presentation.middleware.error_handler import ErrorHandlingMiddleware
+
+
+def _dto(code: str) -> JQuantsListedInfoDTO:
+    return JQuantsListedInfoDTO(
+        date="2024-01-04",
+        code=code,
+        company_name=f"Company {code}",
+        company_name_english=None,
+        sector_17_code="6",
+        sector_17_code_name="自動車・輸送機",
+        sector_33_code="3700",
+        sector_33_code_name="輸送用機器",
+        scale_category=None,
+        market_code="0111",
+        market_code_name="プライム",
+        margin_code=None,
+        margin_code_name=None,
+    )
+
+
+class TestListedInfoEndpoints:
+    """Listed info エンドポイントのテストクラス"""
+
+    @pytest.fixture
+    def use_case(self):
+        """モック UseCase"""
+        use_case = MagicMock()
+        use_case.search = AsyncMock(return_value=([_dto("7203")], 3))
+        use_case.get_by_code = AsyncMock(return_value=_dto("7203"))
+        use_case.get_latest_by_code = AsyncMock(return_value=None)
+        return use_case
+
+    @pytest.fixture
+    def client(self, use_case):
+        app = FastAPI()
+        app.add_middleware(ErrorHandlingMiddleware)
+        app.include_router(listed_info_module.router)
+        app.dependency_overrides[get_query_listed_info_use_case] = lambda: use_case
+        with TestClient(app) as client:
+            yield client
+
+    def test_list_by_date_with_filters(self, client, use_case):
+        """日付と絞り込み条件で一覧を取得する"""
+        response = client.get(
+            "/listed-info/",
+            params={"date": "2024-01-04", "market_code": "0111", "page": 2, "per_page": 1},
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert [item["code"] for item in body["data"]] == ["7203"]
+        assert body["meta"]["total"] == 3
+        criteria = use_case.search.await_args.args[0]
+        assert criteria.market_code == "0111"
+        assert use_case.search.await_args.kwargs == {"offset": 1, "limit": 1}
+
+    def test_list_requires_date(self, client):
+        """日付の指定は必須"""
+        assert client.get("/listed-info/").status_code == 422
+
+    def test_get_by_code_and_date(self, client, use_case):
+        """銘柄コードと日付で取得する"""
+        response = client.get("/listed-info/7203", params={"date": "2024-01-04"})
+
+        assert response.status_code == 200
+        assert response.json()["data"]["company_name"] == "Company 7203"
+
+    def test_latest_not_found(self, client):
+        """データがない場合は 404"""
+        response = client.get("/listed-info/7203/latest")
+
+        assert response.status_code == 404
+        assert response.json()["error"]["code"] == "RESOURCE_NOT_FOUND"